@@ -5,11 +5,15 @@ from globus_sdk.version import __version__
 
 from globus_sdk.response import GlobusResponse, GlobusHTTPResponse
 
+from globus_sdk.retry import RetryPolicy
+from globus_sdk.cache import ResponseCache
+from globus_sdk.coalesce import RequestCoalescer
+
 from globus_sdk.exc import (
     GlobusError, GlobusSDKUsageError,
     GlobusAPIError, TransferAPIError, SearchAPIError,
     NetworkError, GlobusConnectionError, GlobusTimeoutError,
-    GlobusConnectionTimeoutError)
+    GlobusConnectionTimeoutError, ChunkedSubmitError)
 
 from globus_sdk.authorizers import (
     NullAuthorizer, BasicAuthorizer, AccessTokenAuthorizer,
@@ -31,10 +35,12 @@ __all__ = (
 
     "GlobusResponse", "GlobusHTTPResponse",
 
+    "RetryPolicy", "ResponseCache", "RequestCoalescer",
+
     "GlobusError", "GlobusSDKUsageError",
     "GlobusAPIError", "TransferAPIError", "SearchAPIError",
     "NetworkError", "GlobusConnectionError", "GlobusTimeoutError",
-    "GlobusConnectionTimeoutError",
+    "GlobusConnectionTimeoutError", "ChunkedSubmitError",
 
     "NullAuthorizer", "BasicAuthorizer",
     "AccessTokenAuthorizer", "RefreshTokenAuthorizer",
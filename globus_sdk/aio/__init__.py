@@ -0,0 +1,42 @@
+"""
+asyncio versions of the Globus SDK clients, built on ``aiohttp``.
+
+This package requires Python 3.6+ and the ``aio`` extra::
+
+    pip install globus-sdk[aio]
+"""
+import sys
+
+# the package is installed on every python, but its modules use syntax which
+# older pythons can't compile
+if sys.version_info < (3, 6):
+    raise ImportError('globus_sdk.aio requires Python 3.6+')
+try:
+    import aiohttp  # noqa: F401
+except ImportError:
+    raise ImportError(
+        'globus_sdk.aio requires the aiohttp package, which is not '
+        'installed. Install it with: pip install globus-sdk[aio]')
+
+from globus_sdk.aio.transport import (  # noqa: E402
+    AsyncHTTPTransport, get_default_async_transport,
+    set_default_async_transport)
+from globus_sdk.aio.base import AsyncBaseClient
+from globus_sdk.aio.paging import AsyncPaginatedResource
+from globus_sdk.aio.transfer import AsyncTransferClient
+from globus_sdk.aio.auth import (
+    AsyncAuthClient, AsyncNativeAppAuthClient, AsyncConfidentialAppAuthClient)
+from globus_sdk.aio.search import AsyncSearchClient
+
+
+__all__ = (
+    "AsyncHTTPTransport", "get_default_async_transport",
+    "set_default_async_transport",
+
+    "AsyncBaseClient", "AsyncPaginatedResource",
+
+    "AsyncTransferClient",
+    "AsyncAuthClient", "AsyncNativeAppAuthClient",
+    "AsyncConfidentialAppAuthClient",
+    "AsyncSearchClient",
+)
@@ -0,0 +1,26 @@
+from globus_sdk.auth import (AuthClient, NativeAppAuthClient,
+                             ConfidentialAppAuthClient)
+from globus_sdk.aio.base import AsyncBaseClient
+
+
+class AsyncAuthClient(AsyncBaseClient, AuthClient):
+    """
+    Async version of :class:`AuthClient <globus_sdk.AuthClient>`. Every method
+    which calls Globus Auth must be awaited. ``oauth2_get_authorize_url``
+    makes no request, so it is not a coroutine.
+    """
+
+
+class AsyncNativeAppAuthClient(AsyncBaseClient, NativeAppAuthClient):
+    """
+    Async version of :class:`NativeAppAuthClient
+    <globus_sdk.NativeAppAuthClient>`.
+    """
+
+
+class AsyncConfidentialAppAuthClient(AsyncBaseClient,
+                                     ConfidentialAppAuthClient):
+    """
+    Async version of :class:`ConfidentialAppAuthClient
+    <globus_sdk.ConfidentialAppAuthClient>`.
+    """
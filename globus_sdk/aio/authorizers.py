@@ -0,0 +1,48 @@
+"""
+Helpers for using :ref:`GlobusAuthorizers <authorization>` without blocking
+the event loop.
+
+All authorizers can be used by async clients. Most of them only ever compute
+headers in memory, but a
+:class:`RenewingAuthorizer
+<globus_sdk.authorizers.renewing.RenewingAuthorizer>` calls out to Globus
+Auth whenever its access token expires. Async clients therefore run token
+renewal in the loop's default executor, and make sure that concurrent requests
+which share an authorizer wait for one renewal rather than each starting their
+own.
+"""
+import asyncio
+import logging
+import weakref
+
+from globus_sdk.authorizers.renewing import RenewingAuthorizer
+
+logger = logging.getLogger(__name__)
+
+# one lock per renewing authorizer, created on first use
+_renewal_locks = weakref.WeakKeyDictionary()
+
+
+def _renewal_lock(authorizer):
+    lock = _renewal_locks.get(authorizer)
+    if lock is None:
+        lock = _renewal_locks[authorizer] = asyncio.Lock()
+    return lock
+
+
+async def set_authorization_header(authorizer, header_dict):
+    """
+    Async version of ``authorizer.set_authorization_header(header_dict)``.
+    If the authorizer needs a new access token, it is fetched in an executor.
+    """
+    if isinstance(authorizer, RenewingAuthorizer) and (
+            authorizer._needs_new_access_token()):
+        async with _renewal_lock(authorizer):
+            # another task may have renewed the token while we waited
+            if authorizer._needs_new_access_token():
+                logger.debug("Renewing access token for %s in executor",
+                             type(authorizer).__name__)
+                loop = asyncio.get_event_loop()
+                await loop.run_in_executor(
+                    None, authorizer._get_new_access_token)
+    authorizer.set_authorization_header(header_dict)
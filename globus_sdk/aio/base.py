@@ -0,0 +1,197 @@
+import asyncio
+
+from globus_sdk import exc
+from globus_sdk.authorizers.renewing import RenewingAuthorizer
+from globus_sdk.base import BaseClient, slash_join
+from globus_sdk.hooks import (timer, BEFORE_REQUEST, AFTER_RESPONSE,
+                              ON_ERROR)
+from globus_sdk.aio.authorizers import set_authorization_header
+from globus_sdk.aio.transport import (AsyncHTTPTransport,
+                                      get_default_async_transport)
+
+
+class AsyncBaseClient(BaseClient):
+    r"""
+    Async version of :class:`BaseClient <globus_sdk.base.BaseClient>`.
+    ``get``, ``post``, ``put``, and ``delete`` are coroutines, but take the
+    same arguments, return the same response objects, and raise the same
+    errors as their synchronous counterparts.
+
+    Requests are sent by an :class:`AsyncHTTPTransport
+    <globus_sdk.aio.transport.AsyncHTTPTransport>`, so many requests can be in
+    flight at once from a single event loop.
+
+    Takes all of the parameters of ``BaseClient``, except that
+    ``http_pool_maxsize`` sets the transport's ``limit_per_host``, and that
+    ``http_pool_connections``, ``http_pool_block``, and ``request_coalescer``
+    are not supported.
+
+    **Parameters**
+
+       ``transport`` (:class:`AsyncHTTPTransport \
+       <globus_sdk.aio.transport.AsyncHTTPTransport>`)
+         The transport used to send requests, which may be shared with other
+         async clients. Defaults to the process-wide default async transport,
+         unless ``http_pool_maxsize`` is given.
+    """
+
+    def _init_transport(self, environment, transport, pool_connections,
+                        pool_maxsize, pool_block):
+        if pool_connections is not None or pool_block is not None:
+            raise exc.GlobusSDKUsageError(
+                "Async clients don't support http_pool_connections or "
+                "http_pool_block. Use an AsyncHTTPTransport with a limit.")
+        if transport is not None:
+            if pool_maxsize is not None:
+                raise exc.GlobusSDKUsageError(
+                    "A client can't be given both a transport and connection "
+                    "pool settings. Configure the pool on the transport.")
+            return transport
+        if pool_maxsize is None:
+            return get_default_async_transport()
+        return AsyncHTTPTransport(limit_per_host=pool_maxsize)
+
+    async def get(self, path, params=None, headers=None,
+                  response_class=None, retry_401=True):
+        """
+        Make a GET request to the specified path. See
+        :meth:`BaseClient.get <globus_sdk.base.BaseClient.get>`.
+        """
+        self.logger.debug('GET to %s with params %s', path, params)
+        return await self._request("GET", path, params=params,
+                                   headers=headers,
+                                   response_class=response_class,
+                                   retry_401=retry_401)
+
+    async def post(self, path, json_body=None, params=None, headers=None,
+                   text_body=None, response_class=None, retry_401=True,
+                   compress=None):
+        """
+        Make a POST request to the specified path. See
+        :meth:`BaseClient.post <globus_sdk.base.BaseClient.post>`.
+        """
+        self.logger.debug('POST to %s with params %s', path, params)
+        return await self._request("POST", path, json_body=json_body,
+                                   params=params, headers=headers,
+                                   text_body=text_body,
+                                   response_class=response_class,
+                                   retry_401=retry_401, compress=compress)
+
+    async def delete(self, path, params=None, headers=None,
+                     response_class=None, retry_401=True):
+        """
+        Make a DELETE request to the specified path. See
+        :meth:`BaseClient.delete <globus_sdk.base.BaseClient.delete>`.
+        """
+        self.logger.debug('DELETE to %s with params %s', path, params)
+        return await self._request("DELETE", path, params=params,
+                                   headers=headers,
+                                   response_class=response_class,
+                                   retry_401=retry_401)
+
+    async def put(self, path, json_body=None, params=None, headers=None,
+                  text_body=None, response_class=None, retry_401=True,
+                  compress=None):
+        """
+        Make a PUT request to the specified path. See
+        :meth:`BaseClient.put <globus_sdk.base.BaseClient.put>`.
+        """
+        self.logger.debug('PUT to %s with params %s', path, params)
+        return await self._request("PUT", path, json_body=json_body,
+                                   params=params, headers=headers,
+                                   text_body=text_body,
+                                   response_class=response_class,
+                                   retry_401=retry_401, compress=compress)
+
+    async def _request(self, method, path, params=None, headers=None,
+                       json_body=None, text_body=None,
+                       response_class=None, retry_401=True, compress=None):
+        """
+        Async version of ``BaseClient._request``, with the same 401 and retry
+        handling.
+        """
+        if self.request_coalescer is not None:
+            raise exc.GlobusSDKUsageError(
+                "Async clients don't support request_coalescer")
+        rheaders, text_body = self._prepare_request(headers, json_body,
+                                                    text_body, compress)
+        authorization = await self._authorize_async(rheaders)
+
+        url = slash_join(self.base_url, path)
+        self.logger.debug('request will hit URL:%s', url)
+
+        cache_lookup = self._check_cache(method, path, params, rheaders)
+        if cache_lookup is not None and cache_lookup.response is not None:
+            return self._finish_request(cache_lookup.response, response_class)
+
+        attempt = 0
+        retried_401 = False
+        while True:
+            event = self._new_request_event(method, path, url, params,
+                                            text_body, attempt, authorization)
+            authorization = None
+            self.hooks.fire(BEFORE_REQUEST, event)
+            try:
+                start = timer()
+                # the async transport reads the body along with the headers,
+                # so the request phase includes the body read
+                r = await self.transport.request(
+                    method, url, headers=rheaders, params=params,
+                    data=text_body, verify=self._verify,
+                    timeout=self._http_timeout)
+                event.timings['request'] = timer() - start
+            except exc.NetworkError as err:
+                self.logger.error("NetworkError on request")
+                event.error = err
+                event.finish()
+                if not self.retry_policy.should_retry(
+                        attempt, method, json_body, error=err):
+                    self._update_cache(method, path, cache_lookup, None)
+                    self.hooks.fire(ON_ERROR, event)
+                    raise
+                self._fire_retry(event, self._retry_delay(attempt, err))
+                await asyncio.sleep(event.retry_delay)
+                attempt += 1
+                continue
+
+            self.logger.debug('Request made to URL: %s', r.url)
+            event.set_response(r)
+
+            if self._should_retry_401(r, retry_401, retried_401):
+                retried_401 = True
+                if self.authorizer.handle_missing_authorization():
+                    self.logger.debug('request can be retried')
+                    event.finish()
+                    self.hooks.fire(AFTER_RESPONSE, event)
+                    self._fire_retry(event, 0)
+                    authorization = await self._authorize_async(rheaders)
+                    continue
+
+            if self.retry_policy.should_retry(attempt, method, json_body,
+                                              response=r):
+                event.finish()
+                self.hooks.fire(AFTER_RESPONSE, event)
+                self._fire_retry(event, self._retry_delay(
+                    attempt, r.status_code, response=r))
+                await asyncio.sleep(event.retry_delay)
+                attempt += 1
+                continue
+
+            break
+
+        r = self._update_cache(method, path, cache_lookup, r)
+        return self._finish_request_with_hooks(event, r, response_class)
+
+    async def _authorize_async(self, rheaders):
+        """
+        Async version of ``BaseClient._authorize``.
+        """
+        if self.authorizer is None:
+            return None
+        self.logger.debug('request will have authorization of type %s',
+                          type(self.authorizer))
+        refresh = isinstance(self.authorizer, RenewingAuthorizer) and (
+            self.authorizer._needs_new_access_token())
+        start = timer()
+        await set_authorization_header(self.authorizer, rheaders)
+        return timer() - start, refresh
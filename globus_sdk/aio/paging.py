@@ -0,0 +1,153 @@
+import logging
+from itertools import islice
+
+from globus_sdk.codec import JSONCodec
+from globus_sdk.exc import GlobusSDKUsageError
+from globus_sdk.hooks import timer
+from globus_sdk.transfer.export import ResultExporter
+from globus_sdk.transfer.paging import PaginatedResource
+
+logger = logging.getLogger(__name__)
+
+
+async def _no_results():
+    return
+    yield
+
+
+class AsyncPaginatedResource(PaginatedResource):
+    """
+    The async counterpart of :class:`PaginatedResource
+    <globus_sdk.transfer.paging.PaginatedResource>`, iterated with
+    ``async for``:
+
+    >>> async for task in atc.task_list(num_results=None):
+    >>>     print(task["task_id"])
+
+    Paging works exactly as it does for ``PaginatedResource``, except that no
+    request is made until iteration starts, so errors from the first call are
+    raised by the ``async for`` rather than by the method which returned the
+    resource. As with ``PaginatedResource``, **you can only iterate over an
+    AsyncPaginatedResource once**.
+    """
+
+    def _start_iteration(self):
+        if self.prefetch or self.concurrency > 1:
+            raise GlobusSDKUsageError(
+                "AsyncPaginatedResource doesn't support prefetch or "
+                "concurrency. Pages are fetched without blocking the event "
+                "loop.")
+        if self.cache_bytes is not None:
+            raise GlobusSDKUsageError(
+                "AsyncPaginatedResource doesn't support cache_bytes")
+        # the first page can only be fetched from a running event loop
+        self.generator = None
+        # no result is held back, as results are yielded as they are fetched
+        self.first_elem = self._magic
+        self._start_tracking()
+
+    def __aiter__(self):
+        if self.generator is None:
+            self.generator = self.aiterable_func()
+        return self.generator
+
+    async def aiterable_func(self):
+        """
+        An async generator which walks the results of the paginated API.
+        """
+        async for res in self._afetch_pages():
+            skip = self._track_page(res)
+            items = islice(res, skip, None) if skip else res
+            if self._convert_item is not None:
+                items = map(self._convert_item, items)
+            for item in items:
+                self._item_pending = True
+                yield item
+                self._item_pending = False
+                self.num_results_fetched += 1
+                self._page_consumed += 1
+
+                if (self.num_results is not None and
+                        self.num_results_fetched >= self.num_results):
+                    return
+
+    async def _afetch_pages(self):
+        """
+        An async generator of the pages of results, awaiting
+        ``client_method`` for each page.
+        """
+        self._init_paging()
+
+        has_next_page = True
+        while has_next_page:
+            logger.debug(("AsyncPaginatedResource should have more results, "
+                          "requesting them now"))
+            self._set_params_for_next_call()
+
+            start = timer()
+            res = await self.client_method(self.client_path,
+                                           **self.client_kwargs)
+            self._observe_page(res, timer() - start)
+            stopped = self._cut_at_stop(res)
+            yield res
+            if stopped:
+                return
+            has_next_page = self._check_has_next_page(res)
+
+    def pages(self):
+        """
+        The async counterpart of :meth:`PaginatedResource.pages
+        <globus_sdk.transfer.paging.PaginatedResource.pages>`, iterated with
+        ``async for``:
+
+        >>> async for page in atc.task_list(num_results=None).pages():
+        >>>     print(len(page.data))
+        """
+        if self.generator is not None:
+            raise GlobusSDKUsageError(
+                "AsyncPaginatedResource.pages() can't be used once iteration "
+                "has begun")
+        # leave nothing for iteration over results
+        self.generator = _no_results()
+        return self._aiter_pages()
+
+    async def _aiter_pages(self):
+        async for res in self._afetch_pages():
+            page = self._make_page(res, skip=self._track_page(res))
+            yield page
+            if page._last:
+                return
+
+    async def export(self, destination, format='ndjson', fields=None,
+                     compression=None, progress=None):
+        """
+        The async counterpart of :meth:`PaginatedResource.export
+        <globus_sdk.transfer.paging.PaginatedResource.export>`. Writing to
+        the file is done in the event loop's thread:
+
+        >>> stats = await atc.task_list(num_results=None).export("tasks.csv",
+        >>>                                                     format="csv")
+        """
+        codec = getattr(self.client_object, 'json_codec', None)
+        with ResultExporter(destination, format=format, fields=fields,
+                            compression=compression,
+                            codec=codec if isinstance(codec, JSONCodec)
+                            else None,
+                            progress=progress) as exporter:
+            async for page in self.pages():
+                exporter.write_page(page.data)
+        return exporter.stats
+
+    @property
+    def data(self):
+        raise GlobusSDKUsageError(
+            "AsyncPaginatedResource.data is not available. Collect results "
+            "with `[item async for item in resource]` instead.")
+
+    def __iter__(self):
+        raise GlobusSDKUsageError(
+            "AsyncPaginatedResource must be iterated with `async for`")
+
+    def __next__(self):
+        raise GlobusSDKUsageError(
+            "AsyncPaginatedResource must be iterated with `async for`")
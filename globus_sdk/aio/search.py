@@ -0,0 +1,10 @@
+from globus_sdk.search import SearchClient
+from globus_sdk.aio.base import AsyncBaseClient
+
+
+class AsyncSearchClient(AsyncBaseClient, SearchClient):
+    """
+    Async version of :class:`SearchClient <globus_sdk.SearchClient>`. Every
+    method takes the same arguments as on ``SearchClient``, but must be
+    awaited.
+    """
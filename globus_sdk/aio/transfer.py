@@ -0,0 +1,142 @@
+import asyncio
+
+from globus_sdk import exc
+from globus_sdk.transfer import TransferClient
+from globus_sdk.transfer.chunking import (
+    DEFAULT_MAX_ITEMS, DEFAULT_MAX_BYTES, ChunkedSubmitResult, split_document)
+from globus_sdk.aio.base import AsyncBaseClient
+from globus_sdk.aio.paging import AsyncPaginatedResource
+
+
+class AsyncTransferClient(AsyncBaseClient, TransferClient):
+    """
+    Async version of :class:`TransferClient
+    <globus_sdk.TransferClient>`. Every method takes the same arguments as
+    on ``TransferClient``, but must be awaited, and paginated calls return an
+    :class:`AsyncPaginatedResource
+    <globus_sdk.aio.paging.AsyncPaginatedResource>` to iterate with
+    ``async for``.
+
+    >>> atc = AsyncTransferClient(authorizer=...)
+    >>> tasks = await asyncio.gather(
+    >>>     *[atc.get_task(task_id) for task_id in task_ids])
+    """
+    paginated_resource_class = AsyncPaginatedResource
+
+    def __init__(self, authorizer=None, submission_id_prefetch=0, **kwargs):
+        if submission_id_prefetch:
+            raise exc.GlobusSDKUsageError(
+                "AsyncTransferClient doesn't support submission_id_prefetch")
+        TransferClient.__init__(self, authorizer=authorizer, **kwargs)
+
+    async def next_submission_id(self):
+        """
+        Get a submission ID for a new task, as a string. See
+        :meth:`TransferClient.next_submission_id
+        <globus_sdk.TransferClient.next_submission_id>`.
+        """
+        return (await self.get_submission_id())["value"]
+
+    async def submit_transfer(self, data):
+        """
+        Submit a transfer task, giving ``data`` a submission ID if it has
+        none. See :meth:`TransferClient.submit_transfer
+        <globus_sdk.TransferClient.submit_transfer>`.
+        """
+        if data.get("submission_id") is None:
+            data["submission_id"] = await self.next_submission_id()
+        return await TransferClient.submit_transfer(self, data)
+
+    async def submit_delete(self, data):
+        """
+        Submit a delete task, giving ``data`` a submission ID if it has none.
+        See :meth:`TransferClient.submit_delete
+        <globus_sdk.TransferClient.submit_delete>`.
+        """
+        if data.get("submission_id") is None:
+            data["submission_id"] = await self.next_submission_id()
+        return await TransferClient.submit_delete(self, data)
+
+    async def task_wait(self, task_id, timeout=10, polling_interval=10):
+        """
+        Wait until a Task is complete or fails, with a time limit, without
+        blocking the event loop. See :meth:`TransferClient.task_wait
+        <globus_sdk.TransferClient.task_wait>`.
+        """
+        self.logger.info("AsyncTransferClient.task_wait(%s, %s, %s)", task_id,
+                         timeout, polling_interval)
+
+        if timeout < 1:
+            raise exc.GlobusSDKUsageError(
+                "TransferClient.task_wait timeout has a minimum of 1")
+        if polling_interval < 1:
+            raise exc.GlobusSDKUsageError(
+                "TransferClient.task_wait polling_interval has a minimum of 1")
+        polling_interval = min(timeout, polling_interval)
+
+        waited_time = 0
+        while True:
+            task = await self.get_task(task_id)
+            status = task['status']
+            if status != 'ACTIVE':
+                self.logger.debug("task_wait(task_id=%s) terminated with "
+                                  "status=%s", task_id, status)
+                return True
+
+            waited_time += polling_interval
+            if waited_time > timeout:
+                self.logger.debug("task_wait(task_id=%s) timed out", task_id)
+                return False
+
+            await asyncio.sleep(polling_interval)
+
+    async def submit_transfer_chunked(self, data, max_items=DEFAULT_MAX_ITEMS,
+                                      max_bytes=DEFAULT_MAX_BYTES,
+                                      concurrency=4):
+        """
+        Submit a transfer document as several tasks, up to ``concurrency`` at
+        a time on the event loop. See
+        :meth:`TransferClient.submit_transfer_chunked
+        <globus_sdk.TransferClient.submit_transfer_chunked>`.
+        """
+        self.logger.info("AsyncTransferClient.submit_transfer_chunked(...)")
+        chunks = split_document(data, max_items, max_bytes, self.json_codec)
+        return await self._submit_chunks(self.submit_transfer, chunks,
+                                         concurrency)
+
+    async def submit_delete_chunked(self, data, max_items=DEFAULT_MAX_ITEMS,
+                                    max_bytes=DEFAULT_MAX_BYTES,
+                                    concurrency=4):
+        """
+        Submit a delete document as several tasks, up to ``concurrency`` at
+        a time on the event loop. See
+        :meth:`TransferClient.submit_delete_chunked
+        <globus_sdk.TransferClient.submit_delete_chunked>`.
+        """
+        self.logger.info("AsyncTransferClient.submit_delete_chunked(...)")
+        chunks = split_document(data, max_items, max_bytes, self.json_codec)
+        return await self._submit_chunks(self.submit_delete, chunks,
+                                         concurrency)
+
+    async def _submit_chunks(self, submit, chunks, concurrency):
+        if concurrency < 1:
+            raise exc.GlobusSDKUsageError(
+                "submit_chunks concurrency must be >= 1, got {}"
+                .format(concurrency))
+        result = ChunkedSubmitResult(chunks)
+        slots = asyncio.Semaphore(concurrency)
+
+        async def submit_chunk(index, chunk):
+            async with slots:
+                try:
+                    result.responses[index] = await submit(chunk)
+                except Exception as err:
+                    self.logger.error("Chunk %s of %s failed to submit: %s",
+                                      index + 1, len(chunks), err)
+                    result.errors[index] = err
+
+        await asyncio.gather(*[submit_chunk(index, chunk)
+                               for index, chunk in enumerate(chunks)])
+        if result.errors:
+            raise exc.ChunkedSubmitError(result)
+        return result
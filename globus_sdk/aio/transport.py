@@ -0,0 +1,235 @@
+"""
+The HTTP transport used by :class:`AsyncBaseClient
+<globus_sdk.aio.base.AsyncBaseClient>`, wrapping ``aiohttp``.
+
+Requests are prepared with ``requests`` before they are sent, so URLs, query
+strings, form bodies, and headers are encoded exactly as they are by the
+synchronous :class:`HTTPTransport <globus_sdk.transport.HTTPTransport>`, and
+responses are converted back into ``requests.Response`` objects so that all of
+the SDK's response and error classes can be used unchanged.
+"""
+import asyncio
+import logging
+import threading
+import weakref
+
+import aiohttp
+import requests
+import yarl
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from globus_sdk import exc
+from globus_sdk.codec import JSONStreamBody
+
+logger = logging.getLogger(__name__)
+
+# aiohttp's own defaults for TCPConnector
+DEFAULT_LIMIT = 100
+DEFAULT_LIMIT_PER_HOST = 0
+
+
+class AsyncHTTPTransport(object):
+    """
+    Sends requests with ``aiohttp``, keeping one ``aiohttp.ClientSession`` (and
+    therefore one connection pool) per event loop.
+
+    **Parameters**
+
+        ``limit`` (*int*)
+          The maximum number of connections open at once, across all hosts.
+          Requests beyond this limit wait for a free connection.
+          Defaults to 100.
+
+        ``limit_per_host`` (*int*)
+          The maximum number of connections open at once to any one host.
+          ``0`` means no per-host limit. Defaults to 0.
+
+    Like :class:`HTTPTransport <globus_sdk.transport.HTTPTransport>`,
+    transports are safe to share between clients, and never store cookies.
+    """
+    def __init__(self, limit=None, limit_per_host=None):
+        if limit is None:
+            limit = DEFAULT_LIMIT
+        if limit_per_host is None:
+            limit_per_host = DEFAULT_LIMIT_PER_HOST
+        logger.debug('Creating AsyncHTTPTransport(limit=%s, '
+                     'limit_per_host=%s)', limit, limit_per_host)
+
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+
+        # aiohttp sessions are bound to the loop they are created on
+        self._sessions = weakref.WeakKeyDictionary()
+
+        self._requests_sent = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
+
+    def get_session(self):
+        """
+        Get the ``aiohttp.ClientSession`` for the running event loop, creating
+        it if necessary.
+        """
+        loop = asyncio.get_event_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit, limit_per_host=self.limit_per_host)
+            session = aiohttp.ClientSession(
+                connector=connector,
+                cookie_jar=aiohttp.DummyCookieJar(),
+                # headers are set in full by the client, so don't let aiohttp
+                # add any of its own
+                skip_auto_headers=('User-Agent',))
+            self._sessions[loop] = session
+        return session
+
+    async def request(self, method, url, headers=None, params=None,
+                      data=None, verify=True, timeout=None):
+        """
+        Send a request, taking the same arguments that
+        :class:`BaseClient <globus_sdk.base.BaseClient>` passes to
+        ``HTTPTransport.request``, and get back a ``requests.Response``.
+
+        Failures are raised as
+        :class:`NetworkError <globus_sdk.exc.NetworkError>` subclasses.
+        """
+        prepared = requests.Request(method, url, headers=headers,
+                                    params=params, data=data).prepare()
+        body = prepared.body
+        if isinstance(body, JSONStreamBody):
+            # aiohttp only streams async iterables, and requests has already
+            # set the Content-Length
+            body = _iter_async(body)
+
+        self._requests_sent += 1
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+        try:
+            async with self.get_session().request(
+                    prepared.method,
+                    # already quoted by requests, so must not be requoted
+                    yarl.URL(prepared.url, encoded=True),
+                    headers=dict(prepared.headers), data=body,
+                    ssl=None if verify else False,
+                    timeout=_client_timeout(timeout),
+                    allow_redirects=True) as response:
+                content = await response.read()
+                return _to_requests_response(response, content, prepared)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise convert_aiohttp_exception(e)
+        finally:
+            self._in_flight -= 1
+
+    def pool_stats(self):
+        """
+        Get a dict of connection pool utilization counters:
+
+        ``requests_sent``
+          Total number of requests sent through this transport
+
+        ``in_flight``
+          Number of requests currently being sent or read
+
+        ``peak_in_flight``
+          Highest number of concurrent requests seen so far
+
+        ``sessions``
+          Number of open sessions, one per event loop
+
+        ``limit``, ``limit_per_host``
+          The pool configuration
+        """
+        return {
+            'requests_sent': self._requests_sent,
+            'in_flight': self._in_flight,
+            'peak_in_flight': self._peak_in_flight,
+            'sessions': len([s for s in self._sessions.values()
+                             if not s.closed]),
+            'limit': self.limit,
+            'limit_per_host': self.limit_per_host,
+        }
+
+    async def close(self):
+        """
+        Close the session for the running event loop, and with it all of its
+        pooled connections.
+        """
+        session = self._sessions.pop(asyncio.get_event_loop(), None)
+        if session is not None:
+            await session.close()
+
+
+def _client_timeout(timeout):
+    """
+    Convert a ``requests`` style timeout, which is either a number of seconds,
+    a ``(connect, read)`` tuple, or None, into an ``aiohttp.ClientTimeout``.
+    """
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+    else:
+        connect = read = timeout
+    return aiohttp.ClientTimeout(total=None, sock_connect=connect,
+                                 sock_read=read)
+
+
+async def _iter_async(body):
+    for chunk in body:
+        yield chunk
+
+
+def _to_requests_response(response, content, prepared):
+    """
+    Build a ``requests.Response`` from an ``aiohttp.ClientResponse`` and its
+    body.
+    """
+    r = requests.Response()
+    r.status_code = response.status
+    r.reason = response.reason
+    r.headers = CaseInsensitiveDict(response.headers)
+    r.encoding = get_encoding_from_headers(r.headers)
+    r.url = str(response.url)
+    r._content = content
+    r.request = prepared
+    return r
+
+
+def convert_aiohttp_exception(e):
+    """Converts an aiohttp exception to a Globus NetworkError"""
+    connection_timeout = getattr(aiohttp, 'ConnectionTimeoutError', None)
+    if connection_timeout is not None and isinstance(e, connection_timeout):
+        return exc.GlobusConnectionTimeoutError(
+            "ConnectTimeoutError on request", e)
+    if isinstance(e, asyncio.TimeoutError):
+        return exc.GlobusTimeoutError("TimeoutError on request", e)
+    elif isinstance(e, aiohttp.ClientConnectionError):
+        return exc.GlobusConnectionError("ConnectionError on request", e)
+    else:
+        return exc.NetworkError("NetworkError on request", e)
+
+
+_default_transport = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_async_transport():
+    """
+    Get the process-wide default async transport, which is used by every async
+    client that is not given a ``transport`` or connection limits explicitly.
+    """
+    global _default_transport
+    with _default_transport_lock:
+        if _default_transport is None:
+            _default_transport = AsyncHTTPTransport()
+        return _default_transport
+
+
+def set_default_async_transport(transport):
+    """
+    Replace the process-wide default async transport. Passing ``None`` causes a
+    new default to be created on next use.
+    """
+    global _default_transport
+    with _default_transport_lock:
+        _default_transport = transport
@@ -136,7 +136,7 @@ class AuthClient(BaseClient):
         if ids:
             params['ids'] = _convert_listarg(ids)
 
-        self.logger.debug('params={}'.format(params))
+        self.logger.debug('params=%s', params)
 
         if 'usernames' in params and 'ids' in params:
             self.logger.warn(('get_identities call with both usernames and '
@@ -168,7 +168,7 @@ class AuthClient(BaseClient):
                  'AuthClient to resolve'))
         auth_url = self.current_oauth2_flow_manager.get_authorize_url(
             additional_params=additional_params)
-        self.logger.info('Got authorization URL: {}'.format(auth_url))
+        self.logger.info('Got authorization URL: %s', auth_url)
         return auth_url
 
     def oauth2_exchange_code_for_tokens(self, auth_code):
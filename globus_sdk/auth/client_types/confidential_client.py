@@ -45,8 +45,8 @@ class ConfidentialAppAuthClient(AuthClient):
             self, client_id=client_id,
             authorizer=BasicAuthorizer(client_id, client_secret),
             **kwargs)
-        self.logger.info('Finished initializing client, client_id={}'
-                         .format(client_id))
+        self.logger.info('Finished initializing client, client_id=%s',
+                         client_id)
 
     def oauth2_client_credentials_tokens(self, requested_scopes=None):
         r"""
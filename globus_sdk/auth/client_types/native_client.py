@@ -34,8 +34,8 @@ class NativeAppAuthClient(AuthClient):
 
         AuthClient.__init__(
             self, client_id=client_id, authorizer=NullAuthorizer(), **kwargs)
-        self.logger.info('Finished initializing client, client_id={}'
-                         .format(client_id))
+        self.logger.info('Finished initializing client, client_id=%s',
+                         client_id)
 
     def oauth2_start_flow(
             self, requested_scopes=None, redirect_uri=None,
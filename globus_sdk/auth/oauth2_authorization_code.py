@@ -68,11 +68,11 @@ class GlobusAuthorizationCodeFlowManager(GlobusOAuthFlowManager):
         self.state = state
 
         logger.debug('Starting Authorization Code Flow with params:')
-        logger.debug('auth_client.client_id={}'.format(auth_client.client_id))
-        logger.debug('redirect_uri={}'.format(redirect_uri))
-        logger.debug('refresh_tokens={}'.format(refresh_tokens))
-        logger.debug('state={}'.format(state))
-        logger.debug('requested_scopes={}'.format(self.requested_scopes))
+        logger.debug('auth_client.client_id=%s', auth_client.client_id)
+        logger.debug('redirect_uri=%s', redirect_uri)
+        logger.debug('refresh_tokens=%s', refresh_tokens)
+        logger.debug('state=%s', state)
+        logger.debug('requested_scopes=%s', self.requested_scopes)
 
     def get_authorize_url(self, additional_params=None):
         """
@@ -95,9 +95,9 @@ class GlobusAuthorizationCodeFlowManager(GlobusOAuthFlowManager):
         """
         authorize_base_url = slash_join(self.auth_client.base_url,
                                         '/v2/oauth2/authorize')
-        logger.debug('Building authorization URI. Base URL: {}'
-                     .format(authorize_base_url))
-        logger.debug('additional_params={}'.format(additional_params))
+        logger.debug('Building authorization URI. Base URL: %s',
+                     authorize_base_url)
+        logger.debug('additional_params=%s', additional_params)
 
         params = {
             'client_id': self.client_id,
@@ -113,8 +113,8 @@ class GlobusNativeAppFlowManager(GlobusOAuthFlowManager):
         # set client_id, then check for validity
         self.client_id = auth_client.client_id
         if not self.client_id:
-            logger.error('Invalid auth_client ID to start Native App Flow: {}'
-                         .format(self.client_id))
+            logger.error('Invalid auth_client ID to start Native App Flow: %s',
+                         self.client_id)
             raise GlobusSDKUsageError(
                 'Invalid value for client_id. Got "{0}"'
                 .format(self.client_id))
@@ -141,16 +141,15 @@ class GlobusNativeAppFlowManager(GlobusOAuthFlowManager):
         self.prefill_named_grant = prefill_named_grant
 
         logger.debug('Starting Native App Flow with params:')
-        logger.debug('auth_client.client_id={}'.format(auth_client.client_id))
-        logger.debug('redirect_uri={}'.format(self.redirect_uri))
-        logger.debug('refresh_tokens={}'.format(refresh_tokens))
-        logger.debug('state={}'.format(state))
-        logger.debug('requested_scopes={}'.format(self.requested_scopes))
-        logger.debug('verifier=<REDACTED>,challenge={}'.format(self.challenge))
+        logger.debug('auth_client.client_id=%s', auth_client.client_id)
+        logger.debug('redirect_uri=%s', self.redirect_uri)
+        logger.debug('refresh_tokens=%s', refresh_tokens)
+        logger.debug('state=%s', state)
+        logger.debug('requested_scopes=%s', self.requested_scopes)
+        logger.debug('verifier=<REDACTED>,challenge=%s', self.challenge)
 
         if prefill_named_grant is not None:
-            logger.debug('prefill_named_grant={}'.format(
-                self.prefill_named_grant))
+            logger.debug('prefill_named_grant=%s', self.prefill_named_grant)
 
     def get_authorize_url(self, additional_params=None):
         """
@@ -173,9 +172,9 @@ class GlobusNativeAppFlowManager(GlobusOAuthFlowManager):
         """
         authorize_base_url = slash_join(self.auth_client.base_url,
                                         '/v2/oauth2/authorize')
-        logger.debug('Building authorization URI. Base URL: {}'
-                     .format(authorize_base_url))
-        logger.debug('additional_params={}'.format(additional_params))
+        logger.debug('Building authorization URI. Base URL: %s',
+                     authorize_base_url)
+        logger.debug('additional_params=%s', additional_params)
 
         params = {
             'client_id': self.client_id,
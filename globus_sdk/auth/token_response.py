@@ -164,7 +164,7 @@ class OAuthTokenResponse(GlobusHTTPResponse):
               this token back to the OAuthTokenResponse. The SDK now tracks
               this internally, so it is no longer necessary.
         """
-        logger.info('Decoding ID Token "{}"'.format(self['id_token']))
+        logger.info('Decoding ID Token "%s"', self['id_token'])
 
         # warn (not error) on older usage pattern, but still respect it
         # FIXME: should be deprecated and removed in SDK v2
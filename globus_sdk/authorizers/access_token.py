@@ -19,8 +19,8 @@ class AccessTokenAuthorizer(GlobusAuthorizer):
     def __init__(self, access_token):
         logger.info(("Setting up an AccessTokenAuthorizer. It will use an "
                      "auth type of Bearer and cannot handle 401s."))
-        logger.debug('Bearer token ends in "...{}" (last 5 chars)'
-                     .format(access_token[-5:]))
+        logger.debug('Bearer token ends in "...%s" (last 5 chars)',
+                     access_token[-5:])
         self.access_token = access_token
         self.header_val = "Bearer %s" % access_token
 
@@ -29,7 +29,6 @@ class AccessTokenAuthorizer(GlobusAuthorizer):
         Sets the ``Authorization`` header to
         "Bearer <access_token>"
         """
-        logger.debug(("Setting AccessToken Authorization Header: "
-                      '"Bearer ...{}" (last 5 chars)')
-                     .format(self.header_val[-5:]))
+        logger.debug('Setting AccessToken Authorization Header: "Bearer '
+                     '...%s" (last 5 chars)', self.header_val[-5:])
         header_dict['Authorization'] = self.header_val
@@ -53,10 +53,9 @@ class ClientCredentialsAuthorizer(RenewingAuthorizer):
     """
     def __init__(self, confidential_client, scopes,
                  access_token=None, expires_at=None, on_refresh=None):
-        logger.info((
-            "Setting up ClientCredentialsAuthorizer with confidential_client ="
-            " instance:{} and scopes = "
-            "{}".format(id(confidential_client), scopes)))
+        logger.info("Setting up ClientCredentialsAuthorizer with "
+                    "confidential_client = instance:%s and scopes = %s",
+                    id(confidential_client), scopes)
 
         # values for _get_token_data
         self.confidential_client = confidential_client
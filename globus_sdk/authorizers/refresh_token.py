@@ -48,9 +48,8 @@ class RefreshTokenAuthorizer(RenewingAuthorizer):
     """
     def __init__(self, refresh_token, auth_client,
                  access_token=None, expires_at=None, on_refresh=None):
-        logger.info((
-            "Setting up RefreshTokenAuthorizer with auth_client = "
-            "instance: {}".format(id(auth_client))))
+        logger.info("Setting up RefreshTokenAuthorizer with auth_client = "
+                    "instance: %s", id(auth_client))
 
         # required for _get_token_data
         self.refresh_token = refresh_token
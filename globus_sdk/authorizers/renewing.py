@@ -48,11 +48,9 @@ class RenewingAuthorizer(GlobusAuthorizer):
         # check access_token too -- it's not clear what it would mean to set
         # expiration without an access token
         if expires_at is not None and self.access_token is not None:
-            logger.info(("Got both expires_at and access_token. "
-                         "Will start by using "
-                         "RenewingAuthorizer.access_token = ...{} "
-                         "(last 5 chars)")
-                        .format(self.access_token[-5:]))
+            logger.info("Got both expires_at and access_token. Will start by "
+                        "using RenewingAuthorizer.access_token = ...%s (last "
+                        "5 chars)", self.access_token[-5:])
             self._set_expiration_time(expires_at)
 
         # if these were unspecified, fetch a new access token
@@ -82,9 +80,8 @@ class RenewingAuthorizer(GlobusAuthorizer):
         Set the expiration time adjusting for potential network delays.
         """
         self.expires_at = expires_at - EXPIRES_ADJUST_SECONDS
-        logger.debug(("Adjusted expiration time down to {} to account for "
-                      "potential delays.")
-                     .format(self.expires_at))
+        logger.debug("Adjusted expiration time down to %s to account for "
+                     "potential delays.", self.expires_at)
 
     def _get_new_access_token(self):
         """
@@ -98,21 +95,27 @@ class RenewingAuthorizer(GlobusAuthorizer):
         self._set_expiration_time(token_data['expires_at_seconds'])
         self.access_token = token_data['access_token']
 
-        logger.info(("RenewingAuthorizer.access_token updated to "
-                     '"...{}" (last 5 chars)')
-                    .format(self.access_token[-5:]))
+        logger.info('RenewingAuthorizer.access_token updated to "...%s" '
+                    '(last 5 chars)', self.access_token[-5:])
 
         if callable(self.on_refresh):
             self.on_refresh(res)
             logger.debug("Invoked on_refresh callback")
 
+    def _needs_new_access_token(self):
+        """
+        Check if the current access token is missing or expired, meaning that
+        the next ``set_authorization_header()`` call will fetch a new one.
+        """
+        return self.access_token is None or (
+            self.expires_at is None or time.time() > self.expires_at)
+
     def _check_expiration_time(self):
         """
         Check if the expiration timer is done, and renew the token if it is.
         """
         logger.debug("RenewingAuthorizer checking expiration time")
-        if self.access_token is None or (
-                self.expires_at is None or time.time() > self.expires_at):
+        if self._needs_new_access_token():
             logger.debug(("RenewingAuthorizer determined time has "
                           "expired. Fetching new Access Token"))
             self._get_new_access_token()
@@ -127,9 +130,8 @@ class RenewingAuthorizer(GlobusAuthorizer):
         "Bearer <access_token>"
         """
         self._check_expiration_time()
-        logger.debug(("Setting RefreshToken Authorization Header:"
-                      '"Bearer ...{}" (last 5 chars)')
-                     .format(self.access_token[-5:]))
+        logger.debug('Setting RefreshToken Authorization Header:"Bearer '
+                     '...%s" (last 5 chars)', self.access_token[-5:])
         header_dict['Authorization'] = "Bearer %s" % self.access_token
 
     def handle_missing_authorization(self, *args, **kwargs):
@@ -1,22 +1,36 @@
 from __future__ import unicode_literals
-import json
 import logging
 
 import requests
 import six
 from six.moves.urllib.parse import quote
 
-from globus_sdk import config, exc
+from globus_sdk import coalesce, config, exc
+from globus_sdk.hooks import (ClientHooks, RequestEvent, timer,
+                              BEFORE_REQUEST, AFTER_RESPONSE, ON_RETRY,
+                              ON_ERROR)
+from globus_sdk.authorizers.renewing import RenewingAuthorizer
+from globus_sdk.codec import JSONStreamBody, get_codec, has_long_list
+from globus_sdk.compress import DEFAULT_COMPRESS_LEVEL, GzipBody, gzip_body
 from globus_sdk.version import __version__
 from globus_sdk.response import GlobusHTTPResponse
+from globus_sdk.retry import RetryPolicy
+from globus_sdk.transport import HTTPTransport, get_default_transport
 
 
 class ClientLogAdapter(logging.LoggerAdapter):
     """
     Stuff in the memory location of the client to make log records unambiguous.
+
+    The prefix is computed once, so that processing each message is cheap.
     """
+    def __init__(self, logger, extra):
+        logging.LoggerAdapter.__init__(self, logger, extra)
+        self._prefix = '[instance:{}] '.format(id(extra['client']))
+
     def process(self, msg, kwargs):
-        return '[instance:{}] {}'.format(id(self.extra['client']), msg), kwargs
+        # msg may be any object, such as an exception
+        return '%s%s' % (self._prefix, msg), kwargs
 
     def warn(self, *args, **kwargs):
         return self.warning(*args, **kwargs)
@@ -48,6 +62,78 @@ class BaseClient(object):
          A value of -1 indicates that no timeout should be used (requests can
          hang indefinitely).
 
+       ``retry_policy`` (:class:`RetryPolicy <globus_sdk.retry.RetryPolicy>`)
+         Policy used to retry requests which fail with transient errors, like
+         a 503 or a dropped connection. Defaults to a policy built from the
+         ``http_max_retries``, ``http_retry_backoff``, and
+         ``http_max_retry_backoff`` config values, which does not retry unless
+         ``http_max_retries`` is set.
+
+       ``transport`` (:class:`HTTPTransport \
+       <globus_sdk.transport.HTTPTransport>`)
+         The transport used to send requests, which may be shared with other
+         clients. Defaults to the process-wide default transport, unless any
+         of the ``http_pool_*`` parameters are given, in which case the client
+         gets a transport of its own.
+
+       ``http_pool_connections`` (*int*)
+         Number of per-host connection pools to keep. Defaults to the
+         ``http_pool_connections`` config value, or 10.
+
+       ``http_pool_maxsize`` (*int*)
+         Maximum number of connections kept open to a single host. Raise this
+         when many threads share one client. Defaults to the
+         ``http_pool_maxsize`` config value, or 10.
+
+       ``http_pool_block`` (*bool*)
+         Make requests wait for a pooled connection rather than opening an
+         extra one when ``http_pool_maxsize`` connections to a host are busy.
+         Defaults to the ``http_pool_block`` config value, or False.
+
+       ``json_codec`` (:class:`JSONCodec <globus_sdk.codec.JSONCodec>` \
+       or *string*)
+         The codec used to encode JSON request bodies and to decode JSON
+         responses, or the name of one. Defaults to the ``json_codec`` config
+         value, which selects ``orjson`` or ``ujson`` when installed, and the
+         standard library ``json`` module otherwise.
+
+       ``hooks`` (:class:`ClientHooks <globus_sdk.hooks.ClientHooks>`)
+         Callbacks for request events, which may be shared with other
+         clients. Defaults to an empty set of hooks for this client. Either
+         way, callbacks can be registered via ``client.hooks``.
+
+       ``response_cache`` (:class:`ResponseCache \
+       <globus_sdk.cache.ResponseCache>`)
+         A cache for the responses to GET requests, which may be shared with
+         other clients. Defaults to no caching.
+
+       ``request_coalescer`` (:class:`RequestCoalescer \
+       <globus_sdk.coalesce.RequestCoalescer>`)
+         Lets identical GET requests which are in flight at the same time,
+         from any of the clients sharing the coalescer, share a single HTTP
+         round-trip. Defaults to no coalescing.
+
+       ``json_stream_min_items`` (*int*)
+         JSON request bodies holding a list of at least this many members,
+         such as the items of a large Transfer submission, are encoded as
+         they are sent, with a :class:`JSONStreamBody
+         <globus_sdk.codec.JSONStreamBody>`, rather than all at once. This
+         saves holding the encoded body in memory, but encodes it twice,
+         once to count its length. Defaults to ``None``, which encodes every
+         body at once.
+
+       ``compress_min_bytes`` (*int*)
+         Request bodies of at least this many bytes are sent gzip compressed,
+         with ``Content-Encoding: gzip``. Defaults to ``None``, which only
+         compresses requests sent with ``compress=True``.
+
+       ``compress_level`` (*int*)
+         The gzip compression level, from 1 (fastest) to 9 (smallest).
+         Defaults to 6.
+
+    Connection pool utilization can be inspected with
+    ``client.transport.pool_stats()``.
+
     All other parameters are for internal use and should be ignored.
     """
 
@@ -56,28 +142,36 @@ class BaseClient(object):
     default_response_class = GlobusHTTPResponse
     # a collection of authorizer types, or None to indicate "any"
     allowed_authorizer_types = None
+    # groups of response cache entries changed by requests to other groups,
+    # as for ResponseCache.invalidate
+    cache_related_groups = {}
 
     BASE_USER_AGENT = 'globus-sdk-py-{0}'.format(__version__)
 
     def __init__(self, service, environment=None, base_url=None,
                  base_path=None, authorizer=None, app_name=None,
-                 http_timeout=None,
-                 *args, **kwargs):
+                 http_timeout=None, retry_policy=None,
+                 transport=None, http_pool_connections=None,
+                 http_pool_maxsize=None, http_pool_block=None,
+                 json_codec=None, hooks=None, response_cache=None,
+                 request_coalescer=None,
+                 json_stream_min_items=None, compress_min_bytes=None,
+                 compress_level=DEFAULT_COMPRESS_LEVEL, *args, **kwargs):
         # get the fully qualified name of the client class, so that it's a
         # child of globus_sdk
         self.logger = ClientLogAdapter(
             logging.getLogger(self.__module__ + '.' + self.__class__.__name__),
             {'client': self})
-        self.logger.info('Creating client of type {} for service "{}"'
-                         .format(type(self), service))
+        self.logger.info('Creating client of type %s for service "%s"',
+                         type(self), service)
         # if restrictions have been placed by a child class on the allowed
         # authorizer types, make sure we are not in violation of those
         # constraints
         if self.allowed_authorizer_types is not None and (
                 authorizer is not None and
                 type(authorizer) not in self.allowed_authorizer_types):
-            self.logger.error("{} doesn't support authorizer={}"
-                              .format(type(self), type(authorizer)))
+            self.logger.error("%s doesn't support authorizer=%s", type(self),
+                              type(authorizer))
             raise exc.GlobusSDKUsageError(
                 ("{0} can only take authorizers from {1}, "
                  "but you have provided {2}").format(
@@ -101,7 +195,10 @@ class BaseClient(object):
 
         # setup the basics for wrapping a Requests Session
         # including basics for internal header dict
-        self._session = requests.Session()
+        self.transport = self._init_transport(
+            environment, transport, http_pool_connections,
+            http_pool_maxsize, http_pool_block)
+        self._session = getattr(self.transport, 'session', None)
         self._headers = {
             'Accept': 'application/json',
             'User-Agent': self.BASE_USER_AGENT
@@ -120,11 +217,59 @@ class BaseClient(object):
         if self._http_timeout == -1:
             self._http_timeout = None
 
+        if retry_policy is None:
+            retry_policy = RetryPolicy(
+                max_retries=config.get_http_max_retries(environment),
+                backoff_factor=config.get_http_retry_backoff(environment),
+                max_backoff=config.get_http_max_retry_backoff(environment))
+        self.retry_policy = retry_policy
+
+        if json_codec is None:
+            json_codec = config.get_json_codec(environment)
+        if isinstance(json_codec, six.string_types):
+            json_codec = get_codec(json_codec)
+        self.json_codec = json_codec
+        self.json_stream_min_items = json_stream_min_items
+        self.compress_min_bytes = compress_min_bytes
+        self.compress_level = compress_level
+
+        if hooks is None:
+            hooks = ClientHooks()
+        self.hooks = hooks
+
+        self.response_cache = response_cache
+        self.request_coalescer = request_coalescer
+
         # set application name if given
         self.app_name = None
         if app_name is not None:
             self.set_app_name(app_name)
 
+    def _init_transport(self, environment, transport, pool_connections,
+                        pool_maxsize, pool_block):
+        """
+        Get the transport this client will use, given the ``transport`` and
+        ``http_pool_*`` arguments it was created with.
+        """
+        pool_args = (pool_connections, pool_maxsize, pool_block)
+        if transport is not None:
+            if any(arg is not None for arg in pool_args):
+                raise exc.GlobusSDKUsageError(
+                    "A client can't be given both a transport and connection "
+                    "pool settings. Configure the pool on the transport.")
+            return transport
+        if all(arg is None for arg in pool_args):
+            return get_default_transport()
+
+        if pool_connections is None:
+            pool_connections = config.get_http_pool_connections(environment)
+        if pool_maxsize is None:
+            pool_maxsize = config.get_http_pool_maxsize(environment)
+        if pool_block is None:
+            pool_block = config.get_http_pool_block(environment)
+        return HTTPTransport(pool_connections=pool_connections,
+                             pool_maxsize=pool_maxsize, pool_block=pool_block)
+
     def set_app_name(self, app_name):
         """
         Set an application name to send to Globus services as part of the User
@@ -168,13 +313,14 @@ class BaseClient(object):
         :return: :class:`GlobusHTTPResponse \
         <globus_sdk.response.GlobusHTTPResponse>` object
         """
-        self.logger.debug('GET to {} with params {}'.format(path, params))
+        self.logger.debug('GET to %s with params %s', path, params)
         return self._request("GET", path, params=params, headers=headers,
                              response_class=response_class,
                              retry_401=retry_401)
 
     def post(self, path, json_body=None, params=None, headers=None,
-             text_body=None, response_class=None, retry_401=True):
+             text_body=None, response_class=None, retry_401=True,
+             compress=None):
         """
         Make a POST request to the specified path.
 
@@ -204,14 +350,19 @@ class BaseClient(object):
               Retry on 401 responses with fresh Authorization if
               ``self.authorizer`` supports it
 
+            ``compress`` (*bool*)
+              Send the body gzip compressed (``True``) or not (``False``),
+              whatever its size. Defaults to compressing bodies of at least
+              the client's ``compress_min_bytes``
+
         :return: :class:`GlobusHTTPResponse \
         <globus_sdk.response.GlobusHTTPResponse>` object
         """
-        self.logger.debug('POST to {} with params {}'.format(path, params))
+        self.logger.debug('POST to %s with params %s', path, params)
         return self._request("POST", path, json_body=json_body, params=params,
                              headers=headers, text_body=text_body,
                              response_class=response_class,
-                             retry_401=retry_401)
+                             retry_401=retry_401, compress=compress)
 
     def delete(self, path, params=None, headers=None,
                response_class=None, retry_401=True):
@@ -240,14 +391,15 @@ class BaseClient(object):
         :return: :class:`GlobusHTTPResponse \
         <globus_sdk.response.GlobusHTTPResponse>` object
         """
-        self.logger.debug('DELETE to {} with params {}'.format(path, params))
+        self.logger.debug('DELETE to %s with params %s', path, params)
         return self._request("DELETE", path, params=params,
                              headers=headers,
                              response_class=response_class,
                              retry_401=retry_401)
 
     def put(self, path, json_body=None, params=None, headers=None,
-            text_body=None, response_class=None, retry_401=True):
+            text_body=None, response_class=None, retry_401=True,
+            compress=None):
         """
         Make a PUT request to the specified path.
 
@@ -277,18 +429,23 @@ class BaseClient(object):
               Retry on 401 responses with fresh Authorization if
               ``self.authorizer`` supports it
 
+            ``compress`` (*bool*)
+              Send the body gzip compressed (``True``) or not (``False``),
+              whatever its size. Defaults to compressing bodies of at least
+              the client's ``compress_min_bytes``
+
         :return: :class:`GlobusHTTPResponse \
         <globus_sdk.response.GlobusHTTPResponse>` object
         """
-        self.logger.debug('PUT to {} with params {}'.format(path, params))
+        self.logger.debug('PUT to %s with params %s', path, params)
         return self._request("PUT", path, json_body=json_body, params=params,
                              headers=headers, text_body=text_body,
                              response_class=response_class,
-                             retry_401=retry_401)
+                             retry_401=retry_401, compress=compress)
 
     def _request(self, method, path, params=None, headers=None,
                  json_body=None, text_body=None,
-                 response_class=None, retry_401=True):
+                 response_class=None, retry_401=True, compress=None):
         """
 
         **Parameters**
@@ -320,72 +477,328 @@ class BaseClient(object):
               Retry on 401 responses with fresh Authorization if
               ``self.authorizer`` supports it
 
+            ``compress`` (*bool*)
+              Send the body gzip compressed (``True``) or not (``False``),
+              whatever its size. Defaults to compressing bodies of at least
+              the client's ``compress_min_bytes``
+
         :return: :class:`GlobusHTTPResponse \
         <globus_sdk.response.GlobusHTTPResponse>` object
         """
-        # copy
-        rheaders = dict(self._headers)
-        # expand
-        if headers is not None:
-            rheaders.update(headers)
-
-        if json_body is not None:
-            assert text_body is None
-            text_body = json.dumps(json_body)
-            # set appropriate content-type header
-            rheaders.update({'Content-Type': 'application/json'})
+        rheaders, text_body = self._prepare_request(headers, json_body,
+                                                    text_body, compress)
 
         # add Authorization header, or (if it's a NullAuthorizer) possibly
         # explicitly remove the Authorization header
-        if self.authorizer is not None:
-            self.logger.debug('request will have authorization of type {}'
-                              .format(type(self.authorizer)))
-            self.authorizer.set_authorization_header(rheaders)
+        authorization = self._authorize(rheaders)
 
         url = slash_join(self.base_url, path)
-        self.logger.debug('request will hit URL:{}'.format(url))
-
-        # because a 401 can trigger retry, we need to wrap the retry-able thing
-        # in a method
-        def send_request():
+        self.logger.debug('request will hit URL:%s', url)
+
+        # answer from the response cache when possible
+        cache_lookup = self._check_cache(method, path, params, rheaders)
+        if cache_lookup is not None and cache_lookup.response is not None:
+            return self._finish_request(cache_lookup.response, response_class)
+
+        # share the round-trip of an identical request already in flight
+        if (self.request_coalescer is not None and
+                method in coalesce.SAFE_METHODS):
+            def send():
+                res = self._send_request(
+                    method, path, url, params, rheaders, json_body,
+                    text_body, authorization, cache_lookup, response_class,
+                    retry_401)
+                # decode once, for all of the requests sharing the response
+                if isinstance(res, GlobusHTTPResponse) and (
+                        'application/json' in res.content_type):
+                    res.data
+                return res
+
+            res, shared = self.request_coalescer.run(
+                coalesce.request_key(method, url, params, rheaders), send)
+            if shared:
+                res = self._share_response(res, response_class)
+            return res
+
+        return self._send_request(method, path, url, params, rheaders,
+                                  json_body, text_body, authorization,
+                                  cache_lookup, response_class, retry_401)
+
+    def _send_request(self, method, path, url, params, rheaders, json_body,
+                      text_body, authorization, cache_lookup, response_class,
+                      retry_401):
+        """
+        Send a prepared request, handling retries, and get its response
+        object. ``authorization`` is the result of ``_authorize()``, and
+        ``cache_lookup`` is the result of ``_check_cache()``.
+        """
+        # because a 401 or a transient error can trigger retry, we need to wrap
+        # the retry-able thing in a method
+        def send_request(event):
             try:
-                return self._session.request(
-                    method=method, url=url, headers=rheaders, params=params,
+                start = timer()
+                r = self.transport.request(
+                    method, url, headers=rheaders, params=params,
                     data=text_body, verify=self._verify,
-                    timeout=self._http_timeout)
+                    timeout=self._http_timeout, stream=True)
+                event.timings['request'] = timer() - start
+                # read the body now, so that the time taken is known
+                start = timer()
+                r.content
+                event.timings['body_read'] = timer() - start
+                return r
             except requests.RequestException as e:
                 self.logger.error("NetworkError on request")
                 raise exc.convert_request_exception(e)
 
-        # initial request
-        r = send_request()
+        # send the request, retrying on 401s (at most once, and only if the
+        # authorizer can do something about it) and on transient errors (as
+        # many times as the retry policy allows)
+        # `attempt` counts the retries made under the retry policy
+        attempt = 0
+        retried_401 = False
+        while True:
+            event = self._new_request_event(method, path, url, params,
+                                            text_body, attempt, authorization)
+            authorization = None
+            self.hooks.fire(BEFORE_REQUEST, event)
+            try:
+                r = send_request(event)
+            except exc.NetworkError as err:
+                event.error = err
+                event.finish()
+                if not self.retry_policy.should_retry(
+                        attempt, method, json_body, error=err):
+                    self._update_cache(method, path, cache_lookup, None)
+                    self.hooks.fire(ON_ERROR, event)
+                    raise
+                self._fire_retry(event, self._retry_delay(attempt, err))
+                self.retry_policy.sleep(event.retry_delay)
+                attempt += 1
+                continue
+
+            self.logger.debug('Request made to URL: %s', r.url)
+            event.set_response(r)
+
+            # potential 401 retry handling
+            if self._should_retry_401(r, retry_401, retried_401):
+                retried_401 = True
+                # note that although handle_missing_authorization returns a
+                # T/F value, it may actually mutate the state of the
+                # authorizer and therefore change the value set by the
+                # `set_authorization_header` method
+                if self.authorizer.handle_missing_authorization():
+                    self.logger.debug('request can be retried')
+                    event.finish()
+                    self.hooks.fire(AFTER_RESPONSE, event)
+                    self._fire_retry(event, 0)
+                    authorization = self._authorize(rheaders)
+                    continue
+
+            if self.retry_policy.should_retry(attempt, method, json_body,
+                                              response=r):
+                event.finish()
+                self.hooks.fire(AFTER_RESPONSE, event)
+                self._fire_retry(event, self._retry_delay(
+                    attempt, r.status_code, response=r))
+                self.retry_policy.sleep(event.retry_delay)
+                attempt += 1
+                continue
+
+            break
+
+        r = self._update_cache(method, path, cache_lookup, r)
+        return self._finish_request_with_hooks(event, r, response_class)
+
+    def _authorize(self, rheaders):
+        """
+        Set the Authorization header for a request.
+
+        :return: a ``(duration, token_refreshed)`` tuple, or None if the client
+                 has no authorizer
+        """
+        if self.authorizer is None:
+            return None
+        self.logger.debug('request will have authorization of type %s',
+                          type(self.authorizer))
+        refresh = isinstance(self.authorizer, RenewingAuthorizer) and (
+            self.authorizer._needs_new_access_token())
+        start = timer()
+        self.authorizer.set_authorization_header(rheaders)
+        return timer() - start, refresh
+
+    def _new_request_event(self, method, path, url, params, body, attempt,
+                           authorization):
+        """
+        Create the :class:`RequestEvent <globus_sdk.hooks.RequestEvent>` for
+        an attempt at sending a request. ``authorization`` is the result of
+        ``_authorize()``, if authorization was set for this attempt.
+        """
+        event = RequestEvent(
+            self, method, path, url, params=params, attempt=attempt,
+            request_bytes=_body_bytes(body))
+        if isinstance(body, GzipBody):
+            event.compression = body.stats()
+        if authorization is not None:
+            event.timings['authorize'], event.token_refreshed = authorization
+        return event
+
+    def _share_response(self, res, response_class):
+        """
+        Get a response object of this client's own for a response which was
+        received by a coalesced request, sharing its decoded data.
+        """
+        if response_class is None:
+            response_class = self.default_response_class
+        shared = response_class(res._data, client=self)
+        if isinstance(res, GlobusHTTPResponse) and isinstance(
+                shared, GlobusHTTPResponse):
+            shared._parsed_json = res.data
+        return shared
+
+    def _check_cache(self, method, path, params, rheaders):
+        """
+        Look up a GET request in the response cache, adding conditional
+        headers to ``rheaders`` if a stale response is cached.
+
+        :return: a :class:`CacheLookup <globus_sdk.cache.CacheLookup>`, or
+                 None if the request can't be cached
+        """
+        if self.response_cache is None or method != 'GET':
+            return None
+        return self.response_cache.lookup(self.base_url, path, params,
+                                          rheaders)
+
+    def _update_cache(self, method, path, cache_lookup, r):
+        """
+        Update the response cache with the final response to a request, or
+        invalidate the entries which a POST, PUT, or DELETE may have changed,
+        whether or not it succeeded. ``r`` is None if the request failed
+        without a response.
 
-        self.logger.debug('Request made to URL: {}'.format(r.url))
+        :return: the response to use, which is the cached response if ``r`` is
+                 a ``304 Not Modified``
+        """
+        if self.response_cache is None:
+            return r
+        if cache_lookup is None:
+            if method != 'GET':
+                self.response_cache.invalidate(
+                    self.base_url, path,
+                    related_groups=self.cache_related_groups)
+            return r
+        if r is None:
+            return r
+        return self.response_cache.update(cache_lookup, r)
+
+    def _fire_retry(self, event, delay):
+        event.retry_delay = delay
+        self.hooks.fire(ON_RETRY, event)
+
+    def _finish_request_with_hooks(self, event, r, response_class):
+        """
+        Call ``_finish_request`` for the final response to a request, and fire
+        the ``after_response`` and ``on_error`` hooks.
+        """
+        start = timer()
+        try:
+            result = self._finish_request(r, response_class)
+            # decode now, rather than on first access, so that it is timed
+            if self.hooks.has_callbacks(AFTER_RESPONSE) and (
+                    'application/json' in r.headers.get('Content-Type', '')):
+                result.data
+        except exc.GlobusError as err:
+            event.timings['decode'] = timer() - start
+            event.error = err
+            event.finish()
+            self.hooks.fire(AFTER_RESPONSE, event)
+            self.hooks.fire(ON_ERROR, event)
+            raise
+        event.timings['decode'] = timer() - start
+        event.finish()
+        self.hooks.fire(AFTER_RESPONSE, event)
+        return result
+
+    def _prepare_request(self, headers, json_body, text_body, compress=None):
+        """
+        Build the headers (minus Authorization) and the body of a request,
+        compressing the body as set by ``compress`` and the client.
 
-        # potential 401 retry handling
-        if r.status_code == 401 and retry_401 and self.authorizer is not None:
+        :return: a ``(headers, body)`` tuple
+        """
+        # copy
+        rheaders = dict(self._headers)
+        # expand
+        if headers is not None:
+            rheaders.update(headers)
+
+        if json_body is not None:
+            assert text_body is None
+            if (self.json_stream_min_items is not None and
+                    has_long_list(json_body, self.json_stream_min_items)):
+                self.logger.debug('Streaming the JSON body of the request')
+                text_body = JSONStreamBody(json_body, self.json_codec)
+            else:
+                text_body = self.json_codec.dumps(json_body)
+            # set appropriate content-type header
+            rheaders.update({'Content-Type': 'application/json'})
+
+        # form bodies, and bodies which are already encoded, are sent as-is
+        if (text_body is not None and not isinstance(text_body, dict) and
+                (compress or (compress is None and
+                              self.compress_min_bytes is not None)) and
+                not any(name.lower() == 'content-encoding'
+                        for name in rheaders)):
+            compressed = gzip_body(
+                text_body, self.compress_level,
+                min_bytes=0 if compress else self.compress_min_bytes)
+            if compressed is not None:
+                text_body = compressed
+                rheaders['Content-Encoding'] = 'gzip'
+
+        return rheaders, text_body
+
+    def _should_retry_401(self, r, retry_401, retried_401):
+        """
+        Check if a response is a 401 which the authorizer may be able to fix.
+        """
+        if (r.status_code == 401 and retry_401 and not retried_401 and
+                self.authorizer is not None):
             self.logger.debug('request got 401, checking retry-capability')
-            # note that although handle_missing_authorization returns a T/F
-            # value, it may actually mutate the state of the authorizer and
-            # therefore change the value set by the `set_authorization_header`
-            # method
-            if self.authorizer.handle_missing_authorization():
-                self.logger.debug('request can be retried')
-                self.authorizer.set_authorization_header(rheaders)
-                r = send_request()
+            return True
+        return False
 
+    def _finish_request(self, r, response_class):
+        """
+        Wrap the final HTTP response of a request in a response object, or
+        raise an error if it was not successful.
+        """
         if 200 <= r.status_code < 400:
-            self.logger.debug('request completed with response code: {}'
-                              .format(r.status_code))
+            self.logger.debug('request completed with response code: %s',
+                              r.status_code)
             if response_class is None:
                 return self.default_response_class(r, client=self)
             else:
                 return response_class(r, client=self)
 
-        self.logger.debug('request completed with (error) response code: {}'
-                          .format(r.status_code))
+        self.logger.debug('request completed with (error) response code: %s',
+                          r.status_code)
+        # so that the error body is decoded with this client's codec
+        r._json_codec = self.json_codec
         raise self.error_class(r)
 
+    def _retry_delay(self, attempt, reason, response=None):
+        """
+        Get the delay chosen by the retry policy before retry number
+        ``attempt``. ``reason`` is the status code or error being retried, and
+        is used only for logging.
+        """
+        delay = self.retry_policy.compute_delay(attempt, response=response)
+        self.logger.warning('request failed (%s), retrying in %.2fs (retry '
+                            '%s of %s)', reason, delay, attempt + 1,
+                            self.retry_policy.max_retries)
+        return delay
+
 
 def slash_join(a, b):
     """
@@ -444,6 +857,23 @@ def merge_params(base_params, **more_params):
             base_params[param] = more_params[param]
 
 
+def _body_bytes(body):
+    """
+    The size of a request body as it is sent, in bytes.
+    """
+    if body is None:
+        return 0
+    if isinstance(body, dict):
+        # form encoded, as requests will
+        body = requests.models.RequestEncodingMixin._encode_params(body)
+    if isinstance(body, six.text_type):
+        # on python3, checking whether text is ASCII doesn't scan it
+        if getattr(body, 'isascii', None) is not None and body.isascii():
+            return len(body)
+        body = body.encode('utf-8')
+    return len(body)
+
+
 def safe_stringify(value):
     """
     Converts incoming value to a unicode string. Convert bytes by decoding,
@@ -0,0 +1,483 @@
+"""
+An opt-in cache of the responses to GET requests made by a
+:class:`BaseClient <globus_sdk.base.BaseClient>`, for resources which are read
+far more often than they change, like endpoint documents and bookmark lists.
+
+Entries are kept in memory, and optionally on disk. How long an entry stays
+fresh is given by the ``Cache-Control`` header of the response, or else by the
+TTL configured for its route. Stale entries with an ``ETag`` or
+``Last-Modified`` header are revalidated with a conditional request, so that
+an unchanged resource costs a ``304 Not Modified`` rather than a full body.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+import requests
+import six
+from requests.structures import CaseInsensitiveDict
+
+from globus_sdk import exc
+from globus_sdk.hooks import path_template
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache(object):
+    """
+    A ``ResponseCache`` stores the responses to successful GET requests, and
+    answers repeated requests from them while they are fresh.
+
+    Pass one to any client as ``response_cache``. A cache may be shared by
+    several clients, as entries are keyed by full URL, query params, and the
+    Authorization header of the request, so that responses are never shared
+    between different credentials. A new access token therefore starts with
+    an empty cache.
+
+    An entry is fresh for ``max-age`` seconds if the response has a
+    ``Cache-Control: max-age`` header, and never stored if it has
+    ``Cache-Control: no-store``. Otherwise, it is fresh for the TTL of its
+    route, or ``default_ttl``. Stale entries are revalidated with
+    ``If-None-Match`` or ``If-Modified-Since`` when the response had an
+    ``ETag`` or ``Last-Modified`` header, and refetched otherwise.
+    With the default TTL of 0, every request is revalidated, so the cache
+    never returns outdated data, but unchanged bodies are not downloaded again.
+
+    Any POST, PUT, or DELETE sent by a client with a cache invalidates the
+    cached entries of that client's service which share the first segment of
+    its path, ignoring a trailing ``_list``. For example, updating
+    ``endpoint/<id>`` invalidates every cached ``endpoint/...`` response, and
+    deleting ``bookmark/<id>`` invalidates ``bookmark_list``.
+    A client may also name other groups changed by a request, in its
+    ``cache_related_groups``. ``TransferClient`` does so for task submission
+    and cancellation, which invalidate cached ``task_list``, ``task/<id>`` and
+    ``endpoint_manager/...`` responses, and for endpoint changes, which
+    invalidate ``endpoint_search``. Other routes changed as a side effect of a
+    request are not invalidated, so give them a short TTL, if any.
+
+    Fresh responses are returned without sending a request, so no
+    :class:`hooks <globus_sdk.hooks.ClientHooks>` are called for them.
+
+    **Parameters**
+
+        ``max_entries`` (*int*)
+          Maximum number of entries kept in memory. The least recently used
+          entry is evicted first. Defaults to 256.
+
+        ``default_ttl`` (*float*)
+          Seconds for which responses without ``Cache-Control: max-age`` stay
+          fresh, unless their route has a TTL of its own. Defaults to 0.
+
+        ``route_ttls`` (*dict*)
+          TTLs in seconds by route, where a route is a path relative to the
+          client's base URL with IDs replaced by ``{id}``, as in
+          :func:`path_template <globus_sdk.hooks.path_template>`. For example,
+          ``{"/endpoint/{id}": 300, "/bookmark_list": 60}``
+
+        ``cache_dir`` (*string*)
+          A directory in which to also store entries, so that they outlive
+          memory eviction and the process. Response bodies are written there
+          as-is, in files readable only by the current user. Defaults to no
+          disk storage. Entries written to the directory by other processes
+          after this cache was made are not invalidated by it
+    """
+    def __init__(self, max_entries=256, default_ttl=0, route_ttls=None,
+                 cache_dir=None):
+        if max_entries < 1:
+            raise exc.GlobusSDKUsageError(
+                'ResponseCache.max_entries must be >= 1, got {}'
+                .format(max_entries))
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.route_ttls = dict(route_ttls or {})
+        self.cache_dir = cache_dir
+        if cache_dir is not None and not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        # hashes of the groups with entries on disk, so that invalidating a
+        # group with none does not list the directory
+        self._disk_groups = set()
+        if cache_dir is not None:
+            self._disk_groups.update(
+                name.split('-', 1)[0] for name in os.listdir(cache_dir)
+                if name.endswith('.entry'))
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def lookup(self, base_url, path, params, headers):
+        """
+        Look up the cached response to a GET request to ``path`` under
+        ``base_url``, given the headers it is about to be sent with, including
+        Authorization.
+        If there is a stale entry, conditional request headers are added to
+        ``headers``.
+
+        :return: a :class:`CacheLookup`, whose ``response`` is set if a fresh
+                 response was found
+        """
+        key = _make_key(base_url, path, params, headers)
+        group = _group(base_url, path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                # move to the most recently used end
+                del self._entries[key]
+                self._entries[key] = entry
+        if entry is None and self.cache_dir is not None:
+            entry = self._read_disk_entry(key, group)
+            if entry is not None:
+                self._put(key, entry)
+
+        if entry is not None and entry.is_fresh():
+            with self._lock:
+                self._hits += 1
+            logger.debug('Cache hit for %s', path)
+            return CacheLookup(key, group, path, entry, entry.to_response())
+
+        if entry is not None:
+            if entry.etag is not None:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified is not None:
+                headers['If-Modified-Since'] = entry.last_modified
+        return CacheLookup(key, group, path, entry, None)
+
+    def update(self, lookup, response):
+        """
+        Update the cache with the final response to a GET request which was
+        looked up with :meth:`lookup`.
+
+        :return: the response to give to the caller. A ``304 Not Modified``
+                 to a conditional request is replaced with the cached response
+        """
+        entry = lookup.entry
+        if response.status_code == 304 and entry is not None:
+            lifetime = self._lifetime(lookup.path, response)
+            if lifetime is None:
+                self._discard(lookup.key, lookup.group)
+            else:
+                entry.refresh(response, lifetime)
+                self._store(lookup.key, entry)
+            with self._lock:
+                self._revalidations += 1
+            logger.debug('Cache revalidated %s', response.url)
+            return entry.to_response()
+
+        with self._lock:
+            self._misses += 1
+        if response.status_code != 200:
+            return response
+
+        lifetime = self._lifetime(lookup.path, response)
+        if lifetime is None or not (lifetime > 0 or
+                                    'ETag' in response.headers or
+                                    'Last-Modified' in response.headers):
+            # nothing to gain from storing it
+            self._discard(lookup.key, lookup.group)
+        else:
+            self._store(lookup.key, _CacheEntry.from_response(
+                response, lifetime, lookup.group))
+        return response
+
+    def invalidate(self, base_url, path, related_groups=None):
+        """
+        Drop the entries which may be changed by a request to ``path`` under
+        ``base_url``.
+
+        ``related_groups`` maps the first segment of a path, without any
+        ``_list`` suffix, to the first segments of other paths whose entries
+        are also changed by requests to it, as in a client's
+        ``cache_related_groups``.
+        """
+        group = _group(base_url, path)
+        groups = set([group])
+        groups.update((group[0], root)
+                      for root in (related_groups or {}).get(group[1], ()))
+        with self._lock:
+            keys = [key for key, entry in self._entries.items()
+                    if entry.group in groups]
+            for key in keys:
+                del self._entries[key]
+            self._invalidations += len(keys)
+            prefixes = tuple(_group_hash(g) for g in groups
+                             if _group_hash(g) in self._disk_groups)
+            self._disk_groups.difference_update(prefixes)
+        if prefixes:
+            prefixes = tuple(prefix + '-' for prefix in prefixes)
+            for name in os.listdir(self.cache_dir):
+                if name.startswith(prefixes):
+                    _remove(os.path.join(self.cache_dir, name))
+        if keys:
+            logger.debug('Cache invalidated %s entries for %s', len(keys),
+                         path)
+
+    def clear(self):
+        """
+        Drop all entries, from memory and from disk.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._disk_groups.clear()
+        if self.cache_dir is not None:
+            for name in os.listdir(self.cache_dir):
+                if name.endswith('.entry'):
+                    _remove(os.path.join(self.cache_dir, name))
+
+    def stats(self):
+        """
+        Get a dict of cache counters:
+
+        ``hits``
+          Number of requests answered from the cache, without a request
+
+        ``revalidations``
+          Number of requests answered from the cache after a ``304``
+
+        ``misses``
+          Number of requests which fetched a full response
+
+        ``evictions``
+          Number of entries evicted from memory to make room for others
+
+        ``invalidations``
+          Number of entries dropped because of a POST, PUT, or DELETE
+
+        ``entries``
+          Number of entries currently in memory
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'revalidations': self._revalidations,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'invalidations': self._invalidations,
+                'entries': len(self._entries),
+            }
+
+    def _lifetime(self, path, response):
+        """
+        Get the number of seconds for which a response stays fresh, or None if
+        it must not be stored.
+        """
+        directives = _parse_cache_control(
+            response.headers.get('Cache-Control'))
+        if 'no-store' in directives:
+            return None
+        if 'no-cache' in directives:
+            return 0
+        if 'max-age' in directives:
+            try:
+                max_age = float(directives['max-age'])
+                age = float(response.headers.get('Age', 0))
+            except ValueError:
+                pass
+            else:
+                return max(0, max_age - age)
+        return self.route_ttls.get(path_template(path), self.default_ttl)
+
+    def _put(self, key, entry):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def _store(self, key, entry):
+        self._put(key, entry)
+        if self.cache_dir is not None:
+            self._write_disk_entry(key, entry)
+
+    def _discard(self, key, group):
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.cache_dir is not None:
+            _remove(self._disk_path(key, group))
+
+    def _disk_path(self, key, group):
+        # entries are named after their group, so that they can be found for
+        # invalidation without being read
+        return os.path.join(self.cache_dir, '{}-{}.entry'.format(
+            _group_hash(group), _hash(key)))
+
+    def _write_disk_entry(self, key, entry):
+        path = self._disk_path(key, entry.group)
+        with self._lock:
+            self._disk_groups.add(_group_hash(entry.group))
+        header = json.dumps({'key': key, 'entry': entry.to_dict()})
+        # write to a private temporary file, then move it into place, so that
+        # readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(header.encode('utf-8') + b'\n')
+                f.write(entry.content)
+            _replace(tmp_path, path)
+        except (IOError, OSError) as err:
+            logger.warning('Failed to write cache entry %s: %s', path, err)
+            _remove(tmp_path)
+
+    def _read_disk_entry(self, key, group):
+        path = self._disk_path(key, group)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as f:
+                header = json.loads(f.readline().decode('utf-8'))
+                content = f.read()
+        except (IOError, OSError, ValueError) as err:
+            logger.warning('Failed to read cache entry %s: %s', path, err)
+            return None
+        if header['key'] != key:
+            return None
+        return _CacheEntry.from_dict(header['entry'], content)
+
+
+class CacheLookup(object):
+    """
+    The result of :meth:`ResponseCache.lookup`.
+
+    :ivar key: The cache key of the request (str)
+    :ivar group: The group of entries invalidated together with this one
+    :ivar path: Path of the request (str)
+    :ivar entry: The cached entry, fresh or stale, or None
+    :ivar response: A ``requests.Response`` built from a fresh entry, or None
+    """
+    def __init__(self, key, group, path, entry, response):
+        self.key = key
+        self.group = group
+        self.path = path
+        self.entry = entry
+        self.response = response
+
+
+class _CacheEntry(object):
+    """
+    A stored response, with the time until which it is fresh.
+    """
+    __slots__ = ('status', 'reason', 'headers', 'content', 'encoding', 'url',
+                 'etag', 'last_modified', 'expires_at', 'group')
+
+    # attributes stored in the header of disk entries
+    FIELDS = ('status', 'reason', 'headers', 'encoding', 'url', 'etag',
+              'last_modified', 'expires_at', 'group')
+
+    def __init__(self, **kwargs):
+        for name in self.__slots__:
+            setattr(self, name, kwargs.get(name))
+
+    @classmethod
+    def from_response(cls, response, lifetime, group):
+        return cls(status=response.status_code, reason=response.reason,
+                   headers=dict(response.headers), content=response.content,
+                   encoding=response.encoding, url=response.url,
+                   etag=response.headers.get('ETag'),
+                   last_modified=response.headers.get('Last-Modified'),
+                   expires_at=time.time() + lifetime, group=group)
+
+    @classmethod
+    def from_dict(cls, data, content):
+        kwargs = dict((name, data.get(name)) for name in cls.FIELDS)
+        kwargs['group'] = tuple(kwargs['group'])
+        return cls(content=content, **kwargs)
+
+    def to_dict(self):
+        return dict((name, getattr(self, name)) for name in self.FIELDS)
+
+    def is_fresh(self):
+        return time.time() < self.expires_at
+
+    def refresh(self, response, lifetime):
+        """
+        Update the entry from a ``304 Not Modified`` response.
+        """
+        for name in ('Cache-Control', 'Date', 'ETag', 'Expires',
+                     'Last-Modified'):
+            if name in response.headers:
+                self.headers[name] = response.headers[name]
+        self.etag = self.headers.get('ETag')
+        self.last_modified = self.headers.get('Last-Modified')
+        self.expires_at = time.time() + lifetime
+
+    def to_response(self):
+        response = requests.Response()
+        response.status_code = self.status
+        response.reason = self.reason
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.content
+        response.encoding = self.encoding
+        response.url = self.url
+        return response
+
+
+def _make_key(base_url, path, params, headers):
+    """
+    Get the cache key of a GET request, as a string. The Authorization header
+    is hashed, so that credentials are not kept in memory or written to disk.
+    """
+    params = sorted([six.text_type(k), six.text_type(v)]
+                    for k, v in (params or {}).items())
+    authorization = headers.get('Authorization')
+    return json.dumps([
+        base_url.rstrip('/'), path.strip('/'), params,
+        _hash(authorization) if authorization is not None else None])
+
+
+def _group(base_url, path):
+    """
+    Get the group of entries which a request to ``path`` may change: the
+    first path segment, without any ``_list`` suffix.
+    """
+    root = path.strip('/').split('/', 1)[0]
+    if root.endswith('_list'):
+        root = root[:-len('_list')]
+    return (base_url.rstrip('/'), root)
+
+
+def _group_hash(group):
+    return _hash(json.dumps(list(group)))[:16]
+
+
+def _hash(value):
+    return hashlib.sha256(value.encode('utf-8')).hexdigest()
+
+
+def _parse_cache_control(value):
+    """
+    Parse a ``Cache-Control`` header into a dict of directives, with None for
+    directives which have no value.
+    """
+    directives = {}
+    for directive in (value or '').split(','):
+        name, _, arg = directive.strip().partition('=')
+        if name:
+            directives[name.lower()] = arg.strip('"') if arg else None
+    return directives
+
+
+def _replace(src, dst):
+    # os.rename won't replace an existing file on Windows
+    replace = getattr(os, 'replace', None)
+    if replace is not None:
+        replace(src, dst)
+    else:  # python2
+        if os.name == 'nt':
+            _remove(dst)
+        os.rename(src, dst)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
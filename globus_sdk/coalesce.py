@@ -0,0 +1,134 @@
+"""
+Coalescing of identical concurrent requests made by
+:class:`BaseClient <globus_sdk.base.BaseClient>` instances, also known as
+"singleflight".
+
+When several threads send the same GET at the same time, only the first one
+goes to the network. The others wait for it to finish, and get the same
+response, or the same error.
+"""
+import hashlib
+import json
+import logging
+import threading
+
+import six
+
+logger = logging.getLogger(__name__)
+
+#: methods which are safe to coalesce, as they don't change anything
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class RequestCoalescer(object):
+    """
+    A ``RequestCoalescer`` lets identical requests which are in flight at the
+    same time share a single HTTP round-trip.
+
+    Pass one to any client as ``request_coalescer``. Requests are identical
+    when they have the same method, URL, query params, and headers, including
+    Authorization, so requests made with different credentials are never
+    shared. A coalescer may be shared by several clients, e.g. one per
+    thread, so that their requests are coalesced together.
+
+    Only safe methods (GET, HEAD, and OPTIONS) are coalesced. Requests which
+    are not concurrent are not affected in any way: nothing is cached once a
+    request completes.
+
+    The response body is decoded once, and every caller gets a response
+    object of its own wrapping the same data, so the data should be treated
+    as read-only. Hooks are only called for the request which is actually
+    sent.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._sent = 0
+        self._coalesced = 0
+
+    def run(self, key, send):
+        """
+        Call ``send()`` to make the request identified by ``key``, unless an
+        identical request is already in flight, in which case wait for it.
+
+        :return: a ``(result, shared)`` tuple, where ``result`` is the return
+                 value of the ``send()`` which was called, and ``shared`` is
+                 True if it was called by another thread. Errors raised by
+                 ``send()`` are raised in every waiting thread
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._sent += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            logger.debug('Waiting for identical request in flight')
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = send()
+        except Exception as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def stats(self):
+        """
+        Get a dict of counters:
+
+        ``sent``
+          Number of requests sent
+
+        ``coalesced``
+          Number of requests which waited for an identical one instead of
+          being sent
+
+        ``in_flight``
+          Number of distinct requests currently in flight
+        """
+        with self._lock:
+            return {
+                'sent': self._sent,
+                'coalesced': self._coalesced,
+                'in_flight': len(self._calls),
+            }
+
+
+class _Call(object):
+    """
+    A request in flight, and its outcome once it is done.
+    """
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def request_key(method, url, params, headers):
+    """
+    Get a string identifying a request. The Authorization header is hashed,
+    so that credentials are not kept in memory.
+    """
+    headers = dict(headers)
+    if 'Authorization' in headers:
+        headers['Authorization'] = hashlib.sha256(
+            headers['Authorization'].encode('utf-8')).hexdigest()
+    return json.dumps([
+        method, url,
+        sorted([six.text_type(k), six.text_type(v)]
+               for k, v in (params or {}).items()),
+        sorted([six.text_type(k), six.text_type(v)]
+               for k, v in headers.items())])
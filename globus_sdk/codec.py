@@ -0,0 +1,257 @@
+"""
+JSON codecs used by clients to encode request bodies and to decode response
+and error bodies.
+
+The standard library ``json`` module is always available. When ``orjson`` or
+``ujson`` is installed, it is used instead, as these are several times faster
+on the large documents which are typical of Transfer submissions and Search
+ingests.
+
+Every codec encodes objects with a ``for_json()`` method, such as the compact
+:class:`ItemList <globus_sdk.transfer.data.ItemList>` of a ``TransferData``,
+as the JSON data which that method returns.
+
+Documents with very long lists, such as large Transfer submissions, may be
+encoded a part at a time, as they are sent, with a :class:`JSONStreamBody`.
+"""
+import json
+import logging
+try:
+    from collections.abc import Sequence
+except ImportError:  # python2
+    from collections import Sequence
+
+import six
+
+from globus_sdk import config, exc
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+    # ujson before 2.0 rounds floats when encoding, and before 5.0 it has no
+    # default function for objects it can't encode
+    if int(ujson.__version__.split('.')[0]) < 5:
+        ujson = None
+except (ImportError, AttributeError, ValueError):
+    ujson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _for_json(obj):
+    """
+    The default function of every codec, called with objects which the JSON
+    library can't encode.
+    """
+    for_json = getattr(obj, 'for_json', None)
+    if for_json is None:
+        raise TypeError('Object of type {} is not JSON serializable'
+                        .format(type(obj).__name__))
+    return for_json()
+
+
+class JSONCodec(object):
+    """
+    A ``JSONCodec`` converts between Python data and JSON documents, using the
+    standard library ``json`` module. Subclasses use faster libraries.
+
+    A codec may be passed to any client as ``json_codec``.
+    """
+    #: the name used to select this codec, e.g. in the ``json_codec`` config
+    name = 'json'
+
+    def dumps(self, obj):
+        """
+        Encode ``obj`` as a JSON document, returned as ``str`` or ``bytes``.
+        """
+        return json.dumps(obj, default=_for_json)
+
+    def loads(self, data):
+        """
+        Decode a JSON document given as ``str`` or UTF-8 ``bytes``. Raises a
+        ``ValueError`` if the document is not valid JSON.
+        """
+        if isinstance(data, six.binary_type):
+            data = data.decode('utf-8')
+        return json.loads(data)
+
+    def load_response(self, response):
+        """
+        Decode the body of a ``requests.Response``. Raises a ``ValueError`` if
+        the body is not valid JSON.
+        """
+        # requests detects the encoding of the body, as this codec always has
+        return response.json()
+
+    def __repr__(self):
+        return '{}()'.format(self.__class__.__name__)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    A ``JSONCodec`` which uses `orjson <https://github.com/ijl/orjson>`_.
+    """
+    name = 'orjson'
+
+    def dumps(self, obj):
+        # the stdlib allows non-string keys, converting them to strings
+        return orjson.dumps(obj, default=_for_json,
+                            option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+    def load_response(self, response):
+        return self.loads(response.content)
+
+
+class UjsonCodec(JSONCodec):
+    """
+    A ``JSONCodec`` which uses
+    `ujson <https://github.com/ultrajson/ultrajson>`_.
+    """
+    name = 'ujson'
+
+    def dumps(self, obj):
+        return ujson.dumps(obj, escape_forward_slashes=False,
+                           default=_for_json)
+
+    def loads(self, data):
+        return ujson.loads(data)
+
+    def load_response(self, response):
+        return self.loads(response.content)
+
+
+# codecs in order of preference, along with the module each one needs
+_CODECS = (
+    (OrjsonCodec, lambda: orjson),
+    (UjsonCodec, lambda: ujson),
+    (JSONCodec, lambda: json),
+)
+_codec_instances = {}
+
+
+def get_codec(name='auto'):
+    """
+    Get a ``JSONCodec`` by name: ``orjson``, ``ujson``, or ``json``.
+    ``auto`` gets the fastest codec which is installed.
+    """
+    if name not in _codec_instances:
+        for codec_class, module in _CODECS:
+            if name not in ('auto', codec_class.name):
+                continue
+            if module() is not None:
+                logger.debug('Using JSON codec %s', codec_class.name)
+                _codec_instances[name] = codec_class()
+                break
+            if name != 'auto':
+                raise exc.GlobusSDKUsageError(
+                    'JSON codec "{}" requires the {} package, which is not '
+                    'installed'.format(name, name))
+        else:
+            raise exc.GlobusSDKUsageError(
+                'Unknown JSON codec "{}". Choose one of: auto, {}'
+                .format(name, ', '.join(c.name for c, _ in _CODECS)))
+    return _codec_instances[name]
+
+
+def get_default_codec():
+    """
+    Get the codec selected by the ``json_codec`` config value, which is used
+    by clients which are not given one explicitly and for decoding errors.
+    """
+    return get_codec(config.get_json_codec(config.get_default_environ()))
+
+
+def _is_list(obj):
+    return isinstance(obj, Sequence) and not isinstance(
+        obj, (six.string_types, six.binary_type))
+
+
+def has_long_list(obj, min_items):
+    """
+    Check whether a document holds a list of at least ``min_items`` members,
+    either at the top level or as a value of nested dicts.
+    """
+    if isinstance(obj, dict):
+        return any(has_long_list(value, min_items) for value in obj.values())
+    return _is_list(obj) and len(obj) >= min_items
+
+
+class JSONStreamBody(object):
+    """
+    A request body which encodes a JSON document as it is sent, rather than
+    all at once, so that the encoded document is never held in memory.
+
+    Dicts are encoded key by key, and lists longer than ``batch_size``
+    ``batch_size`` members at a time, with ``codec``. Everything else is
+    encoded whole. Lists with a ``for_json(start, stop)`` method, such as an
+    :class:`ItemList <globus_sdk.transfer.data.ItemList>`, are asked for each
+    batch, so the full list of item dicts is never made either.
+
+    Iterating over a ``JSONStreamBody`` yields the encoded document in chunks
+    of about ``chunk_size`` bytes, and it may be iterated again to send the
+    request again, e.g. after a 401. Its ``len()`` is the size of the encoded
+    document, so that requests have a ``Content-Length``. That is counted by
+    encoding the document once, without keeping it.
+
+    Clients make these for large documents, as set by their
+    ``json_stream_min_items``.
+    """
+    def __init__(self, obj, codec, batch_size=1000, chunk_size=64 * 1024):
+        self.obj = obj
+        self.codec = codec
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self._length = None
+
+    def __iter__(self):
+        chunk = []
+        size = 0
+        for part in self._parts(self.obj):
+            chunk.append(part)
+            size += len(part)
+            if size >= self.chunk_size:
+                yield b''.join(chunk)
+                chunk = []
+                size = 0
+        if chunk:
+            yield b''.join(chunk)
+
+    def __len__(self):
+        if self._length is None:
+            self._length = sum(len(part) for part in self._parts(self.obj))
+        return self._length
+
+    def _dumps(self, obj):
+        doc = self.codec.dumps(obj)
+        if isinstance(doc, six.text_type):
+            doc = doc.encode('utf-8')
+        return doc
+
+    def _parts(self, obj):
+        if isinstance(obj, dict) and all(
+                isinstance(key, six.string_types) for key in obj):
+            yield b'{'
+            for index, (key, value) in enumerate(obj.items()):
+                yield (b', ' if index else b'') + self._dumps(key) + b': '
+                for part in self._parts(value):
+                    yield part
+            yield b'}'
+        elif _is_list(obj) and len(obj) > self.batch_size:
+            for_json = getattr(obj, 'for_json', None)
+            yield b'['
+            for start in range(0, len(obj), self.batch_size):
+                stop = start + self.batch_size
+                batch = (for_json(start, stop) if for_json is not None
+                         else list(obj[start:stop]))
+                # the members of the batch, without its brackets
+                yield (b', ' if start else b'') + self._dumps(batch)[1:-1]
+            yield b']'
+        else:
+            yield self._dumps(obj)
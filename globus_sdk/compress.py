@@ -0,0 +1,97 @@
+"""
+Gzip compression of the request bodies sent by
+:class:`BaseClient <globus_sdk.base.BaseClient>` instances.
+
+Large documents, such as Transfer submissions with many similar paths or
+Search ingest documents, often compress ten times or more, so sending them
+with ``Content-Encoding: gzip`` saves a great deal of bandwidth for a little
+CPU time. Compression is off unless a client is given ``compress_min_bytes``,
+or a request is sent with ``compress=True``.
+"""
+import logging
+import zlib
+
+import six
+
+from globus_sdk.codec import JSONStreamBody
+from globus_sdk.hooks import timer
+
+logger = logging.getLogger(__name__)
+
+#: zlib's own default, a good balance of speed and size
+DEFAULT_COMPRESS_LEVEL = 6
+
+# wbits for a gzip header and trailer around the deflate stream
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+class GzipBody(six.binary_type):
+    """
+    A gzip compressed request body, which records how it was compressed.
+
+    **Attributes**
+
+        ``level`` (*int*)
+          The compression level used
+
+        ``uncompressed_bytes`` (*int*)
+          The size of the body before compression
+
+        ``seconds`` (*float*)
+          The time taken to compress it
+    """
+    level = None
+    uncompressed_bytes = None
+    seconds = None
+
+    def stats(self):
+        """
+        Get a dict describing the compression of this body, as reported by
+        :class:`RequestEvent <globus_sdk.hooks.RequestEvent>`.
+        """
+        return {'encoding': 'gzip', 'level': self.level,
+                'uncompressed_bytes': self.uncompressed_bytes,
+                'compressed_bytes': len(self), 'seconds': self.seconds}
+
+
+def gzip_body(body, level=DEFAULT_COMPRESS_LEVEL, min_bytes=0):
+    """
+    Compress a request body, which may be text, bytes, or a
+    :class:`JSONStreamBody <globus_sdk.codec.JSONStreamBody>`, into a
+    ``GzipBody``. Text is encoded as UTF-8.
+
+    Returns None for bodies smaller than ``min_bytes``, which are best sent
+    as they are. A ``JSONStreamBody`` is compressed as it is encoded, so only
+    the compressed body is held in memory, and its size is only known once
+    it has been compressed.
+    """
+    start = timer()
+    if isinstance(body, six.text_type):
+        body = body.encode('utf-8')
+    if isinstance(body, six.binary_type):
+        if len(body) < min_bytes:
+            return None
+        chunks = (body,)
+    else:
+        chunks = body
+
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _GZIP_WBITS)
+    parts = []
+    size = 0
+    for chunk in chunks:
+        size += len(chunk)
+        parts.append(compressor.compress(chunk))
+    if size < min_bytes:
+        if isinstance(body, JSONStreamBody):
+            # save counting it again when it is sent
+            body._length = size
+        return None
+    parts.append(compressor.flush())
+
+    compressed = GzipBody(b''.join(parts))
+    compressed.level = level
+    compressed.uncompressed_bytes = size
+    compressed.seconds = timer() - start
+    logger.debug('Compressed a request body of %s bytes to %s bytes in '
+                 '%.3fs', size, len(compressed), compressed.seconds)
+    return compressed
@@ -90,17 +90,17 @@ class GlobusConfigParser(object):
         env_option_name = 'GLOBUS_SDK_{}'.format(option.upper())
         value = None
         if check_env and env_option_name in os.environ:
-            logger.debug("Getting config value from environment: {}={}"
-                         .format(env_option_name, value))
+            logger.debug("Getting config value from environment: %s=%s",
+                         env_option_name, value)
             value = os.environ[env_option_name]
         else:
             try:
                 value = self._parser.get(section, option)
             except (NoOptionError, NoSectionError):
                 if failover_to_general:
-                    logger.debug("Config lookup of [{}]:{} failed, checking "
-                                 "[general] for a value as well"
-                                 .format(section, option))
+                    logger.debug("Config lookup of [%s]:%s failed, checking "
+                                 "[general] for a value as well", section,
+                                 option)
                     value = self.get(option,
                                      section=self._GENERAL_CONF_SECTION)
 
@@ -126,8 +126,8 @@ _parser = None
 
 
 def get_service_url(environment, service):
-    logger.debug("Service URL Lookup for \"{}\" under env \"{}\""
-                 .format(service, environment))
+    logger.debug('Service URL Lookup for "%s" under env "%s"', service,
+                 environment)
     p = _get_parser()
     option = service + "_service"
     # TODO: validate with urlparse?
@@ -138,8 +138,7 @@ def get_service_url(environment, service):
              "Please double-check that GLOBUS_SDK_ENVIRONMENT is set "
              "correctly, or not set at all")
             .format(service, environment))
-    logger.debug("Service URL Lookup Result: \"{}\" is at \"{}\""
-                 .format(service, url))
+    logger.debug('Service URL Lookup Result: "%s" is at "%s"', service, url)
     return url
 
 
@@ -150,7 +149,83 @@ def get_http_timeout(environment):
                   type_cast=float)
     if value is None:
         value = 60
-    logger.debug('default http_timeout set to {}'.format(value))
+    logger.debug('default http_timeout set to %s', value)
+    return value
+
+
+def get_http_max_retries(environment):
+    p = _get_parser()
+    value = p.get("http_max_retries", environment=environment,
+                  failover_to_general=True, check_env=True,
+                  type_cast=int)
+    if value is None:
+        value = 0
+    logger.debug('default http_max_retries set to %s', value)
+    return value
+
+
+def get_http_retry_backoff(environment):
+    p = _get_parser()
+    value = p.get("http_retry_backoff", environment=environment,
+                  failover_to_general=True, check_env=True,
+                  type_cast=float)
+    if value is None:
+        value = 0.5
+    logger.debug('default http_retry_backoff set to %s', value)
+    return value
+
+
+def get_http_max_retry_backoff(environment):
+    p = _get_parser()
+    value = p.get("http_max_retry_backoff", environment=environment,
+                  failover_to_general=True, check_env=True,
+                  type_cast=float)
+    if value is None:
+        value = 30.0
+    logger.debug('default http_max_retry_backoff set to %s', value)
+    return value
+
+
+def get_http_pool_connections(environment):
+    p = _get_parser()
+    value = p.get("http_pool_connections", environment=environment,
+                  failover_to_general=True, check_env=True,
+                  type_cast=int)
+    if value is None:
+        value = 10
+    logger.debug('default http_pool_connections set to %s', value)
+    return value
+
+
+def get_http_pool_maxsize(environment):
+    p = _get_parser()
+    value = p.get("http_pool_maxsize", environment=environment,
+                  failover_to_general=True, check_env=True,
+                  type_cast=int)
+    if value is None:
+        value = 10
+    logger.debug('default http_pool_maxsize set to %s', value)
+    return value
+
+
+def get_http_pool_block(environment):
+    p = _get_parser()
+    value = p.get("http_pool_block", environment=environment,
+                  failover_to_general=True, check_env=True,
+                  type_cast=_bool_cast)
+    if value is None:
+        value = False
+    logger.debug('default http_pool_block set to %s', value)
+    return value
+
+
+def get_json_codec(environment):
+    p = _get_parser()
+    value = p.get("json_codec", environment=environment,
+                  failover_to_general=True, check_env=True)
+    if value is None:
+        value = "auto"
+    logger.debug('default json_codec set to %s', value)
     return value
 
 
@@ -161,7 +236,7 @@ def get_ssl_verify(environment):
                   type_cast=_bool_cast)
     if value is None:
         return True
-    logger.debug('ssl_verify set to {}'.format(value))
+    logger.debug('ssl_verify set to %s', value)
     return value
 
 
@@ -171,7 +246,7 @@ def _bool_cast(value):
         return True
     elif value in ("0", "no", "false", "off"):
         return False
-    logger.error('Value "{}" can\'t cast to bool'.format(value))
+    logger.error('Value "%s" can\'t cast to bool', value)
     raise ValueError("Invalid config bool")
 
 
@@ -186,6 +261,6 @@ def get_default_environ():
     if env == 'production':
         env = 'default'
     if env != 'default':
-        logger.info(('On lookup, non-default environment: '
-                     'GLOBUS_SDK_ENVIRONMENT={}'.format(env)))
+        logger.info('On lookup, non-default environment: '
+                    'GLOBUS_SDK_ENVIRONMENT=%s', env)
     return env
@@ -22,6 +22,19 @@ class GlobusSDKUsageError(GlobusError, ValueError):
     """
 
 
+def _load_json(r):
+    """
+    Decode the body of an error response with the JSON codec of the client
+    which received it, or the default codec if it has none.
+    """
+    # imported here, as the codec module depends upon this one
+    from globus_sdk.codec import JSONCodec, get_default_codec
+    codec = getattr(r, '_json_codec', None)
+    if not isinstance(codec, JSONCodec):
+        codec = get_default_codec()
+    return codec.load_response(r)
+
+
 class GlobusAPIError(GlobusError):
     """
     Wraps errors returned by a REST API.
@@ -41,7 +54,7 @@ class GlobusAPIError(GlobusError):
             logger.debug(('Content-Type on error is application/json. '
                           'Doing error load from JSON'))
             try:
-                self._load_from_json(r.json())
+                self._load_from_json(_load_json(r))
             except (KeyError, ValueError):
                 logger.error(('Error body could not be JSON decoded! '
                               'This means the Content-Type is wrong, or the '
@@ -68,7 +81,7 @@ class GlobusAPIError(GlobusError):
         if "Content-Type" in r.headers and (
                 "application/json" in r.headers["Content-Type"]):
             try:
-                return r.json()
+                return _load_json(r)
             except ValueError:
                 logger.error(('Error body could not be JSON decoded! '
                               'This means the Content-Type is wrong, or the '
@@ -98,10 +111,10 @@ class GlobusAPIError(GlobusError):
         """
         if "errors" in data:
             if len(data["errors"]) != 1:
-                logger.warn(("Doing JSON load of error response with multiple "
-                             "errors. Exception data will only include the "
-                             "first error, but there are really {} errors")
-                            .format(len(data["errors"])))
+                logger.warn("Doing JSON load of error response with multiple "
+                            "errors. Exception data will only include the "
+                            "first error, but there are really %s errors",
+                            len(data["errors"]))
             # TODO: handle responses with more than one error
             data = data["errors"][0]
         self.code = data["code"]
@@ -183,10 +196,10 @@ class AuthAPIError(GlobusAPIError):
         """
         if "errors" in data:
             if len(data["errors"]) != 1:
-                logger.warn(("Doing JSON load of error response with multiple "
-                             "errors. Exception data will only include the "
-                             "first error, but there are really {} errors")
-                            .format(len(data["errors"])))
+                logger.warn("Doing JSON load of error response with multiple "
+                            "errors. Exception data will only include the "
+                            "first error, but there are really %s errors",
+                            len(data["errors"]))
             # TODO: handle responses with more than one error
             data = data["errors"][0]
 
@@ -211,6 +224,23 @@ class InvalidDocumentBodyError(GlobusError):
     """
 
 
+class ChunkedSubmitError(GlobusError):
+    """
+    Some chunks of a chunked submission failed.
+
+    :ivar result: The :class:`ChunkedSubmitResult
+                  <globus_sdk.transfer.chunking.ChunkedSubmitResult>`, with
+                  the tasks made by the chunks which succeeded
+    :ivar errors: The error raised by each chunk which failed, by its index
+    """
+    def __init__(self, result):
+        self.result = result
+        self.errors = result.errors
+        super(ChunkedSubmitError, self).__init__(
+            '{} of {} chunks failed to submit'.format(
+                len(result.errors), len(result.chunks)))
+
+
 # Wrappers around requests exceptions, so the SDK is API independent.
 class NetworkError(GlobusError):
     """
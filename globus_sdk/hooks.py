@@ -0,0 +1,198 @@
+"""
+Instrumentation hooks for requests made by a
+:class:`BaseClient <globus_sdk.base.BaseClient>`.
+
+Callbacks are registered on a client's ``hooks`` for one of the following
+events, and are called with a :class:`RequestEvent` describing one attempt at
+sending a request:
+
+``before_request``
+  Just before the request is sent. Authorization has already been set.
+
+``after_response``
+  When a response has been received and its body read, whatever its status.
+  For the final response to a request, this is after the body is decoded.
+
+``on_retry``
+  When a request failed, and is about to be sent again. ``retry_delay``
+  holds the number of seconds before it is sent.
+
+``on_error``
+  When a request has failed for good, just before the error is raised.
+"""
+import logging
+import re
+import threading
+from timeit import default_timer
+
+from globus_sdk import exc
+
+logger = logging.getLogger(__name__)
+
+BEFORE_REQUEST = 'before_request'
+AFTER_RESPONSE = 'after_response'
+ON_RETRY = 'on_retry'
+ON_ERROR = 'on_error'
+
+EVENTS = (BEFORE_REQUEST, AFTER_RESPONSE, ON_RETRY, ON_ERROR)
+
+# path segments which identify a specific resource, rather than a route
+_ID_SEGMENT_RE = re.compile(
+    r'^([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-'
+    r'[0-9a-fA-F]{12}|[0-9]+)$')
+
+#: the clock used for all timings
+timer = default_timer
+
+
+def path_template(path):
+    """
+    Get the route of a request path, with IDs replaced by ``{id}``, so that
+    timings can be grouped by route. For example, ``endpoint/<UUID>/ls``
+    becomes ``/endpoint/{id}/ls``.
+    """
+    return '/' + '/'.join(
+        '{id}' if _ID_SEGMENT_RE.match(segment) else segment
+        for segment in path.split('/') if segment)
+
+
+class RequestEvent(object):
+    """
+    Describes one attempt at sending a request, and its outcome as far as it
+    is known when a hook is called.
+
+    :ivar client: The client sending the request
+    :ivar method: HTTP method (str)
+    :ivar path: Path of the request, as given to the client (str)
+    :ivar path_template: ``path`` with IDs replaced by ``{id}`` (str)
+    :ivar url: Full URL of the request, without query params (str)
+    :ivar params: Query params of the request (dict or None)
+    :ivar attempt: Number of retries of this request already made under the
+                   client's RetryPolicy (int)
+    :ivar request_bytes: Size of the request body, as sent (int)
+    :ivar compression: How the request body was compressed, or None (dict).
+                       ``encoding`` is ``"gzip"``, ``level`` the compression
+                       level, ``uncompressed_bytes`` and ``compressed_bytes``
+                       the sizes of the body, and ``seconds`` the time taken
+                       to compress it, which is done once, before the first
+                       attempt
+    :ivar status: HTTP status of the response, or None (int)
+    :ivar response_bytes: Size of the response body, or None (int)
+    :ivar response: The ``requests.Response``, or None
+    :ivar error: The error which failed this attempt, or None
+    :ivar retry_delay: Seconds before the request is retried, or None (float)
+    :ivar token_refreshed: True if a new access token was fetched to set
+                           Authorization for this attempt (bool)
+    :ivar timings: Durations in seconds of the phases of this attempt (dict).
+                   ``authorize`` is the time spent setting Authorization,
+                   including any token refresh. ``request`` runs from
+                   sending the request, including opening a connection, until
+                   the response headers arrive. ``body_read`` is the time
+                   spent reading the response body, and ``decode`` the time
+                   spent decoding it. ``total`` covers all of these phases.
+                   Phases which did not happen are missing
+    :ivar extra: Free space for callbacks to share data between events (dict)
+    """
+    def __init__(self, client, method, path, url, params=None, attempt=0,
+                 request_bytes=0):
+        self.client = client
+        self.method = method
+        self.path = path
+        self.path_template = path_template(path)
+        self.url = url
+        self.params = params
+        self.attempt = attempt
+        self.request_bytes = request_bytes
+        self.compression = None
+
+        self.status = None
+        self.response_bytes = None
+        self.response = None
+        self.error = None
+        self.retry_delay = None
+        self.token_refreshed = False
+
+        self.timings = {}
+        self.extra = {}
+        self._start = timer()
+
+    def __repr__(self):
+        return ('RequestEvent({} {}, attempt={}, status={}, timings={})'
+                .format(self.method, self.path_template, self.attempt,
+                        self.status, self.timings))
+
+    def set_response(self, response):
+        """
+        Record the HTTP response received for this attempt.
+        """
+        self.response = response
+        self.status = response.status_code
+        self.response_bytes = len(response.content)
+
+    def finish(self):
+        """
+        Record the total time taken by this attempt.
+        """
+        self.timings['total'] = timer() - self._start
+
+
+class ClientHooks(object):
+    """
+    A registry of callbacks for request events. Every client has one, as
+    ``client.hooks``, and one may be shared by several clients by passing it
+    to each of them as ``hooks``.
+
+    >>> def record(event):
+    >>>     histogram(event.method, event.path_template).observe(
+    >>>         event.timings['total'])
+    >>> tc = TransferClient(...)
+    >>> tc.hooks.register('after_response', record)
+
+    Callbacks are called synchronously, in the thread sending the request, so
+    they should be fast. An exception raised by a callback is logged, and
+    does not affect the request.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._callbacks = dict((event, ()) for event in EVENTS)
+
+    def register(self, event, callback):
+        """
+        Call ``callback(request_event)`` whenever ``event`` happens.
+        """
+        self._check_event(event)
+        with self._lock:
+            self._callbacks[event] += (callback,)
+
+    def unregister(self, event, callback):
+        """
+        Stop calling a callback which was registered for ``event``.
+        """
+        self._check_event(event)
+        with self._lock:
+            callbacks = list(self._callbacks[event])
+            callbacks.remove(callback)
+            self._callbacks[event] = tuple(callbacks)
+
+    def has_callbacks(self, event):
+        """
+        Check if any callbacks are registered for ``event``.
+        """
+        return bool(self._callbacks[event])
+
+    def fire(self, event, request_event):
+        """
+        Call the callbacks registered for ``event``.
+        """
+        # callbacks are held in tuples, so no lock is needed to iterate
+        for callback in self._callbacks[event]:
+            try:
+                callback(request_event)
+            except Exception:
+                logger.exception('Error in %s hook %r', event, callback)
+
+    def _check_event(self, event):
+        if event not in self._callbacks:
+            raise exc.GlobusSDKUsageError(
+                'Unknown hook event "{}". Choose one of: {}'
+                .format(event, ', '.join(EVENTS)))
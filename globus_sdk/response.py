@@ -1,7 +1,18 @@
 import logging
+try:
+    from collections.abc import Mapping
+except ImportError:  # python2
+    from collections import Mapping
+
+from globus_sdk.codec import JSONCodec, get_default_codec
+from globus_sdk.exc import GlobusSDKUsageError
 
 logger = logging.getLogger(__name__)
 
+# sentinel marking a GlobusHTTPResponse whose body has not been parsed yet
+# None can't be used for this, as it is the parse result for non-JSON bodies
+_UNPARSED = object()
+
 
 class GlobusResponse(object):
     """
@@ -43,8 +54,7 @@ class GlobusResponse(object):
         try:
             return data[key]
         except TypeError:
-            logger.error("Can't index into responses of type {}"
-                         .format(type(self)))
+            logger.error("Can't index into responses of type %s", type(self))
             # re-raise with an altered message -- the issue is that whatever
             # type of GlobusResponse you're working with doesn't support
             # indexing
@@ -81,6 +91,11 @@ class GlobusHTTPResponse(GlobusResponse):
     ``data``, otherwise ``data`` will be ``None`` and ``text`` should
     be used instead.
 
+    The body is parsed at most once, on first access to ``data`` (or any of
+    the item access helpers which rely on it). Subsequent accesses return the
+    same object, so modifications made to ``data`` are visible to later
+    readers of the response.
+
     :ivar http_status: HTTP status code returned by the server (int)
     :ivar content_type: Content-Type header returned by the server (str)
     """
@@ -95,11 +110,22 @@ class GlobusHTTPResponse(GlobusResponse):
         # worse).
         self.http_status = http_response.status_code
         self.content_type = http_response.headers["Content-Type"]
+        # the parsed body is memoized here on first access, so that item
+        # access and iteration over large documents do not re-parse the body
+        self._parsed_json = _UNPARSED
 
     @property
     def data(self):
+        if self._parsed_json is _UNPARSED:
+            self._parsed_json = self._parse_json()
+        return self._parsed_json
+
+    def _parse_json(self):
+        codec = getattr(self._client, 'json_codec', None)
+        if not isinstance(codec, JSONCodec):
+            codec = get_default_codec()
         try:
-            return self._data.json()
+            return codec.load_response(self._data)
         # JSON decoding may raise a ValueError due to an invalid JSON
         # document. In the case of trying to fetch the "data" on an HTTP
         # response, this means we didn't get a JSON response. Rather than
@@ -117,3 +143,116 @@ class GlobusHTTPResponse(GlobusResponse):
         The raw response data as a string.
         """
         return self._data.text
+
+
+#: the ways in which the items of a list of results can be represented
+ITEM_MODES = ('response', 'dict', 'view', 'record')
+
+
+class ItemView(Mapping):
+    """
+    A read-only mapping over an item of a list of results, sharing the dict
+    decoded from the response rather than copying it.
+
+    Takes far less memory than a :class:`GlobusResponse` per item, but as it
+    shares the page's data, keeping any view keeps that data alive.
+    """
+    __slots__ = ('_item',)
+
+    def __init__(self, item):
+        self._item = item
+
+    def __getitem__(self, key):
+        return self._item[key]
+
+    def __iter__(self):
+        return iter(self._item)
+
+    def __len__(self):
+        return len(self._item)
+
+    def __contains__(self, key):
+        return key in self._item
+
+    def get(self, key, default=None):
+        return self._item.get(key, default)
+
+    def __repr__(self):
+        return "{0}({1!r})".format(self.__class__.__name__, self._item)
+
+
+class ItemRecord(Mapping):
+    """
+    A read-only mapping holding a copy of the values of an item of a list of
+    results, without a dict of its own.
+
+    Records of items with the same keys share a single tuple of keys, so each
+    record only costs a tuple of values, which is several times smaller than
+    the decoded dict. Nothing is shared with the response, which can be freed
+    once its records are made. Nested values are kept as they were decoded.
+    """
+    __slots__ = ('_fields', '_values')
+
+    # keys -> (keys, {key: index}), shared by the records with those keys
+    _fields_cache = {}
+    # a bound on the number of distinct sets of keys cached
+    _max_fields_cached = 1024
+
+    def __init__(self, item):
+        keys = tuple(item)
+        fields = self._fields_cache.get(keys)
+        if fields is None:
+            fields = (keys, dict((key, i) for i, key in enumerate(keys)))
+            if len(self._fields_cache) < self._max_fields_cached:
+                fields = self._fields_cache.setdefault(keys, fields)
+        self._fields = fields
+        self._values = tuple(item.values())
+
+    def __getitem__(self, key):
+        return self._values[self._fields[1][key]]
+
+    def __iter__(self):
+        return iter(self._fields[0])
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, key):
+        return key in self._fields[1]
+
+    def get(self, key, default=None):
+        index = self._fields[1].get(key)
+        return default if index is None else self._values[index]
+
+    def __repr__(self):
+        return "{0}({1!r})".format(self.__class__.__name__, dict(self))
+
+
+def item_converter(item_mode, client=None):
+    """
+    Get a function making the representation of an item, a decoded dict,
+    selected by ``item_mode``, or None if items are used as they are:
+
+    ``"response"``
+      A :class:`GlobusResponse` for each item, holding ``client``
+
+    ``"dict"``
+      The decoded dict itself, so None is returned
+
+    ``"view"``
+      An :class:`ItemView` of the decoded dict
+
+    ``"record"``
+      An :class:`ItemRecord` copying the values of the decoded dict
+    """
+    if item_mode == 'response':
+        return lambda item: GlobusResponse(item, client=client)
+    if item_mode == 'dict':
+        return None
+    if item_mode == 'view':
+        return ItemView
+    if item_mode == 'record':
+        return ItemRecord
+    raise GlobusSDKUsageError(
+        'item_mode must be one of {}, got {!r}'.format(
+            ', '.join(ITEM_MODES), item_mode))
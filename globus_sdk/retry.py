@@ -0,0 +1,160 @@
+"""
+Retry policies for requests made by a
+:class:`BaseClient <globus_sdk.base.BaseClient>`.
+"""
+import logging
+import random
+import time
+from email.utils import parsedate_tz, mktime_tz
+
+from globus_sdk import exc
+
+logger = logging.getLogger(__name__)
+
+
+class RetryPolicy(object):
+    """
+    A ``RetryPolicy`` decides whether or not a failed request should be sent
+    again, and how long to wait before doing so.
+
+    Requests are retried when the service responds with one of the
+    ``retry_statuses`` (by default: 429, 502, 503, and 504), or when the
+    request fails with a :class:`NetworkError <globus_sdk.exc.NetworkError>`.
+    Waits grow exponentially with each attempt, with full jitter, but a
+    ``Retry-After`` header sent by the service is always honored.
+
+    Only idempotent requests are retried after the service may have acted on
+    them. ``GET``, ``HEAD``, ``OPTIONS``, ``PUT``, and ``DELETE`` are
+    idempotent, and a ``POST`` is treated as idempotent when its JSON body
+    carries a ``submission_id`` (as Transfer task submissions do). A ``429``
+    or a connection timeout means that the request was never handled, so these
+    are retried regardless of method.
+
+    The 401 retry driven by the client's authorizer is separate from this
+    policy, and does not count as an attempt.
+
+    **Parameters**
+
+        ``max_retries`` (*int*)
+          The maximum number of times to retry a single request. ``0``
+          disables retries.
+
+        ``backoff_factor`` (*float*)
+          Base of the exponential backoff, in seconds. The wait before retry
+          number ``n`` (starting from 0) is at most
+          ``backoff_factor * 2 ** n``.
+
+        ``max_backoff`` (*float*)
+          Upper bound on any single wait, in seconds. This also caps waits
+          requested via ``Retry-After``.
+
+        ``retry_statuses`` (*iterable of int*)
+          HTTP status codes which should be retried.
+
+        ``jitter`` (*bool*)
+          When true (the default), each wait is chosen uniformly at random
+          between zero and the exponential backoff value.
+    """
+    DEFAULT_RETRY_STATUSES = (429, 502, 503, 504)
+    IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+
+    def __init__(self, max_retries=0, backoff_factor=0.5, max_backoff=30.0,
+                 retry_statuses=DEFAULT_RETRY_STATUSES, jitter=True):
+        if max_retries < 0:
+            raise exc.GlobusSDKUsageError(
+                'RetryPolicy.max_retries must be >= 0, got {}'
+                .format(max_retries))
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.jitter = jitter
+
+    def __repr__(self):
+        return ('{}(max_retries={!r}, backoff_factor={!r}, max_backoff={!r}, '
+                'retry_statuses={!r}, jitter={!r})'
+                .format(self.__class__.__name__, self.max_retries,
+                        self.backoff_factor, self.max_backoff,
+                        sorted(self.retry_statuses), self.jitter))
+
+    def is_idempotent(self, method, json_body=None):
+        """
+        Check if a request can safely be sent more than once.
+        """
+        if method in self.IDEMPOTENT_METHODS:
+            return True
+        return (method == 'POST' and isinstance(json_body, dict) and
+                bool(json_body.get('submission_id')))
+
+    def should_retry(self, attempt, method, json_body=None,
+                     response=None, error=None):
+        """
+        Decide whether or not a request should be retried, given either the
+        HTTP response it got or the
+        :class:`NetworkError <globus_sdk.exc.NetworkError>` it raised.
+
+        ``attempt`` is the number of retries which have already been made.
+        """
+        if attempt >= self.max_retries:
+            return False
+
+        if error is not None:
+            if not isinstance(error, exc.NetworkError):
+                return False
+            # a connection timeout means the request never reached the service
+            if isinstance(error, exc.GlobusConnectionTimeoutError):
+                return True
+            return self.is_idempotent(method, json_body)
+
+        if response is None or (
+                response.status_code not in self.retry_statuses):
+            return False
+        # rate limiting is a refusal to handle the request at all
+        if response.status_code == 429:
+            return True
+        return self.is_idempotent(method, json_body)
+
+    def compute_delay(self, attempt, response=None):
+        """
+        Get the number of seconds to wait before retry number ``attempt``
+        (starting from 0).
+        A valid ``Retry-After`` header on the response takes precedence over
+        the exponential backoff.
+        """
+        retry_after = _parse_retry_after(response)
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+
+        delay = min(self.backoff_factor * (2 ** attempt), self.max_backoff)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def sleep(self, delay):
+        """
+        Wait before a retry. Split out so that it can be overridden, e.g. to
+        sleep cooperatively or to record waits in tests.
+        """
+        time.sleep(delay)
+
+
+def _parse_retry_after(response):
+    """
+    Get the value of a ``Retry-After`` header as a number of seconds, or None
+    if there is no usable header. Both the delay-seconds and the HTTP-date
+    forms are understood.
+    """
+    if response is None:
+        return None
+    value = response.headers.get('Retry-After')
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    parsed = parsedate_tz(value)
+    if parsed is None:
+        logger.debug('Ignoring unparseable Retry-After header: %s', value)
+        return None
+    return max(0.0, mktime_tz(parsed) - time.time())
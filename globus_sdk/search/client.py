@@ -6,6 +6,7 @@ from globus_sdk.base import BaseClient, merge_params, safe_stringify
 from globus_sdk.authorizers import (
     AccessTokenAuthorizer, RefreshTokenAuthorizer, ClientCredentialsAuthorizer)
 from globus_sdk.response import GlobusHTTPResponse
+from globus_sdk.search.response import SearchResponse
 
 logger = logging.getLogger(__name__)
 
@@ -60,7 +61,7 @@ class SearchClient(BaseClient):
         in the API documentation for details.
         """
         index_id = safe_stringify(index_id)
-        self.logger.info("SearchClient.get_index({})".format(index_id))
+        self.logger.info("SearchClient.get_index(%s)", index_id)
         path = self.qjoin_path("v1/index", index_id)
         return self.get(path, params=params)
 
@@ -91,10 +92,9 @@ class SearchClient(BaseClient):
         merge_params(params, q=q, offset=offset, limit=limit,
                      query_template=query_template, advanced=advanced)
 
-        self.logger.info("SearchClient.search({}, ...)"
-                         .format(index_id))
+        self.logger.info("SearchClient.search(%s, ...)", index_id)
         path = self.qjoin_path("v1/index", index_id, "search")
-        return self.get(path, params=params)
+        return self.get(path, params=params, response_class=SearchResponse)
 
     def post_search(self, index_id, data):
         """
@@ -137,10 +137,9 @@ class SearchClient(BaseClient):
         in the API documentation for details.
         """
         index_id = safe_stringify(index_id)
-        self.logger.info("SearchClient.post_search({}, ...)"
-                         .format(index_id))
+        self.logger.info("SearchClient.post_search(%s, ...)", index_id)
         path = self.qjoin_path("v1/index", index_id, "search")
-        return self.post(path, data)
+        return self.post(path, data, response_class=SearchResponse)
 
     #
     # Bulk data indexing
@@ -200,7 +199,7 @@ class SearchClient(BaseClient):
         in the API documentation for details.
         """
         index_id = safe_stringify(index_id)
-        self.logger.info("SearchClient.ingest({}, ...)".format(index_id))
+        self.logger.info("SearchClient.ingest(%s, ...)", index_id)
         path = self.qjoin_path("v1/index", index_id, "ingest")
         return self.post(path, data)
 
@@ -238,8 +237,7 @@ class SearchClient(BaseClient):
         in the API documentation for details.
         """
         index_id = safe_stringify(index_id)
-        self.logger.info("SearchClient.delete_by_query({}, ...)"
-                         .format(index_id))
+        self.logger.info("SearchClient.delete_by_query(%s, ...)", index_id)
         path = self.qjoin_path("v1/index", index_id, "delete_by_query")
         return self.post(path, data)
 
@@ -269,8 +267,8 @@ class SearchClient(BaseClient):
         index_id = safe_stringify(index_id)
         merge_params(params, subject=subject)
 
-        self.logger.info("SearchClient.get_subject({}, {}, ...)"
-                         .format(index_id, subject))
+        self.logger.info("SearchClient.get_subject(%s, %s, ...)", index_id,
+                         subject)
         path = self.qjoin_path("v1/index", index_id, "subject")
         return self.get(path, params=params)
 
@@ -296,8 +294,8 @@ class SearchClient(BaseClient):
         index_id = safe_stringify(index_id)
         merge_params(params, subject=subject)
 
-        self.logger.info("SearchClient.delete_subject({}, {}, ...)"
-                         .format(index_id, subject))
+        self.logger.info("SearchClient.delete_subject(%s, %s, ...)", index_id,
+                         subject)
         path = self.qjoin_path("v1/index", index_id, "subject")
         return self.delete(path, params=params)
 
@@ -334,8 +332,8 @@ class SearchClient(BaseClient):
         index_id = safe_stringify(index_id)
         merge_params(params, subject=subject, entry_id=entry_id)
 
-        self.logger.info("SearchClient.get_entry({}, {}, {}, ...)"
-                         .format(index_id, subject, entry_id))
+        self.logger.info("SearchClient.get_entry(%s, %s, %s, ...)", index_id,
+                         subject, entry_id)
         path = self.qjoin_path("v1/index", index_id, "entry")
         return self.get(path, params=params)
 
@@ -378,7 +376,7 @@ class SearchClient(BaseClient):
         in the API documentation for details.
         """
         index_id = safe_stringify(index_id)
-        self.logger.info("SearchClient.create_entry({}, ...)".format(index_id))
+        self.logger.info("SearchClient.create_entry(%s, ...)", index_id)
         path = self.qjoin_path("v1/index", index_id, "entry")
         return self.post(path, data)
 
@@ -408,7 +406,7 @@ class SearchClient(BaseClient):
         in the API documentation for details.
         """
         index_id = safe_stringify(index_id)
-        self.logger.info("SearchClient.update_entry({}, ...)".format(index_id))
+        self.logger.info("SearchClient.update_entry(%s, ...)", index_id)
         path = self.qjoin_path("v1/index", index_id, "entry")
         return self.put(path, data)
 
@@ -440,8 +438,8 @@ class SearchClient(BaseClient):
         """
         index_id = safe_stringify(index_id)
         merge_params(params, subject=subject, entry_id=entry_id)
-        self.logger.info("SearchClient.delete_entry({}, {}, {}, ...)"
-                         .format(index_id, subject, entry_id))
+        self.logger.info("SearchClient.delete_entry(%s, %s, %s, ...)",
+                         index_id, subject, entry_id)
         path = self.qjoin_path("v1/index", index_id, "entry")
         return self.delete(path, params=params)
 
@@ -461,8 +459,8 @@ class SearchClient(BaseClient):
         in the API documentation for details.
         """
         index_id = safe_stringify(index_id)
-        self.logger.info("SearchClient.get_query_template({}, {})"
-                         .format(index_id, template_name))
+        self.logger.info("SearchClient.get_query_template(%s, %s)", index_id,
+                         template_name)
         path = self.qjoin_path("v1/index", index_id, "query_template",
                                template_name)
         return self.get(path)
@@ -479,7 +477,6 @@ class SearchClient(BaseClient):
         in the API documentation for details.
         """
         index_id = safe_stringify(index_id)
-        self.logger.info("SearchClient.get_query_template_list({})"
-                         .format(index_id))
+        self.logger.info("SearchClient.get_query_template_list(%s)", index_id)
         path = self.qjoin_path("v1/index", index_id, "query_template")
         return self.get(path)
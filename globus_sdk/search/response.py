@@ -0,0 +1,33 @@
+from six.moves import map
+
+from globus_sdk.response import GlobusHTTPResponse, item_converter
+
+
+class SearchResponse(GlobusHTTPResponse):
+    """
+    Response class for search queries. Allows top level fields to be accessed
+    normally via standard item access, and also provides a convenient way to
+    iterate over the results in the ``gmeta`` key:
+
+    >>> print("Total:", r["total"])
+    >>> # Equivalent to: for result in r["gmeta"]
+    >>> for result in r:
+    >>>     print(result["subject"])
+
+    Results are the dicts decoded from the response. Use :meth:`iter_items`
+    to get them in another form.
+    """
+    def __iter__(self):
+        return iter(self["gmeta"])
+
+    def iter_items(self, item_mode='dict'):
+        """
+        Iterate over the results in the ``gmeta`` key, representing each
+        result according to ``item_mode``, which is one of ``"response"``,
+        ``"dict"``, ``"view"``, or ``"record"``, as described in
+        :func:`item_converter <globus_sdk.response.item_converter>`.
+        """
+        convert = item_converter(item_mode, client=self._client)
+        if convert is None:
+            return iter(self)
+        return map(convert, self)
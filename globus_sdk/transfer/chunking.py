@@ -0,0 +1,215 @@
+"""
+Splitting of large transfer and delete documents into several smaller ones,
+each of which is submitted as a task of its own.
+
+A document is split by number of items and by encoded size. The size of each
+item is measured as it will be encoded, so no chunk is larger than the limit,
+however long or unusual its paths.
+"""
+import copy
+import logging
+import threading
+
+from six.moves import queue
+
+from globus_sdk import exc
+from globus_sdk.codec import get_default_codec
+from globus_sdk.transfer.data import ItemList, _item_dict
+
+logger = logging.getLogger(__name__)
+
+# default limits, which may be set to suit the service submitted to
+DEFAULT_MAX_ITEMS = 50000
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+
+# items are encoded as ``, `` separated list members
+_SEPARATOR_SIZE = 2
+# chunks are measured with a submission ID, which is a UUID, in place
+_PLACEHOLDER_SUBMISSION_ID = '00000000-0000-0000-0000-000000000000'
+
+
+def split_document(data, max_items=DEFAULT_MAX_ITEMS,
+                   max_bytes=DEFAULT_MAX_BYTES, codec=None):
+    """
+    Split a transfer or delete document into chunks which hold at most
+    ``max_items`` items and encode to at most ``max_bytes`` bytes.
+
+    Each chunk is a copy of ``data``, with the same fields and a part of its
+    items, in order. The first chunk keeps the ``submission_id`` of ``data``,
+    if any, while the others have none, so that each is given one of its own
+    when it is submitted.
+
+    **Parameters**
+
+        ``data`` (:class:`TransferData <globus_sdk.TransferData>`, \
+        :class:`DeleteData <globus_sdk.DeleteData>` or *dict*)
+          The document to split
+
+        ``max_items`` (*int*)
+          The most items in a chunk
+
+        ``max_bytes`` (*int*)
+          The most bytes in an encoded chunk
+
+        ``codec`` (:class:`JSONCodec <globus_sdk.codec.JSONCodec>`)
+          The codec which will encode the chunks, used to measure them.
+          Defaults to the default codec
+    """
+    if max_items < 1:
+        raise exc.GlobusSDKUsageError(
+            'split_document max_items must be >= 1, got {}'.format(max_items))
+    codec = codec or get_default_codec()
+
+    items = data["DATA"]
+    compact = isinstance(items, ItemList)
+    items = items._items if compact else list(items)
+    empty = copy.copy(data)
+    empty["DATA"] = []
+    empty["submission_id"] = _PLACEHOLDER_SUBMISSION_ID
+    empty_size = len(codec.dumps(empty))
+    measure = _ItemSizes(codec)
+
+    chunks = []
+    chunk_items = []
+    size = empty_size
+    for item in items:
+        item_size = measure(item) + _SEPARATOR_SIZE
+        if empty_size + item_size > max_bytes:
+            raise exc.GlobusSDKUsageError(
+                'An item of {} bytes does not fit in a document of at most {} '
+                'bytes'.format(item_size, max_bytes))
+        if chunk_items and (len(chunk_items) >= max_items or
+                            size + item_size > max_bytes):
+            chunks.append(_make_chunk(data, chunk_items, compact,
+                                      first=not chunks))
+            chunk_items = []
+            size = empty_size
+        chunk_items.append(item)
+        size += item_size
+    if chunk_items or not chunks:
+        chunks.append(_make_chunk(data, chunk_items, compact,
+                                  first=not chunks))
+
+    logger.debug('Split a document of %s items into %s chunks', len(items),
+                 len(chunks))
+    return chunks
+
+
+def _make_chunk(data, items, compact, first):
+    chunk = copy.copy(data)
+    if compact:
+        chunk["DATA"] = ItemList()
+        chunk["DATA"]._items = items
+    else:
+        chunk["DATA"] = items
+    if not first:
+        chunk.pop("submission_id", None)
+    return chunk
+
+
+class _ItemSizes(object):
+    """
+    Measures items as they are encoded. Items held as tuples of values are
+    measured by encoding the tuple, as the difference to the item dict is the
+    same for all items of a DATA_TYPE.
+    """
+    def __init__(self, codec):
+        self.codec = codec
+        self._key_sizes = {}
+
+    def __call__(self, item):
+        if type(item) is not tuple:
+            return len(self.codec.dumps(item))
+        size = len(self.codec.dumps(item))
+        key_size = self._key_sizes.get(item[0])
+        if key_size is None:
+            key_size = self._key_sizes[item[0]] = (
+                len(self.codec.dumps(_item_dict(item))) - size)
+        return size + key_size
+
+
+class ChunkedSubmitResult(object):
+    """
+    The result of a chunked submission, with
+    :meth:`submit_transfer_chunked \
+    <globus_sdk.TransferClient.submit_transfer_chunked>` or
+    :meth:`submit_delete_chunked \
+    <globus_sdk.TransferClient.submit_delete_chunked>`.
+
+    **Attributes**
+
+        ``chunks`` (*list*)
+          The documents submitted, each with the ``submission_id`` used, so
+          that one which failed may be submitted again without any risk of
+          making a second task
+
+        ``responses`` (*list*)
+          The response to each chunk, or ``None`` if it failed
+
+        ``errors`` (*dict*)
+          The error raised by each chunk which failed, by its index
+
+        ``task_ids`` (*list*)
+          The IDs of the tasks made, in the order of the chunks
+    """
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.responses = [None] * len(chunks)
+        self.errors = {}
+
+    @property
+    def task_ids(self):
+        return [res["task_id"] for res in self.responses if res is not None]
+
+    def __repr__(self):
+        return '{}(chunks={}, errors={})'.format(
+            self.__class__.__name__, len(self.chunks), len(self.errors))
+
+
+def submit_chunks(submit, chunks, concurrency=4):
+    """
+    Submit documents with ``submit``, up to ``concurrency`` at a time. Returns
+    a ``ChunkedSubmitResult``, or raises a ``ChunkedSubmitError`` holding it
+    if any submission failed.
+    """
+    if concurrency < 1:
+        raise exc.GlobusSDKUsageError(
+            'submit_chunks concurrency must be >= 1, got {}'
+            .format(concurrency))
+    result = ChunkedSubmitResult(chunks)
+    indexes = queue.Queue()
+    for index in range(len(chunks)):
+        indexes.put(index)
+    done = queue.Queue()
+
+    def submit_next():
+        while True:
+            try:
+                index = indexes.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                done.put((index, submit(chunks[index]), None))
+            except Exception as err:
+                done.put((index, None, err))
+
+    num_workers = min(concurrency, len(chunks))
+    logger.info('Submitting %s chunks, %s at a time', len(chunks),
+                num_workers)
+    for _ in range(num_workers):
+        worker = threading.Thread(target=submit_next,
+                                  name='submit_chunks-submit')
+        worker.daemon = True
+        worker.start()
+    for _ in range(len(chunks)):
+        index, res, err = done.get()
+        if err is None:
+            result.responses[index] = res
+        else:
+            logger.error('Chunk %s of %s failed to submit: %s', index + 1,
+                         len(chunks), err)
+            result.errors[index] = err
+
+    if result.errors:
+        raise exc.ChunkedSubmitError(result)
+    return result
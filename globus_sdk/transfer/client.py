@@ -9,6 +9,9 @@ from globus_sdk.authorizers import (
 from globus_sdk.transfer.response import (
     TransferResponse, IterableTransferResponse, ActivationRequirementsResponse)
 from globus_sdk.transfer.paging import PaginatedResource
+from globus_sdk.transfer.chunking import (
+    DEFAULT_MAX_ITEMS, DEFAULT_MAX_BYTES, split_document, submit_chunks)
+from globus_sdk.transfer.submission import SubmissionIDPool
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +38,33 @@ class TransferClient(BaseClient):
     over the result, call ``list()`` on the ``PaginatedResource`` or call the
     original method again to get fresh results.
 
+    Paginated methods also accept ``prefetch=N``, to fetch up to ``N`` pages
+    ahead of the page being iterated in a background thread, so that network
+    latency overlaps with the processing of results:
+
+    >>> for transfer in tc.task_successful_transfers(task_id, num_results=None,
+    >>>                                              prefetch=2):
+    >>>     record(transfer)
+
+    Methods whose responses give a total number of results, such as
+    ``task_list``, also accept ``concurrency=N`` to fetch ``N`` pages at once
+    after the first one, and ``ordered=False`` to get the results of each page
+    as soon as it arrives:
+
+    >>> for task in tc.task_list(num_results=None, concurrency=4):
+    >>>     record(task)
+
+    Clients which submit many tasks can keep submission IDs ready, fetched in
+    the background, with ``submission_id_prefetch``, and build documents with
+    ``defer_submission_id=True`` so that they take one only when submitted:
+
+    >>> tc = TransferClient(authorizer=..., submission_id_prefetch=10)
+    >>> for source_path, dest_path in work:
+    >>>     tdata = TransferData(tc, source_id, dest_id,
+    >>>                          defer_submission_id=True)
+    >>>     tdata.add_item(source_path, dest_path)
+    >>>     tc.submit_transfer(tdata)
+
     Detailed documentation is available in the official REST API
     documentation, which is linked to from the method documentation. Methods
     that allow arbitrary keyword arguments will pass the extra arguments as
@@ -46,6 +76,13 @@ class TransferClient(BaseClient):
         <globus_sdk.authorizers.base.GlobusAuthorizer>`)
 
           An authorizer instance used for all calls to Globus Transfer
+
+        ``submission_id_prefetch`` (*int*)
+          The number of submission IDs to keep ready in a
+          :class:`SubmissionIDPool
+          <globus_sdk.transfer.submission.SubmissionIDPool>`, from which
+          :meth:`next_submission_id <.next_submission_id>` takes them.
+          Defaults to 0, for no pool
     """
     # disallow basic auth
     allowed_authorizer_types = [AccessTokenAuthorizer,
@@ -53,10 +90,38 @@ class TransferClient(BaseClient):
                                 ClientCredentialsAuthorizer]
     error_class = exc.TransferAPIError
     default_response_class = TransferResponse
-
-    def __init__(self, authorizer=None, **kwargs):
+    # the type of object returned by paginated calls
+    paginated_resource_class = PaginatedResource
+    # submitting or cancelling tasks changes task documents and lists, which
+    # are also listed under endpoint_manager, and changing endpoints changes
+    # search results
+    cache_related_groups = {
+        'transfer': ('task', 'endpoint_manager'),
+        'delete': ('task', 'endpoint_manager'),
+        'task': ('endpoint_manager',),
+        'endpoint_manager': ('task',),
+        'endpoint': ('endpoint_search',),
+        'shared_endpoint': ('endpoint', 'endpoint_search'),
+    }
+
+    def __init__(self, authorizer=None, submission_id_prefetch=0, **kwargs):
         BaseClient.__init__(self, "transfer", base_path="/v0.10/",
                             authorizer=authorizer, **kwargs)
+        if submission_id_prefetch:
+            self.submission_id_pool = SubmissionIDPool(
+                self.get_submission_id, submission_id_prefetch)
+        else:
+            self.submission_id_pool = None
+
+    def _paging_options(self, params):
+        """
+        Take the options of ``paginated_resource_class`` out of the keyword
+        arguments given to a paginated method, so that they are not sent as
+        query params.
+        """
+        return dict((name, params.pop(name))
+                    for name in PaginatedResource.PAGING_OPTIONS
+                    if name in params)
 
     # Convenience methods, providing more pythonic access to common REST
     # resources
@@ -87,7 +152,7 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info("TransferClient.get_endpoint({})".format(endpoint_id))
+        self.logger.info("TransferClient.get_endpoint(%s)", endpoint_id)
         path = self.qjoin_path("endpoint", endpoint_id)
         return self.get(path, params=params)
 
@@ -124,8 +189,8 @@ class TransferClient(BaseClient):
             data['myproxy_server'] = None
 
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info("TransferClient.update_endpoint({}, ...)"
-                         .format(endpoint_id))
+        self.logger.info("TransferClient.update_endpoint(%s, ...)",
+                         endpoint_id)
         path = self.qjoin_path("endpoint", endpoint_id)
         return self.put(path, data, params=params)
 
@@ -188,8 +253,7 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info("TransferClient.delete_endpoint({})"
-                         .format(endpoint_id))
+        self.logger.info("TransferClient.delete_endpoint(%s)", endpoint_id)
         path = self.qjoin_path("endpoint", endpoint_id)
         return self.delete(path)
 
@@ -265,13 +329,13 @@ class TransferClient(BaseClient):
         """
         merge_params(params, filter_scope=filter_scope,
                      filter_fulltext=filter_fulltext)
-        self.logger.info(
-            "TransferClient.endpoint_manager_monitored_endpoints({})"
-            .format(params))
-        return PaginatedResource(
+        self.logger.info("TransferClient.endpoint_manager_monitored_"
+                         "endpoints(%s)", params)
+        return self.paginated_resource_class(
             self.get, "endpoint_search", {'params': params},
             num_results=num_results, max_results_per_call=100,
-            max_total_results=1000)
+            max_total_results=1000,
+            **self._paging_options(params))
 
     def endpoint_autoactivate(self, endpoint_id, **params):
         r"""
@@ -335,8 +399,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info("TransferClient.endpoint_autoactivate({})"
-                         .format(endpoint_id))
+        self.logger.info("TransferClient.endpoint_autoactivate(%s)",
+                         endpoint_id)
         path = self.qjoin_path("endpoint", endpoint_id, "autoactivate")
         return self.post(path, params=params)
 
@@ -355,8 +419,7 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info("TransferClient.endpoint_deactivate({})"
-                         .format(endpoint_id))
+        self.logger.info("TransferClient.endpoint_deactivate(%s)", endpoint_id)
         path = self.qjoin_path("endpoint", endpoint_id, "deactivate")
         return self.post(path, params=params)
 
@@ -379,8 +442,7 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info("TransferClient.endpoint_activate({})"
-                         .format(endpoint_id))
+        self.logger.info("TransferClient.endpoint_activate(%s)", endpoint_id)
         path = self.qjoin_path("endpoint", endpoint_id, "activate")
         return self.post(path, json_body=requirements_data, params=params)
 
@@ -419,8 +481,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info("TransferClient.my_effective_pause_rule_list({}, ...)"
-                         .format(endpoint_id))
+        self.logger.info("TransferClient.my_effective_pause_rule_list(%s, "
+                         "...)", endpoint_id)
         path = self.qjoin_path('endpoint', endpoint_id,
                                'my_effective_pause_rule_list')
         return self.get(path, params=params,
@@ -443,8 +505,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info("TransferClient.my_shared_endpoint_list({}, ...)"
-                         .format(endpoint_id))
+        self.logger.info("TransferClient.my_shared_endpoint_list(%s, ...)",
+                         endpoint_id)
         path = self.qjoin_path('endpoint', endpoint_id,
                                'my_shared_endpoint_list')
         return self.get(path, params=params,
@@ -503,8 +565,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info("TransferClient.endpoint_server_list({}, ...)"
-                         .format(endpoint_id))
+        self.logger.info("TransferClient.endpoint_server_list(%s, ...)",
+                         endpoint_id)
         path = self.qjoin_path('endpoint', endpoint_id, 'server_list')
         return self.get(path, params=params,
                         response_class=IterableTransferResponse)
@@ -524,8 +586,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info("TransferClient.get_endpoint_server({}, {}, ...)"
-                         .format(endpoint_id, server_id))
+        self.logger.info("TransferClient.get_endpoint_server(%s, %s, ...)",
+                         endpoint_id, server_id)
         path = self.qjoin_path("endpoint", endpoint_id,
                                "server", str(server_id))
         return self.get(path, params=params)
@@ -545,8 +607,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info("TransferClient.add_endpoint_server({}, ...)"
-                         .format(endpoint_id))
+        self.logger.info("TransferClient.add_endpoint_server(%s, ...)",
+                         endpoint_id)
         path = self.qjoin_path("endpoint", endpoint_id, "server")
         return self.post(path, server_data)
 
@@ -565,8 +627,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info("TransferClient.update_endpoint_server({}, {}, ...)"
-                         .format(endpoint_id, server_id))
+        self.logger.info("TransferClient.update_endpoint_server(%s, %s, ...)",
+                         endpoint_id, server_id)
         path = self.qjoin_path("endpoint", endpoint_id,
                                "server", str(server_id))
         return self.put(path, server_data)
@@ -586,8 +648,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info("TransferClient.delete_endpoint_server({}, {})"
-                         .format(endpoint_id, server_id))
+        self.logger.info("TransferClient.delete_endpoint_server(%s, %s)",
+                         endpoint_id, server_id)
         path = self.qjoin_path("endpoint", endpoint_id,
                                "server", str(server_id))
         return self.delete(path)
@@ -611,8 +673,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info("TransferClient.endpoint_role_list({}, ...)"
-                         .format(endpoint_id))
+        self.logger.info("TransferClient.endpoint_role_list(%s, ...)",
+                         endpoint_id)
         path = self.qjoin_path('endpoint', endpoint_id, 'role_list')
         return self.get(path, params=params,
                         response_class=IterableTransferResponse)
@@ -632,8 +694,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info("TransferClient.add_endpoint_role({}, ...)"
-                         .format(endpoint_id))
+        self.logger.info("TransferClient.add_endpoint_role(%s, ...)",
+                         endpoint_id)
         path = self.qjoin_path('endpoint', endpoint_id, 'role')
         return self.post(path, role_data)
 
@@ -652,8 +714,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info("TransferClient.get_endpoint_role({}, {}, ...)"
-                         .format(endpoint_id, role_id))
+        self.logger.info("TransferClient.get_endpoint_role(%s, %s, ...)",
+                         endpoint_id, role_id)
         path = self.qjoin_path('endpoint', endpoint_id, 'role', role_id)
         return self.get(path, params=params)
 
@@ -672,8 +734,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info("TransferClient.delete_endpoint_role({}, {})"
-                         .format(endpoint_id, role_id))
+        self.logger.info("TransferClient.delete_endpoint_role(%s, %s)",
+                         endpoint_id, role_id)
         path = self.qjoin_path('endpoint', endpoint_id, 'role', role_id)
         return self.delete(path)
 
@@ -696,8 +758,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info("TransferClient.endpoint_acl_list({}, ...)"
-                         .format(endpoint_id))
+        self.logger.info("TransferClient.endpoint_acl_list(%s, ...)",
+                         endpoint_id)
         path = self.qjoin_path('endpoint', endpoint_id, 'access_list')
         return self.get(path, params=params,
                         response_class=IterableTransferResponse)
@@ -717,8 +779,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info("TransferClient.get_endpoint_acl_rule({}, {}, ...)"
-                         .format(endpoint_id, rule_id))
+        self.logger.info("TransferClient.get_endpoint_acl_rule(%s, %s, ...)",
+                         endpoint_id, rule_id)
         path = self.qjoin_path('endpoint', endpoint_id, 'access', rule_id)
         return self.get(path, params=params)
 
@@ -761,8 +823,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info("TransferClient.add_endpoint_acl_rule({}, ...)"
-                         .format(endpoint_id))
+        self.logger.info("TransferClient.add_endpoint_acl_rule(%s, ...)",
+                         endpoint_id)
         path = self.qjoin_path('endpoint', endpoint_id, 'access')
         return self.post(path, rule_data)
 
@@ -781,8 +843,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info("TransferClient.update_endpoint_acl_rule({}, {}, ...)"
-                         .format(endpoint_id, rule_id))
+        self.logger.info("TransferClient.update_endpoint_acl_rule(%s, %s, "
+                         "...)", endpoint_id, rule_id)
         path = self.qjoin_path('endpoint', endpoint_id, 'access', rule_id)
         return self.put(path, rule_data)
 
@@ -801,8 +863,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info("TransferClient.delete_endpoint_acl_rule({}, {})"
-                         .format(endpoint_id, rule_id))
+        self.logger.info("TransferClient.delete_endpoint_acl_rule(%s, %s)",
+                         endpoint_id, rule_id)
         path = self.qjoin_path('endpoint', endpoint_id, 'access', rule_id)
         return self.delete(path)
 
@@ -824,7 +886,7 @@ class TransferClient(BaseClient):
         <https://docs.globus.org/api/transfer/endpoint_bookmarks/#get_list_of_bookmarks>`_
         in the REST documentation for details.
         """
-        self.logger.info("TransferClient.bookmark_list({})".format(params))
+        self.logger.info("TransferClient.bookmark_list(%s)", params)
         return self.get('bookmark_list', params=params,
                         response_class=IterableTransferResponse)
 
@@ -842,8 +904,7 @@ class TransferClient(BaseClient):
         <https://docs.globus.org/api/transfer/endpoint_bookmarks/#create_bookmark>`_
         in the REST documentation for details.
         """
-        self.logger.info("TransferClient.create_bookmark({})"
-                         .format(bookmark_data))
+        self.logger.info("TransferClient.create_bookmark(%s)", bookmark_data)
         return self.post('bookmark', bookmark_data)
 
     def get_bookmark(self, bookmark_id, **params):
@@ -861,7 +922,7 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         bookmark_id = safe_stringify(bookmark_id)
-        self.logger.info("TransferClient.get_bookmark({})".format(bookmark_id))
+        self.logger.info("TransferClient.get_bookmark(%s)", bookmark_id)
         path = self.qjoin_path('bookmark', bookmark_id)
         return self.get(path, params=params)
 
@@ -879,8 +940,7 @@ class TransferClient(BaseClient):
         <https://docs.globus.org/api/transfer/endpoint_bookmarks/#update_bookmark>`_
         in the REST documentation for details.
         """
-        self.logger.info("TransferClient.update_bookmark({})"
-                         .format(bookmark_id))
+        self.logger.info("TransferClient.update_bookmark(%s)", bookmark_id)
         path = self.qjoin_path('bookmark', bookmark_id)
         return self.put(path, bookmark_data)
 
@@ -898,8 +958,7 @@ class TransferClient(BaseClient):
         <https://docs.globus.org/api/transfer/endpoint_bookmarks/#delete_bookmark_by_id>`_
         in the REST documentation for details.
         """
-        self.logger.info("TransferClient.delete_bookmark({})"
-                         .format(bookmark_id))
+        self.logger.info("TransferClient.delete_bookmark(%s)", bookmark_id)
         path = self.qjoin_path('bookmark', bookmark_id)
         return self.delete(path)
 
@@ -928,8 +987,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info("TransferClient.operation_ls({}, {})"
-                         .format(endpoint_id, params))
+        self.logger.info("TransferClient.operation_ls(%s, %s)", endpoint_id,
+                         params)
         path = self.qjoin_path("operation/endpoint", endpoint_id, "ls")
         return self.get(path, params=params,
                         response_class=IterableTransferResponse)
@@ -955,8 +1014,8 @@ class TransferClient(BaseClient):
         """
         endpoint_id = safe_stringify(endpoint_id)
         path = safe_stringify(path)
-        self.logger.info("TransferClient.operation_mkdir({}, {}, {})"
-                         .format(endpoint_id, path, params))
+        self.logger.info("TransferClient.operation_mkdir(%s, %s, %s)",
+                         endpoint_id, path, params)
         resource_path = self.qjoin_path("operation/endpoint", endpoint_id,
                                         "mkdir")
         json_body = {
@@ -988,8 +1047,8 @@ class TransferClient(BaseClient):
         endpoint_id = safe_stringify(endpoint_id)
         oldpath = safe_stringify(oldpath)
         newpath = safe_stringify(newpath)
-        self.logger.info("TransferClient.operation_rename({}, {}, {}, {})"
-                         .format(endpoint_id, oldpath, newpath, params))
+        self.logger.info("TransferClient.operation_rename(%s, %s, %s, %s)",
+                         endpoint_id, oldpath, newpath, params)
         resource_path = self.qjoin_path("operation/endpoint", endpoint_id,
                                         "rename")
         json_body = {
@@ -1025,8 +1084,8 @@ class TransferClient(BaseClient):
         endpoint_id = safe_stringify(endpoint_id)
         symlink_target = safe_stringify(symlink_target)
         path = safe_stringify(path)
-        self.logger.info("TransferClient.operation_symlink({}, {}, {}, {})"
-                         .format(endpoint_id, symlink_target, path, params))
+        self.logger.info("TransferClient.operation_symlink(%s, %s, %s, %s)",
+                         endpoint_id, symlink_target, path, params)
         resource_path = self.qjoin_path("operation/endpoint", endpoint_id,
                                         "symlink")
         json_body = {
@@ -1063,9 +1122,31 @@ class TransferClient(BaseClient):
         <https://docs.globus.org/api/transfer/task_submit/#get_submission_id>`_
         in the REST documentation for more details.
         """
-        self.logger.info("TransferClient.get_submission_id({})".format(params))
+        self.logger.info("TransferClient.get_submission_id(%s)", params)
         return self.get("submission_id", params=params)
 
+    def next_submission_id(self):
+        """
+        Get a submission ID for a new task, as a string. It is taken from
+        ``submission_id_pool`` if the client was made with
+        ``submission_id_prefetch``, and fetched with
+        :meth:`get_submission_id <.get_submission_id>` otherwise.
+        """
+        if self.submission_id_pool is not None:
+            return self.submission_id_pool.get()
+        return self.get_submission_id()["value"]
+
+    def _set_submission_id(self, data):
+        """
+        Give a document without a submission ID, such as one made with
+        ``defer_submission_id=True``, a new one. It is kept in the document,
+        so that submitting the document again can't make a second task.
+        """
+        if data.get("submission_id") is None:
+            data["submission_id"] = self.next_submission_id()
+            self.logger.debug("Set submission_id = %s",
+                              data["submission_id"])
+
     def submit_transfer(self, data):
         """
         ``POST /transfer``
@@ -1088,7 +1169,9 @@ class TransferClient(BaseClient):
         >>> print("task_id =", transfer_result["task_id"])
 
         The `data` parameter can be a normal Python dictionary, or
-        a :class:`TransferData <globus_sdk.TransferData>` object.
+        a :class:`TransferData <globus_sdk.TransferData>` object. If it has no
+        ``submission_id``, it is given one with
+        :meth:`next_submission_id <.next_submission_id>`.
 
         **External Documentation**
 
@@ -1098,6 +1181,7 @@ class TransferClient(BaseClient):
         in the REST documentation for more details.
         """
         self.logger.info("TransferClient.submit_transfer(...)")
+        self._set_submission_id(data)
         return self.post('/transfer', data)
 
     def submit_delete(self, data):
@@ -1117,7 +1201,9 @@ class TransferClient(BaseClient):
         >>> print("task_id =", delete_result["task_id"])
 
         The `data` parameter can be a normal Python dictionary, or
-        a :class:`DeleteData <globus_sdk.DeleteData>` object.
+        a :class:`DeleteData <globus_sdk.DeleteData>` object. If it has no
+        ``submission_id``, it is given one with
+        :meth:`next_submission_id <.next_submission_id>`.
 
         **External Documentation**
 
@@ -1127,8 +1213,59 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         self.logger.info("TransferClient.submit_delete(...)")
+        self._set_submission_id(data)
         return self.post('/delete', data)
 
+    def submit_transfer_chunked(self, data, max_items=DEFAULT_MAX_ITEMS,
+                                max_bytes=DEFAULT_MAX_BYTES, concurrency=4):
+        """
+        Submit a transfer document which may be too large for one task, as
+        several tasks, each with a part of its items.
+
+        :rtype: :class:`ChunkedSubmitResult
+                <globus_sdk.transfer.chunking.ChunkedSubmitResult>`
+
+        The document is split into chunks of at most ``max_items`` items
+        which encode to at most ``max_bytes`` bytes. The first chunk keeps the
+        ``submission_id`` of ``data``, if any, and each other chunk gets one of
+        its own when submitted. Chunks are submitted, up to ``concurrency`` at
+        a time, with :meth:`submit_transfer <.submit_transfer>`.
+
+        If any chunk fails, a :class:`ChunkedSubmitError
+        <globus_sdk.exc.ChunkedSubmitError>` is raised once the others are
+        done. Its ``result`` holds the tasks which were made and the chunks,
+        so that those which failed may be submitted again, safely, with the
+        same submission IDs.
+
+        **Examples**
+
+        >>> tc = globus_sdk.TransferClient(...)
+        >>> tdata = globus_sdk.TransferData(tc, source_endpoint_id,
+        >>>                                 destination_endpoint_id)
+        >>> tdata.add_items((path, path) for path in many_paths)
+        >>> result = tc.submit_transfer_chunked(tdata, max_items=10000)
+        >>> print("task_ids =", result.task_ids)
+        """
+        self.logger.info("TransferClient.submit_transfer_chunked(...)")
+        chunks = split_document(data, max_items, max_bytes, self.json_codec)
+        return submit_chunks(self.submit_transfer, chunks, concurrency)
+
+    def submit_delete_chunked(self, data, max_items=DEFAULT_MAX_ITEMS,
+                              max_bytes=DEFAULT_MAX_BYTES, concurrency=4):
+        """
+        Submit a delete document which may be too large for one task, as
+        several tasks, each with a part of its items.
+
+        :rtype: :class:`ChunkedSubmitResult
+                <globus_sdk.transfer.chunking.ChunkedSubmitResult>`
+
+        As :meth:`submit_transfer_chunked <.submit_transfer_chunked>`, but the
+        chunks are submitted with :meth:`submit_delete <.submit_delete>`.
+        """
+        self.logger.info("TransferClient.submit_delete_chunked(...)")
+        chunks = split_document(data, max_items, max_bytes, self.json_codec)
+        return submit_chunks(self.submit_delete, chunks, concurrency)
+
     #
     # Task inspection and management
     #
@@ -1172,10 +1309,11 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         self.logger.info("TransferClient.task_list(...)")
-        return PaginatedResource(
+        return self.paginated_resource_class(
             self.get, 'task_list', {'params': params},
             num_results=num_results, max_results_per_call=1000,
-            paging_style=PaginatedResource.PAGING_STYLE_TOTAL)
+            paging_style=PaginatedResource.PAGING_STYLE_TOTAL,
+            **self._paging_options(params))
 
     def task_event_list(self, task_id, num_results=10, **params):
         r"""
@@ -1218,13 +1356,13 @@ class TransferClient(BaseClient):
         <https://docs.globus.org/api/transfer/task/#get_event_list>`_
         in the REST documentation for details.
         """
-        self.logger.info("TransferClient.task_event_list({}, ...)"
-                         .format(task_id))
+        self.logger.info("TransferClient.task_event_list(%s, ...)", task_id)
         path = self.qjoin_path('task', task_id, 'event_list')
-        return PaginatedResource(
+        return self.paginated_resource_class(
             self.get, path, {'params': params},
             num_results=num_results, max_results_per_call=1000,
-            paging_style=PaginatedResource.PAGING_STYLE_TOTAL)
+            paging_style=PaginatedResource.PAGING_STYLE_TOTAL,
+            **self._paging_options(params))
 
     def get_task(self, task_id, **params):
         """
@@ -1240,7 +1378,7 @@ class TransferClient(BaseClient):
         <https://docs.globus.org/api/transfer/task/#get_task_by_id>`_
         in the REST documentation for details.
         """
-        self.logger.info("TransferClient.get_task({}, ...)".format(task_id))
+        self.logger.info("TransferClient.get_task(%s, ...)", task_id)
         resource_path = self.qjoin_path("task", task_id)
         return self.get(resource_path, params=params)
 
@@ -1258,7 +1396,7 @@ class TransferClient(BaseClient):
         <https://docs.globus.org/api/transfer/task/#update_task_by_id>`_
         in the REST documentation for details.
         """
-        self.logger.info("TransferClient.update_task({}, ...)".format(task_id))
+        self.logger.info("TransferClient.update_task(%s, ...)", task_id)
         resource_path = self.qjoin_path("task", task_id)
         return self.put(resource_path, data, params=params)
 
@@ -1276,7 +1414,7 @@ class TransferClient(BaseClient):
         <https://docs.globus.org/api/transfer/task/#cancel_task_by_id>`_
         in the REST documentation for details.
         """
-        self.logger.info("TransferClient.cancel_task({})".format(task_id))
+        self.logger.info("TransferClient.cancel_task(%s)", task_id)
         resource_path = self.qjoin_path("task", task_id, "cancel")
         return self.post(resource_path)
 
@@ -1327,20 +1465,18 @@ class TransferClient(BaseClient):
         >>>     print(".", end="")
         >>> print("\n{0} completed!".format(task_id))
         """
-        self.logger.info("TransferClient.task_wait({}, {}, {})"
-                         .format(task_id, timeout, polling_interval))
+        self.logger.info("TransferClient.task_wait(%s, %s, %s)", task_id,
+                         timeout, polling_interval)
 
         # check valid args
         if timeout < 1:
-            self.logger.error(
-                "task_wait() timeout={} is less than minimum of 1s"
-                .format(timeout))
+            self.logger.error("task_wait() timeout=%s is less than minimum "
+                              "of 1s", timeout)
             raise exc.GlobusSDKUsageError(
                 "TransferClient.task_wait timeout has a minimum of 1")
         if polling_interval < 1:
-            self.logger.error(
-                "task_wait() polling_interval={} is less than minimum of 1s"
-                .format(polling_interval))
+            self.logger.error("task_wait() polling_interval=%s is less than "
+                              "minimum of 1s", polling_interval)
             raise exc.GlobusSDKUsageError(
                 "TransferClient.task_wait polling_interval has a minimum of 1")
 
@@ -1361,22 +1497,19 @@ class TransferClient(BaseClient):
             task = self.get_task(task_id)
             status = task['status']
             if status != 'ACTIVE':
-                self.logger.debug(
-                    "task_wait(task_id={}) terminated with status={}"
-                    .format(task_id, status))
+                self.logger.debug("task_wait(task_id=%s) terminated with "
+                                  "status=%s", task_id, status)
                 return True
 
             # make sure to check if we timed out before sleeping again, so we
             # don't sleep an extra polling_interval
             waited_time += polling_interval
             if timed_out(waited_time):
-                self.logger.debug(
-                    "task_wait(task_id={}) timed out".format(task_id))
+                self.logger.debug("task_wait(task_id=%s) timed out", task_id)
                 return False
 
-            self.logger.debug(
-                "task_wait(task_id={}) waiting {}s"
-                .format(task_id, polling_interval))
+            self.logger.debug("task_wait(task_id=%s) waiting %ss", task_id,
+                              polling_interval)
             time.sleep(polling_interval)
         # unreachable -- end of task_wait
 
@@ -1394,8 +1527,7 @@ class TransferClient(BaseClient):
         <https://docs.globus.org/api/transfer/task/#get_task_pause_info>`_
         in the REST documentation for details.
         """
-        self.logger.info("TransferClient.task_pause_info({}, ...)"
-                         .format(task_id))
+        self.logger.info("TransferClient.task_pause_info(%s, ...)", task_id)
         resource_path = self.qjoin_path("task", task_id, "pause_info")
         return self.get(resource_path, params=params)
 
@@ -1441,15 +1573,16 @@ class TransferClient(BaseClient):
         <https://docs.globus.org/api/transfer/task/#get_task_successful_transfers>`_
         in the REST documentation for details.
         """
-        self.logger.info("TransferClient.task_successful_transfers({}, ...)"
-                         .format(task_id))
+        self.logger.info("TransferClient.task_successful_transfers(%s, ...)",
+                         task_id)
 
         resource_path = self.qjoin_path("task", task_id,
                                         "successful_transfers")
-        return PaginatedResource(
+        return self.paginated_resource_class(
             self.get, resource_path, {'params': params},
             num_results=num_results, max_results_per_call=1000,
-            paging_style=PaginatedResource.PAGING_STYLE_MARKER)
+            paging_style=PaginatedResource.PAGING_STYLE_MARKER,
+            **self._paging_options(params))
 
     #
     # advanced endpoint management (requires endpoint manager role)
@@ -1469,9 +1602,8 @@ class TransferClient(BaseClient):
         <https://docs.globus.org/api/transfer/advanced_endpoint_management/#get_monitored_endpoints>`_
         in the REST documentation for details.
         """
-        self.logger.info(
-            "TransferClient.endpoint_manager_monitored_endpoints({})"
-            .format(params))
+        self.logger.info("TransferClient.endpoint_manager_monitored_"
+                         "endpoints(%s)", params)
         path = self.qjoin_path('endpoint_manager', 'monitored_endpoints')
         return self.get(path, params=params,
                         response_class=IterableTransferResponse)
@@ -1491,8 +1623,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info(("TransferClient.endpoint_manager_"
-                          "hosted_endpoint_list({})".format(endpoint_id)))
+        self.logger.info("TransferClient.endpoint_manager_hosted_endpoint_"
+                         "list(%s)", endpoint_id)
         path = self.qjoin_path("endpoint_manager", "endpoint",
                                endpoint_id, "hosted_endpoint_list")
         return self.get(path, params=params,
@@ -1515,8 +1647,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info(("TransferClient.endpoint_manager_"
-                          "get_endpoint({})".format(endpoint_id)))
+        self.logger.info("TransferClient.endpoint_manager_get_endpoint(%s)",
+                         endpoint_id)
         path = self.qjoin_path("endpoint_manager", "endpoint", endpoint_id)
         return self.get(path, params=params)
 
@@ -1537,8 +1669,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         endpoint_id = safe_stringify(endpoint_id)
-        self.logger.info(("TransferClient.endpoint_manager_"
-                          "endpoint_acl_list({}, ...)".format(endpoint_id)))
+        self.logger.info("TransferClient.endpoint_manager_endpoint_acl_"
+                         "list(%s, ...)", endpoint_id)
         path = self.qjoin_path("endpoint_manager", "endpoint",
                                endpoint_id, "access_list")
         return self.get(path, params=params,
@@ -1598,10 +1730,11 @@ class TransferClient(BaseClient):
         """
         self.logger.info("TransferClient.endpoint_manager_task_list(...)")
         path = self.qjoin_path('endpoint_manager', 'task_list')
-        return PaginatedResource(
+        return self.paginated_resource_class(
             self.get, path, {'params': params},
             num_results=num_results, max_results_per_call=1000,
-            paging_style=PaginatedResource.PAGING_STYLE_LAST_KEY)
+            paging_style=PaginatedResource.PAGING_STYLE_LAST_KEY,
+            **self._paging_options(params))
 
     def endpoint_manager_get_task(self, task_id, **params):
         """
@@ -1621,8 +1754,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         task_id = safe_stringify(task_id)
-        self.logger.info(("TransferClient.endpoint_manager_"
-                          "get_task({}, ...)".format(task_id)))
+        self.logger.info("TransferClient.endpoint_manager_get_task(%s, ...)",
+                         task_id)
         path = self.qjoin_path("endpoint_manager", "task", task_id)
         return self.get(path, params=params)
 
@@ -1661,14 +1794,15 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         task_id = safe_stringify(task_id)
-        self.logger.info(("TransferClient.endpoint_manager_"
-                          "task_event_list({}, ...)".format(task_id)))
+        self.logger.info("TransferClient.endpoint_manager_task_event_"
+                         "list(%s, ...)", task_id)
         path = self.qjoin_path("endpoint_manager", "task",
                                task_id, "event_list")
-        return PaginatedResource(
+        return self.paginated_resource_class(
             self.get, path, {"params": params},
             num_results=num_results, max_results_per_call=1000,
-            paging_style=PaginatedResource.PAGING_STYLE_TOTAL)
+            paging_style=PaginatedResource.PAGING_STYLE_TOTAL,
+            **self._paging_options(params))
 
     def endpoint_manager_task_pause_info(self, task_id, **params):
         """
@@ -1688,8 +1822,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         task_id = safe_stringify(task_id)
-        self.logger.info(("TransferClient.endpoint_manager_"
-                         "task_pause_info({}, ...)".format(task_id)))
+        self.logger.info("TransferClient.endpoint_manager_task_pause_"
+                         "info(%s, ...)", task_id)
         path = self.qjoin_path("endpoint_manager", "task",
                                task_id, "pause_info")
         return self.get(path, params=params)
@@ -1728,15 +1862,16 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         task_id = safe_stringify(task_id)
-        self.logger.info(("TransferClient.endpoint_manager_task_"
-                          "successful_transfers({}, ...)".format(task_id)))
+        self.logger.info("TransferClient.endpoint_manager_task_successful_"
+                         "transfers(%s, ...)", task_id)
 
         resource_path = self.qjoin_path("endpoint_manager", "task", task_id,
                                         "successful_transfers")
-        return PaginatedResource(
+        return self.paginated_resource_class(
             self.get, resource_path, {'params': params},
             num_results=num_results, max_results_per_call=1000,
-            paging_style=PaginatedResource.PAGING_STYLE_MARKER)
+            paging_style=PaginatedResource.PAGING_STYLE_MARKER,
+            **self._paging_options(params))
 
     def endpoint_manager_cancel_tasks(self, task_ids, message, **params):
         """
@@ -1768,8 +1903,8 @@ class TransferClient(BaseClient):
         """
         task_ids = [safe_stringify(i) for i in task_ids]
         message = safe_stringify(message)
-        self.logger.info(("TransferClient.endpoint_manager_"
-                          "cancel_tasks({},{})".format(task_ids, message)))
+        self.logger.info("TransferClient.endpoint_manager_cancel_tasks(%s,%s)",
+                         task_ids, message)
         json_body = {
             "message": safe_stringify(message),
             "task_id_list": task_ids
@@ -1802,8 +1937,8 @@ class TransferClient(BaseClient):
         <https://docs.globus.org/api/transfer/advanced_endpoint_management/#get_cancel_status_by_id>`_
         in the REST documentation for details.
         """
-        self.logger.info(("TransferClient.endpoint_manager_"
-                          "cancel_status({})".format(admin_cancel_id)))
+        self.logger.info("TransferClient.endpoint_manager_cancel_status(%s)",
+                         admin_cancel_id)
         path = self.qjoin_path("endpoint_manager", "admin_cancel",
                                admin_cancel_id)
         return self.get(path, params=params)
@@ -1838,8 +1973,8 @@ class TransferClient(BaseClient):
         """
         task_ids = [safe_stringify(i) for i in task_ids]
         message = safe_stringify(message)
-        self.logger.info(("TransferClient.endpoint_manager_"
-                          "pause_tasks({},{})".format(task_ids, message)))
+        self.logger.info("TransferClient.endpoint_manager_pause_tasks(%s,%s)",
+                         task_ids, message)
         json_body = {
             "message": safe_stringify(message),
             "task_id_list": task_ids
@@ -1873,8 +2008,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         task_ids = [safe_stringify(i) for i in task_ids]
-        self.logger.info(("TransferClient.endpoint_manager_"
-                          "resume_tasks({})".format(task_ids)))
+        self.logger.info("TransferClient.endpoint_manager_resume_tasks(%s)",
+                         task_ids)
         json_body = {
             "task_id_list": task_ids
         }
@@ -1983,8 +2118,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         pause_rule_id = safe_stringify(pause_rule_id)
-        self.logger.info(("TransferClient.endpoint_manager_"
-                          "get_pause_rule({})".format(pause_rule_id)))
+        self.logger.info("TransferClient.endpoint_manager_get_pause_rule(%s)",
+                         pause_rule_id)
         path = self.qjoin_path("endpoint_manager", "pause_rule", pause_rule_id)
         return self.get(path, params=params)
 
@@ -2017,8 +2152,8 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         pause_rule_id = safe_stringify(pause_rule_id)
-        self.logger.info(("TransferClient.endpoint_manager_"
-                          "update_pause_rule({})".format(pause_rule_id)))
+        self.logger.info("TransferClient.endpoint_manager_update_pause_"
+                         "rule(%s)", pause_rule_id)
         path = self.qjoin_path("endpoint_manager", "pause_rule", pause_rule_id)
         return self.put(path, data)
 
@@ -2049,7 +2184,7 @@ class TransferClient(BaseClient):
         in the REST documentation for details.
         """
         pause_rule_id = safe_stringify(pause_rule_id)
-        self.logger.info(("TransferClient.endpoint_manager_"
-                          "delete_pause_rule({})".format(pause_rule_id)))
+        self.logger.info("TransferClient.endpoint_manager_delete_pause_"
+                         "rule(%s)", pause_rule_id)
         path = self.qjoin_path("endpoint_manager", "pause_rule", pause_rule_id)
         return self.delete(path, params=params)
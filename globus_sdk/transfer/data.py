@@ -6,11 +6,151 @@ conversion.
 """
 from __future__ import unicode_literals
 import logging
+try:
+    from collections.abc import MutableSequence
+except ImportError:  # python2
+    from collections import MutableSequence
+
+import six
 
 from globus_sdk.base import safe_stringify
+from globus_sdk.exc import GlobusSDKUsageError
 
 logger = logging.getLogger(__name__)
 
+# an ItemList holds each item as a tuple of its DATA_TYPE and its values, in
+# the order of the arguments of the function which makes its dict
+
+
+def _transfer_item(data_type, source_path, destination_path, recursive):
+    return {"DATA_TYPE": data_type, "source_path": source_path,
+            "destination_path": destination_path, "recursive": recursive}
+
+
+def _transfer_symlink_item(data_type, source_path, destination_path):
+    return {"DATA_TYPE": data_type, "source_path": source_path,
+            "destination_path": destination_path}
+
+
+def _delete_item(data_type, path):
+    return {"DATA_TYPE": data_type, "path": path}
+
+
+_ITEM_DICTS = {
+    "transfer_item": _transfer_item,
+    "transfer_symlink_item": _transfer_symlink_item,
+    "delete_item": _delete_item,
+}
+
+
+def _item_dict(values):
+    """
+    Make the item document held by an ItemList as a tuple of values.
+    """
+    return _ITEM_DICTS[values[0]](*values)
+
+
+def _add_items(document, items):
+    """
+    Add items, as tuples of values, to the DATA of a document, which is an
+    ItemList if it was made with ``compact_items``, and a list otherwise.
+    """
+    data = document["DATA"]
+    if isinstance(data, ItemList):
+        data._items.extend(items)
+    else:
+        data.extend(_item_dict(values) for values in items)
+
+
+def _next_submission_id(transfer_client):
+    # objects other than a TransferClient may only have get_submission_id
+    next_submission_id = getattr(transfer_client, "next_submission_id", None)
+    if next_submission_id is None:
+        return transfer_client.get_submission_id()["value"]
+    submission_id = next_submission_id()
+    if hasattr(submission_id, "__await__"):
+        submission_id.close()
+        raise GlobusSDKUsageError(
+            "Documents for an async client need a submission_id, or "
+            "defer_submission_id=True")
+    return submission_id
+
+
+class ItemList(MutableSequence):
+    """
+    The ``DATA`` list of a :class:`TransferData <globus_sdk.TransferData>` or
+    :class:`DeleteData <globus_sdk.DeleteData>` made with
+    ``compact_items=True``.
+
+    Items added with ``add_item`` or ``add_items`` are held as tuples of their
+    values, a fraction of the size of dicts, and only become
+    ``transfer_item`` or ``delete_item`` dicts when the document is encoded
+    or when they are read from the list. Items which have been read stay as
+    dicts, so changes made to them are kept.
+
+    Otherwise, an ``ItemList`` behaves as a list of dicts, and item dicts
+    may be added to it directly. It is not a ``list``, though, so documents
+    holding one can only be encoded by the SDK's
+    :class:`JSONCodec <globus_sdk.codec.JSONCodec>` classes, or with
+    ``default=lambda obj: obj.for_json()`` for ``json.dumps``.
+    """
+    def __init__(self, items=()):
+        self._items = []
+        self.extend(items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        item = self._items[index]
+        if isinstance(item, tuple):
+            item = self._items[index] = _item_dict(item)
+        return item
+
+    def __setitem__(self, index, value):
+        self._items[index] = value
+
+    def __delitem__(self, index):
+        del self._items[index]
+
+    def __iter__(self):
+        for index in range(len(self._items)):
+            yield self[index]
+
+    def __eq__(self, other):
+        if isinstance(other, ItemList):
+            return self.for_json() == other.for_json()
+        if isinstance(other, list):
+            return self.for_json() == other
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.for_json())
+
+    def insert(self, index, value):
+        self._items.insert(index, value)
+
+    def for_json(self, start=None, stop=None):
+        """
+        Get the items, or those in ``[start:stop]``, as a list of dicts, which
+        are made afresh for items held as values. This is how the document
+        is encoded.
+        """
+        items = self._items
+        if start is not None or stop is not None:
+            items = items[start:stop]
+        item_dicts = _ITEM_DICTS
+        return [item_dicts[item[0]](*item) if type(item) is tuple else item
+                for item in items]
+
 
 class TransferData(dict):
     """
@@ -19,9 +159,11 @@ class TransferData(dict):
     :meth:`submit_transfer <globus_sdk.TransferClient.submit_transfer>`.
 
     At least one item must be added using
-    :meth:`add_item <globus_sdk.TransferData.add_item>`.
+    :meth:`add_item <globus_sdk.TransferData.add_item>` or
+    :meth:`add_items <globus_sdk.TransferData.add_items>`.
 
-    If ``submission_id`` isn't passed, one will be fetched automatically. The
+    If ``submission_id`` isn't passed, one will be fetched automatically,
+    unless ``defer_submission_id`` is set. The
     submission ID can be pulled out of here to inspect, but the document
     can be used as-is multiple times over to retry a potential submission
     failure (so there shouldn't be any need to inspect it).
@@ -46,7 +188,19 @@ class TransferData(dict):
         A submission ID value fetched via
         :meth:`get_submission_id \
         <globus_sdk.TransferClient.get_submission_id>`. Defaults to using
-        ``transfer_client.get_submission_id``
+        :meth:`transfer_client.next_submission_id \
+        <globus_sdk.TransferClient.next_submission_id>`
+
+      ``defer_submission_id`` (*bool*) [default: ``False``]
+        When true, and no ``submission_id`` is passed, the document is made
+        without one, and is given one when it is submitted. No request is
+        made here, and ``transfer_client`` may be ``None``.
+
+      ``compact_items`` (*bool*) [default: ``False``]
+        When true, ``DATA`` is an
+        :class:`ItemList <globus_sdk.transfer.data.ItemList>`, which holds
+        items in a fraction of the memory of a list of dicts, for documents
+        with very many items. Otherwise it is a list of item dicts.
 
       ``sync_level`` (*int* or *string*) [optional]
         For compatibility with older code and those knowledgeable about the API
@@ -96,41 +250,40 @@ class TransferData(dict):
                  label=None, submission_id=None, sync_level=None,
                  verify_checksum=False, preserve_timestamp=False,
                  encrypt_data=False, deadline=None,
-                 recursive_symlinks="ignore", **kwargs):
+                 recursive_symlinks="ignore", defer_submission_id=False,
+                 compact_items=False, **kwargs):
         source_endpoint = safe_stringify(source_endpoint)
         destination_endpoint = safe_stringify(destination_endpoint)
         logger.info("Creating a new TransferData object")
         self["DATA_TYPE"] = "transfer"
-        self["submission_id"] = submission_id or \
-            transfer_client.get_submission_id()["value"]
-        logger.info("TransferData.submission_id = {}"
-                    .format(self["submission_id"]))
+        if submission_id or not defer_submission_id:
+            self["submission_id"] = submission_id or \
+                _next_submission_id(transfer_client)
+            logger.debug("TransferData.submission_id = %s",
+                         self["submission_id"])
         self["source_endpoint"] = source_endpoint
-        logger.info("TransferData.source_endpoint = {}"
-                    .format(source_endpoint))
+        logger.debug("TransferData.source_endpoint = %s", source_endpoint)
         self["destination_endpoint"] = destination_endpoint
-        logger.info("TransferData.destination_endpoint = {}"
-                    .format(destination_endpoint))
+        logger.debug("TransferData.destination_endpoint = %s",
+                     destination_endpoint)
         self["verify_checksum"] = verify_checksum
-        logger.info("TransferData.verify_checksum = {}"
-                    .format(verify_checksum))
+        logger.debug("TransferData.verify_checksum = %s", verify_checksum)
         self["preserve_timestamp"] = preserve_timestamp
-        logger.info("TransferData.preserve_timestamp = {}"
-                    .format(preserve_timestamp))
+        logger.debug("TransferData.preserve_timestamp = %s",
+                     preserve_timestamp)
         self["encrypt_data"] = encrypt_data
-        logger.info("TransferData.encrypt_data = {}"
-                    .format(encrypt_data))
+        logger.debug("TransferData.encrypt_data = %s", encrypt_data)
         self["recursive_symlinks"] = recursive_symlinks
-        logger.info("TransferData.recursive_symlinks = {}"
-                    .format(recursive_symlinks))
+        logger.debug("TransferData.recursive_symlinks = %s",
+                     recursive_symlinks)
 
         if label is not None:
             self["label"] = label
-            logger.debug("TransferData.label = {}".format(label))
+            logger.debug("TransferData.label = %s", label)
 
         if deadline is not None:
             self["deadline"] = str(deadline)
-            logger.debug("TransferData.deadline = {}".format(deadline))
+            logger.debug("TransferData.deadline = %s", deadline)
 
         # map the sync_level (if it's a nice string) to one of the known int
         # values
@@ -141,15 +294,15 @@ class TransferData(dict):
         if sync_level is not None:
             sync_dict = {"exists": 0, "size": 1, "mtime": 2, "checksum": 3}
             self['sync_level'] = sync_dict.get(sync_level, sync_level)
-            logger.info("TransferData.sync_level = {} ({})"
-                        .format(self['sync_level'], sync_level))
+            logger.debug("TransferData.sync_level = %s (%s)",
+                         self['sync_level'], sync_level)
 
-        self["DATA"] = []
+        self["DATA"] = ItemList() if compact_items else []
 
         self.update(kwargs)
         for option, value in kwargs.items():
-            logger.info("TransferData.{} = {} (option passed in via kwargs)"
-                        .format(option, value))
+            logger.debug("TransferData.%s = %s (option passed in via kwargs)",
+                         option, value)
 
     def add_item(self, source_path, destination_path, recursive=False):
         """
@@ -162,17 +315,47 @@ class TransferData(dict):
         """
         source_path = safe_stringify(source_path)
         destination_path = safe_stringify(destination_path)
-        item_data = {
-            "DATA_TYPE": "transfer_item",
-            "source_path": source_path,
-            "destination_path": destination_path,
-            "recursive": recursive,
-        }
-        logger.debug('TransferData[{}, {}].add_item: "{}"->"{}"'
-                     .format(self["source_endpoint"],
-                             self["destination_endpoint"],
-                             source_path, destination_path))
-        self["DATA"].append(item_data)
+        logger.debug('TransferData[%s, %s].add_item: "%s"->"%s"',
+                     self["source_endpoint"], self["destination_endpoint"],
+                     source_path, destination_path)
+        _add_items(self, (("transfer_item", source_path, destination_path,
+                           recursive),))
+
+    def add_items(self, items, recursive=False):
+        """
+        Add many files or directories to be transfered, as by
+        :meth:`add_item <globus_sdk.TransferData.add_item>`, but several
+        times faster for large numbers of items.
+
+        ``items`` is an iterable of ``(source_path, destination_path)`` pairs,
+        or of ``(source_path, destination_path, recursive)`` triples. Pairs
+        take the value of ``recursive``, which defaults to ``False``.
+
+        >>> tdata.add_items(("/~/source/" + name, "/~/dest/" + name)
+        >>>                 for name in names)
+        """
+        text = six.text_type
+
+        def values():
+            # most paths are already text, so safe_stringify is skipped
+            for item in items:
+                if len(item) == 2:
+                    source_path, destination_path = item
+                    item_recursive = recursive
+                else:
+                    source_path, destination_path, item_recursive = item
+                if type(source_path) is not text:
+                    source_path = safe_stringify(source_path)
+                if type(destination_path) is not text:
+                    destination_path = safe_stringify(destination_path)
+                yield ("transfer_item", source_path, destination_path,
+                       item_recursive)
+
+        count = len(self["DATA"])
+        _add_items(self, values())
+        logger.debug("TransferData[%s, %s].add_items: %s items",
+                     self["source_endpoint"], self["destination_endpoint"],
+                     len(self["DATA"]) - count)
 
     def add_symlink_item(self, source_path, destination_path):
         """
@@ -184,16 +367,11 @@ class TransferData(dict):
         """
         source_path = safe_stringify(source_path)
         destination_path = safe_stringify(destination_path)
-        item_data = {
-            "DATA_TYPE": "transfer_symlink_item",
-            "source_path": source_path,
-            "destination_path": destination_path,
-        }
-        logger.debug('TransferData[{}, {}].add_symlink_item: "{}"->"{}"'
-                     .format(self["source_endpoint"],
-                             self["destination_endpoint"],
-                             source_path, destination_path))
-        self["DATA"].append(item_data)
+        logger.debug('TransferData[%s, %s].add_symlink_item: "%s"->"%s"',
+                     self["source_endpoint"], self["destination_endpoint"],
+                     source_path, destination_path)
+        _add_items(self, (("transfer_symlink_item", source_path,
+                           destination_path),))
 
 
 class DeleteData(dict):
@@ -203,9 +381,11 @@ class DeleteData(dict):
     :meth:`submit_delete <globus_sdk.TransferClient.submit_delete>`.
 
     At least one item must be added using
-    :meth:`add_item <globus_sdk.DeleteData.add_item>`.
+    :meth:`add_item <globus_sdk.DeleteData.add_item>` or
+    :meth:`add_items <globus_sdk.DeleteData.add_items>`.
 
-    If ``submission_id`` isn't passed, one will be fetched automatically. The
+    If ``submission_id`` isn't passed, one will be fetched automatically,
+    unless ``defer_submission_id`` is set. The
     submission ID can be pulled out of here to inspect, but the document
     can be used as-is multiple times over to retry a potential submission
     failure (so there shouldn't be any need to inspect it).
@@ -227,7 +407,19 @@ class DeleteData(dict):
         A submission ID value fetched via
         :meth:`get_submission_id \
         <globus_sdk.TransferClient.get_submission_id>`. Defaults to using
-        ``transfer_client.get_submission_id``
+        :meth:`transfer_client.next_submission_id \
+        <globus_sdk.TransferClient.next_submission_id>`
+
+      ``defer_submission_id`` (*bool*) [default: ``False``]
+        When true, and no ``submission_id`` is passed, the document is made
+        without one, and is given one when it is submitted. No request is
+        made here, and ``transfer_client`` may be ``None``.
+
+      ``compact_items`` (*bool*) [default: ``False``]
+        When true, ``DATA`` is an
+        :class:`ItemList <globus_sdk.transfer.data.ItemList>`, which holds
+        items in a fraction of the memory of a list of dicts, for documents
+        with very many items. Otherwise it is a list of item dicts.
 
       ``recursive`` (*bool*) [default: ``False``]
         Recursively delete subdirectories on the target endpoint
@@ -248,35 +440,35 @@ class DeleteData(dict):
     documentation for example usage.
     """
     def __init__(self, transfer_client, endpoint, label=None,
-                 submission_id=None, recursive=False, deadline=None, **kwargs):
+                 submission_id=None, recursive=False, deadline=None,
+                 defer_submission_id=False, compact_items=False, **kwargs):
         endpoint = safe_stringify(endpoint)
         logger.info("Creating a new DeleteData object")
         self["DATA_TYPE"] = "delete"
-        self["submission_id"] = submission_id or \
-            transfer_client.get_submission_id()["value"]
-        logger.info("DeleteData.submission_id = {}"
-                    .format(self["submission_id"]))
+        if submission_id or not defer_submission_id:
+            self["submission_id"] = submission_id or \
+                _next_submission_id(transfer_client)
+            logger.debug("DeleteData.submission_id = %s",
+                         self["submission_id"])
         self["endpoint"] = endpoint
-        logger.info("DeleteData.endpoint = {}"
-                    .format(endpoint))
+        logger.debug("DeleteData.endpoint = %s", endpoint)
         self["recursive"] = recursive
-        logger.info("DeleteData.recursive = {}"
-                    .format(recursive))
+        logger.debug("DeleteData.recursive = %s", recursive)
 
         if label is not None:
             self["label"] = label
-            logger.debug("DeleteData.label = {}".format(label))
+            logger.debug("DeleteData.label = %s", label)
 
         if deadline is not None:
             self["deadline"] = str(deadline)
-            logger.debug("DeleteData.deadline = {}".format(deadline))
+            logger.debug("DeleteData.deadline = %s", deadline)
 
-        self["DATA"] = []
+        self["DATA"] = ItemList() if compact_items else []
 
         self.update(kwargs)
         for option, value in kwargs.items():
-            logger.info("DeleteData.{} = {} (option passed in via kwargs)"
-                        .format(option, value))
+            logger.debug("DeleteData.%s = %s (option passed in via kwargs)",
+                         option, value)
 
     def add_item(self, path):
         """
@@ -288,10 +480,20 @@ class DeleteData(dict):
         document.
         """
         path = safe_stringify(path)
-        item_data = {
-            "DATA_TYPE": "delete_item",
-            "path": path,
-        }
-        logger.debug('DeleteData[{}].add_item: "{}"'
-                     .format(self["endpoint"], path))
-        self["DATA"].append(item_data)
+        logger.debug('DeleteData[%s].add_item: "%s"', self["endpoint"], path)
+        _add_items(self, (("delete_item", path),))
+
+    def add_items(self, paths):
+        """
+        Add many files, directories or symlinks to be deleted, as by
+        :meth:`add_item <globus_sdk.DeleteData.add_item>`, but several times
+        faster for large numbers of items.
+
+        >>> ddata.add_items("/~/scratch/" + name for name in names)
+        """
+        text = six.text_type
+        count = len(self["DATA"])
+        _add_items(self, (("delete_item", path if type(path) is text
+                           else safe_stringify(path)) for path in paths))
+        logger.debug("DeleteData[%s].add_items: %s items", self["endpoint"],
+                     len(self["DATA"]) - count)
@@ -0,0 +1,320 @@
+"""
+Streaming export of the results of a :class:`PaginatedResource
+<globus_sdk.transfer.paging.PaginatedResource>` to NDJSON, CSV or Parquet
+files.
+
+Results are written one page at a time, straight from the decoded ``DATA``
+lists of the responses, so memory use is bounded by the size of a page
+however many results are exported.
+
+NDJSON and CSV files may be compressed with ``gzip`` or ``bz2``. Parquet files
+require `pyarrow <https://pypi.org/project/pyarrow/>`_, and are compressed
+by pyarrow itself, with any codec it supports.
+"""
+import bz2
+import csv
+import io
+import logging
+import zlib
+
+import six
+
+from globus_sdk import exc
+from globus_sdk.codec import get_default_codec
+from globus_sdk.hooks import timer
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ('ndjson', 'csv', 'parquet')
+COMPRESSIONS = ('gzip', 'bz2')
+
+
+def _import_pyarrow():
+    # pyarrow is slow to import, so it is only imported to write Parquet
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise exc.GlobusSDKUsageError(
+            'Parquet export requires the pyarrow package, which is not '
+            'installed')
+    return pyarrow
+
+
+class ResultExporter(object):
+    """
+    Writes pages of results to a file, and keeps count of what was written.
+
+    >>> with ResultExporter("tasks.csv.gz", format="csv",
+    >>>                     compression="gzip") as exporter:
+    >>>     for page in tc.task_list(num_results=None).pages():
+    >>>         exporter.write_page(page.data)
+    >>> print(exporter.stats["results_per_second"])
+
+    :meth:`PaginatedResource.export
+    <globus_sdk.transfer.paging.PaginatedResource.export>` does this for you.
+
+    **Parameters**
+
+        ``destination`` (*string* or file)
+          A path, or a file opened in binary mode. A path is opened, and
+          closed again by :meth:`close`, while a file is left open
+
+        ``format`` (*string*)
+          One of ``"ndjson"``, ``"csv"`` or ``"parquet"``. Defaults to
+          ``"ndjson"``
+
+        ``fields`` (*list* of *string*)
+          The keys of each result to write, in order. Missing keys are
+          written as null. Defaults to all keys for NDJSON, and to the keys
+          of the first result for CSV and Parquet, as those formats need a
+          fixed set of columns
+
+        ``compression`` (*string*)
+          ``"gzip"`` or ``"bz2"`` for NDJSON and CSV, and any codec supported
+          by pyarrow, such as ``"snappy"`` or ``"zstd"``, for Parquet.
+          Defaults to no compression
+
+        ``codec`` (:class:`JSONCodec <globus_sdk.codec.JSONCodec>`)
+          The codec used to encode NDJSON lines, and nested values in CSV and
+          Parquet columns. Defaults to the default codec
+
+        ``progress`` (*callable*)
+          Called with :attr:`stats` after each page is written
+
+    **Attributes**
+
+        ``stats`` (*dict*)
+          The number of ``results`` and ``pages`` written, the
+          ``bytes_written`` to the file, the ``seconds`` since the exporter
+          was created, and the ``results_per_second`` written in that time.
+          For Parquet, ``bytes_written`` is only known once the exporter is
+          closed, and only if the file can ``tell()`` its position
+    """
+    def __init__(self, destination, format='ndjson', fields=None,
+                 compression=None, codec=None, progress=None):
+        if format not in FORMATS:
+            raise exc.GlobusSDKUsageError(
+                'Unknown export format "{}". Choose one of: {}'
+                .format(format, ', '.join(FORMATS)))
+        if format == 'parquet':
+            pyarrow = _import_pyarrow()
+        elif compression is not None and compression not in COMPRESSIONS:
+            raise exc.GlobusSDKUsageError(
+                'Unknown export compression "{}". Choose one of: {}'
+                .format(compression, ', '.join(COMPRESSIONS)))
+
+        self.format = format
+        self.progress = progress
+        self._owns_file = isinstance(destination, six.string_types)
+        self._file = (open(destination, 'wb') if self._owns_file
+                      else destination)
+        codec = codec or get_default_codec()
+        if format == 'parquet':
+            self._stream = None
+            self._writer = _ParquetWriter(self._file, fields, codec,
+                                          compression, pyarrow)
+        else:
+            self._stream = _CountingStream(self._file, compression)
+            writer_class = _NDJSONWriter if format == 'ndjson' else _CSVWriter
+            self._writer = writer_class(self._stream, fields, codec)
+
+        self._start = timer()
+        self._closed = False
+        self.stats = {'results': 0, 'pages': 0, 'bytes_written': 0,
+                      'seconds': 0.0, 'results_per_second': 0.0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write_page(self, results):
+        """
+        Write a list of results, as decoded dicts.
+        """
+        self._writer.write(results)
+        self.stats['results'] += len(results)
+        self.stats['pages'] += 1
+        if self._stream is not None:
+            self.stats['bytes_written'] = self._stream.bytes_written
+        self._update_rate()
+        if self.progress is not None:
+            self.progress(self.stats)
+
+    def close(self):
+        """
+        Finish the file, and close it if it was opened from a path.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._writer.close()
+            if self._stream is not None:
+                self._stream.close()
+                self.stats['bytes_written'] = self._stream.bytes_written
+            else:
+                try:
+                    self.stats['bytes_written'] = self._file.tell()
+                except (AttributeError, IOError, ValueError):
+                    self.stats['bytes_written'] = None
+        finally:
+            if self._owns_file:
+                self._file.close()
+        self._update_rate()
+        logger.info('Exported %s results in %s pages as %s, %s bytes, '
+                    '%.0f results/s', self.stats['results'],
+                    self.stats['pages'], self.format,
+                    self.stats['bytes_written'],
+                    self.stats['results_per_second'])
+
+    def _update_rate(self):
+        seconds = timer() - self._start
+        self.stats['seconds'] = seconds
+        if seconds > 0:
+            self.stats['results_per_second'] = self.stats['results'] / seconds
+
+
+class _CountingStream(object):
+    """
+    Writes bytes to a file, optionally compressing them, and counts the bytes
+    which reach the file.
+    """
+    def __init__(self, f, compression=None):
+        self.file = f
+        self.bytes_written = 0
+        if compression == 'gzip':
+            self._compressor = zlib.compressobj(
+                6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        elif compression == 'bz2':
+            self._compressor = bz2.BZ2Compressor()
+        else:
+            self._compressor = None
+
+    def write(self, data):
+        if self._compressor is not None:
+            data = self._compressor.compress(data)
+        if data:
+            self.file.write(data)
+            self.bytes_written += len(data)
+
+    def close(self):
+        if self._compressor is not None:
+            data = self._compressor.flush()
+            self._compressor = None
+            if data:
+                self.file.write(data)
+                self.bytes_written += len(data)
+
+
+class _ResultWriter(object):
+    def __init__(self, stream, fields, codec):
+        self.stream = stream
+        self.fields = fields
+        self.codec = codec
+
+    def write(self, results):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def _dumps(self, obj):
+        doc = self.codec.dumps(obj)
+        if isinstance(doc, six.text_type):
+            doc = doc.encode('utf-8')
+        return doc
+
+    def _flat_value(self, value):
+        """
+        Nested values are kept as JSON text in CSV and Parquet columns.
+        """
+        if isinstance(value, (dict, list)):
+            return self._dumps(value).decode('utf-8')
+        return value
+
+
+class _NDJSONWriter(_ResultWriter):
+    def write(self, results):
+        if not results:
+            return
+        if self.fields is not None:
+            results = [dict((field, result.get(field))
+                            for field in self.fields)
+                       for result in results]
+        self.stream.write(
+            b'\n'.join(self._dumps(result) for result in results) + b'\n')
+
+
+class _CSVWriter(_ResultWriter):
+    _header_written = False
+
+    def write(self, results):
+        if not results:
+            return
+        if self.fields is None:
+            self.fields = list(results[0])
+        rows = []
+        if not self._header_written:
+            rows.append(self.fields)
+            self._header_written = True
+        for result in results:
+            rows.append([self._cell(result.get(field))
+                         for field in self.fields])
+
+        if six.PY2:
+            buf = io.BytesIO()
+            csv.writer(buf).writerows(
+                [[cell.encode('utf-8') if isinstance(cell, unicode)  # noqa
+                  else cell for cell in row] for row in rows])
+            self.stream.write(buf.getvalue())
+        else:
+            buf = io.StringIO()
+            csv.writer(buf).writerows(rows)
+            self.stream.write(buf.getvalue().encode('utf-8'))
+
+    def _cell(self, value):
+        if value is None:
+            return ''
+        if isinstance(value, bool):
+            return 'true' if value else 'false'
+        return self._flat_value(value)
+
+
+class _ParquetWriter(_ResultWriter):
+    def __init__(self, f, fields, codec, compression, pyarrow):
+        _ResultWriter.__init__(self, f, fields, codec)
+        self.pyarrow = pyarrow
+        self.compression = compression or 'none'
+        self._writer = None
+        self._schema = None
+
+    def write(self, results):
+        if not results:
+            return
+        if self.fields is None:
+            self.fields = list(results[0])
+        columns = [[self._flat_value(result.get(field)) for result in results]
+                   for field in self.fields]
+        if self._writer is None:
+            # columns which are all null on the first page are taken to be
+            # strings, so that later pages can fill them
+            pyarrow = self.pyarrow
+            arrays = [pyarrow.array(column) for column in columns]
+            self._schema = pyarrow.schema([
+                pyarrow.field(name, pyarrow.string()
+                              if pyarrow.types.is_null(array.type)
+                              else array.type)
+                for name, array in zip(self.fields, arrays)])
+            self._writer = pyarrow.parquet.ParquetWriter(
+                self.stream, self._schema, compression=self.compression)
+        arrays = [self.pyarrow.array(column, type=field.type)
+                  for column, field in zip(columns, self._schema)]
+        self._writer.write_table(
+            self.pyarrow.Table.from_arrays(arrays, schema=self._schema))
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
@@ -0,0 +1,191 @@
+"""
+Ordered merging of the results of several :class:`PaginatedResource
+<globus_sdk.transfer.paging.PaginatedResource>` objects into one stream.
+"""
+import heapq
+import logging
+import operator
+import threading
+
+import six
+from six.moves import queue
+
+from globus_sdk.exc import GlobusSDKUsageError
+
+logger = logging.getLogger(__name__)
+
+
+def merge_paginated(resources, key, reverse=False, prefetch=1):
+    """
+    Merge the results of several ``PaginatedResource`` objects, each of which
+    is already ordered by ``key``, into one stream ordered by ``key``:
+
+    >>> since = "2018-01-01T00:00:00"
+    >>> resources = [
+    >>>     tc.endpoint_manager_task_list(
+    >>>         num_results=None, filter_endpoint=ep_id,
+    >>>         filter_completion_time=since + ",")
+    >>>     for ep_id in endpoint_ids]
+    >>> for task in merge_paginated(resources, "request_time", reverse=True):
+    >>>     print(task["request_time"], task["task_id"])
+
+    The pages of every resource are fetched concurrently, each in a thread of
+    its own, which stays at most ``prefetch`` pages ahead of the merge. Memory
+    use is therefore bounded by ``1 + prefetch`` pages per resource, however
+    many results there are. Results are yielded as each resource's
+    ``item_mode`` selects, and results with equal keys are yielded in the
+    order of ``resources``.
+
+    As with :meth:`PaginatedResource.pages
+    <globus_sdk.transfer.paging.PaginatedResource.pages>`, the resources must
+    not have been iterated already, unless their pages are cached. If
+    fetching a page fails, the error is raised by the merge.
+
+    **Parameters**
+
+        ``resources`` (*iterable* of ``PaginatedResource``)
+          The resources to merge
+
+        ``key`` (*string* or *callable*)
+          The field of each result to order by, or a function called with
+          each result, as a decoded dict, which returns the value to order by
+
+        ``reverse`` (*bool*)
+          If True, the resources are ordered by descending ``key``, as is
+          the merged stream. Defaults to False
+
+        ``prefetch`` (*int*)
+          The number of pages of each resource fetched ahead of the page
+          being merged. Defaults to 1
+    """
+    if prefetch < 1:
+        raise GlobusSDKUsageError(
+            'merge_paginated prefetch must be >= 1, got {}'.format(prefetch))
+    if isinstance(key, six.string_types):
+        key = operator.itemgetter(key)
+    if reverse:
+        get_key = key
+
+        def key(result):
+            return _Descending(get_key(result))
+
+    streams = [_PageStream(resource, prefetch) for resource in resources]
+    return _merge(streams, key)
+
+
+def _merge(streams, key):
+    """
+    A generator of the results of ``streams``, merged by ``key``.
+    """
+    try:
+        for stream in streams:
+            stream.start()
+
+        # the heap holds the next result of each stream which has one
+        heap = []
+        for index, stream in enumerate(streams):
+            result = stream.next_result()
+            if result is not _END:
+                heap.append((key(result), index, result))
+        heapq.heapify(heap)
+
+        while heap:
+            _, index, result = heap[0]
+            stream = streams[index]
+            yield stream.convert(result)
+            result = stream.next_result()
+            if result is _END:
+                heapq.heappop(heap)
+            else:
+                heapq.heapreplace(heap, (key(result), index, result))
+    finally:
+        for stream in streams:
+            stream.stop()
+
+
+# marks the end of a stream
+_END = object()
+
+
+class _Descending(object):
+    """
+    Wraps a key, so that it sorts in descending order.
+    """
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+class _PageStream(object):
+    """
+    The results of one resource, with its pages fetched in a worker thread up
+    to ``prefetch`` pages ahead of the page being merged.
+    """
+    def __init__(self, resource, prefetch):
+        self.resource = resource
+        self._result_lists = resource._result_lists()
+        self._pages = queue.Queue()
+        # each fetched page takes a slot until it is merged
+        self._slots = threading.Semaphore(prefetch)
+        self._stop = threading.Event()
+        self._page = []
+        self._position = 0
+
+    def convert(self, result):
+        convert = self.resource._convert_item
+        return result if convert is None else convert(result)
+
+    def start(self):
+        worker = threading.Thread(target=self._fetch,
+                                  name='merge_paginated-fetch')
+        worker.daemon = True
+        worker.start()
+
+    def stop(self):
+        self._stop.set()
+        # wake the worker if it is waiting for a slot
+        self._slots.release()
+
+    def next_result(self):
+        """
+        Get the next result of the stream, or ``_END``.
+        """
+        while self._position >= len(self._page):
+            results, err = self._pages.get()
+            if err is not None:
+                raise err
+            if results is None:
+                self._page = []
+                return _END
+            self._slots.release()
+            self._page = results
+            self._position = 0
+        result = self._page[self._position]
+        self._position += 1
+        return result
+
+    def _fetch(self):
+        try:
+            while True:
+                self._slots.acquire()
+                if self._stop.is_set():
+                    return
+                results = next(self._result_lists, None)
+                if results is None:
+                    break
+                self._pages.put((results, None))
+        except Exception as err:
+            self._pages.put((None, err))
+        else:
+            self._pages.put((None, None))
+        finally:
+            close = getattr(self._result_lists, 'close', None)
+            if close is not None:
+                close()
@@ -1,8 +1,17 @@
 import logging
+import tempfile
+import threading
+import zlib
+from collections import deque
+from itertools import islice
+
 import six
+from six.moves import map, queue
 
+from globus_sdk.codec import JSONCodec, get_default_codec
 from globus_sdk.exc import GlobusSDKUsageError
-from globus_sdk.response import GlobusResponse
+from globus_sdk.hooks import timer
+from globus_sdk.response import GlobusResponse, item_converter
 from globus_sdk.transfer.response import IterableTransferResponse
 
 logger = logging.getLogger(__name__)
@@ -21,6 +30,9 @@ class PaginatedResource(GlobusResponse, six.Iterator):
 
     Because paginated data can be large, you will tend to get the best
     performance by being sure to only iterate over the results once.
+    If results must be iterated more than once, pass ``cache_bytes``, which
+    keeps pages in a :class:`PageCache` of bounded memory, rather than keeping
+    every result in a list.
     """
 
     # pages have 'has_next_page', 'offset', and 'limit'
@@ -34,6 +46,15 @@ class PaginatedResource(GlobusResponse, six.Iterator):
     # results, but which is opaque
     PAGING_STYLE_MARKER = 3
 
+    # options which paginated TransferClient methods pass through from their
+    # keyword arguments, rather than sending them as query params
+    PAGING_OPTIONS = ('prefetch', 'concurrency', 'ordered', 'item_mode',
+                      'cursor', 'cache_bytes', 'adaptive_limit', 'fields',
+                      'stop_when')
+
+    # query params set by paging, which are left out of cursors
+    PAGING_PARAMS = ('limit', 'offset', 'marker', 'last_key')
+
     # bind an object at class def time to act as a sentinel value for iteration
     # Basically grabbing something that can't be duplicated by iteration
     # results
@@ -45,7 +66,10 @@ class PaginatedResource(GlobusResponse, six.Iterator):
                  # paging parameters
                  num_results=None, max_results_per_call=1000,
                  max_total_results=None, offset=0,
-                 paging_style=PAGING_STYLE_HAS_NEXT):
+                 paging_style=PAGING_STYLE_HAS_NEXT, prefetch=0,
+                 concurrency=1, ordered=True, item_mode='response',
+                 cursor=None, cache_bytes=None, adaptive_limit=None,
+                 fields=None, stop_when=None):
         """
         A class that describes paginated Transfer API resources.
         This is not a top level helper func because it depends upon the
@@ -112,16 +136,132 @@ class PaginatedResource(GlobusResponse, six.Iterator):
           ``paging_style``
             An value from an enum on this class which tells us how paging works
             for this API.
+
+          ``prefetch``
+            The number of pages to fetch ahead of the page being iterated, in
+            a background thread, so that fetching pages overlaps with
+            processing results. Pages beyond ``num_results`` are never
+            fetched. Defaults to 0, meaning that each page is only fetched
+            once the previous one has been consumed.
+
+          ``concurrency``
+            The number of pages to fetch at once. Only supported by
+            ``PAGING_STYLE_TOTAL``, where the first page gives the total
+            number of results, and so the offsets of all other pages. Those
+            pages are then fetched by ``concurrency`` worker threads, which
+            stay at most ``2 * concurrency`` pages ahead of iteration.
+            Takes precedence over ``prefetch``. Defaults to 1, meaning that
+            pages are fetched one at a time.
+
+          ``ordered``
+            When fetching pages concurrently, yield results in the order of
+            the result set. If False, the results of each page are yielded as
+            soon as it arrives. Defaults to True.
+
+          ``item_mode``
+            How results are represented. ``"response"`` wraps each one in a
+            ``GlobusResponse``, which is the default, and ``"dict"`` yields
+            the decoded dicts themselves. ``"view"`` yields read-only
+            :class:`ItemView <globus_sdk.response.ItemView>` mappings sharing
+            those dicts, and ``"record"`` yields compact
+            :class:`ItemRecord <globus_sdk.response.ItemRecord>` copies,
+            which let each page be freed once its results are made, and so
+            take the least memory when results are kept, e.g. by ``data``.
+
+          ``cursor``
+            A cursor from :meth:`cursor`, to resume paging where it was
+            taken, rather than from the start. The query params and
+            ``num_results`` of the cursor are used in place of those given,
+            and only the page on which the cursor was taken is fetched again.
+
+          ``cache_bytes``
+            Keep the pages of results in a :class:`PageCache`, so that the
+            resource can be iterated again, and by several consumers at once,
+            with each page only fetched once. Up to ``cache_bytes`` of the
+            most recent pages, as measured by the size of their responses,
+            are kept in memory, and older pages are spilled to a temporary
+            file. Every ``iter()`` of the resource starts from the first
+            result, while ``next()`` continues a single iteration. Defaults
+            to None, meaning that nothing is cached, and the resource can
+            only be iterated once.
+
+          ``adaptive_limit``
+            Choose the ``limit`` of each page at runtime, rather than always
+            asking for ``max_results_per_call`` results, with an
+            :class:`AdaptivePageSize`, or True for one with default settings.
+            Pages then start small, so that the first results arrive quickly,
+            and grow as far as ``max_results_per_call`` when responses are
+            fast. Not supported with ``concurrency``.
+
+          ``fields``
+            The fields of each result which the API should return, as a list
+            or a comma separated string. It is sent as the ``fields`` query
+            param, so that the API leaves out all other fields, which makes
+            responses smaller. Defaults to None, meaning all fields.
+
+          ``stop_when``
+            A function called with each result, as a decoded dict, as soon as
+            its page is fetched. Paging stops at the first result for which
+            it returns True, and that result and all those after it are left
+            out. No page after it is fetched, even when prefetching. With
+            ``concurrency``, pages are requested ahead of it, so up to
+            ``2 * concurrency`` pages already in flight when it is seen are
+            still fetched, and their results dropped, but no more are
+            requested. With ``ordered=False``, pages are cut in the order
+            they arrive, so results of later pages may already have been
+            yielded. For example, to stop at tasks requested before a date,
+            when tasks are listed newest first:
+
+            >>> tc.task_list(num_results=None,
+            >>>              stop_when=lambda t: t["request_time"] < since)
         """
-        logger.info("Creating PaginatedResource({}) on {}(instance:{}):{}:{}"
-                    .format(paging_style,
-                            client_method.__self__.__class__.__name__,
-                            id(client_method.__self__),
-                            client_method.__name__, path))
+        logger.info("Creating PaginatedResource(%s) on %s(instance:%s):%s:%s",
+                    paging_style, client_method.__self__.__class__.__name__,
+                    id(client_method.__self__), client_method.__name__, path)
         self.max_results_per_call = max_results_per_call
         self.max_total_results = max_total_results
         self.offset = offset
         self.paging_style = paging_style
+        self.prefetch = prefetch
+        if concurrency < 1:
+            raise GlobusSDKUsageError(
+                'PaginatedResource.concurrency must be >= 1, got {}'
+                .format(concurrency))
+        if concurrency > 1 and paging_style != self.PAGING_STYLE_TOTAL:
+            raise GlobusSDKUsageError(
+                'PaginatedResource.concurrency is only supported for '
+                'resources whose pages give a total number of results')
+        self.concurrency = concurrency
+        self.ordered = ordered
+        if adaptive_limit is True:
+            adaptive_limit = AdaptivePageSize()
+        elif adaptive_limit is False:
+            adaptive_limit = None
+        if adaptive_limit is not None and concurrency > 1:
+            raise GlobusSDKUsageError(
+                'PaginatedResource.adaptive_limit is not supported with '
+                'concurrency')
+        self.adaptive_limit = adaptive_limit
+        self.item_mode = item_mode
+        self.cache_bytes = cache_bytes
+
+        if cursor is not None:
+            if (cursor['paging_style'] != paging_style or
+                    cursor['path'] != path):
+                raise GlobusSDKUsageError(
+                    'PaginatedResource cursor was taken from a different '
+                    'resource')
+            client_kwargs['params'] = dict(cursor['params'])
+            num_results = cursor['num_results']
+            if cursor['offset'] is not None:
+                self.offset = cursor['offset']
+
+        if fields is not None:
+            if not isinstance(fields, six.string_types):
+                fields = ','.join(fields)
+            client_kwargs['params'] = dict(client_kwargs['params'] or {},
+                                           fields=fields)
+        self.stop_when = stop_when
 
         # check the requested num results to see if it exceeds the maximum
         # total number of results allowed by the API or if it is not set and
@@ -142,6 +282,13 @@ class PaginatedResource(GlobusResponse, six.Iterator):
         # counter for how many results we've gotten thusfar, used to cap paging
         # in non-offset based styles
         self.num_results_fetched = 0
+        # the number of results of the first page to skip when resuming from
+        # a cursor
+        self._skip = 0
+        if cursor is not None:
+            self.next_marker = cursor['marker'] or cursor['last_key']
+            self.num_results_fetched = cursor['num_results_fetched']
+            self._skip = cursor['skip']
 
         # what function call does this class instance wrap up?
         self.client_method = client_method
@@ -154,9 +301,35 @@ class PaginatedResource(GlobusResponse, six.Iterator):
         self.client_kwargs = client_kwargs
         self.client_kwargs['response_class'] = IterableTransferResponse
 
+        self._convert_item = item_converter(item_mode,
+                                            client=self.client_object)
+
+        self._start_iteration()
+
+    def _start_iteration(self):
+        """
+        Begin iteration, fetching the first page of results. This is done at
+        creation time so that errors from the first call are raised eagerly.
+        """
+        # the current page, set up by _start_tracking(), and the generator of
+        # pages, are kept so that iteration can move from results to pages()
+        self._page_source = None
+        self._pages_taken = False
+        self._start_tracking()
+
         # convert the iterable_func method into a generator expression by
         # calling it
-        self.generator = self.iterable_func()
+        if self.cache_bytes is None:
+            self.generator = self.iterable_func()
+        else:
+            codec = getattr(self.client_object, 'json_codec', None)
+            self._cache = PageCache(
+                self.cache_bytes,
+                codec=codec if isinstance(codec, JSONCodec) else None)
+            self._cache_lock = threading.Lock()
+            self._cache_feed = self._page_generator()
+            self._cache_error = None
+            self.generator = self._iter_cached()
 
         # grab the first element out of the internal iteration function
         # because this could raise a StopIteration exception, we need to be
@@ -185,7 +358,12 @@ class PaginatedResource(GlobusResponse, six.Iterator):
         """
         Each instance is an iterable, so make it the result of `__iter__` and
         rely on an explicit `next()` method.
+
+        When pages are cached, each iteration instead starts from the first
+        result.
         """
+        if self.cache_bytes is not None:
+            return self._iter_cached()
         return self
 
     def __next__(self):
@@ -202,7 +380,7 @@ class PaginatedResource(GlobusResponse, six.Iterator):
                           "iteration empty (not an error!)"))
             raise StopIteration()
 
-        if self.first_elem != self._magic:
+        if self.first_elem is not self._magic:
             tmp = self.first_elem
             self.first_elem = self._magic
             return tmp
@@ -220,103 +398,850 @@ class PaginatedResource(GlobusResponse, six.Iterator):
 
         This method is the real workhorse of this entire module.
         """
-        if not self.client_kwargs['params']:
-            self.client_kwargs['params'] = {}
+        pages = self._page_generator()
+        self._page_source = pages
+        try:
+            for res in pages:
+                # keep the current page, in case iteration moves to pages()
+                skip = self._track_page(res)
+                # walk the page, yielding its results as selected by
+                # item_mode, by default wrapped in GlobusResponse objects
+                # nicely, the __getitem__ for GlobusResponse will work on raw
+                # dicts, so these handle well
+                items = islice(res, skip, None) if skip else res
+                if self._convert_item is not None:
+                    items = map(self._convert_item, items)
+                for item in items:
+                    self._item_pending = True
+                    yield item
+                    self._item_pending = False
+                    # increment the "num results" counter
+                    self.num_results_fetched += 1
+                    self._page_consumed += 1
 
-        # to start with, cap the limit per request to the max per request size
-        self.limit = self.max_results_per_call
+                    # ensure that even if the paging style requires that we
+                    # fetch more results than were requested, we still only
+                    # yield the number that were requested -- returning here
+                    # will result in a StopIteration because this is a
+                    # generator function
+                    if (self.num_results is not None and
+                            self.num_results_fetched >= self.num_results):
+                        return
+        finally:
+            # stop any prefetching as soon as iteration ends, unless the
+            # pages have been handed over to pages()
+            if not self._pages_taken:
+                pages.close()
+
+    def _page_generator(self):
+        """
+        Get the generator of pages selected by ``concurrency`` and
+        ``prefetch``.
+        """
+        if self.concurrency > 1:
+            return self._fetch_pages_concurrently()
+        if self.prefetch:
+            return self._prefetch_pages()
+        return self._fetch_pages()
+
+    def _iter_cached(self):
+        """
+        A generator of all results, read from the page cache, which is filled
+        from the pages fetched as needed.
+        """
+        for data in self._iter_cached_pages():
+            items = data
+            if self._convert_item is not None:
+                items = map(self._convert_item, data)
+            for item in items:
+                yield item
+
+    def _iter_cached_pages(self):
+        """
+        A generator of the list of results of each page in the page cache.
+        """
+        index = 0
+        while True:
+            data = self._cached_page(index)
+            if data is None:
+                return
+            index += 1
+            yield data
+
+    def _cached_page(self, index):
+        """
+        Get the results of the page at ``index`` from the page cache, fetching
+        pages until it is there, or None if there is no such page.
+        Consumers wait for each other, so that each page is fetched once.
+        """
+        if index >= len(self._cache):
+            with self._cache_lock:
+                while index >= len(self._cache):
+                    if self._cache_error is not None:
+                        raise self._cache_error
+                    if self._cache_feed is None:
+                        return None
+                    try:
+                        self._cache_next_page()
+                    except Exception as err:
+                        self._cache_error = err
+                        self._cache_feed = None
+                        raise
+        return self._cache.get(index)
+
+    def _cache_next_page(self):
+        """
+        Fetch the next page into the page cache, cutting its results short if
+        they would go over ``num_results``.
+        """
+        res = next(self._cache_feed, None)
+        if res is None:
+            self._cache_feed = None
+            return
+        skip = self._track_page(res)
+        data = res['DATA'][skip:] if skip else res['DATA']
         if self.num_results is not None:
-            self.limit = min(self.num_results, self.limit)
+            data = data[:max(self.num_results - self.num_results_fetched, 0)]
+        self.num_results_fetched += len(data)
+        self._page_consumed = skip + len(data)
+        self._cache.append(data, _response_bytes(res))
+        if (self.num_results is not None and
+                self.num_results_fetched >= self.num_results):
+            # stop any prefetching
+            self._cache_feed.close()
+            self._cache_feed = None
 
-        def _set_params_for_next_call():
-            # if we're about to request more results than the user asked
-            # for, limit ourselves on the last paginated call to the API
-            if (self.num_results is not None and
-                    self.offset + self.limit > self.num_results):
-                self.limit = self.num_results - self.offset
+    def pages(self):
+        """
+        Iterate over whole pages of results rather than over individual
+        results, getting a :class:`PaginatedResourcePage` for each page.
+        Pages hold the raw ``DATA`` list of the response, so no object is
+        created per result, which makes this much faster for bulk processing:
 
-            # all paging styles support limit
-            # MARKER doesn't have it documented, but it is in fact supported
-            self.client_kwargs['params']['limit'] = self.limit
+        >>> for page in tc.task_list(num_results=None).pages():
+        >>>     total_bytes += sum(t["bytes_transferred"] for t in page.data)
 
-            # if the paging is done by marker, just carry over the marker
-            if self.paging_style == self.PAGING_STYLE_MARKER:
-                if self.next_marker:
-                    self.client_kwargs['params']['marker'] = (
-                        self.next_marker)
-            elif self.paging_style == self.PAGING_STYLE_LAST_KEY:
-                if self.next_marker:
-                    self.client_kwargs['params']['last_key'] = self.next_marker
-            # these params work for all paging styles *except* MARKER
-            # and LAST_KEY
-            else:
-                self.client_kwargs['params']['offset'] = self.offset
+        As with results, pages can only be iterated once, and ``pages()``
+        can't be used once iteration over results has begun. The last page is
+        cut short if needed, so that pages hold no more than ``num_results``
+        results in total.
+        """
+        if self.cache_bytes is not None:
+            raise GlobusSDKUsageError(
+                "PaginatedResource.pages() can't be used when pages are "
+                "cached")
+        if self._pages_taken or (self.generator is not None and
+                                 self.first_elem is self._magic):
+            raise GlobusSDKUsageError(
+                "PaginatedResource.pages() can't be used once iteration has "
+                "begun")
+        self._pages_taken = True
+        # the item generator holds the first page; drop it, leaving the page
+        # generator to pages()
+        self.generator = None
+        self._item_pending = False
+        return self._iter_pages(self._page, self._page_source)
 
-        def _check_has_next_page(res):
-            """
-            Check that the API says there are more results available.
+    def _iter_pages(self, first_page, pages):
+        """
+        A generator of ``PaginatedResourcePage`` objects for ``first_page``,
+        which was fetched before ``pages()`` was called, and then ``pages``.
+        """
+        try:
+            if first_page is not None:
+                page = self._make_page(first_page, skip=self._page_consumed)
+                yield page
+                if page._last:
+                    return
+            for res in pages:
+                page = self._make_page(res, skip=self._track_page(res))
+                yield page
+                if page._last:
+                    return
+        finally:
+            pages.close()
 
-            Additionally, update the PaginatedResource.maker or
-            PaginatedResource.offset based on the response
-            """
-            # if the paging style is LAST_KEY, check has_next_page
-            if self.paging_style == self.PAGING_STYLE_LAST_KEY:
-                self.next_marker = res.get('last_key')
-                return res['has_next_page']
+    def _make_page(self, res, skip=0):
+        """
+        Wrap a response in a ``PaginatedResourcePage``, leaving out its first
+        ``skip`` results, and cutting its results short if they would go over
+        ``num_results``.
+        """
+        page = PaginatedResourcePage(res)
+        if skip:
+            page.data = page.data[skip:]
+        if self.num_results is not None:
+            remaining = self.num_results - self.num_results_fetched
+            if len(page.data) >= remaining:
+                page.data = page.data[:remaining]
+                page._last = True
+        self.num_results_fetched += len(page.data)
+        self._page_consumed = skip + len(page.data)
+        return page
 
-            # if the paging style is MARKER, look at the marker
-            if self.paging_style == self.PAGING_STYLE_MARKER:
-                # marker may be 0, null, or absent if no more results
-                # API docs aren't 100% clear -- looks like 0 is what we should
-                # expect, but we'll also accept null or absent to be safe
-                self.next_marker = res.get('next_marker')
-                return bool(self.next_marker)
-
-            # start doing the offset maths and see if we have another page to
-            # fetch
-            # step size is the number of results per call -- we'll catch this
-            # "walking off the end" of the requested results afterwards
-            self.offset += self.max_results_per_call
-
-            # if it's HAS_NEXT, the check is easy, as it's explicitly part of
-            # the response
-            if self.paging_style == self.PAGING_STYLE_HAS_NEXT:
-                # just return the has_next_page value
-                return res['has_next_page']
-
-            # if paging is TOTAL oriented, check if we've reached the total
-            if self.paging_style == self.PAGING_STYLE_TOTAL:
-                return self.offset < res['total']
-
-            logger.error("PaginatedResource.paging_style={} is invalid"
-                         .format(self.paging_style))
+    def export(self, destination, format='ndjson', fields=None,
+               compression=None, progress=None):
+        """
+        Write all results to a file, one page at a time, straight from the
+        decoded ``DATA`` lists of the responses, so that memory use stays
+        bounded by a page of results however many there are:
+
+        >>> tasks = tc.endpoint_manager_task_list(num_results=None)
+        >>> stats = tasks.export("tasks.ndjson.gz", compression="gzip",
+        >>>                      fields=["task_id", "status", "bytes"])
+        >>> print(stats["results_per_second"])
+
+        ``destination``, ``format``, ``fields``, ``compression`` and
+        ``progress`` are as for :class:`ResultExporter
+        <globus_sdk.transfer.export.ResultExporter>`, and the stats of the
+        exporter are returned. As for :meth:`pages`, this can't be used once
+        iteration has begun, unless pages are cached.
+        """
+        # imported here, so that only exporting pays for importing it
+        from globus_sdk.transfer.export import ResultExporter
+
+        codec = getattr(self.client_object, 'json_codec', None)
+        with ResultExporter(destination, format=format, fields=fields,
+                            compression=compression,
+                            codec=codec if isinstance(codec, JSONCodec)
+                            else None,
+                            progress=progress) as exporter:
+            for results in self._result_lists():
+                exporter.write_page(results)
+        return exporter.stats
+
+    def _result_lists(self):
+        """
+        Get an iterator of the list of results of each page, from the page
+        cache if there is one.
+        """
+        if self.cache_bytes is not None:
+            return self._iter_cached_pages()
+        return (page.data for page in self.pages())
+
+    def cursor(self):
+        """
+        Take a snapshot of how far paging has got, as a dict which can be
+        serialized, e.g. as JSON, and later given as the ``cursor`` of a call
+        for the same resource, to resume paging from the first result not yet
+        consumed:
+
+        >>> tasks = tc.endpoint_manager_task_list(num_results=None)
+        >>> for task in tasks:
+        >>>     export(task)
+        >>>     save_checkpoint(json.dumps(tasks.cursor()))
+        >>> ...
+        >>> cursor = json.loads(load_checkpoint())
+        >>> for task in tc.endpoint_manager_task_list(cursor=cursor):
+        >>>     export(task)
+
+        Results count as consumed once they have been taken from the
+        iterator, and pages once they have been taken from :meth:`pages`.
+
+        The cursor holds the ``paging_style``, ``path`` and query ``params``
+        of the resource, ``num_results``, the ``offset``, ``marker`` or
+        ``last_key`` of the current page, the number of its results to
+        ``skip``, and ``num_results_fetched``.
+        """
+        if self.concurrency > 1 and not self.ordered:
             raise GlobusSDKUsageError(
-                'Invalid Paging Style Given to PaginatedResource')
+                "PaginatedResource.cursor() isn't supported when results "
+                "are not ordered")
+        if self.cache_bytes is not None:
+            raise GlobusSDKUsageError(
+                "PaginatedResource.cursor() isn't supported when pages are "
+                "cached")
+        num_results_fetched = self.num_results_fetched
+        consumed = self._page_consumed
+        # a result the generator has yielded, which is not the first result
+        # still held back, has been consumed
+        if self._item_pending and self.first_elem is self._magic:
+            num_results_fetched += 1
+            consumed += 1
+
+        position = self._page_position
+        offset = marker = last_key = None
+        if self.paging_style == self.PAGING_STYLE_MARKER:
+            marker = position
+        elif self.paging_style == self.PAGING_STYLE_LAST_KEY:
+            last_key = position
+        else:
+            offset = position
+        params = self.client_kwargs['params'] or {}
+        return {
+            'paging_style': self.paging_style,
+            'path': self.client_path,
+            'params': dict((key, value) for key, value in params.items()
+                           if key not in self.PAGING_PARAMS),
+            'num_results': self.num_results,
+            'offset': offset,
+            'marker': marker,
+            'last_key': last_key,
+            'skip': consumed,
+            'num_results_fetched': num_results_fetched,
+        }
 
+    def _start_tracking(self):
+        """
+        Set up the state kept for ``cursor()``, before any page is fetched.
+        """
+        # where the current page starts, and how many of its results have
+        # been consumed
+        self._page = None
+        self._page_position = self._paging_position()
+        self._page_consumed = 0
+        # whether the generator is paused on a result it has yielded
+        self._item_pending = False
+
+    def _paging_position(self):
+        """
+        The offset, marker, or last_key of the next page to be requested.
+        """
+        if self.paging_style in (self.PAGING_STYLE_MARKER,
+                                 self.PAGING_STYLE_LAST_KEY):
+            return self.next_marker
+        return self.offset
+
+    def _track_page(self, res):
+        """
+        Make ``res`` the current page, working out where it starts from the
+        previous page. Returns the number of its results to skip, which is
+        only nonzero for the first page when resuming from a cursor.
+        """
+        if self._page is not None:
+            if self.paging_style == self.PAGING_STYLE_MARKER:
+                self._page_position = self._page.get('next_marker')
+            elif self.paging_style == self.PAGING_STYLE_LAST_KEY:
+                self._page_position = self._page.get('last_key')
+            else:
+                self._page_position += len(self._page['DATA'])
+        self._page = res
+        self._page_consumed, self._skip = self._skip, 0
+        return self._page_consumed
+
+    def _fetch_pages(self):
+        """
+        A generator which fetches the pages of results one by one, each one
+        only once the previous one has been consumed.
+        """
+        self._init_paging()
+
+        # results in the pages fetched so far, so that no page is fetched
+        # once there are enough results to satisfy num_results
+        # CAREFUL! otherwise, we could end up making one-too-many API calls
+        # when resuming, this starts from the results before the first page,
+        # as the first page has not yet reached _track_page()
+        results_in_pages = self.num_results_fetched - self._skip
         has_next_page = True
         while has_next_page:
             logger.debug(("PaginatedResource should have more results, "
                           "requesting them now"))
-            _set_params_for_next_call()
+            self._set_params_for_next_call()
 
-            # fetch a page of results and walk them, yielding them as the
-            # iterated elements wrapped in GlobusResponse objects
-            # nicely, the __getitem__ for GlobusResponse will work on raw
-            # dicts, so these handle well
+            start = timer()
             res = self.client_method(self.client_path, **self.client_kwargs)
-            for item in res:
-                yield GlobusResponse(item, client=self.client_object)
-                # increment the "num results" counter
-                self.num_results_fetched += 1
-
-                # ensure that even if the paging style requires that we fetch
-                # more results than were requested, we still only yield the
-                # number that were requested -- returning here will result in a
-                # StopIteration because this is a generator function
-                # CAREFUL! make sure we catch num_results_fetched==num_results
-                # otherwise, we could end up making one-too-many API calls
-                if (self.num_results is not None and
-                        self.num_results_fetched >= self.num_results):
+            self._observe_page(res, timer() - start)
+            stopped = self._cut_at_stop(res)
+            yield res
+            if stopped:
+                return
+
+            results_in_pages += len(res['DATA'])
+            if (self.num_results is not None and
+                    results_in_pages >= self.num_results):
+                return
+            has_next_page = self._check_has_next_page(res)
+
+    def _prefetch_pages(self):
+        """
+        A generator of the same pages as ``_fetch_pages``, which are fetched
+        and decoded in a worker thread up to ``prefetch`` pages ahead of the
+        page being consumed.
+        """
+        pages = queue.Queue()
+        # each fetched page takes a slot until it is handed to the consumer
+        slots = threading.Semaphore(self.prefetch)
+        stop = threading.Event()
+
+        def fetch():
+            try:
+                fetcher = self._fetch_pages()
+                while True:
+                    slots.acquire()
+                    if stop.is_set():
+                        return
+                    res = next(fetcher, None)
+                    if res is None:
+                        break
+                    # decode here, rather than in the consumer's thread
+                    res.data
+                    pages.put((res, None))
+            except Exception as err:
+                pages.put((None, err))
+            else:
+                pages.put((None, None))
+
+        worker = threading.Thread(target=fetch,
+                                  name='PaginatedResource-prefetch')
+        worker.daemon = True
+        worker.start()
+        try:
+            while True:
+                res, err = pages.get()
+                if err is not None:
+                    raise err
+                if res is None:
                     return
+                slots.release()
+                yield res
+        finally:
+            stop.set()
+            # wake the worker if it is waiting for a slot
+            slots.release()
+
+    def _fetch_pages_concurrently(self):
+        """
+        A generator of the pages of a ``PAGING_STYLE_TOTAL`` resource, which
+        fetches the first page, and then all other pages at once with
+        ``concurrency`` worker threads.
+        """
+        self._init_paging()
+        self._set_params_for_next_call()
+        first_offset = self.offset
+        # results before the first page, when resuming from a cursor
+        results_before = self.num_results_fetched - self._skip
+        res = self.client_method(self.client_path, **self.client_kwargs)
+        stopped = self._cut_at_stop(res)
+        yield res
+        if stopped:
+            return
+
+        # every other page is known from the total
+        end = res['total']
+        if self.num_results is not None:
+            end = min(end,
+                      first_offset + self.num_results - results_before)
+        windows = [
+            (offset, min(self.max_results_per_call, end - offset))
+            for offset in range(first_offset + self.max_results_per_call,
+                                end, self.max_results_per_call)]
+        if not windows:
+            return
+        logger.debug('PaginatedResource fetching %s more pages, %s at a time',
+                     len(windows), self.concurrency)
+
+        tasks = queue.Queue()
+        results = queue.Queue()
+
+        def fetch():
+            while True:
+                task = tasks.get()
+                if task is None:
+                    return
+                index, offset, limit = task
+                kwargs = dict(self.client_kwargs)
+                kwargs['params'] = dict(kwargs['params'], offset=offset,
+                                        limit=limit)
+                try:
+                    page = self.client_method(self.client_path, **kwargs)
+                    # decode here, rather than in the consumer's thread
+                    page.data
+                except Exception as err:
+                    results.put((index, None, err))
+                else:
+                    results.put((index, page, None))
+
+        num_workers = min(self.concurrency, len(windows))
+        for _ in range(num_workers):
+            worker = threading.Thread(target=fetch,
+                                      name='PaginatedResource-fetch')
+            worker.daemon = True
+            worker.start()
+
+        # pages which have been requested but not yet yielded are limited, so
+        # that a slow page can't make ordered results pile up without bound
+        max_outstanding = 2 * self.concurrency
+        dispatched = 0
+        received = {}
+        next_index = 0
+        try:
+            while next_index < len(windows):
+                while (dispatched < len(windows) and
+                       dispatched - next_index < max_outstanding):
+                    tasks.put((dispatched,) + windows[dispatched])
+                    dispatched += 1
+
+                index, page, err = results.get()
+                if err is not None:
+                    raise err
+                if not self.ordered:
+                    next_index += 1
+                    stopped = self._cut_at_stop(page)
+                    yield page
+                    if stopped:
+                        return
+                    continue
+                received[index] = page
+                while next_index in received:
+                    page = received.pop(next_index)
+                    next_index += 1
+                    stopped = self._cut_at_stop(page)
+                    yield page
+                    if stopped:
+                        return
+        finally:
+            # drop the pages not yet requested, and stop the workers
+            try:
+                while True:
+                    tasks.get_nowait()
+            except queue.Empty:
+                pass
+            for _ in range(num_workers):
+                tasks.put(None)
+
+    def _cut_at_stop(self, res):
+        """
+        Cut the results of the page ``res`` short at the first one for which
+        ``stop_when`` returns True, if any. Returns True if they were cut, in
+        which case no page should follow it.
+        """
+        if self.stop_when is None:
+            return False
+        results = res['DATA']
+        for index, result in enumerate(results):
+            if self.stop_when(result):
+                logger.debug('PaginatedResource stopped by stop_when')
+                del results[index:]
+                return True
+        return False
+
+    def _init_paging(self):
+        """
+        Set up the paging parameters before the first call.
+        """
+        if not self.client_kwargs['params']:
+            self.client_kwargs['params'] = {}
+
+        # to start with, cap the limit per request to the max per request size
+        self.limit = self.max_results_per_call
+        if self.num_results is not None:
+            self.limit = min(self.num_results, self.limit)
+
+    def _observe_page(self, res, seconds):
+        """
+        Tell ``adaptive_limit`` how long the page ``res`` took to fetch.
+        """
+        if self.adaptive_limit is not None:
+            self.adaptive_limit.observe(self.limit, len(res['DATA']), seconds,
+                                        _response_bytes(res))
+
+    def _set_params_for_next_call(self):
+        if self.adaptive_limit is not None:
+            self.limit = self.adaptive_limit.next_limit(
+                self.max_results_per_call)
+            if self.num_results is not None:
+                self.limit = min(self.limit, self.num_results)
+
+        # if we're about to request more results than the user asked
+        # for, limit ourselves on the last paginated call to the API
+        if (self.num_results is not None and
+                self.offset + self.limit > self.num_results):
+            self.limit = self.num_results - self.offset
+
+        # all paging styles support limit
+        # MARKER doesn't have it documented, but it is in fact supported
+        self.client_kwargs['params']['limit'] = self.limit
+
+        # if the paging is done by marker, just carry over the marker
+        if self.paging_style == self.PAGING_STYLE_MARKER:
+            if self.next_marker:
+                self.client_kwargs['params']['marker'] = self.next_marker
+        elif self.paging_style == self.PAGING_STYLE_LAST_KEY:
+            if self.next_marker:
+                self.client_kwargs['params']['last_key'] = self.next_marker
+        # these params work for all paging styles *except* MARKER
+        # and LAST_KEY
+        else:
+            self.client_kwargs['params']['offset'] = self.offset
+
+    def _check_has_next_page(self, res):
+        """
+        Check that the API says there are more results available.
+
+        Additionally, update the PaginatedResource.maker or
+        PaginatedResource.offset based on the response
+        """
+        # if the paging style is LAST_KEY, check has_next_page
+        if self.paging_style == self.PAGING_STYLE_LAST_KEY:
+            self.next_marker = res.get('last_key')
+            return res['has_next_page']
+
+        # if the paging style is MARKER, look at the marker
+        if self.paging_style == self.PAGING_STYLE_MARKER:
+            # marker may be 0, null, or absent if no more results
+            # API docs aren't 100% clear -- looks like 0 is what we should
+            # expect, but we'll also accept null or absent to be safe
+            self.next_marker = res.get('next_marker')
+            return bool(self.next_marker)
+
+        # start doing the offset maths and see if we have another page to
+        # fetch
+        # step size is the number of results asked for by the call, which is
+        # max_results_per_call unless it is chosen by adaptive_limit -- we'll
+        # catch this "walking off the end" of the requested results afterwards
+        self.offset += self.limit
+
+        # if it's HAS_NEXT, the check is easy, as it's explicitly part of
+        # the response
+        if self.paging_style == self.PAGING_STYLE_HAS_NEXT:
+            # just return the has_next_page value
+            return res['has_next_page']
+
+        # if paging is TOTAL oriented, check if we've reached the total
+        if self.paging_style == self.PAGING_STYLE_TOTAL:
+            return self.offset < res['total']
+
+        logger.error("PaginatedResource.paging_style=%s is invalid",
+                     self.paging_style)
+        raise GlobusSDKUsageError(
+            'Invalid Paging Style Given to PaginatedResource')
+
+
+class AdaptivePageSize(object):
+    """
+    Chooses the ``limit`` of each page of a :class:`PaginatedResource` created
+    with ``adaptive_limit``, from how fast the pages before it were fetched.
+
+    The first page asks for ``initial_limit`` results. After each page, the
+    rate of results per second, and the size of each result, are updated as
+    moving averages, and the next limit is the number of results expected to
+    take ``target_seconds`` to fetch, and to stay within ``max_page_bytes``.
+    The limit never grows by more than ``max_growth`` times from one page to
+    the next, and stays between ``min_limit`` and the API maximum.
+
+    One ``AdaptivePageSize`` may be shared by several resources, so that each
+    starts from what the others learned. Every page it observed is recorded
+    in ``history``, as a dict of the ``limit`` asked for, the number of
+    ``results`` returned, the ``seconds`` taken, and the response ``bytes``.
+    Each limit is also sent as the ``limit`` query param, and so is seen by
+    :class:`hooks <globus_sdk.hooks.ClientHooks>` as
+    ``event.params["limit"]``.
+
+    **Parameters**
+
+        ``initial_limit`` (*int*)
+          The limit of the first page. Defaults to 100
 
-            has_next_page = _check_has_next_page(res)
+        ``target_seconds`` (*float*)
+          How long fetching each page should take. Defaults to 1.0
+
+        ``max_page_bytes`` (*int*)
+          The largest response wanted, or None for no bound. Defaults to None
+
+        ``min_limit`` (*int*)
+          The smallest limit chosen. Defaults to 10
+
+        ``max_growth`` (*float*)
+          How many times larger a limit may be than the one before it.
+          Defaults to 4.0
+
+        ``smoothing`` (*float*)
+          The weight of the latest page in the moving averages, from 0 to 1.
+          Defaults to 0.5
+    """
+    def __init__(self, initial_limit=100, target_seconds=1.0,
+                 max_page_bytes=None, min_limit=10, max_growth=4.0,
+                 smoothing=0.5):
+        self.target_seconds = target_seconds
+        self.max_page_bytes = max_page_bytes
+        self.min_limit = min_limit
+        self.max_growth = max_growth
+        self.smoothing = smoothing
+        self.history = []
+        self._limit = initial_limit
+        # moving averages of results per second and bytes per result
+        self._rate = None
+        self._result_bytes = None
+        self._lock = threading.Lock()
+
+    def next_limit(self, maximum):
+        """
+        Get the limit of the next page, where the API allows at most
+        ``maximum`` results per page.
+        """
+        return max(1, min(self._limit, maximum))
+
+    def observe(self, limit, results, seconds, size):
+        """
+        Record that a page asking for ``limit`` results returned ``results``
+        results and ``size`` bytes in ``seconds``, and choose the next limit.
+        """
+        with self._lock:
+            self.history.append({'limit': limit, 'results': results,
+                                 'seconds': seconds, 'bytes': size})
+            # an empty page says nothing about rates
+            if not results:
+                return
+            rate = results / max(float(seconds), 1e-6)
+            result_bytes = size / float(results)
+            if self._rate is None:
+                self._rate, self._result_bytes = rate, result_bytes
+            else:
+                self._rate += self.smoothing * (rate - self._rate)
+                self._result_bytes += self.smoothing * (
+                    result_bytes - self._result_bytes)
+
+            target = self._rate * self.target_seconds
+            if self.max_page_bytes is not None:
+                target = min(target, self.max_page_bytes / self._result_bytes)
+            target = min(target, limit * self.max_growth)
+            self._limit = max(self.min_limit, int(target))
+        logger.debug('AdaptivePageSize: page of %s results took %.3fs, next '
+                     'limit is %s', results, seconds, self._limit)
+
+
+def _response_bytes(res):
+    """
+    The size of the body of a page, as received.
+    """
+    return len(res._data.content)
+
+
+class PageCache(object):
+    """
+    The pages of results kept by a :class:`PaginatedResource` created with
+    ``cache_bytes``.
+
+    The most recent pages are kept in memory, as the lists of results decoded
+    from their responses, until their responses add up to more than
+    ``max_memory`` bytes. Older pages are then spilled to a temporary file,
+    as zlib-compressed JSON, and decoded again each time they are read. The
+    file is deleted when the cache is closed or garbage collected.
+
+    All methods are thread-safe.
+
+    **Attributes**
+
+      ``memory_bytes`` (*int*)
+        The size of the responses of the pages held in memory
+
+      ``spilled_pages`` (*int*)
+        The number of pages spilled to disk
+
+      ``spilled_bytes`` (*int*)
+        The size of the temporary file
+    """
+    def __init__(self, max_memory, codec=None):
+        self.max_memory = max_memory
+        self.codec = codec or get_default_codec()
+        # for each page, its list of results, or the (offset, length) of its
+        # compressed results in the temporary file
+        self._pages = []
+        # the indexes of the pages in memory, oldest first, and their sizes
+        self._in_memory = deque()
+        self._sizes = {}
+        self._file = None
+        self._lock = threading.Lock()
+        self.memory_bytes = 0
+        self.spilled_pages = 0
+        self.spilled_bytes = 0
+
+    def __len__(self):
+        return len(self._pages)
+
+    def append(self, data, size):
+        """
+        Add a page with results ``data``, whose response was ``size`` bytes,
+        spilling older pages if the memory budget is exceeded.
+        """
+        with self._lock:
+            index = len(self._pages)
+            self._pages.append(data)
+            self._in_memory.append(index)
+            self._sizes[index] = size
+            self.memory_bytes += size
+            while self.memory_bytes > self.max_memory and self._in_memory:
+                self._spill(self._in_memory.popleft())
+
+    def get(self, index):
+        """
+        Get the list of results of the page at ``index``.
+        """
+        with self._lock:
+            page = self._pages[index]
+            if isinstance(page, list):
+                return page
+            offset, length = page
+            self._file.seek(offset)
+            blob = self._file.read(length)
+        return self.codec.loads(zlib.decompress(blob))
+
+    def close(self):
+        """
+        Drop all pages and delete the temporary file.
+        """
+        with self._lock:
+            self._pages = []
+            self._in_memory.clear()
+            self._sizes.clear()
+            self.memory_bytes = 0
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _spill(self, index):
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(prefix='globus-sdk-pages-')
+        doc = self.codec.dumps(self._pages[index])
+        if isinstance(doc, six.text_type):
+            doc = doc.encode('utf-8')
+        blob = zlib.compress(doc, 1)
+        self._file.seek(0, 2)
+        self._pages[index] = (self._file.tell(), len(blob))
+        self._file.write(blob)
+        self.memory_bytes -= self._sizes.pop(index)
+        self.spilled_pages += 1
+        self.spilled_bytes += len(blob)
+        logger.debug('PageCache spilled page %s, %s bytes', index, len(blob))
+
+
+class PaginatedResourcePage(object):
+    """
+    A page of results, as iterated by :meth:`PaginatedResource.pages`.
+
+    **Attributes**
+
+      ``data`` (*list*)
+        The results on the page, as the raw dicts of the ``DATA`` list of the
+        response
+
+      ``offset``, ``limit``, ``total``, ``has_next_page``, ``last_key``,
+      ``next_marker``
+        The paging fields of the response. Each paging style only has some of
+        them, and the others are None
+
+      ``response`` (:class:`IterableTransferResponse \
+      <globus_sdk.transfer.response.IterableTransferResponse>`)
+        The response the page was read from
+    """
+    __slots__ = ('data', 'offset', 'limit', 'total', 'has_next_page',
+                 'last_key', 'next_marker', 'response', '_last')
+
+    def __init__(self, response):
+        doc = response.data
+        self.response = response
+        self.data = doc.get('DATA', [])
+        self.offset = doc.get('offset')
+        self.limit = doc.get('limit')
+        self.total = doc.get('total')
+        self.has_next_page = doc.get('has_next_page')
+        self.last_key = doc.get('last_key')
+        self.next_marker = doc.get('next_marker')
+        # whether the page reaches num_results, set by PaginatedResource
+        self._last = False
+
+    def __len__(self):
+        return len(self.data)
+
+    def __iter__(self):
+        return iter(self.data)
@@ -1,3 +1,6 @@
+from six.moves import map
+
+from globus_sdk.response import item_converter
 from globus_sdk.transfer.response.base import TransferResponse
 
 
@@ -12,6 +15,21 @@ class IterableTransferResponse(TransferResponse):
     >>> # Equivalent to: for item in r["DATA"]
     >>> for item in r:
     >>>     print(item["name"], item["type"])
+
+    Items are the dicts decoded from the response. Use :meth:`iter_items` to
+    get them in another form.
     """
     def __iter__(self):
         return iter(self["DATA"])
+
+    def iter_items(self, item_mode='dict'):
+        """
+        Iterate over the sub-item list in the ``DATA`` key, representing each
+        item according to ``item_mode``, which is one of ``"response"``,
+        ``"dict"``, ``"view"``, or ``"record"``, as described in
+        :func:`item_converter <globus_sdk.response.item_converter>`.
+        """
+        convert = item_converter(item_mode, client=self._client)
+        if convert is None:
+            return iter(self)
+        return map(convert, self)
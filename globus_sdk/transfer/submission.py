@@ -0,0 +1,127 @@
+"""
+A pool of submission IDs, fetched ahead of time in the background, so that
+tasks can be submitted without waiting for a ``GET /submission_id`` each.
+"""
+import logging
+import threading
+from collections import deque
+
+from globus_sdk.exc import GlobusSDKUsageError
+
+logger = logging.getLogger(__name__)
+
+
+class SubmissionIDPool(object):
+    """
+    Keeps up to ``size`` submission IDs ready, refilling itself in a
+    background thread as they are taken.
+
+    A :class:`TransferClient <globus_sdk.TransferClient>` made with
+    ``submission_id_prefetch=N`` has one, as ``submission_id_pool``, which
+    :meth:`TransferClient.next_submission_id
+    <globus_sdk.TransferClient.next_submission_id>` takes IDs from.
+
+    The thread starts when the first ID is taken, so making a client sends no
+    requests. If fetching an ID fails while a caller is waiting for one, the
+    error is raised to that caller, and the next one to wait starts fetching
+    again.
+
+    **Parameters**
+
+        ``fetch`` (*callable*)
+          Called with no arguments to get a response holding a new submission
+          ID as its ``value``, such as ``TransferClient.get_submission_id``
+
+        ``size`` (*int*)
+          The number of IDs to keep ready
+    """
+    def __init__(self, fetch, size):
+        self.fetch = fetch
+        self.size = size
+        self._ids = deque()
+        self._cond = threading.Condition()
+        self._worker = None
+        self._waiting = 0
+        self._error = None
+        self._closed = False
+        self._fetched = 0
+        self._taken = 0
+
+    def get(self):
+        """
+        Take a submission ID, waiting for one to be fetched if there are none
+        ready.
+        """
+        with self._cond:
+            self._waiting += 1
+            try:
+                while not self._ids:
+                    if self._error is not None:
+                        err, self._error = self._error, None
+                        raise err
+                    if self._worker is None:
+                        self._start()
+                    self._cond.wait()
+            finally:
+                self._waiting -= 1
+            self._taken += 1
+            # wake the worker to replace it
+            self._cond.notify_all()
+            return self._ids.popleft()
+
+    def close(self):
+        """
+        Stop fetching IDs. IDs which are ready can still be taken.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def stats(self):
+        """
+        Get a dict of counters:
+
+        ``fetched``
+          Number of IDs fetched from the service
+
+        ``taken``
+          Number of IDs taken from the pool
+
+        ``ready``
+          Number of IDs ready to be taken
+        """
+        with self._cond:
+            return {'fetched': self._fetched, 'taken': self._taken,
+                    'ready': len(self._ids)}
+
+    def _start(self):
+        if self._closed:
+            raise GlobusSDKUsageError('SubmissionIDPool is closed')
+        self._worker = threading.Thread(target=self._fill,
+                                        name='SubmissionIDPool-fill')
+        self._worker.daemon = True
+        self._worker.start()
+
+    def _fill(self):
+        while True:
+            with self._cond:
+                while len(self._ids) >= self.size and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    self._worker = None
+                    return
+            try:
+                value = self.fetch()["value"]
+            except Exception as err:
+                logger.warning('Fetching a submission ID failed: %s', err)
+                with self._cond:
+                    # only callers waiting now need to hear of it
+                    if self._waiting:
+                        self._error = err
+                    self._worker = None
+                    self._cond.notify_all()
+                return
+            with self._cond:
+                self._ids.append(value)
+                self._fetched += 1
+                self._cond.notify_all()
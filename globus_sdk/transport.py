@@ -0,0 +1,180 @@
+"""
+The HTTP transport used by :class:`BaseClient <globus_sdk.base.BaseClient>`
+to send requests, wrapping a ``requests.Session`` and its connection pool.
+
+A single transport may be shared by any number of clients. Unless told
+otherwise, all clients use one process-wide default transport, so that
+connections to Globus services are reused across client instances.
+"""
+import logging
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from six.moves.http_cookiejar import DefaultCookiePolicy
+
+from globus_sdk import config
+
+logger = logging.getLogger(__name__)
+
+# requests' own defaults for HTTPAdapter
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_POOL_BLOCK = False
+
+
+class HTTPTransport(object):
+    """
+    Holds a ``requests.Session`` whose connection pool can be tuned, and keeps
+    counters of how heavily that pool is used.
+
+    Connections are pooled per host. If more threads make concurrent requests
+    to one host than ``pool_maxsize`` allows, the extra connections are opened
+    and then discarded once they are done, which is expensive for HTTPS.
+    Compare ``peak_in_flight`` and ``connections_created`` from
+    :meth:`pool_stats` against ``pool_maxsize`` to size the pool correctly.
+
+    **Parameters**
+
+        ``pool_connections`` (*int*)
+          The number of per-host pools to keep. Defaults to 10.
+
+        ``pool_maxsize`` (*int*)
+          The maximum number of connections kept open to any one host.
+          Defaults to 10.
+
+        ``pool_block`` (*bool*)
+          When true, requests wait for a free pooled connection instead of
+          opening (and later discarding) a new one once ``pool_maxsize``
+          connections to a host are in use. Defaults to False.
+
+    Transports are safe to share between clients and threads. Authorization
+    is set on each request by the client which sends it, and cookies are
+    never stored, so no credentials or session state leak between clients
+    sharing a transport.
+    """
+    def __init__(self, pool_connections=None, pool_maxsize=None,
+                 pool_block=None):
+        if pool_connections is None:
+            pool_connections = DEFAULT_POOL_CONNECTIONS
+        if pool_maxsize is None:
+            pool_maxsize = DEFAULT_POOL_MAXSIZE
+        if pool_block is None:
+            pool_block = DEFAULT_POOL_BLOCK
+        logger.debug('Creating HTTPTransport(pool_connections=%s, '
+                     'pool_maxsize=%s, pool_block=%s)',
+                     pool_connections, pool_maxsize, pool_block)
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+
+        self._adapter = HTTPAdapter(pool_connections=pool_connections,
+                                    pool_maxsize=pool_maxsize,
+                                    pool_block=pool_block)
+        self.session = requests.Session()
+        # reject all cookies, as the session may be shared by clients acting
+        # on behalf of different users
+        self.session.cookies.set_policy(
+            DefaultCookiePolicy(allowed_domains=[]))
+        self.session.mount('https://', self._adapter)
+        self.session.mount('http://', self._adapter)
+
+        self._stats_lock = threading.Lock()
+        self._requests_sent = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
+
+    def request(self, method, url, **kwargs):
+        """
+        Send a request via the underlying session. Takes the same arguments as
+        ``requests.Session.request``.
+        """
+        with self._stats_lock:
+            self._requests_sent += 1
+            self._in_flight += 1
+            if self._in_flight > self._peak_in_flight:
+                self._peak_in_flight = self._in_flight
+        try:
+            return self.session.request(method=method, url=url, **kwargs)
+        finally:
+            with self._stats_lock:
+                self._in_flight -= 1
+
+    def pool_stats(self):
+        """
+        Get a dict of connection pool utilization counters:
+
+        ``requests_sent``
+          Total number of requests sent through this transport
+
+        ``in_flight``
+          Number of requests currently being sent or read
+
+        ``peak_in_flight``
+          Highest number of concurrent requests seen so far
+
+        ``connections_created``
+          Number of connections opened across all hosts. When this is close
+          to ``requests_sent``, connections are not being reused
+
+        ``host_pools``
+          Number of per-host pools currently held
+
+        ``pool_connections``, ``pool_maxsize``, ``pool_block``
+          The pool configuration
+        """
+        pools = self._adapter.poolmanager.pools
+        # pools may be evicted concurrently, so tolerate missing keys
+        host_pools = [pool for pool in (pools.get(key) for key in pools.keys())
+                      if pool is not None]
+        with self._stats_lock:
+            return {
+                'requests_sent': self._requests_sent,
+                'in_flight': self._in_flight,
+                'peak_in_flight': self._peak_in_flight,
+                'connections_created': sum(
+                    pool.num_connections for pool in host_pools),
+                'host_pools': len(host_pools),
+                'pool_connections': self.pool_connections,
+                'pool_maxsize': self.pool_maxsize,
+                'pool_block': self.pool_block,
+            }
+
+    def close(self):
+        """
+        Close all pooled connections.
+        """
+        self.session.close()
+
+
+_default_transport = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_transport():
+    """
+    Get the process-wide default transport, which is used by every client that
+    is not given a ``transport`` or connection pool settings explicitly.
+    It is created on first use, with pool settings from the SDK config.
+    """
+    global _default_transport
+    with _default_transport_lock:
+        if _default_transport is None:
+            environment = config.get_default_environ()
+            _default_transport = HTTPTransport(
+                pool_connections=config.get_http_pool_connections(environment),
+                pool_maxsize=config.get_http_pool_maxsize(environment),
+                pool_block=config.get_http_pool_block(environment))
+        return _default_transport
+
+
+def set_default_transport(transport):
+    """
+    Replace the process-wide default transport. Clients which were already
+    created keep using the transport they were created with.
+    Passing ``None`` causes a new default to be created on next use.
+    """
+    global _default_transport
+    with _default_transport_lock:
+        _default_transport = transport
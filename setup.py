@@ -30,6 +30,8 @@ setup(name="globus-sdk",
       author="Globus Team",
       author_email="support@globus.org",
       url="https://github.com/globus/globus-sdk-python",
+      # globus_sdk.aio is always included, whichever python builds the
+      # distribution, and checks for python 3.6+ and aiohttp when imported
       packages=find_packages(exclude=['tests', 'tests.*']),
       install_requires=[
           'requests>=2.0.0,<3.0.0',
@@ -39,7 +41,11 @@ setup(name="globus-sdk",
 
       extras_require={
           # empty extra included to support older installs
-          'jwt': []
+          'jwt': [],
+          # asyncio clients, in globus_sdk.aio
+          'aio': ['aiohttp>=3.3.0,<4.0.0; python_version >= "3.6"'],
+          # Parquet export of paginated results
+          'parquet': ['pyarrow>=0.11.0'],
       },
 
       include_package_data=True,
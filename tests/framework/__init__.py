@@ -2,7 +2,8 @@ from tests.framework.capturedio_testcase import CapturedIOTestCase
 from tests.framework.transfer_client_testcase import TransferClientTestCase
 from tests.framework.tools import (get_fixture_file_dir,
                                    get_client_data, get_user_data,
-                                   retry_errors)
+                                   make_response, patch_request,
+                                   start_http_server, retry_errors)
 
 from tests.framework.constants import (GO_EP1_ID, GO_EP2_ID, GO_EP3_ID,
                                        GO_S3_ID, GO_EP1_SERVER_ID,
@@ -22,6 +23,9 @@ __all__ = [
     "get_fixture_file_dir",
     "get_client_data",
     "get_user_data",
+    "make_response",
+    "patch_request",
+    "start_http_server",
     "retry_errors",
 
     "GO_EP1_ID",
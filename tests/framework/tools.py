@@ -1,8 +1,16 @@
 import os
 import json
+import threading
 import time
 from functools import wraps
 
+import requests
+from six.moves import BaseHTTPServer, socketserver
+try:
+    import mock
+except ImportError:
+    from unittest import mock
+
 from globus_sdk.exc import NetworkError
 
 
@@ -38,6 +46,52 @@ def get_user_data():
     return ret
 
 
+def make_response(status, data=None, headers=None, body=None,
+                  content_type="application/json"):
+    """
+    Make a requests.Response, as if received, with a body of ``data``
+    encoded as JSON, or of the bytes ``body``
+    """
+    response = requests.Response()
+    response.status_code = status
+    response._content = (body if body is not None
+                         else json.dumps(data or {}).encode("utf-8"))
+    response.headers["Content-Type"] = content_type
+    response.headers.update(headers or {})
+    return response
+
+
+def patch_request(client, *results):
+    """
+    Patch the session of ``client`` so that its requests return, or raise,
+    each of ``results`` in turn
+    """
+    return mock.patch.object(client._session, "request",
+                             side_effect=list(results))
+
+
+class ThreadedHTTPServer(socketserver.ThreadingMixIn,
+                         BaseHTTPServer.HTTPServer):
+    """
+    A local HTTP server which handles each connection in a thread
+    """
+    # kept-alive connections must not block server shutdown
+    daemon_threads = True
+
+
+def start_http_server(handler_class):
+    """
+    Start a ThreadedHTTPServer on a free local port, serving from a daemon
+    thread. Returns the server and its base URL; stop it with
+    ``server.shutdown()`` and ``server.server_close()``
+    """
+    server = ThreadedHTTPServer(("127.0.0.1", 0), handler_class)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server, "http://127.0.0.1:{}/".format(server.server_port)
+
+
 def retry_errors(retries=2, error_classes=(NetworkError,)):
     """
     A decorator which wraps tests to make them retry x times after a short
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""
+Memory benchmark for the item modes of PaginatedResource.
+
+Lists successful transfers through a TransferClient whose ``get`` decodes
+canned pages, so that no network I/O is done, keeps all results with
+``PaginatedResource.data``, and reports the memory held by the results, and
+the time taken, for each item mode.
+
+Uses tracemalloc, so python 3.4+ is required.
+"""
+from __future__ import print_function
+import gc
+import json
+import time
+import tracemalloc
+
+import requests
+import six
+
+import globus_sdk
+from globus_sdk.transfer.response import IterableTransferResponse
+
+NUM_RESULTS = 200000
+PAGE_SIZE = 1000
+
+
+def make_body(offset):
+    data = {
+        "DATA_TYPE": "successful_transfers",
+        "marker": 0, "next_marker": offset + PAGE_SIZE,
+        "DATA": [{"DATA_TYPE": "successful_transfer",
+                  "source_path": "/~/source/file{}".format(i),
+                  "destination_path": "/~/dest/file{}".format(i),
+                  "size": i * 1024}
+                 for i in range(offset, offset + PAGE_SIZE)]
+    }
+    if offset + PAGE_SIZE >= NUM_RESULTS:
+        data["next_marker"] = None
+    return six.b(json.dumps(data))
+
+
+class CannedTransferClient(globus_sdk.TransferClient):
+    """
+    A TransferClient whose ``get`` decodes canned successful_transfers pages
+    """
+    def __init__(self):
+        globus_sdk.TransferClient.__init__(
+            self, authorizer=globus_sdk.AccessTokenAuthorizer("token"))
+        self.bodies = [make_body(offset)
+                       for offset in range(0, NUM_RESULTS, PAGE_SIZE)]
+
+    def get(self, path, params=None, **kwargs):
+        response = requests.Response()
+        response._content = self.bodies[int(params.get("marker", 0)) //
+                                        PAGE_SIZE]
+        response.headers["Content-Type"] = "application/json"
+        response.status_code = 200
+        return IterableTransferResponse(response, client=self)
+
+
+def measure(client, item_mode):
+    gc.collect()
+    tracemalloc.start()
+    start = time.time()
+    results = client.task_successful_transfers(
+        "task-id", num_results=None, item_mode=item_mode).data
+    elapsed = time.time() - start
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(results) == NUM_RESULTS
+    return held, elapsed
+
+
+def run():
+    client = CannedTransferClient()
+    for item_mode in ("response", "dict", "view", "record"):
+        held, elapsed = measure(client, item_mode)
+        print("{:<10} {:>8.1f} MB held  {:>6.0f} bytes/result  {:.2f}s".format(
+            item_mode, held / 1e6, held / NUM_RESULTS, elapsed))
+
+
+if __name__ == "__main__":
+    run()
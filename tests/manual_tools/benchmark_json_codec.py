@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark for the JSON codecs used by clients.
+
+Encodes a large, offline TransferData document as it would be submitted, and
+decodes a large task_list style response, with every installed codec.
+"""
+from __future__ import print_function
+import json
+import timeit
+
+import requests
+import six
+
+from globus_sdk import codec
+from globus_sdk.transfer.data import TransferData
+
+NUM_ITEMS = 100000
+REPEAT = 5
+
+
+class _FakeClient(object):
+    def get_submission_id(self):
+        return {"value": "00000000-0000-0000-0000-000000000000"}
+
+
+def make_transfer_data(n):
+    tdata = TransferData(_FakeClient(), "source-endpoint-id",
+                         "dest-endpoint-id", label="benchmark",
+                         sync_level="checksum")
+    for i in range(n):
+        tdata.add_item("/~/source/dir/file{}.txt".format(i),
+                       "/~/dest/dir/file{}.txt".format(i))
+    return tdata
+
+
+def make_response(n):
+    data = {
+        "DATA_TYPE": "task_list",
+        "offset": 0, "limit": n, "total": n,
+        "DATA": [{"DATA_TYPE": "task", "task_id": str(i),
+                  "label": "task number {}".format(i),
+                  "status": "SUCCEEDED", "bytes_transferred": i * 1024}
+                 for i in range(n)]
+    }
+    response = requests.Response()
+    response._content = six.b(json.dumps(data))
+    response.headers["Content-Type"] = "application/json"
+    response.status_code = 200
+    return response
+
+
+def run():
+    tdata = make_transfer_data(NUM_ITEMS)
+    response = make_response(NUM_ITEMS)
+    print("document size: {} items, response size: {} bytes"
+          .format(NUM_ITEMS, len(response.content)))
+
+    for name in ("json", "ujson", "orjson"):
+        try:
+            c = codec.get_codec(name)
+        except ValueError:
+            print("{:<8} not installed".format(name))
+            continue
+        encode = min(timeit.repeat(lambda: c.dumps(tdata),
+                                   number=1, repeat=REPEAT))
+        decode = min(timeit.repeat(lambda: c.load_response(response),
+                                   number=1, repeat=REPEAT))
+        print("{:<8} encode: {:.4f}s  decode: {:.4f}s  (best of {})"
+              .format(name, encode, decode, REPEAT))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark for the cost of the SDK's logging when it is switched off.
+
+Sends requests through a TransferClient whose HTTP session is replaced with
+one returning a canned response, so that no network I/O is timed, and adds
+items to a TransferData. Each is timed with logging disabled, and again with
+the loggers replaced by no-ops, so the difference is the overhead of the
+disabled logging calls themselves.
+"""
+from __future__ import print_function
+import logging
+import timeit
+
+import requests
+
+import globus_sdk
+from globus_sdk.transfer import data
+from globus_sdk.transport import HTTPTransport
+
+NUM_REQUESTS = 20000
+NUM_ITEMS = 200000
+REPEAT = 5
+
+
+class _NullLogger(object):
+    """
+    A logger which does nothing at all
+    """
+    def _noop(self, *args, **kwargs):
+        pass
+    debug = info = warning = warn = error = exception = critical = _noop
+
+
+class _FakeClient(object):
+    def get_submission_id(self):
+        return {"value": "00000000-0000-0000-0000-000000000000"}
+
+
+def make_client():
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b'{"DATA_TYPE": "endpoint"}'
+    response.headers["Content-Type"] = "application/json"
+
+    # a transport of its own, so that patching its session leaves the shared
+    # default transport untouched
+    transport = HTTPTransport()
+    transport.session.request = lambda *args, **kwargs: response
+    return globus_sdk.TransferClient(
+        authorizer=globus_sdk.AccessTokenAuthorizer("token"),
+        transport=transport)
+
+
+def time_requests(client):
+    return min(timeit.repeat(lambda: client.get("endpoint/foo"),
+                             number=NUM_REQUESTS, repeat=REPEAT))
+
+
+def time_add_item():
+    tdata = data.TransferData(_FakeClient(), "source-endpoint-id",
+                              "dest-endpoint-id")
+
+    def add_items():
+        del tdata["DATA"][:]
+        for i in range(NUM_ITEMS):
+            tdata.add_item("/~/source/file", "/~/dest/file")
+    return min(timeit.repeat(add_items, number=1, repeat=REPEAT))
+
+
+def time_message(logger, eager):
+    if eager:
+        def log():
+            logger.debug('GET to {} with params {}'.format("foo", None))
+    else:
+        def log():
+            logger.debug('GET to %s with params %s', "foo", None)
+    return min(timeit.repeat(log, number=NUM_REQUESTS, repeat=REPEAT))
+
+
+def report(name, disabled, noop, count):
+    print("{:<24} disabled: {:.3f}us  no-op: {:.3f}us  "
+          "overhead: {:.3f}us per call".format(
+              name, disabled / count * 1e6, noop / count * 1e6,
+              (disabled - noop) / count * 1e6))
+
+
+def run():
+    logging.getLogger("globus_sdk").setLevel(logging.WARNING)
+
+    client = make_client()
+    disabled = time_requests(client)
+    client.logger = _NullLogger()
+    noop = time_requests(client)
+    report("request", disabled, noop, NUM_REQUESTS)
+
+    disabled = time_add_item()
+    real_logger, data.logger = data.logger, _NullLogger()
+    try:
+        noop = time_add_item()
+    finally:
+        data.logger = real_logger
+    report("TransferData.add_item", disabled, noop, NUM_ITEMS)
+
+    client = make_client()
+    eager = time_message(client.logger, eager=True)
+    deferred = time_message(client.logger, eager=False)
+    print("{:<24} eager: {:.3f}us  deferred: {:.3f}us per call".format(
+        "disabled debug message", eager / NUM_REQUESTS * 1e6,
+        deferred / NUM_REQUESTS * 1e6))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark for iterating a PaginatedResource by result and by page.
+
+Pages a task_list through a TransferClient whose ``get`` returns canned,
+already decoded pages, so that neither network I/O nor JSON parsing is timed,
+and reports how many results per second are walked when iterating over
+results, which wraps each one in a GlobusResponse, and over pages(), which
+hands out the raw DATA lists.
+"""
+from __future__ import print_function
+import json
+import timeit
+
+import requests
+import six
+
+import globus_sdk
+from globus_sdk.transfer.response import IterableTransferResponse
+
+NUM_PAGES = 50
+PAGE_SIZE = 1000
+REPEAT = 5
+
+
+def make_pages():
+    pages = []
+    total = NUM_PAGES * PAGE_SIZE
+    for offset in range(0, total, PAGE_SIZE):
+        data = {
+            "DATA_TYPE": "task_list",
+            "offset": offset, "limit": PAGE_SIZE, "total": total,
+            "DATA": [{"DATA_TYPE": "task", "task_id": str(i),
+                      "status": "SUCCEEDED", "bytes_transferred": i * 1024}
+                     for i in range(offset, offset + PAGE_SIZE)]
+        }
+        response = requests.Response()
+        response._content = six.b(json.dumps(data))
+        response.headers["Content-Type"] = "application/json"
+        response.status_code = 200
+        page = IterableTransferResponse(response)
+        # decode up front, so that parsing isn't timed
+        page.data
+        pages.append(page)
+    return pages
+
+
+class CannedTransferClient(globus_sdk.TransferClient):
+    """
+    A TransferClient whose ``get`` returns canned task_list pages
+    """
+    def __init__(self, pages):
+        globus_sdk.TransferClient.__init__(
+            self, authorizer=globus_sdk.AccessTokenAuthorizer("token"))
+        self.pages = pages
+
+    def get(self, path, params=None, **kwargs):
+        return self.pages[params["offset"] // PAGE_SIZE]
+
+
+def by_result(client):
+    total = 0
+    for task in client.task_list(num_results=None):
+        total += task["bytes_transferred"]
+    return total
+
+
+def by_page(client):
+    total = 0
+    for page in client.task_list(num_results=None).pages():
+        for task in page.data:
+            total += task["bytes_transferred"]
+    return total
+
+
+def run():
+    client = CannedTransferClient(make_pages())
+    assert by_result(client) == by_page(client)
+
+    num_results = NUM_PAGES * PAGE_SIZE
+    for name, func in (("results", by_result), ("pages()", by_page)):
+        elapsed = min(timeit.repeat(lambda: func(client), number=1,
+                                    repeat=REPEAT))
+        print("{:<10} {:>12,.0f} results/sec".format(
+            name, num_results / elapsed))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+"""
+Benchmark for the memory used to send a TransferData with a very large number
+of items, encoded all at once and streamed as a JSONStreamBody.
+
+Each run builds the document and sends it, in a process of its own, to a
+session which reads the body as a connection would. The growth of the peak
+RSS while sending is reported, along with the peak of memory allocated by
+python on python3, measured with tracemalloc.
+"""
+from __future__ import print_function
+import multiprocessing
+import resource
+import sys
+import time
+
+import requests
+
+from globus_sdk import TransferClient, codec
+from globus_sdk.exc import GlobusSDKUsageError
+from globus_sdk.transfer.data import TransferData
+from globus_sdk.transport import HTTPTransport
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+NUM_ITEMS = 1000000
+
+
+def new_document():
+    tdata = TransferData(None, "source-endpoint-id", "dest-endpoint-id",
+                         submission_id="00000000-0000-0000-0000-000000000000",
+                         label="benchmark", sync_level="checksum",
+                         compact_items=True)
+    tdata.add_items(("/~/source/dir/file{}.txt".format(i),
+                     "/~/dest/dir/file{}.txt".format(i))
+                    for i in range(NUM_ITEMS))
+    return tdata
+
+
+def read_body(method, url, data=None, **kwargs):
+    if isinstance(data, codec.JSONStreamBody):
+        size = sum(len(chunk) for chunk in data)
+    else:
+        size = len(data.encode("utf-8") if isinstance(data, str) else data)
+    response = requests.Response()
+    response.status_code = 202
+    response._content = '{{"code": "Accepted", "size": {}}}'.format(
+        size).encode("utf-8")
+    response.headers["Content-Type"] = "application/json"
+    return response
+
+
+def maxrss_mb():
+    # kilobytes on linux, bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 1e6
+
+
+def send(args):
+    codec_name, min_items = args
+    # a transport of its own, so that patching its session leaves the shared
+    # default transport untouched
+    transport = HTTPTransport()
+    transport.session.request = read_body
+    tc = TransferClient(json_codec=codec_name, json_stream_min_items=min_items,
+                        transport=transport)
+    tdata = new_document()
+    rss = maxrss_mb()
+    if tracemalloc is not None:
+        tracemalloc.start()
+    start = time.time()
+    size = tc.post("transfer", tdata)["size"]
+    seconds = time.time() - start
+    peak = None
+    if tracemalloc is not None:
+        peak = tracemalloc.get_traced_memory()[1] / 1e6
+        tracemalloc.stop()
+    return size, seconds, maxrss_mb() - rss, peak
+
+
+def run():
+    print("{} items".format(NUM_ITEMS))
+    for name in ("json", "ujson", "orjson"):
+        try:
+            codec.get_codec(name)
+        except GlobusSDKUsageError:
+            print("{:<8} not installed".format(name))
+            continue
+        for mode, min_items in (("dumps", None), ("stream", 10000)):
+            # a fresh process for each, so that peak RSS is its own
+            pool = multiprocessing.Pool(1)
+            size, seconds, rss, peak = pool.apply(send, ((name, min_items),))
+            pool.close()
+            pool.join()
+            print("{:<8} {:<7} {:.1f}MB body  send: {:.3f}s  peak RSS growth: "
+                  "{:.1f}MB  peak python memory: {}".format(
+                      name, mode, size / 1e6, seconds, rss,
+                      "{:.1f}MB".format(peak) if peak is not None else "n/a"))
+
+
+if __name__ == "__main__":
+    run()
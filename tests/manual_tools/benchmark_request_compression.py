@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+"""
+Benchmark for the gzip compression of large request bodies, at each
+compression level.
+
+Compresses a TransferData with many items, as it is encoded at once and as it
+is streamed, and reports the time taken and the size sent, along with the
+time a body of that size takes to send over links of a few speeds. The time
+taken to compress a streamed body includes encoding it.
+"""
+from __future__ import print_function
+
+from globus_sdk import codec
+from globus_sdk.compress import gzip_body
+from globus_sdk.transfer.data import TransferData
+
+NUM_ITEMS = 200000
+# link speeds, in megabits per second
+LINKS = (100, 1000)
+
+
+def new_document():
+    tdata = TransferData(None, "source-endpoint-id", "dest-endpoint-id",
+                         submission_id="00000000-0000-0000-0000-000000000000",
+                         label="benchmark", sync_level="checksum",
+                         compact_items=True)
+    tdata.add_items(("/~/project/run{}/output/file{}.dat".format(i % 50, i),
+                     "/~/archive/run{}/output/file{}.dat".format(i % 50, i))
+                    for i in range(NUM_ITEMS))
+    return tdata
+
+
+def send_seconds(size):
+    return "  ".join("{}Mb/s: {:.3f}s".format(mbps, size * 8 / (mbps * 1e6))
+                     for mbps in LINKS)
+
+
+def run():
+    tdata = new_document()
+    c = codec.get_default_codec()
+    doc = c.dumps(tdata)
+    print("{} items, {:.1f}MB encoded with {}".format(
+        NUM_ITEMS, len(doc) / 1e6, c.name))
+    print("{:<12} send {}".format("uncompressed", send_seconds(len(doc))))
+    for level in (1, 3, 6, 9):
+        for mode, body in (("dumps", doc),
+                           ("stream", codec.JSONStreamBody(tdata, c))):
+            compressed = gzip_body(body, level)
+            print("level {} {:<6} compress: {:.3f}s  {:.2f}MB ({:.1f}x)  "
+                  "send {}".format(
+                      level, mode, compressed.seconds, len(compressed) / 1e6,
+                      len(doc) / float(len(compressed)),
+                      send_seconds(len(compressed))))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark for GlobusHTTPResponse body parsing.
+
+Builds a large, offline, task_list style response and walks it with the
+access patterns commonly used by SDK consumers, reporting how many times the
+JSON body was parsed and how long each pattern took.
+"""
+from __future__ import print_function
+import json
+import timeit
+
+import requests
+import six
+
+from globus_sdk.transfer.response import IterableTransferResponse
+
+NUM_ITEMS = 1000
+REPEAT = 20
+
+
+def make_body(n):
+    data = {
+        "DATA_TYPE": "task_list",
+        "offset": 0, "limit": n, "total": n,
+        "DATA": [{"DATA_TYPE": "task", "task_id": str(i),
+                  "label": "task number {}".format(i),
+                  "status": "SUCCEEDED", "bytes_transferred": i * 1024}
+                 for i in range(n)]
+    }
+    return six.b(json.dumps(data))
+
+
+BODY = make_body(NUM_ITEMS)
+
+
+def make_http_response():
+    response = requests.Response()
+    response._content = BODY
+    response.headers["Content-Type"] = "application/json"
+    response.status_code = 200
+    return response
+
+
+class CountingResponse(requests.Response):
+    """
+    A requests.Response which counts the number of times it is JSON decoded
+    """
+    parse_count = 0
+
+    def json(self, **kwargs):
+        CountingResponse.parse_count += 1
+        return requests.Response.json(self, **kwargs)
+
+
+def counting_response():
+    response = make_http_response()
+    response.__class__ = CountingResponse
+    return response
+
+
+def item_access(res):
+    for _ in range(NUM_ITEMS):
+        res["total"]
+
+
+def iteration(res):
+    for item in res:
+        item["task_id"]
+
+
+def paging_check(res):
+    res.get("has_next_page")
+    res["offset"]
+    res["total"]
+
+
+def run():
+    patterns = [
+        ("{} item accesses".format(NUM_ITEMS), item_access),
+        ("iteration over DATA", iteration),
+        ("paging metadata checks", paging_check),
+    ]
+    print("response size: {} items".format(NUM_ITEMS))
+    for name, func in patterns:
+        CountingResponse.parse_count = 0
+        res = IterableTransferResponse(counting_response())
+        func(res)
+        parses = CountingResponse.parse_count
+
+        def timed():
+            func(IterableTransferResponse(make_http_response()))
+        elapsed = min(timeit.repeat(timed, number=1, repeat=REPEAT))
+
+        print("{:<28} parses={:<6} best of {}: {:.4f}s"
+              .format(name, parses, REPEAT, elapsed))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+"""
+Benchmark for building and encoding a TransferData with a very large number of
+items.
+
+Builds the document with add_item in a loop and with add_items, each with a
+list of item dicts and with compact_items, and, for comparison, as a list of
+item dicts built directly.
+Each is then encoded with every installed codec. On python3, the memory held
+by the items is measured with tracemalloc.
+"""
+from __future__ import print_function
+import gc
+import timeit
+
+from globus_sdk import codec
+from globus_sdk.exc import GlobusSDKUsageError
+from globus_sdk.transfer.data import TransferData
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+NUM_ITEMS = 1000000
+REPEAT = 3
+
+
+def paths(n):
+    return [("/~/source/dir/file{}.txt".format(i),
+             "/~/dest/dir/file{}.txt".format(i)) for i in range(n)]
+
+
+def new_document(compact_items=False):
+    return TransferData(None, "source-endpoint-id", "dest-endpoint-id",
+                        submission_id="00000000-0000-0000-0000-000000000000",
+                        label="benchmark", sync_level="checksum",
+                        compact_items=compact_items)
+
+
+def build_add_item(items, compact_items=False):
+    tdata = new_document(compact_items)
+    for source_path, destination_path in items:
+        tdata.add_item(source_path, destination_path)
+    return tdata
+
+
+def build_add_items(items, compact_items=False):
+    tdata = new_document(compact_items)
+    tdata.add_items(items)
+    return tdata
+
+
+def build_add_item_compact(items):
+    return build_add_item(items, compact_items=True)
+
+
+def build_add_items_compact(items):
+    return build_add_items(items, compact_items=True)
+
+
+def build_dicts(items):
+    tdata = new_document()
+    tdata["DATA"] = [{"DATA_TYPE": "transfer_item", "source_path": s,
+                      "destination_path": d, "recursive": False}
+                     for s, d in items]
+    return tdata
+
+
+def measure_memory(build, items):
+    if tracemalloc is None:
+        return None
+    gc.collect()
+    tracemalloc.start()
+    tdata = build(items)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del tdata
+    return size
+
+
+def time_encode(c, tdata):
+    return min(timeit.repeat(lambda: c.dumps(tdata), number=1, repeat=REPEAT))
+
+
+def run():
+    items = paths(NUM_ITEMS)
+    codecs = []
+    for name in ("json", "ujson", "orjson"):
+        try:
+            codecs.append(codec.get_codec(name))
+        except GlobusSDKUsageError:
+            print("{:<8} not installed".format(name))
+    print("{} items, best of {}".format(NUM_ITEMS, REPEAT))
+
+    for name, build in (("add_item", build_add_item),
+                        ("add_items", build_add_items),
+                        ("add_item compact", build_add_item_compact),
+                        ("add_items compact", build_add_items_compact),
+                        ("dict list", build_dicts)):
+        seconds = min(timeit.repeat(lambda: build(items),
+                                    number=1, repeat=REPEAT))
+        size = measure_memory(build, items)
+        print("{:<18} build: {:.3f}s  memory: {}".format(
+            name, seconds,
+            "{:.1f}MB".format(size / 1e6) if size is not None else "n/a"))
+        tdata = build(items)
+        for c in codecs:
+            print("{:<18}   encode with {:<8} {:.3f}s".format(
+                "", c.name, time_encode(c, tdata)))
+
+
+if __name__ == "__main__":
+    run()
@@ -1,8 +1,17 @@
 import requests
 import json
 import six
-
-from globus_sdk.response import GlobusResponse, GlobusHTTPResponse
+try:
+    import mock
+except ImportError:
+    from unittest import mock
+
+from globus_sdk.codec import get_codec
+from globus_sdk.exc import GlobusSDKUsageError
+from globus_sdk.response import (GlobusResponse, GlobusHTTPResponse,
+                                 ItemRecord, ItemView, item_converter)
+from globus_sdk.search.response import SearchResponse
+from globus_sdk.transfer.response import IterableTransferResponse
 from tests.framework import CapturedIOTestCase
 
 
@@ -125,3 +134,122 @@ class GlobusHTTPResponseTests(CapturedIOTestCase):
         self.assertEqual(self.globus_malformed_response.text, "{")
         # text
         self.assertEqual(self.globus_text_response.text, self.text_data)
+
+    def stdlib_codec(self):
+        """
+        Make responses decode with the stdlib codec, which parses via
+        requests.Response.json
+        """
+        return mock.patch("globus_sdk.response.get_default_codec",
+                          return_value=get_codec("json"))
+
+    def test_data_parsed_once(self):
+        """
+        Accesses data repeatedly, via several access patterns, confirms that
+        the underlying body is only parsed one time
+        """
+        with self.stdlib_codec(), mock.patch.object(
+                requests.Response, "json", autospec=True,
+                side_effect=requests.Response.json) as m:
+            for key in self.json_data:
+                self.assertEqual(self.globus_json_response[key],
+                                 self.json_data[key])
+                self.assertIn(key, self.globus_json_response)
+                self.globus_json_response.get(key)
+            self.assertIs(self.globus_json_response.data,
+                          self.globus_json_response.data)
+            self.assertEqual(m.call_count, 1)
+
+    def test_non_json_data_parsed_once(self):
+        """
+        Accesses data on a non-JSON response repeatedly, confirms that the
+        failed parse is remembered rather than retried
+        """
+        with self.stdlib_codec(), mock.patch.object(
+                requests.Response, "json", autospec=True,
+                side_effect=requests.Response.json) as m:
+            self.assertEqual(self.globus_text_response.data, None)
+            self.assertEqual(self.globus_text_response.data, None)
+            self.assertEqual(m.call_count, 1)
+
+
+class ItemModeTests(CapturedIOTestCase):
+
+    def setUp(self):
+        """
+        Makes an item, and responses holding lists of items
+        """
+        super(ItemModeTests, self).setUp()
+        self.item = {"name": "foo", "size": 10, "@datatype": "file",
+                     "tags": ["a", "b"]}
+        self.items = [dict(self.item, size=i) for i in range(3)]
+
+    def make_response(self, response_class, data):
+        http_response = requests.Response()
+        http_response._content = six.b(json.dumps(data))
+        http_response.headers["Content-Type"] = "application/json"
+        return response_class(http_response)
+
+    def test_view_and_record(self):
+        """
+        Makes an ItemView and an ItemRecord of an item, confirms that they
+        read like the item, and that only the view shares it
+        """
+        for item_type in (ItemView, ItemRecord):
+            obj = item_type(self.item)
+            self.assertEqual(dict(obj), self.item)
+            self.assertEqual(obj, self.item)
+            self.assertEqual(len(obj), 4)
+            self.assertEqual(obj["@datatype"], "file")
+            self.assertIn("tags", obj)
+            self.assertNotIn("owner", obj)
+            self.assertEqual(obj.get("size"), 10)
+            self.assertEqual(obj.get("owner", "me"), "me")
+            with self.assertRaises(KeyError):
+                obj["owner"]
+            with self.assertRaises(TypeError):
+                obj["name"] = "bar"
+            self.assertFalse(hasattr(obj, "__dict__"))
+            self.assertIn("'name': 'foo'", repr(obj))
+
+        self.item["name"] = "bar"
+        self.assertEqual(ItemView(self.item)["name"], "bar")
+        record = ItemRecord(self.item)
+        self.item["name"] = "baz"
+        self.assertEqual(record["name"], "bar")
+        # records with the same keys share them
+        self.assertIs(record._fields, ItemRecord(self.item)._fields)
+
+    def test_item_converter(self):
+        """
+        Gets a converter for each item mode, confirms the type of item made,
+        and that an unknown mode is refused
+        """
+        self.assertIsNone(item_converter("dict"))
+        self.assertIsInstance(item_converter("response")(self.item),
+                              GlobusResponse)
+        self.assertIsInstance(item_converter("view")(self.item), ItemView)
+        self.assertIsInstance(item_converter("record")(self.item), ItemRecord)
+        with self.assertRaises(GlobusSDKUsageError):
+            item_converter("tuple")
+
+    def test_iter_items(self):
+        """
+        Iterates over the items of IterableTransferResponse and
+        SearchResponse objects, confirms the type and contents of items
+        """
+        responses = [
+            self.make_response(IterableTransferResponse,
+                               {"DATA": self.items}),
+            self.make_response(SearchResponse,
+                               {"gmeta": self.items, "total": 3})]
+        for response in responses:
+            self.assertEqual(list(response), self.items)
+            self.assertEqual(list(response.iter_items()), self.items)
+            for item_mode, item_type in (("response", GlobusResponse),
+                                         ("view", ItemView),
+                                         ("record", ItemRecord)):
+                items = list(response.iter_items(item_mode))
+                self.assertEqual([type(item) for item in items],
+                                 [item_type] * 3)
+                self.assertEqual([item["size"] for item in items], [0, 1, 2])
@@ -0,0 +1,390 @@
+import importlib
+import io
+import itertools
+import json
+import socket
+import sys
+import time
+import unittest
+import zlib
+try:
+    import mock
+except ImportError:
+    from unittest import mock
+
+from six.moves import BaseHTTPServer
+from six.moves.urllib.parse import urlparse, parse_qs
+
+from globus_sdk.authorizers import AccessTokenAuthorizer
+from globus_sdk.authorizers.renewing import RenewingAuthorizer
+from globus_sdk.exc import (GlobusSDKUsageError, TransferAPIError,
+                            GlobusConnectionError)
+from globus_sdk.transfer.data import DeleteData
+from globus_sdk.transfer.response import TransferResponse
+from tests.framework import CapturedIOTestCase, start_http_server
+
+try:
+    import asyncio
+    from globus_sdk import aio
+except ImportError:
+    aio = None
+
+
+class _TransferHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    num_tasks = 25
+    submission_ids = itertools.count()
+
+    def _send_json(self, status, data):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = dict((k, v[0]) for k, v in parse_qs(url.query).items())
+        if self.headers.get("Authorization") == "Bearer expired":
+            self._send_json(401, {"code": "AuthenticationFailed"})
+        elif url.path == "/v0.10/task_list":
+            offset, limit = int(params["offset"]), int(params["limit"])
+            self._send_json(200, {
+                "DATA_TYPE": "task_list", "offset": offset, "limit": limit,
+                "total": self.num_tasks,
+                "DATA": [{"task_id": str(i)} for i in
+                         range(offset, min(offset + limit, self.num_tasks))]})
+        elif url.path == "/v0.10/submission_id":
+            self._send_json(200, {"value": "id-{}".format(
+                next(self.submission_ids))})
+        elif url.path.startswith("/v0.10/task/"):
+            # hold the request open, so that concurrency can be observed
+            time.sleep(0.05)
+            self._send_json(200, {"task_id": url.path.split("/")[-1],
+                                  "params": params,
+                                  "authorization":
+                                      self.headers.get("Authorization")})
+        else:
+            self._send_json(404, {"code": "ClientError.NotFound",
+                                  "message": "Not found",
+                                  "request_id": "abc123"})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length"))
+        body = self.rfile.read(length)
+        encoding = self.headers.get("Content-Encoding")
+        if encoding == "gzip":
+            body = zlib.decompress(body, 16 + zlib.MAX_WBITS)
+        doc = json.loads(body.decode("utf-8"))
+        self._send_json(202, {"code": "Accepted",
+                              "task_id": "task-" + doc["submission_id"],
+                              "num_items": len(doc["DATA"]),
+                              "encoding": encoding})
+
+    def log_message(self, *args):
+        pass
+
+
+class CountingRenewer(RenewingAuthorizer):
+    """
+    A RenewingAuthorizer which hands out numbered tokens, slowly, and counts
+    how many it has handed out
+    """
+    def __init__(self, **kwargs):
+        self.renewals = 0
+        super(CountingRenewer, self).__init__(**kwargs)
+
+    def _get_token_response(self):
+        time.sleep(0.05)
+        self.renewals += 1
+        return {"expires_at_seconds": int(time.time()) + 1000,
+                "access_token": "token{}".format(self.renewals)}
+
+    def _extract_token_data(self, res):
+        return res
+
+
+@unittest.skipIf(aio is None, "globus_sdk.aio requires python3.6+ and aiohttp")
+class AsyncClientTests(CapturedIOTestCase):
+
+    def setUp(self):
+        super(AsyncClientTests, self).setUp()
+        self.server, self.base_url = start_http_server(_TransferHandler)
+
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.transport = aio.AsyncHTTPTransport()
+        self.client = aio.AsyncTransferClient(
+            base_url=self.base_url, transport=self.transport,
+            authorizer=AccessTokenAuthorizer("token"))
+
+    def tearDown(self):
+        super(AsyncClientTests, self).tearDown()
+        self.run_async(self.transport.close())
+        self.loop.close()
+        asyncio.set_event_loop(None)
+        self.server.shutdown()
+        self.server.server_close()
+
+    def run_async(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def collect(self, resource):
+        """
+        Equivalent of `[item async for item in resource]`
+        """
+        iterator = resource.__aiter__()
+        results = []
+        while True:
+            try:
+                results.append(self.run_async(iterator.__anext__()))
+            except StopAsyncIteration:  # noqa: F821
+                return results
+
+    def test_get(self):
+        """
+        Awaits a TransferClient method, confirms that the request is built
+        and the response wrapped exactly as by the sync client
+        """
+        res = self.run_async(self.client.get_task("abc", fields="a b"))
+        self.assertIsInstance(res, TransferResponse)
+        self.assertEqual(res["task_id"], "abc")
+        self.assertEqual(res["params"], {"fields": "a b"})
+        self.assertEqual(res["authorization"], "Bearer token")
+
+    def test_error(self):
+        """
+        Awaits a request for a missing resource, confirms the client's error
+        class is raised
+        """
+        with self.assertRaises(TransferAPIError) as err:
+            self.run_async(self.client.get_endpoint("nonexistent"))
+        self.assertEqual(err.exception.http_status, 404)
+        self.assertEqual(err.exception.code, "ClientError.NotFound")
+        self.assertEqual(err.exception.request_id, "abc123")
+
+    def test_connection_error(self):
+        """
+        Sends a request to a closed port, confirms a GlobusConnectionError
+        """
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        closed_url = "http://127.0.0.1:{}/".format(sock.getsockname()[1])
+        sock.close()
+        client = aio.AsyncTransferClient(base_url=closed_url,
+                                         transport=self.transport)
+        with self.assertRaises(GlobusConnectionError):
+            self.run_async(client.get_task("abc"))
+
+    def test_concurrent_requests(self):
+        """
+        Gathers many requests on one loop, confirms they were all in flight
+        at once
+        """
+        results = self.run_async(asyncio.gather(
+            *[self.client.get_task(str(i)) for i in range(20)]))
+        self.assertEqual([r["task_id"] for r in results],
+                         [str(i) for i in range(20)])
+        stats = self.transport.pool_stats()
+        self.assertEqual(stats["requests_sent"], 20)
+        self.assertEqual(stats["in_flight"], 0)
+        self.assertGreater(stats["peak_in_flight"], 1)
+
+    def test_async_paging(self):
+        """
+        Iterates over an AsyncPaginatedResource, confirms all pages are
+        fetched, and that sync iteration is refused
+        """
+        resource = self.client.task_list(num_results=None)
+        self.assertIsInstance(resource, aio.AsyncPaginatedResource)
+        # no request is made until iteration
+        self.assertEqual(self.transport.pool_stats()["requests_sent"], 0)
+        with self.assertRaises(GlobusSDKUsageError):
+            list(resource)
+        with self.assertRaises(GlobusSDKUsageError):
+            resource.data
+
+        # the page size for task_list is 1000, so force a few pages
+        resource.max_results_per_call = 10
+        tasks = self.collect(resource)
+        self.assertEqual([t["task_id"] for t in tasks],
+                         [str(i) for i in range(25)])
+        self.assertEqual(self.transport.pool_stats()["requests_sent"], 3)
+
+        # num_results is respected
+        resource = self.client.task_list(num_results=12)
+        resource.max_results_per_call = 10
+        self.assertEqual(len(self.collect(resource)), 12)
+
+    def test_async_pages(self):
+        """
+        Iterates over the pages of an AsyncPaginatedResource, confirms that
+        they hold the raw results and paging fields, and respect num_results
+        """
+        resource = self.client.task_list(num_results=22)
+        resource.max_results_per_call = 10
+        pages = self.collect(resource.pages())
+        self.assertEqual([len(page) for page in pages], [10, 10, 2])
+        self.assertEqual([page.offset for page in pages], [0, 10, 20])
+        self.assertEqual(pages[0].total, 25)
+        self.assertEqual(pages[2].data, [{"task_id": "20"}, {"task_id": "21"}])
+        # results were taken by pages()
+        self.assertEqual(self.collect(resource), [])
+        with self.assertRaises(GlobusSDKUsageError):
+            resource.pages()
+
+    def test_async_cursor(self):
+        """
+        Takes a cursor part way through an AsyncPaginatedResource, confirms
+        that resuming from it yields the remaining results
+        """
+        resource = self.client.task_list(num_results=None)
+        resource.max_results_per_call = 10
+        iterator = resource.__aiter__()
+        for _ in range(13):
+            self.run_async(iterator.__anext__())
+        cursor = resource.cursor()
+        self.assertEqual((cursor["offset"], cursor["skip"]), (10, 3))
+
+        resumed = self.client.task_list(cursor=cursor)
+        resumed.max_results_per_call = 10
+        self.assertEqual([t["task_id"] for t in self.collect(resumed)],
+                         [str(i) for i in range(13, 25)])
+        self.assertEqual(resumed.num_results_fetched, 25)
+
+    def test_async_export(self):
+        """
+        Exports an AsyncPaginatedResource as NDJSON, confirms that every
+        result is written
+        """
+        resource = self.client.task_list(num_results=None)
+        resource.max_results_per_call = 10
+        f = io.BytesIO()
+        stats = self.run_async(resource.export(f, fields=["task_id"]))
+        self.assertEqual((stats["results"], stats["pages"]), (25, 3))
+        self.assertEqual([json.loads(line)["task_id"]
+                          for line in f.getvalue().splitlines()],
+                         [str(i) for i in range(25)])
+
+    def test_async_submit_chunked(self):
+        """
+        Submits a DeleteData in chunks, confirms that each chunk is a task
+        with a submission ID of its own
+        """
+        ddata = DeleteData(None, "endpoint", submission_id="first")
+        ddata.add_items("/~/{}".format(i) for i in range(25))
+        result = self.run_async(self.client.submit_delete_chunked(
+            ddata, max_items=10, concurrency=2))
+        self.assertEqual([res["num_items"] for res in result.responses],
+                         [10, 10, 5])
+        self.assertEqual(result.task_ids[0], "task-first")
+        self.assertEqual(len(set(result.task_ids)), 3)
+
+    def test_async_streamed_body(self):
+        """
+        Submits a DeleteData long enough to be streamed, confirms that it is
+        sent whole
+        """
+        client = aio.AsyncTransferClient(
+            base_url=self.base_url, transport=self.transport,
+            json_stream_min_items=100)
+        ddata = DeleteData(None, "endpoint", submission_id="streamed")
+        ddata.add_items("/~/{}".format(i) for i in range(2500))
+        res = self.run_async(client.submit_delete(ddata))
+        self.assertEqual(res["num_items"], 2500)
+        self.assertEqual(res["task_id"], "task-streamed")
+
+    def test_async_compressed_body(self):
+        """
+        Submits a DeleteData with gzip compression, confirms that it is sent
+        compressed, and whole
+        """
+        client = aio.AsyncTransferClient(
+            base_url=self.base_url, transport=self.transport,
+            json_stream_min_items=100, compress_min_bytes=1000)
+        ddata = DeleteData(None, "endpoint", submission_id="compressed")
+        ddata.add_items("/~/{}".format(i) for i in range(2500))
+        res = self.run_async(client.submit_delete(ddata))
+        self.assertEqual(res["num_items"], 2500)
+        self.assertEqual(res["encoding"], "gzip")
+        res = self.run_async(client.post(
+            "delete", {"submission_id": "small", "DATA": []}, compress=True))
+        self.assertEqual(res["encoding"], "gzip")
+
+    def test_async_deferred_submission_id(self):
+        """
+        Submits a DeleteData with a deferred submission ID, confirms that it
+        is given one, and that documents can't fetch one from an async client
+        """
+        ddata = DeleteData(self.client, "endpoint", defer_submission_id=True)
+        ddata.add_item("/~/a")
+        res = self.run_async(self.client.submit_delete(ddata))
+        self.assertEqual(res["task_id"], "task-" + ddata["submission_id"])
+
+        with self.assertRaises(GlobusSDKUsageError):
+            DeleteData(self.client, "endpoint")
+        with self.assertRaises(GlobusSDKUsageError):
+            aio.AsyncTransferClient(submission_id_prefetch=2)
+
+    def test_renewing_authorizer(self):
+        """
+        Sends concurrent requests with an expired RenewingAuthorizer, confirms
+        that the token is renewed only once, and then after a 401
+        """
+        authorizer = CountingRenewer(access_token="expired",
+                                     expires_at=int(time.time()) + 1000)
+        authorizer.expires_at = 0
+        client = aio.AsyncTransferClient(base_url=self.base_url,
+                                         transport=self.transport)
+        client.authorizer = authorizer
+
+        results = self.run_async(asyncio.gather(
+            *[client.get_task(str(i)) for i in range(10)]))
+        self.assertEqual(authorizer.renewals, 1)
+        self.assertEqual(set(r["authorization"] for r in results),
+                         set(["Bearer token1"]))
+
+        # a 401 invalidates the token, and the request is retried
+        authorizer.access_token = "expired"
+        res = self.run_async(client.get_task("abc"))
+        self.assertEqual(res["authorization"], "Bearer token2")
+
+    def test_transport_arguments(self):
+        """
+        Creates async clients with pool settings, confirms how they map to
+        transports
+        """
+        default = aio.get_default_async_transport()
+        self.assertIs(aio.AsyncSearchClient().transport, default)
+        self.assertIs(aio.AsyncAuthClient().transport, default)
+
+        client = aio.AsyncTransferClient(http_pool_maxsize=5)
+        self.assertEqual(client.transport.limit_per_host, 5)
+        with self.assertRaises(GlobusSDKUsageError):
+            aio.AsyncTransferClient(http_pool_block=True)
+        with self.assertRaises(GlobusSDKUsageError):
+            aio.AsyncTransferClient(transport=self.transport,
+                                    http_pool_maxsize=5)
+
+
+class AsyncImportTests(CapturedIOTestCase):
+
+    def test_import_requirements(self):
+        """
+        Imports globus_sdk.aio without aiohttp, or on a python older than
+        3.6, confirms that a clear ImportError is raised
+        """
+        with mock.patch.dict(sys.modules, {"aiohttp": None}):
+            sys.modules.pop("globus_sdk.aio", None)
+            with self.assertRaises(ImportError) as err:
+                importlib.import_module("globus_sdk.aio")
+            self.assertIn("pip install globus-sdk[aio]",
+                          str(err.exception))
+
+        with mock.patch.dict(sys.modules):
+            sys.modules.pop("globus_sdk.aio", None)
+            with mock.patch.object(sys, "version_info", (3, 5, 0)):
+                with self.assertRaises(ImportError) as err:
+                    importlib.import_module("globus_sdk.aio")
+            self.assertIn("Python 3.6+", str(err.exception))
@@ -1,5 +1,7 @@
+import os
 import six
 import logging
+import logging.handlers
 from random import getrandbits
 
 import globus_sdk
@@ -296,3 +298,67 @@ class BaseClientTests(CapturedIOTestCase):
             safe_value = safe_stringify(value)
             self.assertEqual(safe_value, u"1")
             self.assertEqual(type(safe_value), six.text_type)
+
+
+class ClientLogAdapterTests(CapturedIOTestCase):
+
+    def setUp(self):
+        super(ClientLogAdapterTests, self).setUp()
+        self.bc = BaseClient("transfer", base_path="/v0.10/")
+        self.handler = logging.handlers.MemoryHandler(1028)
+        self.bc.logger.logger.addHandler(self.handler)
+
+    def tearDown(self):
+        super(ClientLogAdapterTests, self).tearDown()
+        self.bc.logger.logger.removeHandler(self.handler)
+        self.bc.logger.logger.setLevel(logging.NOTSET)
+        self.handler.close()
+
+    def test_deferred_formatting(self):
+        """
+        Logs messages with arguments at disabled and enabled levels, confirms
+        that arguments are only formatted when the level is enabled
+        """
+        formatted = []
+
+        class Arg(object):
+            def __str__(self):
+                formatted.append(self)
+                return "arg"
+
+        self.bc.logger.logger.setLevel(logging.INFO)
+        self.bc.logger.debug("not logged %s", Arg())
+        self.assertEqual(self.handler.buffer, [])
+        self.assertEqual(formatted, [])
+
+        self.bc.logger.info("logged %s", Arg())
+        self.bc.logger.warn("warned %s", Arg())
+        self.assertEqual(
+            [record.getMessage() for record in self.handler.buffer],
+            ["[instance:{}] logged arg".format(id(self.bc)),
+             "[instance:{}] warned arg".format(id(self.bc))])
+
+    def test_non_string_message(self):
+        """
+        Logs objects which are not strings as messages, confirms that they
+        are logged as their string value
+        """
+        self.bc.logger.logger.setLevel(logging.DEBUG)
+        self.bc.logger.error(ValueError("bad value"))
+        self.bc.logger.debug(42)
+        self.assertEqual(
+            [record.getMessage() for record in self.handler.buffer],
+            ["[instance:{}] bad value".format(id(self.bc)),
+             "[instance:{}] 42".format(id(self.bc))])
+
+    def test_caller_location(self):
+        """
+        Logs a message, confirms the record names the calling function and
+        file rather than the adapter
+        """
+        self.bc.logger.logger.setLevel(logging.DEBUG)
+        self.bc.logger.info("located")
+        record = self.handler.buffer[0]
+        self.assertEqual(record.funcName, "test_caller_location")
+        self.assertEqual(os.path.basename(record.pathname),
+                         "test_base_client.py")
@@ -0,0 +1,239 @@
+import os
+import shutil
+import tempfile
+try:
+    import mock
+except ImportError:
+    from unittest import mock
+
+import globus_sdk
+from globus_sdk import cache as cache_module
+from globus_sdk.cache import ResponseCache
+from globus_sdk.exc import GlobusSDKUsageError
+from globus_sdk.transport import HTTPTransport
+from tests.framework import (CapturedIOTestCase, make_response,
+                             patch_request)
+
+ENDPOINT_ID = "ddb59aef-6d04-11e5-ba46-22000b92c6ec"
+TASK_ID = "0b4f2c3e-6d04-11e5-ba46-22000b92c6ec"
+
+
+class ResponseCacheTests(CapturedIOTestCase):
+
+    def setUp(self):
+        super(ResponseCacheTests, self).setUp()
+        self.cache = ResponseCache(route_ttls={"/endpoint/{id}": 60})
+        self.tc = self.make_client("token")
+
+    def make_client(self, token, cache=None):
+        return globus_sdk.TransferClient(
+            authorizer=globus_sdk.AccessTokenAuthorizer(token),
+            response_cache=cache or self.cache, transport=HTTPTransport())
+
+    def test_ttl(self):
+        """
+        Gets an endpoint twice, confirms that the second response comes from
+        the cache without a request, while other routes are not cached
+        """
+        with patch_request(
+                self.tc, make_response(200, data={"id": ENDPOINT_ID}),
+                make_response(200, data={"DATA": []}),
+                make_response(200, data={"DATA": []})) as m:
+            self.tc.get_endpoint(ENDPOINT_ID)
+            self.assertEqual(self.tc.get_endpoint(ENDPOINT_ID)["id"],
+                             ENDPOINT_ID)
+            self.tc.bookmark_list()
+            self.tc.bookmark_list()
+        self.assertEqual(m.call_count, 3)
+        self.assertEqual(self.cache.stats(), {
+            "hits": 1, "revalidations": 0, "misses": 3, "evictions": 0,
+            "invalidations": 0, "entries": 1})
+
+    def test_cache_control(self):
+        """
+        Confirms that Cache-Control max-age overrides the route TTL, and that
+        no-store responses are not stored
+        """
+        with patch_request(
+                self.tc,
+                make_response(200, headers={"Cache-Control": "max-age=0"}),
+                make_response(200, headers={"Cache-Control": "no-store"}),
+                make_response(200, headers={"Cache-Control": "max-age=60"}),
+                make_response(200)) as m:
+            for _ in range(4):
+                self.tc.get("bookmark_list")
+        self.assertEqual(m.call_count, 3)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_revalidation(self):
+        """
+        Gets a resource with an ETag twice, confirms that the second request
+        is conditional, and that a 304 is answered from the cache
+        """
+        with patch_request(
+                self.tc,
+                make_response(200, headers={"ETag": '"v1"'},
+                              data={"DATA": ["bookmark"]}),
+                make_response(304, headers={"ETag": '"v1"'})) as m:
+            self.tc.bookmark_list()
+            res = self.tc.bookmark_list()
+        self.assertNotIn("If-None-Match", m.call_args_list[0][1]["headers"])
+        self.assertEqual(m.call_args_list[1][1]["headers"]["If-None-Match"],
+                         '"v1"')
+        self.assertEqual(res.http_status, 200)
+        self.assertEqual(res["DATA"], ["bookmark"])
+        self.assertEqual(self.cache.stats()["revalidations"], 1)
+
+    def test_invalidation(self):
+        """
+        Caches endpoint and bookmark responses, confirms that mutations
+        invalidate the entries of their resource only
+        """
+        cache = ResponseCache(default_ttl=60)
+        tc = self.make_client("token", cache)
+        with patch_request(tc, *[make_response(200)] * 6) as m:
+            tc.get_endpoint(ENDPOINT_ID)
+            tc.bookmark_list()
+            tc.delete_bookmark("123")
+            tc.get_endpoint(ENDPOINT_ID)
+            tc.bookmark_list()
+        self.assertEqual(m.call_count, 4)
+        self.assertEqual(cache.stats()["invalidations"], 1)
+
+        with patch_request(tc, *[make_response(200)] * 2) as m:
+            tc.update_endpoint(ENDPOINT_ID, {"display_name": "x"})
+            tc.get_endpoint(ENDPOINT_ID)
+        self.assertEqual(m.call_count, 2)
+
+    def test_related_invalidation(self):
+        """
+        Caches task responses, confirms that submitting a transfer and
+        cancelling tasks as an endpoint manager invalidate them
+        """
+        cache = ResponseCache(route_ttls={"/task_list": 60,
+                                          "/task/{id}": 60})
+        tc = self.make_client("token", cache)
+        with patch_request(tc, *[make_response(200)] * 7) as m:
+            tc.get("task_list")
+            tc.get("task/" + TASK_ID)
+            tc.post("transfer", {"DATA": []})
+            tc.get("task_list")
+            tc.get("task/" + TASK_ID)
+            tc.post("endpoint_manager/admin_cancel", {"task_id": [TASK_ID]})
+            tc.get("task_list")
+            tc.get("task_list")
+        self.assertEqual(m.call_count, 7)
+        self.assertEqual(cache.stats()["invalidations"], 4)
+
+    def test_lru_and_credentials(self):
+        """
+        Confirms that the least recently used entry is evicted, and that
+        clients with different tokens do not share entries
+        """
+        cache = ResponseCache(max_entries=2, default_ttl=60)
+        with self.assertRaises(GlobusSDKUsageError):
+            ResponseCache(max_entries=0)
+        tc = self.make_client("token", cache)
+        with patch_request(tc, *[make_response(200)] * 4) as m:
+            tc.get("endpoint/a")
+            tc.get("endpoint/b")
+            tc.get("endpoint/a")
+            tc.get("endpoint/c")
+            tc.get("endpoint/a")
+            tc.get("endpoint/b")
+        self.assertEqual(m.call_count, 4)
+        self.assertEqual(cache.stats()["evictions"], 2)
+
+        other = self.make_client("other token", cache)
+        with patch_request(other, make_response(200)) as m:
+            other.get("endpoint/b")
+        self.assertEqual(m.call_count, 1)
+
+    def test_disk(self):
+        """
+        Caches a response on disk, confirms that a new cache using the same
+        directory serves it, and that invalidation removes it
+        """
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        tc = self.make_client(
+            "token", ResponseCache(default_ttl=60, cache_dir=cache_dir))
+        with patch_request(tc, make_response(200, data={"x": 1})):
+            tc.get("endpoint/a")
+
+        cache = ResponseCache(default_ttl=60, cache_dir=cache_dir)
+        tc = self.make_client("token", cache)
+        with patch_request(tc, make_response(200)) as m:
+            self.assertEqual(tc.get("endpoint/a")["x"], 1)
+            self.assertEqual(m.call_count, 0)
+            tc.delete("endpoint/a")
+
+        cache = ResponseCache(default_ttl=60, cache_dir=cache_dir)
+        tc = self.make_client("token", cache)
+        with patch_request(tc, make_response(200)) as m:
+            tc.get("endpoint/a")
+        self.assertEqual(m.call_count, 1)
+
+    def test_disk_invalidation_listing(self):
+        """
+        Confirms that the cache directory is only listed to invalidate groups
+        which have entries on disk, including entries written before the
+        cache was made
+        """
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        tc = self.make_client(
+            "token", ResponseCache(default_ttl=60, cache_dir=cache_dir))
+        with patch_request(tc, make_response(200)):
+            tc.get("endpoint/a")
+
+        tc = self.make_client(
+            "token", ResponseCache(default_ttl=60, cache_dir=cache_dir))
+        with mock.patch.object(cache_module.os, "listdir",
+                               side_effect=os.listdir) as listdir:
+            with patch_request(tc, *[make_response(200)] * 3):
+                tc.delete("bookmark/a")
+                self.assertEqual(listdir.call_count, 0)
+                tc.delete("endpoint/a")
+                self.assertEqual(listdir.call_count, 1)
+                tc.delete("endpoint/a")
+                self.assertEqual(listdir.call_count, 1)
+        self.assertEqual(os.listdir(cache_dir), [])
+
+    def test_disk_replace(self):
+        """
+        Replaces a disk entry which already exists, confirms that it is
+        replaced, including where os.rename refuses to, as on Windows
+        """
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        path = os.path.join(cache_dir, "a.entry")
+
+        def write(name, content):
+            with open(os.path.join(cache_dir, name), "w") as f:
+                f.write(content)
+
+        real_rename = os.rename
+
+        def rename(src, dst):
+            if os.path.exists(dst):
+                raise OSError("destination exists")
+            real_rename(src, dst)
+
+        write("a.entry", "old")
+        write("a.tmp", "new")
+        cache_module._replace(os.path.join(cache_dir, "a.tmp"), path)
+        with open(path) as f:
+            self.assertEqual(f.read(), "new")
+
+        # python2 on Windows, which has no os.replace
+        write("a.tmp", "newer")
+        with mock.patch.object(cache_module.os, "replace", None,
+                               create=True):
+            with mock.patch.object(cache_module.os, "name", "nt"):
+                with mock.patch.object(cache_module.os, "rename", rename):
+                    cache_module._replace(os.path.join(cache_dir, "a.tmp"),
+                                          path)
+        with open(path) as f:
+            self.assertEqual(f.read(), "newer")
+        self.assertEqual(os.listdir(cache_dir), ["a.entry"])
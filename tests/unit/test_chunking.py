@@ -0,0 +1,164 @@
+import json
+import threading
+import time
+
+import globus_sdk
+from globus_sdk import codec
+from globus_sdk.exc import ChunkedSubmitError, GlobusSDKUsageError
+from globus_sdk.transfer.chunking import split_document
+from globus_sdk.transport import HTTPTransport
+from tests.framework import (CapturedIOTestCase, GO_EP1_ID, GO_EP2_ID,
+                             make_response)
+
+
+class SubmissionSimulator(object):
+    """
+    Simulates the submission_id, transfer and delete APIs, keeping every
+    document submitted, and failing those with a given first path
+    """
+    def __init__(self, fail_path=None, id_delay=0):
+        self.fail_path = fail_path
+        self.id_delay = id_delay  # seconds taken to get a submission ID
+        self.fail_ids = False
+        self.documents = []
+        self.submission_ids = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.lock = threading.Lock()
+
+    def request(self, method, url, data=None, **kwargs):
+        if method == "GET":
+            time.sleep(self.id_delay)
+            if self.fail_ids:
+                return make_response(503, {"code": "Unavailable"})
+            with self.lock:
+                self.submission_ids += 1
+                return make_response(200, {"value": "id{}".format(
+                    self.submission_ids)})
+        with self.lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+            doc = json.loads(data)
+            self.documents.append(doc)
+        first = doc["DATA"][0]
+        if first.get("source_path", first.get("path")) == self.fail_path:
+            return make_response(409, {"code": "Conflict", "message": "no"})
+        return make_response(202, {"code": "Accepted",
+                                   "task_id": "task-" + doc["submission_id"]})
+
+
+class ChunkingTests(CapturedIOTestCase):
+
+    def setUp(self):
+        """
+        Makes a TransferClient whose requests go to a SubmissionSimulator, and
+        a TransferData with many items
+        """
+        super(ChunkingTests, self).setUp()
+        self.simulator = SubmissionSimulator()
+        self.tc = globus_sdk.TransferClient(json_codec="json",
+                                            transport=HTTPTransport())
+        self.tc._session.request = self.simulator.request
+        self.tdata = globus_sdk.TransferData(self.tc, GO_EP1_ID, GO_EP2_ID,
+                                             label="big", compact_items=True)
+        self.tdata.add_items(("/~/{}".format(i), u"/~/café/{}".format(i))
+                             for i in range(95))
+        self.tdata.add_symlink_item("/~/link", "/~/link")
+
+    def test_split_document(self):
+        """
+        Splits a document by number of items and by size, confirms that the
+        chunks hold all the items, in order, within the limits
+        """
+        items = self.tdata["DATA"].for_json()
+        chunks = split_document(self.tdata, max_items=40)
+        self.assertEqual([len(chunk["DATA"]) for chunk in chunks],
+                         [40, 40, 16])
+        self.assertEqual(chunks[0]["submission_id"], "id1")
+        self.assertNotIn("submission_id", chunks[1])
+        self.assertEqual(chunks[2]["label"], "big")
+        self.assertEqual(len(self.tdata["DATA"]), 96)
+
+        for c in (codec.get_codec("json"), codec.get_default_codec()):
+            max_bytes = 2000
+            chunks = split_document(self.tdata, max_bytes=max_bytes, codec=c)
+            self.assertGreater(len(chunks), 2)
+            self.assertEqual([item for chunk in chunks
+                              for item in chunk["DATA"].for_json()], items)
+            for index, chunk in enumerate(chunks):
+                chunk["submission_id"] = "id1"
+                size = len(c.dumps(chunk))
+                self.assertLessEqual(size, max_bytes)
+                # chunks are filled as far as the next item allows
+                if index < len(chunks) - 1:
+                    next_item = c.dumps(chunks[index + 1]["DATA"][0])
+                    self.assertGreater(size + len(next_item) + 2, max_bytes)
+
+        # documents with plain lists of items are split into plain lists
+        tdata = globus_sdk.TransferData(self.tc, GO_EP1_ID, GO_EP2_ID)
+        tdata["DATA"].extend(items)
+        chunks = split_document(tdata, max_items=40)
+        self.assertEqual([type(chunk["DATA"]) for chunk in chunks],
+                         [list] * 3)
+        self.assertEqual([item for chunk in chunks
+                          for item in json.loads(json.dumps(chunk))["DATA"]],
+                         items)
+
+        # a document with no items is one chunk, which any item can't fit
+        ddata = globus_sdk.DeleteData(self.tc, GO_EP1_ID)
+        self.assertEqual(len(split_document(ddata)), 1)
+        ddata.add_item("/~/" + "x" * 1000)
+        with self.assertRaises(GlobusSDKUsageError):
+            split_document(ddata, max_bytes=1000)
+        with self.assertRaises(GlobusSDKUsageError):
+            split_document(ddata, max_items=0)
+
+    def test_submit_chunked(self):
+        """
+        Submits a document in chunks, confirms that each is a task with its
+        own submission ID, and that chunks are submitted concurrently
+        """
+        result = self.tc.submit_transfer_chunked(self.tdata, max_items=10,
+                                                 concurrency=3)
+        self.assertEqual(len(result.chunks), 10)
+        # the first chunk keeps the submission ID of the document, and the
+        # others get theirs as they are submitted, in any order
+        self.assertEqual(result.task_ids[0], "task-id1")
+        self.assertEqual(sorted(result.task_ids),
+                         sorted("task-id{}".format(i) for i in range(1, 11)))
+        self.assertEqual(self.simulator.submission_ids, 10)
+        self.assertEqual([doc["submission_id"] for doc in sorted(
+            self.simulator.documents,
+            key=lambda doc: int(doc["DATA"][0]["source_path"][3:]))],
+            [chunk["submission_id"] for chunk in result.chunks])
+        self.assertEqual(self.simulator.peak_in_flight, 3)
+
+        ddata = globus_sdk.DeleteData(self.tc, GO_EP1_ID, submission_id="d")
+        ddata.add_items(["/~/a", "/~/b"])
+        result = self.tc.submit_delete_chunked(ddata, max_items=1)
+        self.assertEqual(result.task_ids, ["task-d", "task-id11"])
+
+    def test_submit_chunked_errors(self):
+        """
+        Fails one chunk, confirms that the others are submitted, and that the
+        error holds their tasks and the chunk to submit again
+        """
+        self.simulator.fail_path = "/~/20"
+        with self.assertRaises(ChunkedSubmitError) as err:
+            self.tc.submit_transfer_chunked(self.tdata, max_items=10)
+        result = err.exception.result
+        self.assertEqual(list(err.exception.errors), [2])
+        self.assertEqual(err.exception.errors[2].http_status, 409)
+        self.assertEqual(len(result.task_ids), 9)
+        self.assertIsNone(result.responses[2])
+
+        self.simulator.fail_path = None
+        res = self.tc.submit_transfer(result.chunks[2])
+        self.assertEqual(res["task_id"], "task-" +
+                         result.chunks[2]["submission_id"])
+
+        with self.assertRaises(GlobusSDKUsageError):
+            self.tc.submit_transfer_chunked(self.tdata, concurrency=0)
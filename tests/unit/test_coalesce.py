@@ -0,0 +1,116 @@
+import threading
+import time
+try:
+    import mock
+except ImportError:
+    from unittest import mock
+
+import requests
+
+import globus_sdk
+from globus_sdk.exc import GlobusConnectionError
+from globus_sdk.transport import HTTPTransport
+from tests.framework import CapturedIOTestCase, make_response
+
+
+class RequestCoalescerTests(CapturedIOTestCase):
+
+    def setUp(self):
+        super(RequestCoalescerTests, self).setUp()
+        self.coalescer = globus_sdk.RequestCoalescer()
+        self.transport = HTTPTransport()
+
+    def make_client(self, token="token"):
+        return globus_sdk.TransferClient(
+            authorizer=globus_sdk.AccessTokenAuthorizer(token),
+            request_coalescer=self.coalescer, transport=self.transport,
+            retry_policy=globus_sdk.RetryPolicy(max_retries=0))
+
+    def blocking_request(self, result, ready):
+        """
+        Get a fake Session.request which waits until ``ready()`` is true
+        before returning (or raising) ``result``
+        """
+        def request(*args, **kwargs):
+            deadline = time.time() + 5
+            while not ready() and time.time() < deadline:
+                time.sleep(0.01)
+            if isinstance(result, Exception):
+                raise result
+            return result
+        return request
+
+    def run_threads(self, funcs):
+        results = [None] * len(funcs)
+
+        def run(i):
+            try:
+                results[i] = funcs[i]()
+            except Exception as err:
+                results[i] = err
+        threads = [threading.Thread(target=run, args=(i,))
+                   for i in range(len(funcs))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_coalesced(self):
+        """
+        Gets an endpoint from several threads at once, confirms that one
+        request is sent, and that every caller gets its own response with the
+        same decoded data
+        """
+        clients = [self.make_client() for _ in range(5)]
+        with mock.patch.object(
+                self.transport.session, "request",
+                side_effect=self.blocking_request(
+                    make_response(200, data={"id": "abc"}),
+                    lambda: self.coalescer.stats()["coalesced"] == 4)) as m:
+            results = self.run_threads(
+                [lambda c=c: c.get_endpoint("abc") for c in clients])
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual([res["id"] for res in results], ["abc"] * 5)
+        self.assertEqual([res._client for res in results], clients)
+        self.assertEqual(len(set(id(res) for res in results)), 5)
+        self.assertEqual(len(set(id(res.data) for res in results)), 1)
+        self.assertEqual(self.coalescer.stats(),
+                         {"sent": 1, "coalesced": 4, "in_flight": 0})
+
+    def test_error(self):
+        """
+        Fails a coalesced request, confirms that every caller gets the error
+        """
+        clients = [self.make_client() for _ in range(3)]
+        with mock.patch.object(
+                self.transport.session, "request",
+                side_effect=self.blocking_request(
+                    requests.ConnectionError("down"),
+                    lambda: self.coalescer.stats()["coalesced"] == 2)) as m:
+            results = self.run_threads(
+                [lambda c=c: c.get_endpoint("abc") for c in clients])
+        self.assertEqual(m.call_count, 1)
+        for res in results:
+            self.assertIsInstance(res, GlobusConnectionError)
+
+    def test_not_coalesced(self):
+        """
+        Sends concurrent GETs with different tokens, and POSTs, confirms that
+        none of them are coalesced
+        """
+        clients = [self.make_client("token1"), self.make_client("token2")]
+        with mock.patch.object(
+                self.transport.session, "request",
+                side_effect=self.blocking_request(
+                    make_response(200), lambda: m.call_count == 2)) as m:
+            self.run_threads(
+                [lambda c=c: c.get_endpoint("abc") for c in clients])
+        self.assertEqual(m.call_count, 2)
+
+        with mock.patch.object(self.transport.session, "request",
+                               return_value=make_response(200)) as m:
+            self.run_threads([lambda c=c: c.post("bookmark", {})
+                              for c in clients * 2])
+        self.assertEqual(m.call_count, 4)
+        self.assertEqual(self.coalescer.stats()["coalesced"], 0)
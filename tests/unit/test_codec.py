@@ -0,0 +1,237 @@
+import json
+import os
+try:
+    import mock
+except ImportError:
+    from unittest import mock
+
+import requests
+import six
+
+import globus_sdk
+from globus_sdk import codec
+from globus_sdk.base import BaseClient
+from globus_sdk.exc import GlobusSDKUsageError, TransferAPIError
+from globus_sdk.transport import HTTPTransport
+from tests.framework import CapturedIOTestCase, make_response
+
+
+class RecordingCodec(codec.JSONCodec):
+    """
+    A stdlib JSONCodec which records the calls made to it
+    """
+    def __init__(self):
+        self.calls = []
+
+    def dumps(self, obj):
+        self.calls.append("dumps")
+        return codec.JSONCodec.dumps(self, obj)
+
+    def load_response(self, response):
+        self.calls.append("load_response")
+        return codec.JSONCodec.load_response(self, response)
+
+
+class JSONCodecTests(CapturedIOTestCase):
+
+    def tearDown(self):
+        super(JSONCodecTests, self).tearDown()
+        codec._codec_instances.clear()
+
+    def test_get_codec(self):
+        """
+        Gets codecs by name, confirms that auto prefers the fastest codec and
+        that unknown or missing codecs are refused
+        """
+        self.assertIsInstance(codec.get_codec("json"), codec.JSONCodec)
+        self.assertIs(codec.get_codec("json"), codec.get_codec("json"))
+        if codec.orjson is not None:
+            self.assertIsInstance(codec.get_codec("auto"), codec.OrjsonCodec)
+
+        with self.assertRaises(GlobusSDKUsageError):
+            codec.get_codec("simplejson")
+
+        codec._codec_instances.clear()
+        with mock.patch.object(codec, "orjson", None):
+            with mock.patch.object(codec, "ujson", None):
+                self.assertEqual(codec.get_codec("auto").name, "json")
+                with self.assertRaises(GlobusSDKUsageError):
+                    codec.get_codec("orjson")
+
+    def test_round_trip(self):
+        """
+        Encodes and decodes a document with every installed codec, confirms
+        that they all agree with the stdlib
+        """
+        doc = {"DATA": [{"source_path": u"/~/café ☃.txt",
+                         "recursive": False, "size": 1.5e10, "n": None}],
+               1: "int keys become strings"}
+        expected = json.loads(json.dumps(doc))
+        names = ["json"] + [name for name, module in
+                            (("orjson", codec.orjson), ("ujson", codec.ujson))
+                            if module is not None]
+        for name in names:
+            c = codec.get_codec(name)
+            encoded = c.dumps(doc)
+            self.assertEqual(json.loads(encoded if isinstance(
+                encoded, six.text_type) else encoded.decode("utf-8")),
+                expected)
+            self.assertEqual(c.loads(json.dumps(doc)), expected)
+            self.assertEqual(c.loads(json.dumps(doc).encode("utf-8")),
+                             expected)
+            self.assertEqual(c.load_response(
+                make_response(200, body=json.dumps(doc).encode("utf-8"))),
+                expected)
+            with self.assertRaises(ValueError):
+                c.loads(b"not json")
+
+    def test_config(self):
+        """
+        Confirms that the json_codec config value selects the default codec
+        """
+        with mock.patch.dict(os.environ, {"GLOBUS_SDK_JSON_CODEC": "json"}):
+            self.assertEqual(codec.get_default_codec().name, "json")
+            self.assertEqual(globus_sdk.TransferClient().json_codec.name,
+                             "json")
+
+
+class ClientJSONCodecTests(CapturedIOTestCase):
+
+    def setUp(self):
+        super(ClientJSONCodecTests, self).setUp()
+        self.codec = RecordingCodec()
+        self.client = globus_sdk.TransferClient(
+            json_codec=self.codec, transport=HTTPTransport())
+
+    def test_request_and_response(self):
+        """
+        Sends a JSON body and gets a JSON response, confirms that both go
+        through the client's codec
+        """
+        with mock.patch.object(
+                self.client._session, "request",
+                return_value=make_response(200, data={"code": "Accepted"})) \
+                as m:
+            res = self.client.post("transfer", {"DATA": []})
+            self.assertEqual(res["code"], "Accepted")
+        self.assertEqual(json.loads(m.call_args[1]["data"]), {"DATA": []})
+        self.assertEqual(self.codec.calls, ["dumps", "load_response"])
+
+        # codecs may also be given by name
+        client = BaseClient("transfer", base_path="/v0.10/",
+                            json_codec="json")
+        self.assertIsInstance(client.json_codec, codec.JSONCodec)
+
+    def test_error(self):
+        """
+        Gets an error response, confirms that it is parsed with the client's
+        codec, and that a malformed body falls back to text
+        """
+        body = (b'{"code": "ClientError.NotFound", "message": "Nope", '
+                b'"request_id": "abc"}')
+        with mock.patch.object(self.client._session, "request",
+                               return_value=make_response(404, body=body)):
+            with self.assertRaises(TransferAPIError) as err:
+                self.client.get("endpoint/foo")
+        self.assertEqual(err.exception.code, "ClientError.NotFound")
+        self.assertEqual(err.exception.raw_json["request_id"], "abc")
+        self.assertEqual(self.codec.calls,
+                         ["load_response", "load_response"])
+
+        with mock.patch.object(
+                self.client._session, "request",
+                return_value=make_response(502, body=b"<html>")):
+            with self.assertRaises(TransferAPIError) as err:
+                self.client.get("endpoint/foo")
+        self.assertEqual(err.exception.code, "Error")
+        self.assertIsNone(err.exception.raw_json)
+
+
+class JSONStreamBodyTests(CapturedIOTestCase):
+
+    def setUp(self):
+        """
+        Makes a document with long lists, both plain and ItemList, nested
+        among small values
+        """
+        super(JSONStreamBodyTests, self).setUp()
+        self.tdata = globus_sdk.TransferData(None, "src", "dst",
+                                             submission_id="sub",
+                                             compact_items=True,
+                                             label=u"café ☃")
+        self.tdata.add_items(("/~/{}".format(i), u"/~/é/{}".format(i))
+                             for i in range(2500))
+        self.doc = {"ingest_data": {"gmeta": [{"id": i} for i in range(1001)],
+                                    "small": [1, 2], 3: "int keys"},
+                    "transfer": self.tdata, "empty": {}, "nothing": None}
+        self.expected = json.loads(json.dumps(self.doc,
+                                              default=codec._for_json))
+
+    def test_stream_body(self):
+        """
+        Streams the document with every installed codec, confirms that it is
+        encoded as a whole, in chunks, as many times as it is iterated, and
+        that its length is that of the encoded document
+        """
+        names = ["json"] + [name for name, module in
+                            (("orjson", codec.orjson), ("ujson", codec.ujson))
+                            if module is not None]
+        for name in names:
+            body = codec.JSONStreamBody(self.doc, codec.get_codec(name),
+                                        batch_size=100, chunk_size=4096)
+            chunks = list(body)
+            self.assertGreater(len(chunks), 10)
+            self.assertTrue(all(len(chunk) >= 4096 for chunk in chunks[:-1]))
+            encoded = b"".join(chunks)
+            self.assertEqual(json.loads(encoded.decode("utf-8")),
+                             self.expected)
+            self.assertEqual(len(body), len(encoded))
+            self.assertEqual(b"".join(body), encoded)
+
+        self.assertTrue(codec.has_long_list(self.doc, 2500))
+        self.assertFalse(codec.has_long_list(self.doc, 2501))
+        self.assertFalse(codec.has_long_list("x" * 5000, 10))
+
+    def test_client_streams_body(self):
+        """
+        Sends long and short documents, confirms that only the long one is
+        streamed, that it's sent whole with a Content-Length, and again when
+        a 401 is retried
+        """
+        from tests.unit.test_aio import CountingRenewer
+        sent = []
+
+        def request(method, url, data=None, headers=None, **kwargs):
+            if isinstance(data, codec.JSONStreamBody):
+                self.assertEqual(requests.Request(
+                    method, url, data=data).prepare().headers[
+                        "Content-Length"], str(len(data)))
+                data = b"".join(data)
+            sent.append(json.loads(data))
+            if len(sent) == 1:
+                return make_response(
+                    401, data={"code": "AuthenticationFailed"})
+            return make_response(202, data={"code": "Accepted"})
+
+        client = BaseClient("transfer", base_path="/v0.10/",
+                            authorizer=CountingRenewer(),
+                            json_stream_min_items=2000,
+                            transport=HTTPTransport())
+        with mock.patch.object(client._session, "request", request):
+            client.post("transfer", self.doc)
+        self.assertEqual(sent, [self.expected, self.expected])
+
+        # streaming is off by default
+        client = globus_sdk.TransferClient(transport=HTTPTransport())
+        rheaders, body = client._prepare_request(None, self.doc, None)
+        self.assertIsInstance(body, (six.text_type, six.binary_type))
+        for min_items in (None, 2501):
+            client = globus_sdk.TransferClient(
+                json_stream_min_items=min_items, transport=HTTPTransport())
+            rheaders, body = client._prepare_request(None, self.doc, None)
+            self.assertIsInstance(body, (six.text_type, six.binary_type))
+        rheaders, body = client._prepare_request(None, self.tdata, None)
+        self.assertIsInstance(body, (six.text_type, six.binary_type))
+        client.json_stream_min_items = 2500
+        rheaders, body = client._prepare_request(None, self.tdata, None)
+        self.assertIsInstance(body, codec.JSONStreamBody)
@@ -0,0 +1,122 @@
+import json
+import zlib
+try:
+    import mock
+except ImportError:
+    from unittest import mock
+
+import requests
+
+import globus_sdk
+from globus_sdk import codec
+from globus_sdk.compress import GzipBody, gzip_body
+from globus_sdk.transport import HTTPTransport
+from tests.framework import CapturedIOTestCase
+
+
+def gunzip(data):
+    return zlib.decompress(data, 16 + zlib.MAX_WBITS)
+
+
+class CompressTests(CapturedIOTestCase):
+
+    def setUp(self):
+        """
+        Makes a TransferClient which compresses large bodies, whose requests
+        and hook events are recorded
+        """
+        super(CompressTests, self).setUp()
+        self.sent = []
+        self.events = []
+        self.client = globus_sdk.TransferClient(
+            compress_min_bytes=1000, compress_level=9,
+            transport=HTTPTransport())
+        self.client.hooks.register("after_response", self.events.append)
+        self.tdata = globus_sdk.TransferData(None, "src", "dst",
+                                             submission_id="sub")
+        self.tdata.add_items(("/~/dir/{}".format(i), "/~/dir/{}".format(i))
+                             for i in range(100))
+
+    def request(self, method, url, data=None, headers=None, **kwargs):
+        self.sent.append((headers, data))
+        response = requests.Response()
+        response.status_code = 202
+        response._content = b'{"code": "Accepted"}'
+        response.headers["Content-Type"] = "application/json"
+        return response
+
+    def post(self, *args, **kwargs):
+        """
+        Posts with the client, and gets the headers and body sent
+        """
+        with mock.patch.object(self.client._session, "request",
+                               self.request):
+            self.client.post(*args, **kwargs)
+        return self.sent[-1]
+
+    def test_gzip_body(self):
+        """
+        Compresses text, bytes, and streamed bodies, confirms that they are
+        gzip encoded, and that bodies below the minimum are left alone
+        """
+        doc = json.dumps(self.tdata, default=codec._for_json)
+        stream = codec.JSONStreamBody(self.tdata, codec.get_codec("json"),
+                                      batch_size=10, chunk_size=100)
+        for body in (doc, doc.encode("utf-8"), stream):
+            compressed = gzip_body(body, level=1)
+            self.assertIsInstance(compressed, GzipBody)
+            self.assertEqual(json.loads(gunzip(compressed).decode("utf-8")),
+                             json.loads(doc))
+            stats = compressed.stats()
+            self.assertEqual(stats["level"], 1)
+            self.assertEqual(stats["uncompressed_bytes"], len(doc))
+            self.assertEqual(stats["compressed_bytes"], len(compressed))
+            self.assertLess(len(compressed) * 10, len(doc))
+            self.assertIsNone(gzip_body(body, min_bytes=len(doc) + 1))
+
+        self.assertEqual(gunzip(gzip_body(u"caf\xe9")), u"caf\xe9".encode(
+            "utf-8"))
+
+    def test_client_compression(self):
+        """
+        Posts large and small bodies, confirms that only large ones are
+        compressed, unless set otherwise per call, and that hooks are told of
+        the compression
+        """
+        headers, data = self.post("transfer", self.tdata)
+        self.assertEqual(headers["Content-Encoding"], "gzip")
+        self.assertEqual(json.loads(gunzip(data).decode("utf-8")),
+                         json.loads(json.dumps(self.tdata,
+                                               default=codec._for_json)))
+        event = self.events[-1]
+        self.assertEqual(event.request_bytes, len(data))
+        self.assertEqual(event.compression["encoding"], "gzip")
+        self.assertEqual(event.compression["level"], 9)
+        self.assertGreater(event.compression["uncompressed_bytes"],
+                           len(data) * 10)
+        self.assertGreaterEqual(event.compression["seconds"], 0)
+
+        headers, data = self.post("transfer", {"small": True})
+        self.assertNotIn("Content-Encoding", headers)
+        self.assertIsNone(self.events[-1].compression)
+        headers, data = self.post("transfer", {"small": True}, compress=True)
+        self.assertEqual(json.loads(gunzip(data).decode("utf-8")),
+                         {"small": True})
+        headers, data = self.post("transfer", self.tdata, compress=False)
+        self.assertNotIn("Content-Encoding", headers)
+
+        # form bodies, and bodies already encoded by the caller, are not
+        headers, data = self.post("transfer", text_body={"x" * 2000: "y"})
+        self.assertEqual(data, {"x" * 2000: "y"})
+        headers, data = self.post("transfer", text_body=b"x" * 2000,
+                                  headers={"content-encoding": "br"})
+        self.assertEqual(data, b"x" * 2000)
+
+        # streamed bodies are compressed as they are encoded
+        self.client.json_stream_min_items = 50
+        headers, data = self.post("transfer", self.tdata)
+        self.assertEqual(headers["Content-Encoding"], "gzip")
+        self.assertIsInstance(data, GzipBody)
+        self.client.compress_min_bytes = None
+        headers, data = self.post("transfer", self.tdata)
+        self.assertIsInstance(data, codec.JSONStreamBody)
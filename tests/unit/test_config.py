@@ -134,6 +134,47 @@ class ConfigParserTests(CapturedIOTestCase):
         with self.assertRaises(ValueError):
             globus_sdk.config.get_ssl_verify("invalid")
 
+    def test_get_retry_settings(self):
+        """
+        Confirms the retry config getters return expected results
+        Tests explicit values, failover to general, and defaults
+        """
+        self._load_config_file("retry_test.cfg")
+
+        # explicit environment values
+        self.assertEqual(
+            globus_sdk.config.get_http_max_retries("retrying"), 5)
+        self.assertEqual(
+            globus_sdk.config.get_http_retry_backoff("retrying"), 1.5)
+        self.assertEqual(
+            globus_sdk.config.get_http_max_retry_backoff("retrying"), 10.0)
+        # failover to general, and defaults
+        self.assertEqual(
+            globus_sdk.config.get_http_max_retries("default"), 2)
+        self.assertEqual(
+            globus_sdk.config.get_http_retry_backoff("default"), 0.25)
+        self.assertEqual(
+            globus_sdk.config.get_http_max_retry_backoff("default"), 30.0)
+
+        # environment variables take precedence
+        with mock.patch.dict(os.environ,
+                             {"GLOBUS_SDK_HTTP_MAX_RETRIES": "7"}):
+            self.assertEqual(
+                globus_sdk.config.get_http_max_retries("retrying"), 7)
+
+    def test_get_json_codec(self):
+        """
+        Confirms the json_codec config getter defaults to auto, and reads
+        config files and environment variables
+        """
+        self._load_config_file("retry_test.cfg")
+        self.assertEqual(globus_sdk.config.get_json_codec("default"), "auto")
+        self.assertEqual(globus_sdk.config.get_json_codec("retrying"), "json")
+        with mock.patch.dict(os.environ,
+                             {"GLOBUS_SDK_JSON_CODEC": "orjson"}):
+            self.assertEqual(
+                globus_sdk.config.get_json_codec("retrying"), "orjson")
+
     def test_bool_cast(self):
         """
         Confirms bool cast returns correct bools from sets off string values
@@ -1,5 +1,9 @@
-import globus_sdk
+import copy
+import json
 
+import globus_sdk
+from globus_sdk import codec
+from globus_sdk.transfer.data import ItemList
 from tests.framework import (CapturedIOTestCase, get_client_data,
                              SDKTESTER1A_NATIVE1_TRANSFER_RT,
                              GO_EP1_ID, GO_EP2_ID)
@@ -132,3 +136,123 @@ class DataTests(CapturedIOTestCase):
         data = self.ddata["DATA"][0]
         self.assertEqual(data["DATA_TYPE"], "delete_item")
         self.assertEqual(data["path"], path)
+
+
+class ItemListTests(CapturedIOTestCase):
+
+    def setUp(self):
+        """
+        Creates a TransferData and a DeleteData with compact items and
+        submission IDs, so no client is needed
+        """
+        super(ItemListTests, self).setUp()
+        self.tdata = globus_sdk.TransferData(None, GO_EP1_ID, GO_EP2_ID,
+                                             submission_id="abc",
+                                             compact_items=True)
+        self.ddata = globus_sdk.DeleteData(None, GO_EP1_ID,
+                                           submission_id="abc",
+                                           compact_items=True)
+
+    def test_add_items(self):
+        """
+        Adds items singly and in bulk, confirms that they read back, and
+        encode with every installed codec, as the same dicts
+        """
+        self.tdata.add_item("/a", "/b")
+        self.tdata.add_items([("/c", b"/d"), ("/e", "/f", True)],
+                             recursive=None)
+        self.tdata.add_symlink_item("/g", "/h")
+        self.tdata.add_items(("/{}".format(i), "/{}".format(i))
+                             for i in range(3))
+        expected = [
+            {"DATA_TYPE": "transfer_item", "source_path": "/a",
+             "destination_path": "/b", "recursive": False},
+            {"DATA_TYPE": "transfer_item", "source_path": "/c",
+             "destination_path": "/d", "recursive": None},
+            {"DATA_TYPE": "transfer_item", "source_path": "/e",
+             "destination_path": "/f", "recursive": True},
+            {"DATA_TYPE": "transfer_symlink_item", "source_path": "/g",
+             "destination_path": "/h"}] + [
+            {"DATA_TYPE": "transfer_item", "source_path": "/{}".format(i),
+             "destination_path": "/{}".format(i), "recursive": False}
+            for i in range(3)]
+        self.assertIsInstance(self.tdata["DATA"], ItemList)
+        self.assertEqual(len(self.tdata["DATA"]), 7)
+        self.assertEqual(self.tdata["DATA"].for_json(), expected)
+
+        self.ddata.add_item("/a")
+        self.ddata.add_items(["/b", 3])
+        self.assertEqual(self.ddata["DATA"], [
+            {"DATA_TYPE": "delete_item", "path": path}
+            for path in ("/a", "/b", "3")])
+
+        for name in ("json", "orjson", "ujson"):
+            try:
+                c = codec.get_codec(name)
+            except globus_sdk.exc.GlobusSDKUsageError:
+                continue
+            doc = c.loads(c.dumps(self.tdata))
+            self.assertEqual(doc["DATA"], expected)
+            self.assertEqual(doc["submission_id"], "abc")
+            with self.assertRaises(TypeError):
+                c.dumps({"DATA": object()})
+
+    def test_list_behavior(self):
+        """
+        Reads, changes and removes items, confirms that the list acts as a
+        list of dicts, keeping changes made to items which were read
+        """
+        self.tdata.add_items([("/a", "/b"), ("/c", "/d"), ("/e", "/f")])
+        data = self.tdata["DATA"]
+        data[0]["recursive"] = True
+        for item in data:
+            item["label"] = "x"
+        data.append({"DATA_TYPE": "transfer_item", "source_path": "/g",
+                     "destination_path": "/h", "recursive": False})
+        del data[1]
+        self.assertEqual([(item["source_path"], item["recursive"])
+                          for item in data[:]],
+                         [("/a", True), ("/e", False), ("/g", False)])
+        self.assertEqual(json.loads(json.dumps(data.for_json()))[0]["label"],
+                         "x")
+        self.assertEqual(data, copy.deepcopy(data))
+        self.assertNotEqual(data, [])
+        self.assertEqual(repr(data), repr(data.for_json()))
+
+        del data[:]
+        self.assertEqual(len(data), 0)
+        self.assertEqual(ItemList([{"path": "/a"}]), [{"path": "/a"}])
+
+        # a document whose DATA was replaced still takes items
+        self.ddata["DATA"] = []
+        self.ddata.add_items(["/a"])
+        self.assertEqual(self.ddata["DATA"],
+                         [{"DATA_TYPE": "delete_item", "path": "/a"}])
+
+    def test_plain_items(self):
+        """
+        Adds items to documents made without compact_items, confirms that
+        DATA is a list of dicts, and that the stdlib json module encodes them
+        """
+        tdata = globus_sdk.TransferData(None, GO_EP1_ID, GO_EP2_ID,
+                                        submission_id="abc")
+        tdata.add_item("/a", "/b")
+        tdata.add_items([("/c", "/d", True)])
+        tdata.add_symlink_item("/e", "/f")
+        self.assertIs(type(tdata["DATA"]), list)
+        self.assertEqual(json.loads(json.dumps(tdata))["DATA"], [
+            {"DATA_TYPE": "transfer_item", "source_path": "/a",
+             "destination_path": "/b", "recursive": False},
+            {"DATA_TYPE": "transfer_item", "source_path": "/c",
+             "destination_path": "/d", "recursive": True},
+            {"DATA_TYPE": "transfer_symlink_item", "source_path": "/e",
+             "destination_path": "/f"}])
+        self.assertEqual(len(tdata["DATA"] + [{}]), 4)
+
+        ddata = globus_sdk.DeleteData(None, GO_EP1_ID, submission_id="abc")
+        ddata.add_item("/a")
+        ddata.add_items(["/b"])
+        self.assertIs(type(ddata["DATA"]), list)
+        self.assertEqual(json.loads(json.dumps(ddata))["DATA"], [
+            {"DATA_TYPE": "delete_item", "path": "/a"},
+            {"DATA_TYPE": "delete_item", "path": "/b"}])
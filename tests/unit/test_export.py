@@ -0,0 +1,171 @@
+import bz2
+import csv
+import gzip
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+try:
+    import mock
+except ImportError:
+    from unittest import mock
+
+import six
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+from globus_sdk.exc import GlobusSDKUsageError
+from globus_sdk.transfer.export import ResultExporter
+from globus_sdk.transfer.paging import PaginatedResource
+from tests.framework import CapturedIOTestCase
+from tests.unit.test_paging import PagingSimulator
+
+
+class ExportTests(CapturedIOTestCase):
+
+    def setUp(self):
+        """
+        Makes a temporary directory, and a PagingSimulator whose results have
+        several keys
+        """
+        super(ExportTests, self).setUp()
+        self.tmpdir = tempfile.mkdtemp()
+        self.n = 25
+        self.simulator = PagingSimulator(self.n)
+
+    def tearDown(self):
+        super(ExportTests, self).tearDown()
+        shutil.rmtree(self.tmpdir)
+
+    def make_resource(self, **kwargs):
+        return PaginatedResource(
+            self.simulator.simulate_get, "path", {"params": {}},
+            max_results_per_call=10, num_results=None, **kwargs)
+
+    def path(self, name):
+        return os.path.join(self.tmpdir, name)
+
+    def test_ndjson(self):
+        """
+        Exports a PaginatedResource as NDJSON, plain and with bz2, confirms
+        that every result is written, one page at a time, and the stats
+        """
+        for name, compression, opener in (("out.ndjson", None, open),
+                                          ("out.ndjson.bz2", "bz2",
+                                           bz2.BZ2File)):
+            progress = []
+            stats = self.make_resource().export(
+                self.path(name), compression=compression,
+                progress=lambda stats: progress.append(stats["results"]))
+            with opener(self.path(name), "rb") as f:
+                lines = f.read().decode("utf-8").splitlines()
+            self.assertEqual([json.loads(line) for line in lines],
+                             [{"value": i} for i in range(self.n)])
+            self.assertEqual(progress, [10, 20, 25])
+            self.assertEqual((stats["results"], stats["pages"]), (self.n, 3))
+            self.assertEqual(stats["bytes_written"],
+                             os.path.getsize(self.path(name)))
+            self.assertGreater(stats["results_per_second"], 0)
+
+    def test_csv(self):
+        """
+        Writes pages of results as gzipped CSV with projected fields, confirms
+        the header, rows, and how missing, boolean and nested values are
+        written
+        """
+        results = [{"task_id": "a", "bytes": 10, "ok": True,
+                    "labels": ["x"], "extra": 1},
+                   {"task_id": "b", "ok": False}]
+        with ResultExporter(self.path("out.csv.gz"), format="csv",
+                            fields=["task_id", "bytes", "ok", "labels"],
+                            compression="gzip") as exporter:
+            exporter.write_page(results)
+            exporter.write_page([])
+            exporter.write_page(results[:1])
+
+        with gzip.open(self.path("out.csv.gz"), "rb") as f:
+            text = f.read().decode("utf-8")
+        rows = list(csv.reader(io.StringIO(six.text_type(text))))
+        self.assertEqual(rows, [["task_id", "bytes", "ok", "labels"],
+                                ["a", "10", "true", '["x"]'],
+                                ["b", "", "false", ""],
+                                ["a", "10", "true", '["x"]']])
+        self.assertEqual(exporter.stats["pages"], 3)
+
+    def test_file_object(self):
+        """
+        Exports to a file object, confirms that it is left open, and that CSV
+        columns default to the keys of the first result
+        """
+        f = io.BytesIO()
+        self.make_resource().export(f, format="csv")
+        self.assertFalse(f.closed)
+        lines = f.getvalue().decode("utf-8").splitlines()
+        self.assertEqual(lines[:2], ["value", "0"])
+        self.assertEqual(len(lines), self.n + 1)
+
+    def test_cached_export(self):
+        """
+        Exports a PaginatedResource with cached pages, confirms that it can
+        still be iterated, without fetching pages again
+        """
+        pr = self.make_resource(cache_bytes=0)
+        next(pr)
+        f = io.BytesIO()
+        self.assertEqual(pr.export(f)["results"], self.n)
+        self.assertEqual(len(list(pr)), self.n)
+        self.assertEqual(len(self.simulator.calls), 3)
+
+    @unittest.skipIf(pyarrow is None, "requires pyarrow")
+    def test_parquet(self):
+        """
+        Exports a PaginatedResource as Parquet, confirms that it reads back
+        """
+        import pyarrow.parquet
+        stats = self.make_resource().export(self.path("out.parquet"),
+                                            format="parquet",
+                                            compression="snappy")
+        table = pyarrow.parquet.read_table(self.path("out.parquet"))
+        self.assertEqual(table.column("value").to_pylist(),
+                         list(range(self.n)))
+        self.assertEqual(stats["bytes_written"],
+                         os.path.getsize(self.path("out.parquet")))
+
+    def test_lazy_import(self):
+        """
+        Imports globus_sdk in a new interpreter, confirms that neither the
+        export module nor pyarrow is imported until results are exported
+        """
+        code = ("import sys, globus_sdk; print(sorted(m for m in "
+                "('pyarrow', 'globus_sdk.transfer.export') "
+                "if m in sys.modules))")
+        root = os.path.dirname(os.path.dirname(os.path.dirname(
+            os.path.abspath(__file__))))
+        out = subprocess.check_output([sys.executable, "-c", code], cwd=root)
+        self.assertEqual(out.decode("utf-8").strip(), "[]")
+
+    def test_errors(self):
+        """
+        Confirms that unknown formats and compressions are refused, as is
+        Parquet when pyarrow is not installed, and that export can't be used
+        once iteration has begun
+        """
+        with self.assertRaises(GlobusSDKUsageError):
+            ResultExporter(io.BytesIO(), format="xml")
+        with self.assertRaises(GlobusSDKUsageError):
+            ResultExporter(io.BytesIO(), compression="lzma")
+        with mock.patch.dict("sys.modules", {"pyarrow": None,
+                                             "pyarrow.parquet": None}):
+            with self.assertRaises(GlobusSDKUsageError):
+                ResultExporter(io.BytesIO(), format="parquet")
+
+        pr = self.make_resource()
+        next(pr)
+        with self.assertRaises(GlobusSDKUsageError):
+            pr.export(io.BytesIO())
@@ -0,0 +1,192 @@
+import time
+try:
+    import mock
+except ImportError:
+    from unittest import mock
+
+import requests
+
+from globus_sdk.authorizers import AccessTokenAuthorizer
+from globus_sdk.authorizers.renewing import RenewingAuthorizer
+from globus_sdk.base import BaseClient
+from globus_sdk.exc import (GlobusAPIError, GlobusConnectionError,
+                            GlobusSDKUsageError)
+from globus_sdk.hooks import ClientHooks, path_template
+from globus_sdk.transport import HTTPTransport
+from tests.framework import (CapturedIOTestCase, make_response,
+                             patch_request)
+from tests.unit.test_retry import RecordingRetryPolicy
+
+
+class ExpiredRenewer(RenewingAuthorizer):
+    """
+    A RenewingAuthorizer whose token is always expired
+    """
+    def _get_token_response(self):
+        return {"expires_at_seconds": int(time.time()) - 1000,
+                "access_token": "token"}
+
+    def _extract_token_data(self, res):
+        return res
+
+
+class ClientHooksTests(CapturedIOTestCase):
+
+    def setUp(self):
+        super(ClientHooksTests, self).setUp()
+        self.hooks = ClientHooks()
+        self.events = []
+        for name in ("before_request", "after_response", "on_retry",
+                     "on_error"):
+            self.hooks.register(
+                name, lambda event, name=name:
+                    self.events.append((name, event)))
+        self.client = BaseClient(
+            "transfer", base_path="/v0.10/", hooks=self.hooks,
+            authorizer=AccessTokenAuthorizer("token"),
+            retry_policy=RecordingRetryPolicy(max_retries=2, jitter=False),
+            transport=HTTPTransport())
+
+    def event_names(self):
+        return [name for name, _ in self.events]
+
+    def test_path_template(self):
+        """
+        Confirms that IDs are removed from paths
+        """
+        self.assertEqual(
+            path_template("endpoint/ddb59aef-6d04-11e5-ba46-22000b92c6ec/ls"),
+            "/endpoint/{id}/ls")
+        self.assertEqual(
+            path_template("/endpoint_manager/task/123/event_list"),
+            "/endpoint_manager/task/{id}/event_list")
+        self.assertEqual(path_template("/v2/api/identities"),
+                         "/v2/api/identities")
+
+    def test_register(self):
+        """
+        Registers and unregisters callbacks, confirms unknown events are
+        refused
+        """
+        hooks = ClientHooks()
+        callback = mock.Mock()
+        hooks.register("on_error", callback)
+        self.assertTrue(hooks.has_callbacks("on_error"))
+        self.assertFalse(hooks.has_callbacks("on_retry"))
+        hooks.fire("on_error", "event")
+        callback.assert_called_once_with("event")
+
+        hooks.unregister("on_error", callback)
+        self.assertFalse(hooks.has_callbacks("on_error"))
+        with self.assertRaises(GlobusSDKUsageError):
+            hooks.register("after_request", callback)
+
+        # clients get hooks of their own by default
+        self.assertIsInstance(BaseClient("transfer").hooks, ClientHooks)
+
+    def test_successful_request(self):
+        """
+        Sends a request, confirms the events and what they describe
+        """
+        with patch_request(self.client,
+                           make_response(200, data={"x": 1})) as m:
+            res = self.client.post("endpoint/123", {"DATA": []},
+                                   params={"a": "b"})
+        self.assertEqual(m.call_args[1]["stream"], True)
+        self.assertEqual(self.event_names(),
+                         ["before_request", "after_response"])
+
+        event = self.events[-1][1]
+        self.assertIs(event, self.events[0][1])
+        self.assertIs(event.client, self.client)
+        self.assertEqual(event.method, "POST")
+        self.assertEqual(event.path, "endpoint/123")
+        self.assertEqual(event.path_template, "/endpoint/{id}")
+        self.assertEqual(event.params, {"a": "b"})
+        self.assertEqual(event.attempt, 0)
+        self.assertEqual(event.status, 200)
+        self.assertEqual(event.request_bytes,
+                         len(self.client.json_codec.dumps({"DATA": []})))
+        self.assertEqual(event.response_bytes, len('{"x": 1}'))
+        self.assertIsNone(event.error)
+
+        # form and non-ASCII bodies are measured in bytes, as sent
+        with mock.patch.object(self.client._session, "request",
+                               return_value=make_response(200)):
+            self.client.post("endpoint/123", text_body={"a": "b c",
+                                                        "d": "e"})
+            self.assertEqual(self.events[-1][1].request_bytes,
+                             len("a=b+c&d=e"))
+            self.client.post("endpoint/123", text_body=u"caf\u00e9")
+            self.assertEqual(self.events[-1][1].request_bytes, 5)
+        self.assertFalse(event.token_refreshed)
+        self.assertEqual(
+            sorted(event.timings),
+            ["authorize", "body_read", "decode", "request", "total"])
+        # the body was decoded before the after_response hooks were called
+        self.assertEqual(res._parsed_json, {"x": 1})
+
+    def test_retries(self):
+        """
+        Sends a request which fails transiently, confirms one event per
+        attempt, with on_retry between them
+        """
+        with patch_request(self.client, requests.ConnectionError("down"),
+                           make_response(503), make_response(200)):
+            self.client.get("foo")
+        self.assertEqual(self.event_names(),
+                         ["before_request", "on_retry",
+                          "before_request", "after_response", "on_retry",
+                          "before_request", "after_response"])
+        events = [event for name, event in self.events
+                  if name == "before_request"]
+        self.assertEqual([e.attempt for e in events], [0, 1, 2])
+        self.assertIsInstance(events[0].error, GlobusConnectionError)
+        self.assertEqual(events[0].retry_delay, 0.5)
+        self.assertEqual(events[1].status, 503)
+        self.assertEqual(events[1].retry_delay, 1.0)
+        # authorization is only set before the first attempt
+        self.assertIn("authorize", events[0].timings)
+        self.assertNotIn("authorize", events[1].timings)
+
+    def test_errors(self):
+        """
+        Sends requests which fail, confirms on_error is fired with the error
+        which is raised
+        """
+        with patch_request(self.client, make_response(404)):
+            with self.assertRaises(GlobusAPIError) as err:
+                self.client.get("foo")
+        self.assertEqual(self.event_names(),
+                         ["before_request", "after_response", "on_error"])
+        self.assertIs(self.events[-1][1].error, err.exception)
+        self.assertEqual(self.events[-1][1].status, 404)
+
+        self.events = []
+        self.client.retry_policy.max_retries = 0
+        with patch_request(self.client, requests.ConnectionError("down")):
+            with self.assertRaises(GlobusConnectionError) as err:
+                self.client.get("foo")
+        self.assertEqual(self.event_names(), ["before_request", "on_error"])
+        self.assertIs(self.events[-1][1].error, err.exception)
+
+    def test_failing_callback(self):
+        """
+        Registers a callback which raises an error, confirms that requests
+        are unaffected
+        """
+        self.hooks.register("before_request", mock.Mock(side_effect=KeyError))
+        with patch_request(self.client, make_response(200, data={"x": 1})):
+            self.assertEqual(self.client.get("foo")["x"], 1)
+        self.assertEqual(self.event_names(),
+                         ["before_request", "after_response"])
+
+    def test_token_refresh(self):
+        """
+        Sends a request with an expired renewing authorizer, confirms that the
+        refresh is reported
+        """
+        self.client.authorizer = ExpiredRenewer()
+        with patch_request(self.client, make_response(200)):
+            self.client.get("foo")
+        self.assertTrue(self.events[0][1].token_refreshed)
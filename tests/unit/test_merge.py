@@ -0,0 +1,121 @@
+import json
+import threading
+import time
+
+import requests
+import six
+
+from globus_sdk.exc import GlobusAPIError, GlobusSDKUsageError
+from globus_sdk.response import ItemRecord
+from globus_sdk.transfer.merge import merge_paginated
+from globus_sdk.transfer.paging import PaginatedResource
+from globus_sdk.transfer.response import IterableTransferResponse
+from tests.framework import CapturedIOTestCase
+
+
+class ListPagingSimulator(object):
+    """
+    Simulates a has next page API whose results are the given values
+    """
+    def __init__(self, values, delay=0, fail_at=None):
+        self.values = values
+        self.delay = delay  # seconds taken by each call
+        self.fail_at = fail_at  # an offset at which calls fail
+        self.calls = 0
+
+    def simulate_get(self, path, params=None, **kwargs):
+        self.calls += 1
+        time.sleep(self.delay)
+        offset, limit = params["offset"], params["limit"]
+        if offset == self.fail_at:
+            response = requests.Response()
+            response.status_code = 500
+            raise GlobusAPIError(response)
+        data = {"DATA": [{"time": value, "stream": id(self)}
+                         for value in self.values[offset:offset + limit]],
+                "has_next_page": offset + limit < len(self.values)}
+        response = requests.Response()
+        response._content = six.b(json.dumps(data))
+        response.headers["Content-Type"] = "application/json"
+        return IterableTransferResponse(response)
+
+    def resource(self, **kwargs):
+        return PaginatedResource(
+            self.simulate_get, "path", {"params": {}},
+            max_results_per_call=10, num_results=None, **kwargs)
+
+
+class MergePaginatedTests(CapturedIOTestCase):
+
+    def test_merge(self):
+        """
+        Merges several resources, ascending and descending, confirms that the
+        results are all there and in order, with ties in stream order
+        """
+        streams = [list(range(0, 60, 3)), list(range(1, 40, 2)), [],
+                   list(range(0, 30, 5))]
+        expected = sorted(value for values in streams for value in values)
+
+        simulators = [ListPagingSimulator(values) for values in streams]
+        merged = list(merge_paginated(
+            [simulator.resource() for simulator in simulators], "time"))
+        self.assertEqual([result["time"] for result in merged], expected)
+        # ties keep the order of resources
+        zeros = [result["stream"] for result in merged if result["time"] == 0]
+        self.assertEqual(zeros, [id(simulators[0]), id(simulators[3])])
+
+        simulators = [ListPagingSimulator(sorted(values, reverse=True))
+                      for values in streams]
+        merged = merge_paginated(
+            [simulator.resource(item_mode="record")
+             for simulator in simulators],
+            lambda result: result["time"], reverse=True)
+        merged = list(merged)
+        self.assertEqual([result["time"] for result in merged],
+                         expected[::-1])
+        self.assertIsInstance(merged[0], ItemRecord)
+
+    def test_merge_concurrency(self):
+        """
+        Merges slow resources, confirms that their pages are fetched
+        concurrently, and that fetching stops with the merge
+        """
+        simulators = [ListPagingSimulator(list(range(i, 200, 4)), delay=0.02)
+                      for i in range(4)]
+        resources = [simulator.resource() for simulator in simulators]
+        start = time.time()
+        merged = list(merge_paginated(resources, "time", prefetch=2))
+        self.assertEqual(len(merged), 200)
+        # 5 pages per resource after the first, 20ms each
+        self.assertLess(time.time() - start, 0.3)
+
+        threads = threading.active_count()
+        simulators = [ListPagingSimulator(list(range(i, 400, 4)))
+                      for i in range(4)]
+        merged = merge_paginated(
+            [simulator.resource() for simulator in simulators], "time")
+        next(merged)
+        merged.close()
+        time.sleep(0.05)
+        for simulator in simulators:
+            # the first page, the page merged, and one prefetched
+            self.assertLessEqual(simulator.calls, 3)
+        self.assertEqual(threading.active_count(), threads)
+
+    def test_merge_errors(self):
+        """
+        Fails a page of one resource, confirms that the merge raises the
+        error, and that bad arguments and iterated resources are refused
+        """
+        resources = [ListPagingSimulator(list(range(50))).resource(),
+                     ListPagingSimulator(list(range(50)),
+                                         fail_at=20).resource()]
+        with self.assertRaises(GlobusAPIError):
+            list(merge_paginated(resources, "time"))
+
+        resource = ListPagingSimulator(list(range(50))).resource()
+        with self.assertRaises(GlobusSDKUsageError):
+            merge_paginated([resource], "time", prefetch=0)
+        next(resource)
+        with self.assertRaises(GlobusSDKUsageError):
+            merge_paginated([resource], "time")
@@ -1,24 +1,43 @@
 import requests
 import json
 import six
+import threading
+import time
+try:
+    import mock
+except ImportError:
+    from unittest import mock
 
+import globus_sdk
 from tests.framework import (CapturedIOTestCase)
-from globus_sdk.transfer.paging import PaginatedResource
+from globus_sdk.exc import GlobusAPIError, GlobusSDKUsageError
+from globus_sdk.response import GlobusResponse, ItemRecord, ItemView
+from globus_sdk.transfer.paging import (AdaptivePageSize, PageCache,
+                                        PaginatedResource, _response_bytes)
 from globus_sdk.transfer.response import IterableTransferResponse
 
 
 class PagingSimulator(object):
 
-    def __init__(self, n):
+    def __init__(self, n, delay=0, fail_at=None):
         self.n = n  # the number of simulated items
+        self.delay = delay  # seconds taken by each call
+        self.fail_at = fail_at  # an offset at which calls fail
+        self.calls = []  # the params of each call made
 
     def simulate_get(self, path, params=None,
                      headers=None, response_class=None, retry_401=True):
         """
         Simulates a paginated response from a Globus API get supporting limit,
-        offset, and has next page
+        offset, has next page, and total
         """
+        self.calls.append(dict(params))
+        time.sleep(self.delay)
         offset = params["offset"]
+        if offset == self.fail_at:
+            response = requests.Response()
+            response.status_code = 500
+            raise GlobusAPIError(response)
         limit = params["limit"]
         data = {}  # dict that will be treated as the json data of a response
         data["offset"] = offset
@@ -27,8 +46,9 @@ class PagingSimulator(object):
         data["DATA"] = []
         for i in range(offset, min(self.n, offset + limit)):
             data["DATA"].append({"value": i})
-        # fill has_next_page field
+        # fill has_next_page and total fields
         data["has_next_page"] = (offset + limit) < self.n
+        data["total"] = self.n
 
         # make the simulated response
         response = requests.Response()
@@ -37,6 +57,52 @@ class PagingSimulator(object):
         return IterableTransferResponse(response)
 
 
+class MarkerPagingSimulator(PagingSimulator):
+    """
+    A PagingSimulator for resources paged with opaque markers
+    """
+    def simulate_get(self, path, params=None, **kwargs):
+        """
+        Simulates a paginated response from a Globus API get supporting limit
+        and marker
+        """
+        self.calls.append(dict(params))
+        offset = int(params.get("marker", "m0")[1:])
+        limit = params["limit"]
+        data = {"marker": "m{}".format(offset),
+                "DATA": [{"value": i}
+                         for i in range(offset, min(self.n, offset + limit))]}
+        data["next_marker"] = ("m{}".format(offset + limit)
+                               if offset + limit < self.n else 0)
+
+        response = requests.Response()
+        response._content = six.b(json.dumps(data))
+        response.headers["Content-Type"] = "application/json"
+        return IterableTransferResponse(response)
+
+
+class ConcurrentPagingSimulator(PagingSimulator):
+    """
+    A PagingSimulator recording the greatest number of calls in flight at once
+    """
+    def __init__(self, *args, **kwargs):
+        PagingSimulator.__init__(self, *args, **kwargs)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def simulate_get(self, path, params=None, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return PagingSimulator.simulate_get(self, path, params=params,
+                                                **kwargs)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
 class PaginatedResourceTests(CapturedIOTestCase):
 
     def setUp(self):
@@ -97,3 +163,594 @@ class PaginatedResourceTests(CapturedIOTestCase):
 
         with self.assertRaises(StopIteration):
             six.next(generator)
+
+    def test_pages(self):
+        """
+        Iterates over the pages of PaginatedResources, confirms that they hold
+        the raw results and paging fields, that num_results is respected, and
+        that pages() can't be mixed with iteration over results
+        """
+        simulator = PagingSimulator(100)
+        for num_results, sizes in ((None, [10] * 10), (25, [10, 10, 5]),
+                                   (7, [7])):
+            for options in ({}, {"prefetch": 2}):
+                pr = PaginatedResource(
+                    simulator.simulate_get, "path", {"params": {}},
+                    max_results_per_call=10, num_results=num_results,
+                    **options)
+                pages = list(pr.pages())
+                self.assertEqual([len(page) for page in pages], sizes)
+                self.assertEqual([item["value"] for page in pages
+                                  for item in page.data],
+                                 list(range(sum(sizes))))
+                self.assertEqual(pages[0].offset, 0)
+                self.assertEqual(pages[0].total, 100)
+                self.assertIsNone(pages[0].next_marker)
+                self.assertIs(type(pages[0].data[0]), dict)
+                # results were taken by pages()
+                self.assertEqual(list(pr), [])
+
+        pr = PaginatedResource(
+            self.simulator.simulate_get, "path", {"params": {}},
+            max_results_per_call=10, num_results=None)
+        next(pr)
+        with self.assertRaises(GlobusSDKUsageError):
+            pr.pages()
+
+        # an empty result set still has its page
+        pr = PaginatedResource(
+            PagingSimulator(0).simulate_get, "path", {"params": {}},
+            max_results_per_call=10, num_results=None)
+        pages = list(pr.pages())
+        self.assertEqual([(len(page), page.total) for page in pages], [(0, 0)])
+
+        simulator = ConcurrentPagingSimulator(95)
+        pr = PaginatedResource(
+            simulator.simulate_get, "path", {"params": {}},
+            max_results_per_call=10, num_results=None,
+            paging_style=PaginatedResource.PAGING_STYLE_TOTAL, concurrency=3)
+        self.assertEqual([page.offset for page in pr.pages()],
+                         list(range(0, 100, 10)))
+        with self.assertRaises(GlobusSDKUsageError):
+            pr.pages()
+
+    def test_item_mode(self):
+        """
+        Iterates over PaginatedResources with each item mode, confirms the
+        type and contents of results, and that item_mode passes through
+        TransferClient methods
+        """
+        for item_mode, item_type in (("response", GlobusResponse),
+                                     ("dict", dict), ("view", ItemView),
+                                     ("record", ItemRecord)):
+            pr = PaginatedResource(
+                self.simulator.simulate_get, "path", {"params": {}},
+                max_results_per_call=10, num_results=None,
+                item_mode=item_mode)
+            items = pr.data
+            self.assertEqual([type(item) for item in items],
+                             [item_type] * self.n)
+            self.assertEqual([item["value"] for item in items],
+                             list(range(self.n)))
+
+        tc = globus_sdk.TransferClient()
+        with mock.patch.object(tc, "get", self.simulator.simulate_get):
+            pr = tc.endpoint_search("foo", item_mode="record")
+            self.assertIsInstance(next(pr), ItemRecord)
+        self.assertNotIn("item_mode", self.simulator.calls[-1])
+
+        with self.assertRaises(GlobusSDKUsageError):
+            PaginatedResource(
+                self.simulator.simulate_get, "path", {"params": {}},
+                item_mode="tuple")
+
+    def test_prefetch(self):
+        """
+        Iterates PaginatedResources with prefetching, confirms that results
+        are the same as without it, and that no page beyond num_results is
+        fetched
+        """
+        for num_results in (self.n - 7, self.n + 7, None, 10):
+            simulator = PagingSimulator(self.n)
+            pr = PaginatedResource(
+                simulator.simulate_get, "path", {"params": {}},
+                max_results_per_call=10, num_results=num_results,
+                prefetch=3)
+            expected = list(range(min(self.n, num_results or self.n)))
+            self.assertEqual([item["value"] for item in pr], expected)
+            self.assertEqual(len(simulator.calls), (len(expected) + 9) // 10)
+
+    def test_prefetch_depth(self):
+        """
+        Consumes pages slowly, confirms that fetching runs ahead by at most
+        the prefetch depth, and that it overlaps with consumption
+        """
+        simulator = PagingSimulator(100, delay=0.02)
+        pr = PaginatedResource(
+            simulator.simulate_get, "path", {"params": {}},
+            max_results_per_call=10, num_results=None, prefetch=2)
+        next(pr)
+        time.sleep(0.2)
+        # the page being consumed, and two more
+        self.assertEqual(len(simulator.calls), 3)
+
+        # fetching 10 pages and consuming them, 30ms each, overlaps
+        simulator = PagingSimulator(100, delay=0.03)
+        start = time.time()
+        pr = PaginatedResource(
+            simulator.simulate_get, "path", {"params": {}},
+            max_results_per_call=10, num_results=None, prefetch=2)
+        for i, item in enumerate(pr):
+            if i % 10 == 0:
+                time.sleep(0.03)
+        self.assertLess(time.time() - start, 0.5)
+
+    def test_prefetch_error(self):
+        """
+        Fails the third page of a prefetching PaginatedResource, confirms that
+        the error is raised by iteration after the results of earlier pages
+        """
+        simulator = PagingSimulator(self.n, fail_at=20)
+        pr = PaginatedResource(
+            simulator.simulate_get, "path", {"params": {}},
+            max_results_per_call=10, num_results=None, prefetch=2)
+        results = []
+        with self.assertRaises(GlobusAPIError):
+            for item in pr:
+                results.append(item["value"])
+        self.assertEqual(results, list(range(20)))
+
+    def test_client_prefetch(self):
+        """
+        Passes prefetch to a paginated TransferClient method, confirms that it
+        reaches the PaginatedResource rather than the query params
+        """
+        tc = globus_sdk.TransferClient()
+        with mock.patch.object(tc, "get", self.simulator.simulate_get):
+            pr = tc.endpoint_search("foo", num_results=None, prefetch=2,
+                                    filter_owner_id="me")
+            self.assertEqual(len(list(pr)), self.n)
+        self.assertEqual(pr.prefetch, 2)
+        self.assertEqual(self.simulator.calls[0]["filter_owner_id"], "me")
+        self.assertNotIn("prefetch", self.simulator.calls[0])
+
+    def test_concurrency(self):
+        """
+        Iterates PAGING_STYLE_TOTAL resources with concurrent fetching,
+        confirms that results are complete and in order, that concurrency is
+        bounded, and that num_results is respected
+        """
+        for num_results in (None, 95, 300):
+            simulator = ConcurrentPagingSimulator(250, delay=0.01)
+            pr = PaginatedResource(
+                simulator.simulate_get, "path", {"params": {}},
+                max_results_per_call=10, num_results=num_results,
+                paging_style=PaginatedResource.PAGING_STYLE_TOTAL,
+                concurrency=4)
+            expected = list(range(min(250, num_results or 250)))
+            self.assertEqual([item["value"] for item in pr], expected)
+            self.assertEqual(len(simulator.calls), (len(expected) + 9) // 10)
+            self.assertLessEqual(simulator.max_in_flight, 4)
+        self.assertEqual(simulator.max_in_flight, 4)
+
+        # unordered results are complete
+        simulator = ConcurrentPagingSimulator(250)
+        pr = PaginatedResource(
+            simulator.simulate_get, "path", {"params": {}},
+            max_results_per_call=10, num_results=None,
+            paging_style=PaginatedResource.PAGING_STYLE_TOTAL,
+            concurrency=4, ordered=False)
+        self.assertEqual(sorted(item["value"] for item in pr),
+                         list(range(250)))
+
+    def test_client_concurrency(self):
+        """
+        Passes concurrency to task_list, confirms that it reaches the
+        PaginatedResource rather than the query params
+        """
+        tc = globus_sdk.TransferClient()
+        simulator = ConcurrentPagingSimulator(2500)
+        with mock.patch.object(tc, "get", simulator.simulate_get):
+            pr = tc.task_list(num_results=None, concurrency=2, ordered=False,
+                              filter="status:ACTIVE")
+            self.assertEqual(len(list(pr)), 2500)
+        self.assertEqual((pr.concurrency, pr.ordered), (2, False))
+        self.assertEqual(len(simulator.calls), 3)
+        for call in simulator.calls:
+            self.assertEqual(call["filter"], "status:ACTIVE")
+            self.assertNotIn("concurrency", call)
+
+    def test_concurrency_speed(self):
+        """
+        Fetches 10 pages of 50ms each, 5 at a time, confirms that it is
+        several times faster than fetching them one at a time would be
+        """
+        simulator = ConcurrentPagingSimulator(100, delay=0.05)
+        start = time.time()
+        pr = PaginatedResource(
+            simulator.simulate_get, "path", {"params": {}},
+            max_results_per_call=10, num_results=None,
+            paging_style=PaginatedResource.PAGING_STYLE_TOTAL,
+            concurrency=5)
+        self.assertEqual(len(list(pr)), 100)
+        self.assertLess(time.time() - start, 0.3)
+
+    def test_concurrency_errors(self):
+        """
+        Fails a page fetched concurrently, confirms that the error is raised,
+        and that concurrency is refused for other paging styles
+        """
+        simulator = ConcurrentPagingSimulator(100, fail_at=50)
+        pr = PaginatedResource(
+            simulator.simulate_get, "path", {"params": {}},
+            max_results_per_call=10, num_results=None,
+            paging_style=PaginatedResource.PAGING_STYLE_TOTAL,
+            concurrency=3)
+        with self.assertRaises(GlobusAPIError):
+            list(pr)
+
+        with self.assertRaises(GlobusSDKUsageError):
+            PaginatedResource(
+                self.simulator.simulate_get, "path", {"params": {}},
+                concurrency=3)
+
+    def test_cursor(self):
+        """
+        Takes cursors part way through PaginatedResources of offset and marker
+        paging styles, confirms that they survive JSON, and that resuming from
+        them yields the remaining results, fetching only the page on which
+        the cursor was taken again
+        """
+        for simulator, paging_style in (
+                (PagingSimulator(self.n),
+                 PaginatedResource.PAGING_STYLE_HAS_NEXT),
+                (MarkerPagingSimulator(self.n),
+                 PaginatedResource.PAGING_STYLE_MARKER)):
+            for consumed in (0, 1, 10, 13, 24, 25):
+                pr = PaginatedResource(
+                    simulator.simulate_get, "path",
+                    {"params": {"filter": "foo"}},
+                    max_results_per_call=10, num_results=None,
+                    paging_style=paging_style)
+                for _ in range(consumed):
+                    next(pr)
+                cursor = json.loads(json.dumps(pr.cursor()))
+                self.assertEqual(cursor["num_results_fetched"], consumed)
+                self.assertEqual(cursor["params"], {"filter": "foo"})
+
+                del simulator.calls[:]
+                resumed = PaginatedResource(
+                    simulator.simulate_get, "path", {"params": {}},
+                    max_results_per_call=10, num_results=None,
+                    paging_style=paging_style, cursor=cursor)
+                self.assertEqual([item["value"] for item in resumed],
+                                 list(range(consumed, self.n)))
+                self.assertEqual(resumed.num_results_fetched, self.n)
+                # from the page holding the last result consumed
+                self.assertEqual(len(simulator.calls),
+                                 3 - max(consumed - 1, 0) // 10)
+                for call in simulator.calls:
+                    self.assertEqual(call["filter"], "foo")
+
+    def test_cursor_num_results(self):
+        """
+        Resumes a PaginatedResource with num_results, by pages and with
+        prefetching, confirms that num_results is still respected
+        """
+        pr = PaginatedResource(
+            self.simulator.simulate_get, "path", {"params": {}},
+            max_results_per_call=10, num_results=22)
+        next(pr.pages())
+        cursor = pr.cursor()
+        self.assertEqual((cursor["offset"], cursor["skip"]), (0, 10))
+
+        resumed = PaginatedResource(
+            self.simulator.simulate_get, "path", {"params": {}},
+            max_results_per_call=10, num_results=5, cursor=cursor,
+            prefetch=2)
+        self.assertEqual(resumed.num_results, 22)
+        next(resumed)
+        cursor = resumed.cursor()
+        self.assertEqual((cursor["offset"], cursor["skip"]), (10, 1))
+
+        resumed = PaginatedResource(
+            self.simulator.simulate_get, "path", {"params": {}},
+            max_results_per_call=10, cursor=cursor)
+        self.assertEqual([len(page) for page in resumed.pages()], [9, 2])
+        self.assertEqual(resumed.num_results_fetched, 22)
+
+    def test_cursor_errors(self):
+        """
+        Confirms that a cursor is refused by another resource, and can't be
+        taken from unordered results
+        """
+        pr = PaginatedResource(
+            self.simulator.simulate_get, "path", {"params": {}})
+        with self.assertRaises(GlobusSDKUsageError):
+            PaginatedResource(
+                self.simulator.simulate_get, "other/path", {"params": {}},
+                cursor=pr.cursor())
+
+        pr = PaginatedResource(
+            self.simulator.simulate_get, "path", {"params": {}},
+            paging_style=PaginatedResource.PAGING_STYLE_TOTAL,
+            concurrency=2, ordered=False)
+        with self.assertRaises(GlobusSDKUsageError):
+            pr.cursor()
+
+    def test_client_cursor(self):
+        """
+        Resumes task_successful_transfers from a cursor, confirms that the
+        cursor reaches the PaginatedResource rather than the query params
+        """
+        tc = globus_sdk.TransferClient()
+        simulator = MarkerPagingSimulator(2500)
+        with mock.patch.object(tc, "get", simulator.simulate_get):
+            pr = tc.task_successful_transfers("task-id", num_results=None)
+            for _ in range(1500):
+                next(pr)
+            cursor = pr.cursor()
+            resumed = tc.task_successful_transfers("task-id", cursor=cursor)
+            self.assertEqual([item["value"] for item in resumed],
+                             list(range(1500, 2500)))
+        self.assertEqual(simulator.calls[-2], {"limit": 1000,
+                                               "marker": "m1000"})
+
+    def test_cache_bytes(self):
+        """
+        Iterates PaginatedResources with cached pages several times, confirms
+        that results are the same each time, that each page is fetched once,
+        and that pages are spilled to disk beyond the memory budget
+        """
+        for cache_bytes, spilled in ((0, 3), (10 ** 6, 0)):
+            simulator = PagingSimulator(self.n)
+            pr = PaginatedResource(
+                simulator.simulate_get, "path", {"params": {}},
+                max_results_per_call=10, num_results=None,
+                cache_bytes=cache_bytes)
+            self.assertEqual(next(pr)["value"], 0)
+            self.assertEqual(next(pr)["value"], 1)
+            expected = list(range(self.n))
+            for _ in range(3):
+                self.assertEqual([item["value"] for item in pr], expected)
+            self.assertEqual([item["value"] for item in pr.data], expected)
+            self.assertEqual(next(pr)["value"], 2)
+            self.assertEqual(len(simulator.calls), 3)
+            self.assertEqual(pr._cache.spilled_pages, spilled)
+
+        # num_results is respected, with prefetching
+        simulator = PagingSimulator(self.n)
+        pr = PaginatedResource(
+            simulator.simulate_get, "path", {"params": {}},
+            max_results_per_call=10, num_results=15, prefetch=2,
+            cache_bytes=0, item_mode="record")
+        self.assertEqual([item["value"] for item in pr], list(range(15)))
+        self.assertEqual([item["value"] for item in pr], list(range(15)))
+        self.assertEqual(len(simulator.calls), 2)
+
+        with self.assertRaises(GlobusSDKUsageError):
+            pr.pages()
+        with self.assertRaises(GlobusSDKUsageError):
+            pr.cursor()
+
+    def test_cache_bytes_consumers(self):
+        """
+        Iterates a PaginatedResource with cached pages from several threads at
+        once, confirms that each gets all results and each page is fetched
+        once, and that an error is raised to every consumer
+        """
+        simulator = ConcurrentPagingSimulator(100, delay=0.01)
+        pr = PaginatedResource(
+            simulator.simulate_get, "path", {"params": {}},
+            max_results_per_call=10, num_results=None, cache_bytes=500)
+        results = []
+
+        def consume():
+            results.append([item["value"] for item in pr])
+
+        threads = [threading.Thread(target=consume) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [list(range(100))] * 4)
+        self.assertEqual(len(simulator.calls), 10)
+        self.assertEqual(simulator.max_in_flight, 1)
+
+        simulator = PagingSimulator(self.n, fail_at=20)
+        pr = PaginatedResource(
+            simulator.simulate_get, "path", {"params": {}},
+            max_results_per_call=10, num_results=None, cache_bytes=0)
+        for _ in range(2):
+            with self.assertRaises(GlobusAPIError):
+                list(pr)
+
+    def non_ascii_page(self):
+        """
+        Makes a page of 15 characters, and 16 bytes
+        """
+        response = requests.Response()
+        response._content = u'{"DATA": ["\u00e9"]}'.encode("utf-8")
+        response.headers["Content-Type"] = "application/json"
+        return IterableTransferResponse(response)
+
+    def test_page_cache(self):
+        """
+        Adds pages to a PageCache, confirms that memory use stays within the
+        budget, and that spilled pages read back the same
+        """
+        cache = PageCache(250)
+        pages = [[{"value": i, "name": "x" * 20} for i in range(j, j + 5)]
+                 for j in range(0, 50, 5)]
+        for page in pages:
+            cache.append(page, 100)
+            self.assertLessEqual(cache.memory_bytes, 250)
+        self.assertEqual(len(cache), 10)
+        self.assertEqual(cache.spilled_pages, 8)
+        self.assertGreater(cache.spilled_bytes, 0)
+        self.assertEqual([cache.get(i) for i in range(10)], pages)
+        # the most recent pages are in memory
+        self.assertIs(cache.get(9), pages[9])
+        cache.close()
+        self.assertEqual(len(cache), 0)
+
+        # pages are measured in bytes, as received
+        self.assertEqual(_response_bytes(self.non_ascii_page()), 16)
+
+    def test_adaptive_limit(self):
+        """
+        Iterates PaginatedResources with adaptive limits, confirms that pages
+        grow up to the API maximum when responses are fast, that results are
+        complete and contiguous, and that num_results is respected
+        """
+        for paging_style, simulator in (
+                (PaginatedResource.PAGING_STYLE_HAS_NEXT,
+                 PagingSimulator(2000)),
+                (PaginatedResource.PAGING_STYLE_MARKER,
+                 MarkerPagingSimulator(2000))):
+            page_size = AdaptivePageSize(initial_limit=10)
+            pr = PaginatedResource(
+                simulator.simulate_get, "path", {"params": {}},
+                max_results_per_call=500, num_results=None,
+                paging_style=paging_style, adaptive_limit=page_size)
+            self.assertEqual([item["value"] for item in pr],
+                             list(range(2000)))
+            limits = [call["limit"] for call in simulator.calls]
+            self.assertEqual(limits[:4], [10, 40, 160, 500])
+            self.assertEqual(set(limits[4:]), set([500]))
+            self.assertEqual([page["limit"] for page in page_size.history],
+                             limits)
+
+        pr = PaginatedResource(
+            self.simulator.simulate_get, "path", {"params": {}},
+            max_results_per_call=10, num_results=18, adaptive_limit=True)
+        self.assertEqual([item["value"] for item in pr], list(range(18)))
+        self.assertEqual([call["limit"] for call in self.simulator.calls],
+                         [10, 8])
+
+        with self.assertRaises(GlobusSDKUsageError):
+            PaginatedResource(
+                self.simulator.simulate_get, "path", {"params": {}},
+                paging_style=PaginatedResource.PAGING_STYLE_TOTAL,
+                concurrency=2, adaptive_limit=True)
+
+    def test_adaptive_limit_slow(self):
+        """
+        Iterates a slow PaginatedResource with an adaptive limit, confirms
+        that pages shrink to fit the target time
+        """
+        simulator = PagingSimulator(200, delay=0.02)
+        page_size = AdaptivePageSize(initial_limit=50, target_seconds=0.01,
+                                     min_limit=5)
+        pr = PaginatedResource(
+            simulator.simulate_get, "path", {"params": {}},
+            max_results_per_call=100, num_results=None,
+            adaptive_limit=page_size)
+        self.assertEqual([item["value"] for item in pr], list(range(200)))
+        limits = [call["limit"] for call in simulator.calls]
+        self.assertEqual(limits[0], 50)
+        self.assertLess(max(limits[1:]), 50)
+
+    def test_adaptive_page_size(self):
+        """
+        Feeds observations to an AdaptivePageSize, confirms that limits
+        follow the target time and byte size, within their bounds
+        """
+        page_size = AdaptivePageSize(initial_limit=100, target_seconds=1.0,
+                                     max_growth=4.0, smoothing=1.0)
+        self.assertEqual(page_size.next_limit(1000), 100)
+        self.assertEqual(page_size.next_limit(50), 50)
+        # 100 results per second
+        page_size.observe(100, 100, 1.0, 10000)
+        self.assertEqual(page_size.next_limit(1000), 100)
+        # 1000 results per second, but growth is bounded
+        page_size.observe(100, 100, 0.1, 10000)
+        self.assertEqual(page_size.next_limit(1000), 400)
+        # empty pages are ignored
+        page_size.observe(400, 0, 5.0, 100)
+        self.assertEqual(page_size.next_limit(1000), 400)
+        # 2 results per second, bounded by min_limit
+        page_size.observe(400, 10, 5.0, 1000)
+        self.assertEqual(page_size.next_limit(1000), 10)
+        self.assertEqual(len(page_size.history), 4)
+
+        page_size = AdaptivePageSize(initial_limit=100, max_page_bytes=5000,
+                                     smoothing=1.0)
+        page_size.observe(100, 100, 0.01, 100000)
+        self.assertEqual(page_size.next_limit(1000), 10)
+
+        # pages are observed in bytes, as received
+        pr = PaginatedResource(
+            self.simulator.simulate_get, "path", {"params": {}},
+            adaptive_limit=page_size)
+        pr._observe_page(self.non_ascii_page(), 0.1)
+        self.assertEqual(page_size.history[-1]["bytes"], 16)
+
+    def test_client_adaptive_limit(self):
+        """
+        Passes adaptive_limit to task_list, confirms that it reaches the
+        PaginatedResource, and that the limit of each page is sent as a query
+        param
+        """
+        tc = globus_sdk.TransferClient()
+        simulator = PagingSimulator(300)
+        with mock.patch.object(tc, "get", simulator.simulate_get):
+            pr = tc.task_list(num_results=None, adaptive_limit=True)
+            self.assertEqual(len(list(pr)), 300)
+        self.assertIsInstance(pr.adaptive_limit, AdaptivePageSize)
+        self.assertEqual([call["limit"] for call in simulator.calls],
+                         [100, 400])
+        self.assertNotIn("adaptive_limit", simulator.calls[0])
+
+    def test_stop_when(self):
+        """
+        Iterates PaginatedResources with stop_when, with and without
+        prefetching, by pages, and with concurrency, confirms that results
+        stop before the first matching one, and no later page is fetched, or
+        with concurrency, none beyond those already in flight
+        """
+        for kwargs in ({}, {"prefetch": 3}):
+            simulator = PagingSimulator(self.n)
+            pr = PaginatedResource(
+                simulator.simulate_get, "path", {"params": {}},
+                max_results_per_call=10, num_results=None,
+                stop_when=lambda item: item["value"] >= 13, **kwargs)
+            self.assertEqual([item["value"] for item in pr], list(range(13)))
+            self.assertEqual(len(simulator.calls), 2)
+
+        simulator = PagingSimulator(self.n)
+        pr = PaginatedResource(
+            simulator.simulate_get, "path", {"params": {}},
+            max_results_per_call=10, num_results=None,
+            stop_when=lambda item: item["value"] == 3)
+        self.assertEqual([len(page) for page in pr.pages()], [3])
+        self.assertEqual(len(simulator.calls), 1)
+
+        simulator = ConcurrentPagingSimulator(250)
+        pr = PaginatedResource(
+            simulator.simulate_get, "path", {"params": {}},
+            max_results_per_call=10, num_results=None,
+            paging_style=PaginatedResource.PAGING_STYLE_TOTAL,
+            concurrency=2, stop_when=lambda item: item["value"] == 42)
+        self.assertEqual([item["value"] for item in pr], list(range(42)))
+        # the first page, the four pages up to the stop, and up to
+        # 2 * concurrency pages in flight after it
+        self.assertLessEqual(len(simulator.calls), 1 + 4 + 4)
+
+    def test_fields(self):
+        """
+        Passes fields and stop_when to task_list, confirms that fields is sent
+        as a comma separated query param, and stop_when reaches the
+        PaginatedResource
+        """
+        tc = globus_sdk.TransferClient()
+        with mock.patch.object(tc, "get", self.simulator.simulate_get):
+            pr = tc.task_list(num_results=None, fields=["task_id", "status"],
+                              stop_when=lambda item: item["value"] == 5)
+            self.assertEqual(len(list(pr)), 5)
+            pr = tc.task_list(fields="task_id")
+            next(pr)
+        self.assertEqual(self.simulator.calls[0]["fields"], "task_id,status")
+        self.assertNotIn("stop_when", self.simulator.calls[0])
+        self.assertEqual(self.simulator.calls[1]["fields"], "task_id")
+        self.assertEqual(pr.cursor()["params"], {"fields": "task_id"})
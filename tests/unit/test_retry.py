@@ -0,0 +1,157 @@
+import requests
+
+from globus_sdk.base import BaseClient
+from globus_sdk.exc import (GlobusAPIError, GlobusConnectionError,
+                            GlobusConnectionTimeoutError)
+from globus_sdk.retry import RetryPolicy
+from tests.framework import (CapturedIOTestCase, make_response,
+                             patch_request)
+
+
+class RecordingRetryPolicy(RetryPolicy):
+    """
+    A RetryPolicy which records its waits instead of sleeping
+    """
+    def __init__(self, *args, **kwargs):
+        RetryPolicy.__init__(self, *args, **kwargs)
+        self.waits = []
+
+    def sleep(self, delay):
+        self.waits.append(delay)
+
+
+class RetryPolicyTests(CapturedIOTestCase):
+
+    def setUp(self):
+        super(RetryPolicyTests, self).setUp()
+        self.policy = RetryPolicy(max_retries=3, backoff_factor=1,
+                                  max_backoff=5, jitter=False)
+
+    def test_should_retry_statuses(self):
+        """
+        Confirms retryable statuses are retried for idempotent methods, and
+        that other statuses are not
+        """
+        for status in (429, 502, 503, 504):
+            self.assertTrue(self.policy.should_retry(
+                0, "GET", response=make_response(status)))
+        for status in (200, 400, 401, 404, 500):
+            self.assertFalse(self.policy.should_retry(
+                0, "GET", response=make_response(status)))
+
+    def test_should_retry_max_retries(self):
+        """
+        Confirms that retries stop at max_retries
+        """
+        response = make_response(503)
+        self.assertTrue(self.policy.should_retry(2, "GET", response=response))
+        self.assertFalse(self.policy.should_retry(3, "GET",
+                                                  response=response))
+
+    def test_should_retry_idempotency(self):
+        """
+        Confirms that POSTs are only retried with a submission_id, unless the
+        failure shows that the request was never handled
+        """
+        response = make_response(503)
+        self.assertFalse(self.policy.should_retry(
+            0, "POST", json_body={"DATA": []}, response=response))
+        self.assertTrue(self.policy.should_retry(
+            0, "POST", json_body={"submission_id": "abc"},
+            response=response))
+        self.assertTrue(self.policy.should_retry(
+            0, "PUT", json_body={"DATA": []}, response=response))
+
+        # 429 and connection timeouts are safe for any method
+        self.assertTrue(self.policy.should_retry(
+            0, "POST", response=make_response(429)))
+        self.assertTrue(self.policy.should_retry(
+            0, "POST", error=GlobusConnectionTimeoutError("msg", None)))
+        self.assertFalse(self.policy.should_retry(
+            0, "POST", error=GlobusConnectionError("msg", None)))
+        self.assertTrue(self.policy.should_retry(
+            0, "GET", error=GlobusConnectionError("msg", None)))
+
+    def test_compute_delay(self):
+        """
+        Confirms exponential backoff, the max_backoff cap, and Retry-After
+        """
+        self.assertEqual(
+            [self.policy.compute_delay(n) for n in range(5)],
+            [1, 2, 4, 5, 5])
+
+        def retry_after(value):
+            return make_response(503, headers={"Retry-After": value})
+
+        self.assertEqual(self.policy.compute_delay(
+            0, response=retry_after("3")), 3)
+        self.assertEqual(self.policy.compute_delay(
+            0, response=retry_after("300")), 5)
+        # unparseable values fall back to backoff
+        self.assertEqual(self.policy.compute_delay(
+            2, response=retry_after("soon")), 4)
+
+        jittered = RetryPolicy(backoff_factor=1, jitter=True)
+        for _ in range(20):
+            self.assertTrue(0 <= jittered.compute_delay(2) <= 4)
+
+
+class BaseClientRetryTests(CapturedIOTestCase):
+
+    def setUp(self):
+        super(BaseClientRetryTests, self).setUp()
+        self.policy = RecordingRetryPolicy(max_retries=2, jitter=False)
+        self.client = BaseClient("transfer", base_path="/v0.10/",
+                                 retry_policy=self.policy)
+
+    def test_default_policy_from_config(self):
+        """
+        Confirms that clients get a RetryPolicy which does not retry by default
+        """
+        client = BaseClient("transfer", base_path="/v0.10/")
+        self.assertIsInstance(client.retry_policy, RetryPolicy)
+        self.assertEqual(client.retry_policy.max_retries, 0)
+
+    def test_retry_then_succeed(self):
+        """
+        Sends a GET which fails transiently, confirms it is retried
+        """
+        with patch_request(
+                self.client, make_response(503),
+                requests.ConnectionError("down"),
+                make_response(200, data={"ok": True})) as m:
+            res = self.client.get("foo")
+        self.assertEqual(res["ok"], True)
+        self.assertEqual(m.call_count, 3)
+        self.assertEqual(self.policy.waits, [0.5, 1.0])
+
+    def test_retries_exhausted(self):
+        """
+        Sends a GET which keeps failing, confirms the last error is raised
+        """
+        with patch_request(self.client, make_response(503), make_response(503),
+                           make_response(503)) as m:
+            with self.assertRaises(GlobusAPIError) as err:
+                self.client.get("foo")
+        self.assertEqual(err.exception.http_status, 503)
+        self.assertEqual(m.call_count, 3)
+
+        with patch_request(self.client,
+                           *[requests.ConnectionError("down")] * 3):
+            with self.assertRaises(GlobusConnectionError):
+                self.client.get("foo")
+
+    def test_post_without_submission_id(self):
+        """
+        Sends POSTs which fail transiently, confirms that they are only
+        retried if they carry a submission_id
+        """
+        with patch_request(self.client, make_response(502)) as m:
+            with self.assertRaises(GlobusAPIError):
+                self.client.post("transfer", {"DATA": []})
+        self.assertEqual(m.call_count, 1)
+
+        with patch_request(self.client, make_response(502),
+                           make_response(200)) as m:
+            self.client.post("transfer", {"submission_id": "abc"})
+        self.assertEqual(m.call_count, 2)
@@ -0,0 +1,99 @@
+import time
+
+import globus_sdk
+from globus_sdk.exc import GlobusSDKUsageError, TransferAPIError
+from globus_sdk.transport import HTTPTransport
+from tests.framework import CapturedIOTestCase, GO_EP1_ID, GO_EP2_ID
+from tests.unit.test_chunking import SubmissionSimulator
+
+
+class SubmissionIDTests(CapturedIOTestCase):
+
+    def make_client(self, **kwargs):
+        """
+        Makes a TransferClient whose requests go to self.simulator
+        """
+        tc = globus_sdk.TransferClient(transport=HTTPTransport(), **kwargs)
+        tc._session.request = self.simulator.request
+        return tc
+
+    def wait_for_ready(self, pool, ready):
+        for _ in range(100):
+            if pool.stats()["ready"] == ready:
+                return
+            time.sleep(0.01)
+        self.fail("pool never had {} IDs ready".format(ready))
+
+    def test_pool(self):
+        """
+        Takes submission IDs from a client with a pool, confirms that none are
+        fetched until the first is taken, and that the pool is then kept full
+        so that IDs are taken without waiting
+        """
+        self.simulator = SubmissionSimulator(id_delay=0.05)
+        tc = self.make_client(submission_id_prefetch=3)
+        pool = tc.submission_id_pool
+        time.sleep(0.1)
+        self.assertEqual(self.simulator.submission_ids, 0)
+
+        ids = [tc.next_submission_id()]
+        self.wait_for_ready(pool, 3)
+        start = time.time()
+        ids.extend(tc.next_submission_id() for _ in range(3))
+        self.assertLess(time.time() - start, 0.05)
+        self.assertEqual(ids, ["id1", "id2", "id3", "id4"])
+        self.wait_for_ready(pool, 3)
+        self.assertEqual(pool.stats(),
+                         {"fetched": 7, "taken": 4, "ready": 3})
+
+        # TransferData takes its ID from the pool
+        tdata = globus_sdk.TransferData(tc, GO_EP1_ID, GO_EP2_ID)
+        self.assertEqual(tdata["submission_id"], "id5")
+
+        pool.close()
+        time.sleep(0.1)
+        self.assertEqual(self.simulator.submission_ids, 7)
+        self.assertEqual([pool.get(), pool.get()], ["id6", "id7"])
+        with self.assertRaises(GlobusSDKUsageError):
+            pool.get()
+
+    def test_pool_errors(self):
+        """
+        Fails to fetch submission IDs, confirms that the error reaches the
+        caller waiting for one, and that the pool recovers
+        """
+        self.simulator = SubmissionSimulator()
+        self.simulator.fail_ids = True
+        tc = self.make_client(submission_id_prefetch=2)
+        with self.assertRaises(TransferAPIError) as err:
+            tc.next_submission_id()
+        self.assertEqual(err.exception.http_status, 503)
+
+        self.simulator.fail_ids = False
+        self.assertEqual(tc.next_submission_id(), "id1")
+        self.assertIsNone(self.make_client().submission_id_pool)
+
+    def test_deferred_submission_id(self):
+        """
+        Makes documents with deferred submission IDs, confirms that they are
+        given one when submitted, which is kept for submitting them again
+        """
+        self.simulator = SubmissionSimulator()
+        tc = self.make_client()
+        tdata = globus_sdk.TransferData(None, GO_EP1_ID, GO_EP2_ID,
+                                        defer_submission_id=True)
+        tdata.add_item("/~/a", "/~/b")
+        self.assertNotIn("submission_id", tdata)
+
+        self.assertEqual(tc.submit_transfer(tdata)["task_id"], "task-id1")
+        self.assertEqual(tdata["submission_id"], "id1")
+        self.assertEqual(tc.submit_transfer(tdata)["task_id"], "task-id1")
+        self.assertEqual(self.simulator.submission_ids, 1)
+
+        ddata = globus_sdk.DeleteData(tc, GO_EP1_ID, submission_id="given",
+                                      defer_submission_id=True)
+        ddata.add_item("/~/a")
+        self.assertEqual(tc.submit_delete(ddata)["task_id"], "task-given")
+        ddata = globus_sdk.DeleteData(tc, GO_EP1_ID, defer_submission_id=True)
+        ddata.add_item("/~/a")
+        self.assertEqual(tc.submit_delete(ddata)["task_id"], "task-id2")
@@ -0,0 +1,137 @@
+import json
+
+from six.moves import BaseHTTPServer
+
+import globus_sdk
+from globus_sdk.base import BaseClient
+from globus_sdk.exc import GlobusSDKUsageError
+from globus_sdk.transport import (HTTPTransport, get_default_transport,
+                                  set_default_transport)
+from tests.framework import CapturedIOTestCase, start_http_server
+
+
+class _JSONHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    # keep connections alive so that pooling can be observed
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps({"path": self.path}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Set-Cookie", "session=abc; Path=/")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class HTTPTransportTests(CapturedIOTestCase):
+
+    def setUp(self):
+        super(HTTPTransportTests, self).setUp()
+        self.server, self.base_url = start_http_server(_JSONHandler)
+
+    def tearDown(self):
+        super(HTTPTransportTests, self).tearDown()
+        set_default_transport(None)
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_pool_configuration(self):
+        """
+        Creates transports, confirms pool configuration is applied
+        """
+        transport = HTTPTransport()
+        self.assertEqual(transport.pool_maxsize, 10)
+        self.assertEqual(transport.pool_block, False)
+
+        transport = HTTPTransport(pool_connections=3, pool_maxsize=64,
+                                  pool_block=True)
+        adapter = transport.session.get_adapter("https://example.org")
+        self.assertIs(adapter, transport._adapter)
+        self.assertEqual(adapter._pool_connections, 3)
+        self.assertEqual(adapter._pool_maxsize, 64)
+        self.assertEqual(adapter._pool_block, True)
+
+    def test_client_pool_arguments(self):
+        """
+        Creates clients with and without pool arguments, confirms that they
+        reach the client's transport
+        """
+        client = BaseClient("transfer", base_path="/v0.10/",
+                            http_pool_maxsize=64, http_pool_block=True)
+        self.assertEqual(client.transport.pool_maxsize, 64)
+        self.assertEqual(client.transport.pool_block, True)
+        self.assertIs(client._session, client.transport.session)
+        self.assertIsNot(client.transport, get_default_transport())
+
+        # a transport and pool settings are mutually exclusive
+        with self.assertRaises(GlobusSDKUsageError):
+            BaseClient("transfer", base_path="/v0.10/",
+                       transport=HTTPTransport(), http_pool_maxsize=64)
+
+    def test_default_transport_shared(self):
+        """
+        Creates several types of clients, confirms that they all share the
+        default transport
+        """
+        transport = get_default_transport()
+        self.assertIs(transport, get_default_transport())
+        self.assertEqual(transport.pool_maxsize, 10)
+        clients = [
+            globus_sdk.TransferClient(),
+            globus_sdk.AuthClient(),
+            globus_sdk.SearchClient(),
+            globus_sdk.ConfidentialAppAuthClient("client_id", "secret"),
+        ]
+        for client in clients:
+            self.assertIs(client.transport, transport)
+
+        # replacing the default only affects new clients
+        new_default = HTTPTransport()
+        set_default_transport(new_default)
+        self.assertIs(globus_sdk.TransferClient().transport, new_default)
+        self.assertIs(clients[0].transport, transport)
+
+    def test_explicit_transport_shared(self):
+        """
+        Sends requests from two clients sharing one transport, confirms that
+        both use the same connection
+        """
+        transport = HTTPTransport()
+        clients = [BaseClient("transfer", base_url=self.base_url,
+                              transport=transport) for _ in range(2)]
+        for client in clients:
+            client.get("foo")
+        stats = transport.pool_stats()
+        self.assertEqual(stats["requests_sent"], 2)
+        self.assertEqual(stats["connections_created"], 1)
+
+    def test_cookies_not_stored(self):
+        """
+        Gets a response which sets a cookie, confirms that the transport's
+        session does not store it
+        """
+        transport = HTTPTransport()
+        BaseClient("transfer", base_url=self.base_url,
+                   transport=transport).get("foo")
+        self.assertEqual(len(transport.session.cookies), 0)
+
+    def test_pool_stats(self):
+        """
+        Sends several requests through a client, confirms that they are
+        counted and that a single connection is reused
+        """
+        client = BaseClient("transfer", base_url=self.base_url,
+                            transport=HTTPTransport())
+        for i in range(5):
+            self.assertEqual(client.get("foo")["path"], "/foo")
+
+        stats = client.transport.pool_stats()
+        self.assertEqual(stats["requests_sent"], 5)
+        self.assertEqual(stats["in_flight"], 0)
+        self.assertEqual(stats["peak_in_flight"], 1)
+        self.assertEqual(stats["connections_created"], 1)
+        self.assertEqual(stats["host_pools"], 1)